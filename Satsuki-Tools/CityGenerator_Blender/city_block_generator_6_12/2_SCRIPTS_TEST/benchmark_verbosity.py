@@ -0,0 +1,44 @@
+# Benchmark de la verbosité - Exécuter dans Blender
+# Mesure le temps de génération d'une même ville à chaque niveau de journalisation
+import random
+import time
+
+import bpy
+
+print("=== BENCHMARK VERBOSITÉ ===")
+
+try:
+    from city_block_generator_6_12.city_log import LEVEL_NAMES, CityLogger
+    from city_block_generator_6_12.generator import generate_city
+except Exception as e:
+    print(f"❌ Import impossible (addon installé ?): {e}")
+    raise
+
+scene = bpy.context.scene
+scene.citygen_width = 10
+scene.citygen_length = 10
+scene.citygen_buildings_per_block = 2
+scene.citygen_mesh_backend = 'OBJECTS'
+
+# 1. Coût d'un appel désactivé
+muted = CityLogger(level=LEVEL_NAMES['SILENT'])
+start = time.perf_counter()
+for index in range(100000):
+    muted.debug("Bâtiment %s: %.2f x %.2f", index, 1.0, 2.0)
+print(f"✅ 100 000 appels debug désactivés: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+# 2. Génération complète à chaque niveau
+results = {}
+for level in ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'SILENT'):
+    scene.citygen_verbosity = level
+    random.seed(1234)
+    start = time.perf_counter()
+    success = generate_city(bpy.context)
+    results[level] = time.perf_counter() - start
+    print(f"{'✅' if success else '❌'} {level}: {results[level]:.2f} s")
+
+print("\n=== RÉSULTATS ===")
+reference = results['DEBUG']
+for level, duration in results.items():
+    print(f"{level:8s} {duration:6.2f} s  ({reference / duration if duration else 0:.2f}x vs DEBUG)")
+scene.citygen_verbosity = 'INFO'
@@ -0,0 +1,45 @@
+# Script de test de la tessellation adaptative des routes Bézier (bezier_roads) - Exécuter dans Blender
+# Fonctions sans bpy: nombre de pas de Wang et écart à la courbe
+import numpy as np
+
+print("=== TEST BEZIER ROADS ===")
+
+try:
+    from city_block_generator_6_12.bezier_roads import DEFAULT_TOLERANCE, auto_handles, sample_bezier_path, wang_steps
+except Exception as e:
+    print(f"❌ Import impossible (addon installé ?): {e}")
+    raise
+
+
+def segment(*points):
+    """Points de contrôle (1, 2) d'un segment cubique"""
+    return [np.array([point], dtype=np.float64) for point in points]
+
+
+# 1. Segment droit (contrôles alignés et réguliers): un seul pas
+straight = int(wang_steps(*segment((0, 0), (10, 0), (20, 0), (30, 0)))[0])
+print(f"{'✅' if straight == 1 else '❌'} Segment droit: {straight} pas")
+
+# 2. Virage serré: |p0 - 2p1 + p2| = |(-10, 10)|, n = ceil(sqrt(3/4 * 14.14 / 0.05)) = 15 pas
+tight = int(wang_steps(*segment((0, 0), (10, 0), (10, 10), (0, 10)))[0])
+print(f"{'✅' if tight == 15 else '❌'} Virage serré: {tight} pas")
+
+# 3. Tolérance divisée par 4: n = ceil(29.1) = 30 pas
+finer = int(wang_steps(*segment((0, 0), (10, 0), (10, 10), (0, 10)), tolerance=DEFAULT_TOLERANCE / 4)[0])
+print(f"{'✅' if finer == 30 else '❌'} Tolérance / 4: {finer} pas")
+
+# 4. Route droite: deux sommets; route courbe: écart à la courbe dense sous la tolérance
+line = sample_bezier_path([(0, 0), (30, 0)])
+print(f"{'✅' if len(line) == 2 else '❌'} Route droite: {len(line)} sommets")
+
+points = np.array([(0, 0), (10, 0), (10, 10), (0, 10), (0, 20)], dtype=np.float64)
+path = sample_bezier_path(points)
+left, right = auto_handles(points)
+t = np.linspace(0, 1, 400)[:, None]
+dense = np.vstack([(1 - t) ** 3 * p0 + 3 * (1 - t) ** 2 * t * p1 + 3 * (1 - t) * t ** 2 * p2 + t ** 3 * p3
+                   for p0, p1, p2, p3 in zip(points[:-1], right[:-1], left[1:], points[1:])])
+# Distance de chaque point dense au segment le plus proche de la polyligne
+starts, edges = path[:-1], path[1:] - path[:-1]
+along = np.clip(((dense[:, None] - starts) * edges).sum(-1) / np.maximum((edges ** 2).sum(-1), 1e-12), 0, 1)
+error = np.linalg.norm(dense[:, None] - (starts + along[..., None] * edges), axis=-1).min(axis=1).max()
+print(f"{'✅' if error <= DEFAULT_TOLERANCE else '❌'} Route courbe: {len(path)} sommets, écart max {error:.3f} m")
@@ -0,0 +1,56 @@
+# Script de test du tirage vectorisé des bâtiments (building_sampler) - Exécuter dans Blender
+# Module sans bpy: règles de repli, bornes de hauteur, empreintes et tirages indexés
+import time
+
+import numpy as np
+
+print("=== TEST BUILDING SAMPLER ===")
+
+try:
+    from city_block_generator_6_12.building_sampler import (
+        FOOTPRINT_DRAWS, HEIGHT_DRAWS, TYPE_DRAWS, lot_draws, sample_buildings,
+    )
+    from city_block_generator_6_12.layout_rules import BUILDING_TYPES, ZONE_TYPES
+except Exception as e:
+    print(f"❌ Import impossible (addon installé ?): {e}")
+    raise
+
+DRAWS = HEIGHT_DRAWS + TYPE_DRAWS + FOOTPRINT_DRAWS
+count = 20000
+generator = np.random.default_rng(1)
+widths = generator.uniform(1.0, 20.0, count)
+depths = generator.uniform(1.0, 20.0, count)
+base_heights = generator.integers(1, 9, count) * 3.0
+zones = generator.integers(0, len(ZONE_TYPES), count)
+max_floors = 8
+
+# 1. Tirages indexés: même graine et mêmes coordonnées, mêmes tirages, quel que soit l'ordre
+i, j, lot = np.arange(count) // 400, np.arange(count) // 20 % 20, np.arange(count) % 20
+draws = lot_draws(DRAWS, 'lot', (i, j, lot), seed=7)
+order = generator.permutation(count)
+shuffled = lot_draws(DRAWS, 'lot', (i[order], j[order], lot[order]), seed=7)
+print(f"{'✅' if np.array_equal(draws[order], shuffled) else '❌'} Tirages indépendants de l'ordre des lots")
+
+start = time.perf_counter()
+sampled = sample_buildings(widths, depths, base_heights, zones, 'HIGH', max_floors, 0.5, draws)
+print(f"✅ {count} lots tirés en {(time.perf_counter() - start) * 1000:.1f} ms")
+
+# 2. Lots étroits (< 3 m) hors zone commerciale (qui peut les passer en tour): rectangulaires
+narrow = (np.minimum(widths, depths) < 3.0) & (zones != ZONE_TYPES.index('COMMERCIAL'))
+rectangular = (sampled['type'][narrow] == BUILDING_TYPES.index('rectangular')).all()
+print(f"{'✅' if rectangular else '❌'} {int(narrow.sum())} lots étroits, tous rectangulaires")
+
+# 3. Hauteurs entre 3 m et max_floors étages
+heights = sampled['height']
+print(f"{'✅' if heights.min() >= 3 and heights.max() <= max_floors * 3 else '❌'} "
+      f"Hauteurs entre {heights.min():.0f} et {heights.max():.0f} m")
+
+# 4. Empreintes contenues dans leur lot (hors pyramides, qui prennent le grand côté)
+pyramid = sampled['type'] == BUILDING_TYPES.index('pyramid')
+inside = ((sampled['width'] <= widths + 1e-9) & (sampled['depth'] <= depths + 1e-9))[~pyramid].all()
+print(f"{'✅' if inside else '❌'} Empreintes dans leur lot")
+
+# 5. Type imposé (mode de forme fixe)
+tower = BUILDING_TYPES.index('tower')
+forced = sample_buildings(widths, depths, base_heights, zones, 'HIGH', max_floors, 0.5, draws, tower)
+print(f"{'✅' if (forced['type'] == tower).all() else '❌'} Type imposé respecté")
@@ -0,0 +1,64 @@
+# Script de test du plan de ville (CityPlan) - Exécuter dans Blender
+# Le plan est calculé sans créer d'objet, puis émis avec le backend groupé
+import random
+import time
+
+import bpy
+
+print("=== TEST CITY PLAN ===")
+
+try:
+    from city_block_generator_6_12.city_plan import plan_city
+    from city_block_generator_6_12.plan_emitters import PlanEmitter
+    from city_block_generator_6_12.generator import create_material
+    from city_block_generator_6_12.grid_layout import GridLayout
+except Exception as e:
+    print(f"❌ Import impossible (addon installé ?): {e}")
+    raise
+
+# 1. Calcul du plan seul
+start = time.perf_counter()
+plan = plan_city(20, 20, max_floors=10, buildings_per_block=4, rng=random.Random(42))
+plan_time = time.perf_counter() - start
+print(f"✅ {plan.summary()} en {plan_time * 1000:.1f} ms")
+
+# 2. Cohérence des tables
+assert len(plan.blocks) == 400, "Nombre de blocs incorrect"
+assert len(plan.roads) == 2 * 19, "Nombre de routes incorrect"
+assert len(plan.intersections) == 19 * 19, "Nombre de carrefours incorrect"
+assert len(plan.buildings) == len(plan.lots), "Un bâtiment par lot attendu"
+assert (plan.buildings['height'] > 0).all(), "Hauteurs invalides"
+print("✅ Tables cohérentes")
+
+# 3. Même graine = même plan
+plan_bis = plan_city(20, 20, max_floors=10, buildings_per_block=4, rng=random.Random(42))
+same = all((plan.buildings[column] == plan_bis.buildings[column]).all() for column in plan.buildings.dtypes)
+print(f"{'✅' if same else '❌'} Plan reproductible avec la même graine")
+
+# 4. Graine indexée: un bloc ne dépend que de (graine, i, j)
+small = plan_city(10, 10, max_floors=10, buildings_per_block=4, seed=7)
+large = plan_city(20, 20, max_floors=10, buildings_per_block=4, seed=7)
+small_blocks = {(r['i'], r['j']): (r['width'], r['depth']) for r in small.blocks.rows()}
+large_blocks = {(r['i'], r['j']): (r['width'], r['depth']) for r in large.blocks.rows()}
+same = all(large_blocks[key] == size for key, size in small_blocks.items())
+print(f"{'✅' if same else '❌'} Blocs identiques quelle que soit la taille de la grille")
+
+# 5. Disposition vectorisée d'une grande grille
+import numpy as np
+sizes = np.random.default_rng(1).uniform(8, 20, (2, 200, 200))
+start = time.perf_counter()
+layout = GridLayout(sizes[0], sizes[1], 4.0)
+lots = layout.lot_rects(6, 1.0)
+print(f"✅ Disposition 200x200 ({lots[0].size} lots) en {(time.perf_counter() - start) * 1000:.1f} ms")
+
+# 6. Émission groupée
+bpy.ops.object.select_all(action='SELECT')
+bpy.ops.object.delete(use_global=False)
+emitter = PlanEmitter(create_material("RoadMat", (0.3, 0.3, 0.3)),
+                      create_material("SidewalkMat", (0.6, 0.6, 0.6)),
+                      create_material("BuildingMat", (0.5, 1.0, 0.0)),
+                      mesh_backend='BATCHED')
+start = time.perf_counter()
+counts = emitter.emit(plan)
+print(f"✅ Émission groupée en {(time.perf_counter() - start) * 1000:.1f} ms: {counts}")
+print(f"Objets dans la scène: {len(bpy.context.scene.objects)}")
@@ -0,0 +1,58 @@
+# Script de test de l'élimination des faces cachées (face_culling) - Exécuter dans Blender
+# Module sans bpy: bâtiments isolés (dessous seuls) et bâtiments collés (murs mitoyens)
+import numpy as np
+
+print("=== TEST FACE CULLING ===")
+
+try:
+    from city_block_generator_6_12.building_sampler import FOOTPRINT_TEMPLATES
+    from city_block_generator_6_12.building_templates import stamp_buildings
+    from city_block_generator_6_12.city_plan import plan_city
+    from city_block_generator_6_12.face_culling import face_planes, hidden_faces
+except Exception as e:
+    print(f"❌ Import impossible (addon installé ?): {e}")
+    raise
+
+
+def buildings_geometry(templates, positions, sizes, ratios=None):
+    """Géométrie (verts, loops, totals) de tous les bâtiments réunis"""
+    all_verts, all_loops, all_totals, offset = [], [], [], 0
+    for _, _, verts, loops, totals in stamp_buildings(templates, positions, sizes, ratios=ratios):
+        all_verts.append(verts)
+        all_loops.append(loops + offset)
+        all_totals.append(totals)
+        offset += len(verts)
+    return np.vstack(all_verts), np.concatenate(all_loops), np.concatenate(all_totals)
+
+
+def culled(verts, loops, totals):
+    """Faces retirées (dessous, murs) et part des triangles retirés"""
+    hidden = hidden_faces(verts, loops, totals)
+    normals, _ = face_planes(verts, loops, totals)
+    ground = hidden & (normals[:, 2] < -0.999)
+    triangles = totals - 2
+    return int(ground.sum()), int((hidden & ~ground).sum()), triangles[hidden].sum() / triangles.sum()
+
+
+# 1. Deux boîtes écartées: seuls les dessous sont retirés
+verts, loops, totals = buildings_geometry(['rectangular'] * 2, [(0.0, 0.0), (6.0, 0.0)], [(4.0, 4.0, 9.0)] * 2)
+ground, walls, _ = culled(verts, loops, totals)
+print(f"{'✅' if (ground, walls) == (2, 0) else '❌'} Boîtes écartées: {ground} dessous, {walls} murs retirés")
+
+# 2. Deux boîtes collées de hauteurs différentes: le mur le plus bas est couvert, pas l'autre
+verts, loops, totals = buildings_geometry(['rectangular'] * 2, [(0.0, 0.0), (4.0, 0.0)],
+                                          [(4.0, 4.0, 9.0), (4.0, 4.0, 6.0)])
+ground, walls, _ = culled(verts, loops, totals)
+print(f"{'✅' if (ground, walls) == (2, 1) else '❌'} Boîtes collées: {ground} dessous, {walls} mur retiré")
+
+# 3. Plan réel: avec trottoirs, dessous seuls; routes sans coupure, murs mitoyens en plus
+for sidewalk_width in (1.0, 0.0):
+    plan = plan_city(20, 20, buildings_per_block=9, base_size=6, seed=7, sidewalk_width=sidewalk_width)
+    table = plan.buildings
+    verts, loops, totals = buildings_geometry(
+        np.array(FOOTPRINT_TEMPLATES)[table['template']], np.column_stack((table['x'], table['y'])),
+        np.column_stack((table['footprint_width'], table['footprint_depth'], table['height'])), table['ratio'])
+    ground, walls, cut = culled(verts, loops, totals)
+    expected = walls < len(table) * 0.01 if sidewalk_width else cut >= 0.2
+    print(f"{'✅' if expected else '❌'} Trottoir {sidewalk_width}: {ground} dessous, {walls} murs, "
+          f"{cut * 100:.1f}% des triangles retirés")
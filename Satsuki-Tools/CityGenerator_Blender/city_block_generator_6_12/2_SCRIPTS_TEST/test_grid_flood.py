@@ -0,0 +1,41 @@
+# Script de test de la croissance de régions (grid_flood) - Exécuter dans Blender
+# Module sans bpy: chaque zone reçoit exactement son quota de cellules
+import random
+import time
+
+import numpy as np
+
+print("=== TEST GRID FLOOD ===")
+
+try:
+    from city_block_generator_6_12.grid_flood import UNCLAIMED, flood_regions
+except Exception as e:
+    print(f"❌ Import impossible (addon installé ?): {e}")
+    raise
+
+# 1. Quotas partiels: chaque région a son quota exact, le reste est libre
+quotas = [150, 120, 100]
+labels, counts = flood_regions(20, 20, [[(2, 2), (15, 15)], [(10, 3)], [(3, 17)]], quotas, rng=random.Random(1))
+exact = counts == quotas and [int((labels == region).sum()) for region in range(3)] == quotas
+print(f"{'✅' if exact else '❌'} Quotas exacts {counts}, {int((labels == UNCLAIMED).sum())} cellules libres")
+
+# 2. Quotas couvrant toute la grille: aucune cellule libre
+quotas = [240, 100, 60]
+labels, counts = flood_regions(20, 20, [[(0, 0)], [(19, 19)], [(0, 19)]], quotas, rng=random.Random(2))
+full = counts == quotas and not (labels == UNCLAIMED).any()
+print(f"{'✅' if full else '❌'} Grille couverte: {counts}")
+
+# 3. Région sans source: elle repart d'une cellule libre et atteint son quota
+labels, counts = flood_regions(10, 10, [[(5, 5)], []], [60, 40], rng=random.Random(3))
+print(f"{'✅' if counts == [60, 40] else '❌'} Région sans source: {counts}")
+
+# 4. Les sources gardent leur région
+labels, counts = flood_regions(20, 20, [[(2, 2), (15, 15)], [(10, 3)]], [100, 100], rng=random.Random(4))
+kept = labels[2, 2] == labels[15, 15] == 0 and labels[10, 3] == 1
+print(f"{'✅' if kept else '❌'} Sources attribuées à leur région")
+
+# 5. Temps sur une grande grille
+start = time.perf_counter()
+sources = [np.random.default_rng(5).integers(0, 300, (20, 2)) for _ in range(3)]
+labels, counts = flood_regions(300, 300, sources, [45000, 27000, 18000], rng=random.Random(5))
+print(f"✅ Grille 300x300: {counts} en {(time.perf_counter() - start) * 1000:.0f} ms")
@@ -0,0 +1,51 @@
+# Script de test de l'échantillonnage de Poisson (poisson_disk) - Exécuter dans Blender
+# Module sans bpy: l'espacement minimal et les manques signalés sont vérifiés
+import contextlib
+import io
+import random
+
+import numpy as np
+
+print("=== TEST POISSON DISK ===")
+
+try:
+    from city_block_generator_6_12.poisson_disk import poisson_disk_cells, poisson_disk_points, spaced_cells
+except Exception as e:
+    print(f"❌ Import impossible (addon installé ?): {e}")
+    raise
+
+
+def min_gap(points):
+    """Plus petite distance entre deux points (N, 2)"""
+    points = np.asarray(points, dtype=np.float64)
+    gaps = np.linalg.norm(points[:, None] - points[None], axis=-1)
+    np.fill_diagonal(gaps, np.inf)
+    return gaps.min()
+
+
+# 1. Cellules de grille espacées d'au moins le rayon
+cells = poisson_disk_cells(30, 30, 3.0, rng=random.Random(3))
+print(f"{'✅' if min_gap(cells) >= 3.0 else '❌'} {len(cells)} cellules, écart minimal {min_gap(cells):.2f} (rayon 3)")
+
+# 2. Points du plan espacés d'au moins le rayon
+points = poisson_disk_points(100.0, 60.0, 4.0, rng=random.Random(2))
+inside = bool(((points >= 0) & (points <= (100.0, 60.0))).all())
+print(f"{'✅' if min_gap(points) >= 4.0 and inside else '❌'} {len(points)} points, écart minimal {min_gap(points):.2f} (rayon 4)")
+
+# 3. Rectangle plus petit que l'anneau: aucun candidat, un seul point
+points = poisson_disk_points(1.0, 1.0, 5.0, rng=random.Random(1))
+print(f"{'✅' if len(points) == 1 else '❌'} Rectangle 1x1 rayon 5: {len(points)} point")
+
+# 4. Nombre exact de cellules, espacement relâché et signalé
+output = io.StringIO()
+with contextlib.redirect_stdout(output):
+    cells = spaced_cells(6, 6, 10, 4, rng=random.Random(4), label="zones")
+distinct = len({tuple(cell) for cell in cells.tolist()}) == len(cells)
+print(f"{'✅' if len(cells) == 10 and distinct else '❌'} {len(cells)}/10 cellules distinctes sur une grille 6x6")
+print(f"{'✅' if 'espacement réduit' in output.getvalue() else '❌'} Espacement réduit signalé")
+
+# 5. Plus de cellules demandées que la grille n'en contient: manque signalé
+output = io.StringIO()
+with contextlib.redirect_stdout(output):
+    cells = spaced_cells(3, 3, 12, 2, rng=random.Random(4), label="zones")
+print(f"{'✅' if len(cells) == 9 and 'seulement 9/12' in output.getvalue() else '❌'} Manque signalé: {len(cells)}/12 cellules")
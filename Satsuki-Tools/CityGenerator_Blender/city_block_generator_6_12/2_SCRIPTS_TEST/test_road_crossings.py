@@ -0,0 +1,38 @@
+# Script de test des croisements de routes (road_crossings) - Exécuter dans Blender
+# Module sans bpy: grille connue traversée par une diagonale
+import numpy as np
+
+print("=== TEST ROAD CROSSINGS ===")
+
+try:
+    from city_block_generator_6_12.road_crossings import find_road_crossings, junction_patch
+except Exception as e:
+    print(f"❌ Import impossible (addon installé ?): {e}")
+    raise
+
+# Grille 3x3 de lignes sur [-15, 15] et diagonale y = x / 2 + 1
+grid = [[(x, -15.0), (x, 15.0)] for x in (-10.0, 0.0, 10.0)] + [[(-15.0, y), (15.0, y)] for y in (-10.0, 0.0, 10.0)]
+diagonal = [(-15.0, -6.5), (15.0, 8.5)]
+polylines = grid + [diagonal]
+widths = [4.0] * len(polylines)
+kinds = ['grid'] * len(grid) + ['diagonal']
+
+# 1. Diagonale seule: 3 verticales et 1 horizontale croisées
+crossings = find_road_crossings(polylines, widths, kinds)
+points = sorted((round(float(x), 3), round(float(y), 3)) for x, y in (c['point'] for c in crossings))
+expected = [(-10.0, -4.0), (-2.0, 0.0), (0.0, 1.0), (10.0, 6.0)]
+print(f"{'✅' if points == expected else '❌'} {len(crossings)} croisements de la diagonale: {points}")
+
+# 2. Sans libellés: les 9 croisements de la grille en plus
+crossings = find_road_crossings(polylines, widths)
+print(f"{'✅' if len(crossings) == 13 else '❌'} {len(crossings)} croisements au total (9 grille + 4 diagonale)")
+
+# 3. Routes concourantes en un point: un seul croisement
+crossings = find_road_crossings([[(-5.0, 0.0), (5.0, 0.0)], [(0.0, -5.0), (0.0, 5.0)], [(-5.0, -5.0), (5.0, 5.0)]],
+                                [4.0, 4.0, 2.0])
+print(f"{'✅' if len(crossings) == 1 else '❌'} Trois routes concourantes: {len(crossings)} croisement")
+
+# 4. Patch d'un croisement à angle droit: carré des deux chaussées, orienté vers le haut
+patch = junction_patch(crossings[0])
+area = 0.5 * float(np.dot(patch[:, 0], np.roll(patch[:, 1], -1)) - np.dot(patch[:, 1], np.roll(patch[:, 0], -1)))
+print(f"{'✅' if abs(area - 16.0) < 1e-6 else '❌'} Patch de jonction 4 x 4: aire {area:.2f}")
@@ -0,0 +1,48 @@
+# Script de test du graphe routier planaire - Exécuter dans Blender
+# Les îlots sont extraits des faces du graphe des lignes médianes
+import math
+import time
+
+print("=== TEST ROAD GRAPH ===")
+
+try:
+    from city_block_generator_6_12.road_graph import RoadGraph, points_in_polygon
+except Exception as e:
+    print(f"❌ Import impossible (addon installé ?): {e}")
+    raise
+
+
+def wobbly_grid(count, block_size=12.0):
+    """Lignes médianes d'une grille count x count légèrement ondulée"""
+    extent = count * block_size
+    polylines = []
+    for k in range(count + 1):
+        base = (k - count / 2) * block_size
+        t = [p / 20 for p in range(21)]
+        polylines.append([(base + math.sin(u * 6.28 + k) * 1.5, (u - 0.5) * extent) for u in t])
+        polylines.append([((u - 0.5) * extent, base + math.sin(u * 7.85 + k) * 1.5) for u in t])
+    return polylines
+
+
+# 1. Une face fermée par cellule de grille
+polylines = wobbly_grid(3)
+graph = RoadGraph.from_polylines(polylines, [2.0] * len(polylines), extend=3.0)
+graph.prune_dead_ends()
+blocks = graph.block_polygons(sidewalk_width=1.0)
+print(f"{'✅' if len(blocks) == 9 else '❌'} {len(blocks)} îlots pour une grille 3x3")
+
+# 2. Le rectangle inscrit reste dans le polygone du bloc
+inside = True
+for block in blocks:
+    half_x, half_y = block['half_size']
+    corners = block['centroid'] + [(-half_x, -half_y), (half_x, -half_y), (half_x, half_y), (-half_x, half_y)]
+    inside &= bool(points_in_polygon(corners * 0.999 + block['centroid'] * 0.001, block['polygon']).all())
+print(f"{'✅' if inside else '❌'} Rectangles inscrits dans les îlots")
+
+# 3. Temps de construction d'une grande grille
+polylines = wobbly_grid(60)
+start = time.perf_counter()
+graph = RoadGraph.from_polylines(polylines, [2.0] * len(polylines), extend=3.0)
+graph.prune_dead_ends()
+blocks = graph.block_polygons(sidewalk_width=1.0)
+print(f"✅ Grille 60x60: {len(blocks)} îlots en {(time.perf_counter() - start) * 1000:.0f} ms")
@@ -0,0 +1,47 @@
+# Script de test du maillage en ruban des routes (road_ribbon) - Exécuter dans Blender
+# Module sans bpy: faces de la chaussée orientées vers le haut et non dégénérées
+import numpy as np
+
+print("=== TEST ROAD RIBBON ===")
+
+try:
+    from city_block_generator_6_12.road_ribbon import ribbon_geometry
+except Exception as e:
+    print(f"❌ Import impossible (addon installé ?): {e}")
+    raise
+
+
+def face_normals(verts, loops, totals):
+    """Normales non normalisées (F, 3) des faces (méthode de Newell)"""
+    normals = np.zeros((len(totals), 3))
+    start = 0
+    for face, total in enumerate(totals):
+        ring = verts[loops[start:start + total]]
+        normals[face] = np.cross(ring, np.roll(ring, -1, axis=0)).sum(axis=0) / 2
+        start += total
+    return normals
+
+
+polylines = {
+    'virage à gauche': [(0.0, 0.0), (10.0, 0.0), (10.0, 10.0)],
+    'virage à droite': [(0.0, 0.0), (10.0, 0.0), (10.0, -10.0)],
+    'zigzag serré': [(0.0, 0.0), (6.0, 0.0), (2.0, 3.0), (8.0, 5.0)],
+}
+
+# 1. Chaussée: toutes les normales vers +Z, aire non nulle (onglet et virages arrondis)
+for join in ('MITER', 'ROUND'):
+    for label, points in polylines.items():
+        role, verts, loops, totals, _ = ribbon_geometry(points, 4.0, join=join)[0]
+        normals = face_normals(verts, loops, totals)
+        upward = bool((normals[:, 2] > 1e-6).all())
+        print(f"{'✅' if role == 'road' and upward else '❌'} {join} {label}: {len(totals)} faces, "
+              f"aire minimale {normals[:, 2].min():.2f} m²")
+
+# 2. Bordures et trottoirs: dessus vers +Z, flancs verticaux, aucune face vers le bas
+strips = ribbon_geometry(polylines['virage à gauche'], 4.0, join='ROUND', curb_width=0.3, sidewalk_width=1.5)
+roles = [strip[0] for strip in strips]
+downward = 0
+for role, verts, loops, totals, _ in strips:
+    downward += int((face_normals(verts, loops, totals)[:, 2] < -1e-6).sum())
+print(f"{'✅' if roles == ['road', 'curb', 'sidewalk', 'curb', 'sidewalk'] and downward == 0 else '❌'} "
+      f"Bandes {roles}, {downward} faces vers le bas")
@@ -20,6 +20,27 @@ import random
 # TOKYO 1.0.3 - FICHIER CORRIGÉ
 # Bug résolu: Fichier vide → Contenu complet restauré
 
+# Collection propriétaire du district: le nettoyage ne supprime que son contenu
+TOKYO_COLLECTION = "Tokyo_District"
+
+# Matériau unique du district: la couleur vient de Object.color, le métal de la propriété tokyo_metallic
+TOKYO_SHADER = "Tokyo_Shader"
+METALLIC_PROP = "tokyo_metallic"
+
+# Couleur des blocs selon la zone
+ZONE_COLORS = {
+    'business': (0.1, 0.1, 0.3),     # Bleu foncé
+    'commercial': (0.3, 0.1, 0.1),   # Rouge foncé
+    'residential': (0.1, 0.3, 0.1),  # Vert foncé
+}
+
+# Aspect des bâtiments selon la zone: (couleur, metallic, variation de teinte par bâtiment)
+BUILDING_LOOKS = {
+    'business': ((0.8, 0.8, 0.9), 0.8, 0.0),     # Gris métallique
+    'commercial': ((0.9, 0.6, 0.3), 0.0, 0.08),  # Orange, enseignes variées
+    'residential': ((0.7, 0.9, 0.6), 0.0, 0.0),  # Vert clair
+}
+
 class TOKYO_OT_generate_district(Operator):
     """Generate Tokyo-style district"""
     bl_idname = "tokyo.generate_district"
@@ -35,6 +56,7 @@ class TOKYO_OT_generate_district(Operator):
         
         # Nettoyer la scène
         self.clear_scene()
+        self.collections = self.ensure_collections(context.scene)
         
         # Créer le district Tokyo
         self.create_tokyo_district(size, organic, density, variety)
@@ -44,10 +66,41 @@ class TOKYO_OT_generate_district(Operator):
         return {'FINISHED'}
     
     def clear_scene(self):
-        """Supprime tous les objets Tokyo existants"""
-        for obj in bpy.data.objects:
-            if obj.name.startswith(("TokyoBlock_", "TokyoRoad_", "TokyoBuilding_")):
-                bpy.data.objects.remove(obj, do_unlink=True)
+        """Supprime tous les objets Tokyo existants (contenu de la collection du district)"""
+        root = bpy.data.collections.get(TOKYO_COLLECTION)
+        if root is None:
+            return
+        objects = list(root.all_objects)
+        meshes = {obj.data for obj in objects if obj.type == 'MESH'}
+        materials = {mat for mesh in meshes for mat in mesh.materials if mat is not None}
+        bpy.data.batch_remove(objects)
+        bpy.data.batch_remove([mesh for mesh in meshes if mesh.users == 0])
+        bpy.data.batch_remove([mat for mat in materials if mat.users == 0])
+    
+    def ensure_collections(self, scene):
+        """Crée la collection du district et ses sous-collections Blocks / Buildings"""
+        root = bpy.data.collections.get(TOKYO_COLLECTION)
+        if root is None:
+            root = bpy.data.collections.new(TOKYO_COLLECTION)
+        if root.name not in scene.collection.children:
+            scene.collection.children.link(root)
+        collections = {}
+        for child in ('Blocks', 'Buildings'):
+            name = f"{TOKYO_COLLECTION}_{child}"
+            collection = bpy.data.collections.get(name)
+            if collection is None:
+                collection = bpy.data.collections.new(name)
+            if collection.name not in root.children:
+                root.children.link(collection)
+            collections[child.lower()] = collection
+        return collections
+    
+    def own_object(self, obj, collection):
+        """Déplace un objet créé par bpy.ops dans la collection du district"""
+        source = bpy.context.collection
+        if source != collection:
+            collection.objects.link(obj)
+            source.objects.unlink(obj)
     
     def create_tokyo_district(self, size, organic_factor, block_density, building_variety):
         """Crée un district Tokyo complet"""
@@ -125,10 +178,10 @@ class TOKYO_OT_generate_district(Operator):
             # Appliquer la taille correcte
             block_obj.scale = (block_size*0.9/2, block_size*0.9/2, 1.0)
             block_obj.name = f"TokyoBlock_{zone_type}_{x}_{y}"
+            self.own_object(block_obj, self.collections['blocks'])
             
-            # Matériau selon la zone
-            material = self.create_zone_material(zone_type)
-            block_obj.data.materials.append(material)
+            # Aspect selon la zone (matériau partagé + couleur d'objet)
+            self.apply_look(block_obj, ZONE_COLORS.get(zone_type, ZONE_COLORS['residential']))
             blocks[(x, y)] = block_obj
         
         return blocks
@@ -160,46 +213,43 @@ class TOKYO_OT_generate_district(Operator):
             # Appliquer la taille correcte
             building_obj.scale = (block_size*0.7/2, block_size*0.7/2, height/2)
             building_obj.name = building_name
+            self.own_object(building_obj, self.collections['buildings'])
             
-            # Matériau selon le type
-            material = self.create_building_material(zone_type)
-            building_obj.data.materials.append(material)
+            # Aspect selon le type (matériau partagé + couleur d'objet)
+            color, metallic, tint = BUILDING_LOOKS.get(zone_type, BUILDING_LOOKS['residential'])
+            if tint > 0:
+                color = tuple(min(1.0, max(0.0, channel + random.uniform(-tint, tint))) for channel in color)
+            self.apply_look(building_obj, color, metallic)
             buildings[(x, y)] = building_obj
         
         return buildings
     
-    def create_zone_material(self, zone_type):
-        """Crée un matériau pour les zones"""
-        mat_name = f"Tokyo_{zone_type}_Zone"
-        mat = bpy.data.materials.new(name=mat_name)
+    def ensure_shared_material(self):
+        """Matériau partagé du district (créé une seule fois)"""
+        mat = bpy.data.materials.get(TOKYO_SHADER)
+        if mat is not None:
+            return mat
+        mat = bpy.data.materials.new(name=TOKYO_SHADER)
         mat.use_nodes = True
-        
-        if zone_type == 'business':
-            color = (0.1, 0.1, 0.3, 1.0)  # Bleu foncé
-        elif zone_type == 'commercial':
-            color = (0.3, 0.1, 0.1, 1.0)  # Rouge foncé
-        else:  # residential
-            color = (0.1, 0.3, 0.1, 1.0)  # Vert foncé
-        
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = color
+        nodes = mat.node_tree.nodes
+        links = mat.node_tree.links
+        principled = nodes["Principled BSDF"]
+        object_info = nodes.new('ShaderNodeObjectInfo')
+        object_info.location = (-400, 200)
+        metallic = nodes.new('ShaderNodeAttribute')
+        metallic.attribute_type = 'OBJECT'
+        metallic.attribute_name = METALLIC_PROP
+        metallic.location = (-400, -100)
+        links.new(object_info.outputs['Color'], principled.inputs['Base Color'])
+        links.new(metallic.outputs['Fac'], principled.inputs['Metallic'])
         return mat
     
-    def create_building_material(self, zone_type):
-        """Crée un matériau pour les bâtiments"""
-        mat_name = f"Tokyo_{zone_type}_Building"
-        mat = bpy.data.materials.new(name=mat_name)
-        mat.use_nodes = True
-        
-        if zone_type == 'business':
-            color = (0.8, 0.8, 0.9, 1.0)  # Gris métallique
-            mat.node_tree.nodes["Principled BSDF"].inputs[6].default_value = 0.8  # Metallic
-        elif zone_type == 'commercial':
-            color = (0.9, 0.6, 0.3, 1.0)  # Orange
-        else:  # residential
-            color = (0.7, 0.9, 0.6, 1.0)  # Vert clair
-        
-        mat.node_tree.nodes["Principled BSDF"].inputs[0].default_value = color
-        return mat
+    def apply_look(self, obj, color, metallic=0.0):
+        """Applique le matériau partagé; la couleur et le métal sont portés par l'objet"""
+        obj.data.materials.clear()
+        obj.data.materials.append(self.ensure_shared_material())
+        obj.color = (*color, 1.0)
+        obj[METALLIC_PROP] = metallic
 
 
 # INTERFACE UTILISATEUR COMPATIBLE BLENDER 4.x
@@ -0,0 +1,197 @@
+"""
+Routes en courbes de Bézier à tessellation adaptative.
+
+Les routes organiques étaient des courbes Bézier à resolution_u=64 et
+bevel_resolution=16 (profil rond, fill_mode='BOTH') converties une par une en
+mesh par bpy.ops.object.convert: des centaines de milliers de sommets pour des
+routes plates. Ici chaque segment de Bézier est découpé selon la formule de
+Wang: le nombre de pas garantit un écart à la courbe inférieur à une tolérance
+en mètres (les segments droits ne gardent qu'un pas, les virages serrés en ont
+plus). La polyligne obtenue est maillée en ruban plat (road_ribbon).
+
+Mode optionnel "courbes vivantes": toutes les routes restent des splines d'un
+seul objet courbe, maillées par un modificateur Geometry Nodes (Curve to Mesh
+avec un profil plat) avec la résolution adaptative de chaque spline; aucune
+conversion n'est nécessaire, realize_live_roads en fait un mesh en un appel.
+"""
+
+import numpy as np
+
+from .city_log import log
+
+# Écart maximal (m) entre la courbe et sa tessellation
+DEFAULT_TOLERANCE = 0.05
+
+# Bornes du nombre de pas par segment de Bézier
+MIN_STEPS = 1
+MAX_STEPS = 64
+
+LIVE_NODE_GROUP_NAME = "CityGen_FlatRoad"
+# Marque des objets courbes vivants (opérateur de réalisation)
+LIVE_ROADS_PROP = "citygen_live_roads"
+
+
+def auto_handles(points):
+    """Poignées (gauche, droite) (K, D) de type AUTO: tangente lissée, longueur 1/3 des voisins"""
+    points = np.asarray(points, dtype=np.float64)
+    previous = np.vstack((points[:1], points[:-1]))
+    following = np.vstack((points[1:], points[-1:]))
+    to_previous = points - previous
+    to_next = following - points
+    dist_previous = np.linalg.norm(to_previous, axis=1)
+    dist_next = np.linalg.norm(to_next, axis=1)
+
+    # Tangente: moyenne des directions vers les voisins (extrémités: direction unique)
+    tangent = (to_previous / np.maximum(dist_previous, 1e-12)[:, None] +
+               to_next / np.maximum(dist_next, 1e-12)[:, None])
+    tangent /= np.maximum(np.linalg.norm(tangent, axis=1), 1e-12)[:, None]
+    left = points - tangent * (dist_previous / 3)[:, None]
+    right = points + tangent * (dist_next / 3)[:, None]
+    return left, right
+
+
+def wang_steps(p0, p1, p2, p3, tolerance=DEFAULT_TOLERANCE):
+    """Pas de tessellation de segments cubiques (S, D) pour un écart <= tolerance
+
+    Formule de Wang: n = ceil(sqrt(3/4 * max(|p0 - 2p1 + p2|, |p1 - 2p2 + p3|) / tolérance)).
+    """
+    second = np.maximum(np.linalg.norm(p0 - 2 * p1 + p2, axis=-1), np.linalg.norm(p1 - 2 * p2 + p3, axis=-1))
+    steps = np.ceil(np.sqrt(0.75 * second / max(tolerance, 1e-6)))
+    return np.clip(steps, MIN_STEPS, MAX_STEPS).astype(np.int64)
+
+
+def sample_bezier_path(points, tolerance=DEFAULT_TOLERANCE):
+    """Polyligne adaptative (M, D) de la courbe Bézier AUTO passant par points (K, D)"""
+    points = np.asarray(points, dtype=np.float64)
+    if len(points) < 2:
+        return points.copy()
+    left, right = auto_handles(points)
+    p0, p1, p2, p3 = points[:-1], right[:-1], left[1:], points[1:]
+    steps = wang_steps(p0, p1, p2, p3, tolerance)
+
+    # Paramètres t de tous les segments d'un coup (sans le point final de chaque segment)
+    segment = np.repeat(np.arange(len(steps)), steps)
+    offsets = np.concatenate(([0], np.cumsum(steps)[:-1]))
+    t = ((np.arange(steps.sum()) - np.repeat(offsets, steps)) / np.repeat(steps, steps))[:, None]
+    u = 1 - t
+    curve = (u ** 3 * p0[segment] + 3 * u ** 2 * t * p1[segment] +
+             3 * u * t ** 2 * p2[segment] + t ** 3 * p3[segment])
+    return np.vstack((curve, points[-1:]))
+
+
+def ensure_flat_road_node_group():
+    """Arbre Geometry Nodes: Curve to Mesh avec un profil plat de largeur 'Width'"""
+    import bpy
+    from .gn_instancing import _new_group_socket
+
+    node_group = bpy.data.node_groups.get(LIVE_NODE_GROUP_NAME)
+    if node_group is not None:
+        return node_group
+
+    node_group = bpy.data.node_groups.new(LIVE_NODE_GROUP_NAME, 'GeometryNodeTree')
+    _new_group_socket(node_group, "Geometry", 'INPUT', 'NodeSocketGeometry')
+    width_socket = _new_group_socket(node_group, "Width", 'INPUT', 'NodeSocketFloat')
+    width_socket.default_value = 4.0
+    _new_group_socket(node_group, "Geometry", 'OUTPUT', 'NodeSocketGeometry')
+    nodes, links = node_group.nodes, node_group.links
+
+    group_input = nodes.new('NodeGroupInput')
+    group_input.location = (-600, 0)
+    group_output = nodes.new('NodeGroupOutput')
+    group_output.location = (400, 0)
+
+    # Profil: segment horizontal de -Width/2 à +Width/2
+    half = nodes.new('ShaderNodeMath')
+    half.operation = 'MULTIPLY'
+    half.inputs[1].default_value = 0.5
+    half.location = (-400, -200)
+    links.new(group_input.outputs['Width'], half.inputs[0])
+    start = nodes.new('ShaderNodeCombineXYZ')
+    start.location = (-200, -150)
+    negate = nodes.new('ShaderNodeMath')
+    negate.operation = 'MULTIPLY'
+    negate.inputs[1].default_value = -1.0
+    negate.location = (-300, -100)
+    links.new(half.outputs[0], negate.inputs[0])
+    links.new(negate.outputs[0], start.inputs['X'])
+    end = nodes.new('ShaderNodeCombineXYZ')
+    end.location = (-200, -300)
+    links.new(half.outputs[0], end.inputs['X'])
+    profile = nodes.new('GeometryNodeCurvePrimitiveLine')
+    profile.location = (0, -200)
+    links.new(start.outputs[0], profile.inputs['Start'])
+    links.new(end.outputs[0], profile.inputs['End'])
+
+    curve_to_mesh = nodes.new('GeometryNodeCurveToMesh')
+    curve_to_mesh.location = (200, 0)
+    links.new(group_input.outputs['Geometry'], curve_to_mesh.inputs['Curve'])
+    links.new(profile.outputs['Curve'], curve_to_mesh.inputs['Profile Curve'])
+    links.new(curve_to_mesh.outputs['Mesh'], group_output.inputs['Geometry'])
+    return node_group
+
+
+def build_live_curve_roads(name, paths, width, materials=None, tolerance=DEFAULT_TOLERANCE, collection=None):
+    """Un objet courbe (une spline Bézier AUTO par route) maillé par Geometry Nodes
+
+    paths: liste de points de contrôle (K, 2 ou 3); materials: un matériau par route
+    (material_index des splines). La résolution de chaque spline vient de wang_steps.
+    """
+    import bpy
+
+    curve_data = bpy.data.curves.new(name, type='CURVE')
+    curve_data.dimensions = '3D'
+    curve_data.bevel_depth = 0.0
+    slots = {}
+    for index, points in enumerate(paths):
+        points = np.asarray(points, dtype=np.float64)
+        if points.shape[1] == 2:
+            points = np.column_stack((points, np.zeros(len(points))))
+        if len(points) < 2:
+            continue
+        spline = curve_data.splines.new('BEZIER')
+        spline.bezier_points.add(len(points) - 1)
+        spline.bezier_points.foreach_set("co", points.astype(np.float32).ravel())
+        for point in spline.bezier_points:
+            point.handle_left_type = 'AUTO'
+            point.handle_right_type = 'AUTO'
+        left, right = auto_handles(points)
+        spline.resolution_u = int(wang_steps(points[:-1], right[:-1], left[1:], points[1:], tolerance).max())
+
+        material = materials[index] if materials else None
+        if material is not None:
+            if material.name not in slots:
+                slots[material.name] = len(curve_data.materials)
+                curve_data.materials.append(material)
+            spline.material_index = slots[material.name]
+
+    obj = bpy.data.objects.new(name, curve_data)
+    obj[LIVE_ROADS_PROP] = True
+    (collection or bpy.context.collection).objects.link(obj)
+    modifier = obj.modifiers.new("CityGen Flat Road", 'NODES')
+    node_group = modifier.node_group = ensure_flat_road_node_group()
+    if hasattr(node_group, "interface"):
+        inputs = [item for item in node_group.interface.items_tree if getattr(item, 'in_out', None) == 'INPUT']
+    else:
+        inputs = list(node_group.inputs)
+    for socket in inputs:
+        if socket.name == "Width":
+            modifier[socket.identifier] = float(width)
+    log.info("🌊 %s routes courbes vivantes dans '%s'", len(curve_data.splines), name)
+    return obj
+
+
+def realize_live_roads(obj):
+    """Remplace l'objet courbe vivant par son mesh évalué (un seul passage depsgraph)"""
+    import bpy
+
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    evaluated = obj.evaluated_get(depsgraph)
+    mesh = bpy.data.meshes.new_from_object(evaluated, preserve_all_data_layers=True, depsgraph=depsgraph)
+    realized = bpy.data.objects.new(obj.name, mesh)
+    for collection in obj.users_collection:
+        collection.objects.link(realized)
+    curve_data = obj.data
+    bpy.data.objects.remove(obj, do_unlink=True)
+    if curve_data.users == 0:
+        bpy.data.curves.remove(curve_data)
+    return realized
@@ -0,0 +1,207 @@
+"""
+Empreintes de bâtiments: union 2D par niveaux et extrusion (sans dépendance à bpy).
+
+Un bâtiment composé (L, U/F, T, complexe) est décrit par des empreintes
+rectangulaires avec leur tranche de hauteur (z bas, z haut) au lieu de cubes
+superposés. union_mesh calcule l'union exacte de ces volumes sur la grille des
+coordonnées distinctes: seules les faces entre intérieur et extérieur sont
+émises, sans faces internes ni recouvrements coplanaires. Chaque région plane
+devient un seul polygone qui garde tous les sommets de la grille sur son bord,
+ce qui donne un mesh fermé et manifold (pas de jonctions en T).
+
+extrude_footprints extrude d'un coup N contours de même nombre de sommets
+(murs et couvercles), pour les empreintes non rectangulaires.
+"""
+
+import numpy as np
+
+# Précision de fusion des coordonnées de la grille
+GRID_DECIMALS = 9
+
+
+def _box_occupancy(boxes):
+    """Grille (xs, ys, zs) des coordonnées distinctes et occupation des cellules (nx, ny, nz)"""
+    boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 6)
+    axes = [np.unique(np.round(boxes[:, [2 * a, 2 * a + 1]], GRID_DECIMALS)) for a in range(3)]
+    occupancy = np.zeros(tuple(len(axis) - 1 for axis in axes), dtype=bool)
+    for box in np.round(boxes, GRID_DECIMALS):
+        ranges = [np.searchsorted(axes[a], box[2 * a:2 * a + 2]) for a in range(3)]
+        occupancy[ranges[0][0]:ranges[0][1], ranges[1][0]:ranges[1][1], ranges[2][0]:ranges[2][1]] = True
+    return axes, occupancy
+
+
+def _mask_loops(mask):
+    """Contours (sens trigonométrique) des régions d'un masque 2D (nu, nv) en points de la grille
+
+    Retourne None si le masque a des trous ou des sommets pincés (régions en diagonale).
+    """
+    padded = np.pad(mask, 1)
+    inside = padded[1:-1, 1:-1]
+    edges = {}
+
+    def add(start, end):
+        if start in edges:
+            edges[start] = None  # Sommet pincé
+        else:
+            edges[start] = end
+
+    for i, j in zip(*np.nonzero(inside)):
+        i, j = int(i), int(j)
+        if not padded[i + 1, j]:
+            add((i, j), (i + 1, j))
+        if not padded[i + 2, j + 1]:
+            add((i + 1, j), (i + 1, j + 1))
+        if not padded[i + 1, j + 2]:
+            add((i + 1, j + 1), (i, j + 1))
+        if not padded[i, j + 1]:
+            add((i, j + 1), (i, j))
+    if any(end is None for end in edges.values()):
+        return None
+
+    loops = []
+    while edges:
+        start, end = edges.popitem()
+        loop = [start]
+        while end != start:
+            loop.append(end)
+            end = edges.pop(end)
+        points = np.array(loop, dtype=np.float64)
+        area = np.dot(points[:, 0], np.roll(points[:, 1], -1)) - np.dot(points[:, 1], np.roll(points[:, 0], -1))
+        if area < 0:
+            return None  # Trou: pas représentable par un seul polygone
+        loops.append(loop)
+    return loops
+
+
+def _split_loops(mask):
+    """Régions à trous (toit d'un socle autour d'une tour): coupe le masque en deux le long
+    d'une ligne de la grille pour obtenir deux régions sans trou, sinon None
+    """
+    for axis in (0, 1):
+        for cut in range(1, mask.shape[axis]):
+            first, second = mask.copy(), mask.copy()
+            if axis == 0:
+                first[cut:], second[:cut] = False, False
+            else:
+                first[:, cut:], second[:, :cut] = False, False
+            first_loops = _mask_loops(first)
+            second_loops = _mask_loops(second) if first_loops is not None else None
+            if second_loops is not None:
+                return first_loops + second_loops
+    return None
+
+
+def _mask_rows(mask):
+    """Dernier repli: une bande par suite de cellules d'une même ligne v"""
+    loops = []
+    for j in range(mask.shape[1]):
+        column = np.concatenate(([False], mask[:, j], [False]))
+        changes = np.flatnonzero(column[1:] != column[:-1])
+        for start, stop in zip(changes[::2], changes[1::2]):
+            loop = [(i, j) for i in range(start, stop + 1)]
+            loop += [(i, j + 1) for i in range(stop, start - 1, -1)]
+            loops.append(loop)
+    return loops
+
+
+def union_mesh(boxes):
+    """Mesh fermé de l'union de boîtes alignées sur les axes (B, 6): x0, x1, y0, y1, z0, z1
+
+    Retourne (verts (N, 3), loops, totals) avec des normales sortantes.
+    """
+    axes, occupancy = _box_occupancy(boxes)
+    sizes = [len(axis) for axis in axes]
+    vertex_ids = {}
+    verts, loops, totals = [], [], []
+
+    def vertex(lattice):
+        index = vertex_ids.get(lattice)
+        if index is None:
+            index = vertex_ids[lattice] = len(verts)
+            verts.append([axes[a][lattice[a]] for a in range(3)])
+        return index
+
+    for axis in range(3):
+        # (u, v, axe) direct: contour trigonométrique en (u, v) = normale vers +axe
+        u_axis, v_axis = (axis + 1) % 3, (axis + 2) % 3
+        cells = np.moveaxis(occupancy, (u_axis, v_axis, axis), (0, 1, 2))
+        padded = np.pad(cells, ((0, 0), (0, 0), (1, 1)))
+        for plane in range(sizes[axis]):
+            below, above = padded[:, :, plane], padded[:, :, plane + 1]
+            for mask, outward in ((below & ~above, True), (above & ~below, False)):
+                if not mask.any():
+                    continue
+                face_loops = _mask_loops(mask)
+                if face_loops is None:
+                    face_loops = _split_loops(mask) or _mask_rows(mask)
+                for loop in face_loops:
+                    if not outward:
+                        loop = loop[::-1]
+                    for u, v in loop:
+                        lattice = [0, 0, 0]
+                        lattice[u_axis], lattice[v_axis], lattice[axis] = u, v, plane
+                        loops.append(vertex(tuple(lattice)))
+                    totals.append(len(loop))
+
+    verts = np.array(verts, dtype=np.float64).reshape(-1, 3)
+    return _drop_straight_vertices(verts, np.array(loops, dtype=np.int64), np.array(totals, dtype=np.int64))
+
+
+def _drop_straight_vertices(verts, loops, totals):
+    """Retire les sommets alignés dans toutes les faces qui les utilisent
+
+    Ils ne servent qu'à la grille: les garder multiplierait les triangles. Un
+    sommet qui est un coin d'au moins une face est conservé (pas de jonction en T).
+    """
+    starts = np.concatenate(([0], np.cumsum(totals)[:-1]))
+    face = np.repeat(np.arange(len(totals)), totals)
+    position = np.arange(len(loops)) - starts[face]
+    previous = loops[starts[face] + (position - 1) % totals[face]]
+    following = loops[starts[face] + (position + 1) % totals[face]]
+    turn = np.cross(verts[loops] - verts[previous], verts[following] - verts[loops])
+    corner = np.zeros(len(verts), dtype=bool)
+    corner[loops[np.linalg.norm(turn, axis=1) > 1e-12]] = True
+
+    keep = corner[loops]
+    totals = np.bincount(face[keep], minlength=len(totals))
+    used = np.flatnonzero(corner)
+    remap = np.full(len(verts), -1, dtype=np.int64)
+    remap[used] = np.arange(len(used))
+    return verts[used], remap[loops[keep]], totals
+
+
+def footprint_boxes(parts):
+    """Boîtes (B, 6) des empreintes ('box', cx, cy, largeur, profondeur, z_bas, hauteur, ...)"""
+    boxes = [(cx - width / 2, cx + width / 2, cy - depth / 2, cy + depth / 2, z, z + height)
+             for _, cx, cy, width, depth, z, height, *_ in parts]
+    return np.array(boxes, dtype=np.float64).reshape(-1, 6)
+
+
+def extrude_footprints(polygons, bottoms, tops, bottom_caps=True):
+    """Extrude N contours (N, K, 2) en sens trigonométrique entre bottoms et tops (N,)
+
+    Retourne (verts, loops, totals): par empreinte, le couvercle bas (optionnel),
+    le couvercle haut (n-gones) et K murs quads.
+    """
+    polygons = np.asarray(polygons, dtype=np.float64)
+    count, sides = polygons.shape[:2]
+    bottoms = np.broadcast_to(np.asarray(bottoms, dtype=np.float64), (count,))
+    tops = np.broadcast_to(np.asarray(tops, dtype=np.float64), (count,))
+
+    verts = np.empty((count, 2, sides, 3))
+    verts[:, :, :, :2] = polygons[:, None, :, :]
+    verts[:, 0, :, 2] = bottoms[:, None]
+    verts[:, 1, :, 2] = tops[:, None]
+
+    ring = np.arange(sides)
+    next_ring = (ring + 1) % sides
+    faces = [ring + sides, np.column_stack((ring, next_ring, next_ring + sides, ring + sides)).ravel()]
+    face_totals = [[sides], np.full(sides, 4)]
+    if bottom_caps:
+        faces.insert(0, ring[::-1])
+        face_totals.insert(0, [sides])
+    local_loops = np.concatenate(faces)
+    local_totals = np.concatenate(face_totals)
+
+    loops = (local_loops[None, :] + (np.arange(count) * 2 * sides)[:, None]).ravel()
+    return verts.reshape(-1, 3), loops, np.tile(local_totals, count)
@@ -0,0 +1,186 @@
+"""
+Tirage vectorisé des attributs de bâtiments (sans dépendance à bpy).
+
+choose_building_type et calculate_height_with_variation traitent un lot à la
+fois. Ici tous les lots sont tirés d'un coup: les règles de layout_rules sont
+compilées une fois en tables NumPy indexées par code (BUILDING_TYPES,
+ZONE_TYPES), poids cumulés par niveau de variété, puis chaque attribut est
+une passe vectorisée sur des tirages uniformes (N, k). Les règles sont les
+mêmes que la version par lot: repli vers un type simple si le lot est trop
+petit ou trop bas, ajustements commercial / industriel, bornes de hauteur.
+"""
+
+import random
+
+import numpy as np
+
+from .building_templates import TYPE_TEMPLATE_NAMES
+from .city_rng import keyed_uniform
+from .layout_rules import (
+    BUILDING_HEIGHT_FACTORS, BUILDING_TYPE_RULES, BUILDING_TYPES, DEFAULT_TYPE_WEIGHTS, VARIETY_TYPE_WEIGHTS,
+    ZONE_HEIGHT_FACTORS, ZONE_TYPES,
+)
+
+# Nombre de tirages uniformes consommés par lot
+TYPE_DRAWS = 4
+HEIGHT_DRAWS = 1
+FOOTPRINT_DRAWS = 2
+
+_CODE = {name: code for code, name in enumerate(BUILDING_TYPES)}
+_ZONE_CODE = {name: code for code, name in enumerate(ZONE_TYPES)}
+
+# Contraintes de taille et de hauteur par code de type
+MIN_SIZES = np.array([BUILDING_TYPE_RULES[name][1] for name in BUILDING_TYPES])
+MIN_HEIGHTS = np.array([BUILDING_TYPE_RULES[name][2] for name in BUILDING_TYPES])
+
+# Facteurs de hauteur par code de zone et par code de type (types sans facteur: NaN)
+ZONE_FACTORS = np.array([ZONE_HEIGHT_FACTORS[name] for name in ZONE_TYPES], dtype=np.float64)
+TYPE_FACTORS = np.array([BUILDING_HEIGHT_FACTORS.get(name, (np.nan, np.nan)) for name in BUILDING_TYPES])
+
+# Replis et ajustements de zone (mêmes listes que choose_building_type)
+FALLBACK_TYPES = np.array([_CODE['rectangular'], _CODE['tower'], _CODE['stepped']])
+INDUSTRIAL_TYPES = np.array([_CODE['rectangular'], _CODE['l_shaped']])
+
+# Gabarits d'empreinte (building_templates) et gabarit par défaut de chaque code de type
+FOOTPRINT_TEMPLATES = ('rectangular', 'l_shaped', 'u_shaped', 'f_shaped', 't_shaped', 'complex', 'cylinder', 'cone')
+TYPE_TEMPLATES = np.array([FOOTPRINT_TEMPLATES.index(TYPE_TEMPLATE_NAMES.get(name, 'rectangular'))
+                           for name in BUILDING_TYPES])
+
+
+def _cumulative_table(weights):
+    """(codes, poids cumulés) d'une répartition ((type, poids), ...)"""
+    codes = np.array([_CODE[name] for name, _ in weights])
+    return codes, np.cumsum([count for _, count in weights]).astype(np.float64)
+
+
+_TYPE_TABLES = {level: _cumulative_table(weights) for level, weights in VARIETY_TYPE_WEIGHTS.items()}
+_DEFAULT_TABLE = _cumulative_table(DEFAULT_TYPE_WEIGHTS)
+
+
+def lot_draws(count, stage, coords, seed=None, rng=random):
+    """Tirages uniformes (N, count) pour N lots
+
+    Avec seed, le tirage k du lot est keyed_uniform(seed, stage, *coords, draw=k + 1):
+    il ne dépend que des coordonnées du lot. Sinon un générateur NumPy est amorcé par rng.
+    """
+    coords = [np.asarray(coord).ravel() for coord in coords]
+    if seed is not None:
+        return np.stack([keyed_uniform(seed, stage, *coords, draw=draw) for draw in range(1, count + 1)], axis=-1)
+    generator = np.random.default_rng(rng.getrandbits(64))
+    return generator.random((len(coords[0]) if coords else 0, count))
+
+
+def _choose(table, uniforms):
+    codes, cumulative = table
+    return codes[np.searchsorted(cumulative, uniforms * cumulative[-1], side='right')]
+
+
+def sample_building_types(widths, depths, heights, zone_codes, variety, draws):
+    """Codes de types (N,) selon la variété, la taille du lot et la zone
+
+    variety: niveau de variété commun ou un niveau par lot; draws: tirages (N, TYPE_DRAWS).
+    """
+    widths, depths = np.asarray(widths, dtype=np.float64), np.asarray(depths, dtype=np.float64)
+    heights, zone_codes = np.asarray(heights, dtype=np.float64), np.asarray(zone_codes)
+    draws = np.asarray(draws, dtype=np.float64).reshape(len(widths), -1)
+
+    if np.ndim(variety) == 0:
+        types = _choose(_TYPE_TABLES.get(variety, _DEFAULT_TABLE), draws[:, 0])
+    else:
+        variety = np.asarray(variety)
+        types = np.empty(len(widths), dtype=np.int64)
+        for level in np.unique(variety):
+            mask = variety == level
+            types[mask] = _choose(_TYPE_TABLES.get(level, _DEFAULT_TABLE), draws[mask, 0])
+
+    # Dimensions insuffisantes: type plus simple
+    size = np.minimum(widths, depths)
+    unfit = (size < MIN_SIZES[types]) | (heights < MIN_HEIGHTS[types])
+    simple = np.where(size >= 3.0, FALLBACK_TYPES[(draws[:, 1] * len(FALLBACK_TYPES)).astype(np.int64)],
+                      _CODE['rectangular'])
+    types = np.where(unfit, simple, types)
+
+    # Ajustement selon le type de zone
+    commercial = (zone_codes == _ZONE_CODE['COMMERCIAL']) & np.isin(types, (_CODE['rectangular'], _CODE['stepped']))
+    industrial = (zone_codes == _ZONE_CODE['INDUSTRIAL']) & np.isin(types, (_CODE['tower'], _CODE['complex']))
+    commercial &= draws[:, 2] < 0.3  # 30% de chance
+    industrial &= draws[:, 2] < 0.5  # 50% de chance
+    types = np.where(commercial, _CODE['tower'], types)
+    types = np.where(industrial, INDUSTRIAL_TYPES[(draws[:, 3] * len(INDUSTRIAL_TYPES)).astype(np.int64)], types)
+    return types.astype(np.int8)
+
+
+def sample_heights(base_heights, max_floors, height_variation, zone_codes, draws, type_codes=None):
+    """Hauteurs (N,) autour de base_heights, bornées selon la zone (et le type si type_codes)
+
+    draws: tirages (N, HEIGHT_DRAWS). Mêmes bornes que calculate_height_with_variation.
+    """
+    base_heights = np.asarray(base_heights, dtype=np.float64)
+    zone_codes = np.asarray(zone_codes, dtype=np.int64)
+    draws = np.asarray(draws, dtype=np.float64).reshape(len(base_heights), -1)
+
+    factors = ZONE_FACTORS[zone_codes]
+    min_height = np.maximum(3, np.trunc(base_heights * factors[:, 0]))
+    max_height = np.minimum(max_floors * 3, np.trunc(base_heights * factors[:, 1]) + factors[:, 2])
+
+    if type_codes is not None:
+        type_factors = TYPE_FACTORS[np.asarray(type_codes, dtype=np.int64)]
+        typed = ~np.isnan(type_factors[:, 0])
+        min_height = np.where(typed, np.maximum(min_height, np.trunc(base_heights * type_factors[:, 0])), min_height)
+        max_height = np.where(typed, np.maximum(max_height, np.trunc(base_heights * type_factors[:, 1])), max_height)
+
+    heights = base_heights.copy()
+    if height_variation > 0:
+        # Décalage entier uniforme dans [-portée // 2, portée // 2] (bornes incluses, comme randint)
+        spread = np.trunc((max_height - min_height) * height_variation)
+        low, high = np.floor_divide(-spread, 2), np.floor_divide(spread, 2)
+        offsets = low + np.floor(draws[:, 0] * (high - low + 1))
+        heights = np.where(spread > 0, base_heights + offsets, base_heights)
+    return np.maximum(min_height, np.minimum(max_height, heights))
+
+
+def sample_footprints(type_codes, widths, depths, draws):
+    """Version vectorisée de building_templates.resolve_building
+
+    draws: tirages (N, FOOTPRINT_DRAWS). Retourne (codes de gabarit (N,) dans
+    FOOTPRINT_TEMPLATES, largeurs, profondeurs, ratios).
+    """
+    type_codes = np.asarray(type_codes, dtype=np.int64)
+    widths = np.array(widths, dtype=np.float64)
+    depths = np.array(depths, dtype=np.float64)
+    draws = np.asarray(draws, dtype=np.float64).reshape(len(type_codes), -1)
+    ratios = np.ones(len(type_codes))
+    templates = TYPE_TEMPLATES[type_codes]
+
+    is_type = {name: type_codes == code for name, code in _CODE.items()}
+    ratios = np.where(is_type['l_shaped'], 0.7 + 0.3 * draws[:, 0], ratios)
+    templates = np.where(is_type['u_shaped'] & (draws[:, 0] < 0.4), FOOTPRINT_TEMPLATES.index('f_shaped'), templates)
+
+    tower, stepped = is_type['tower'], is_type['stepped']
+    widths *= np.where(tower, 0.7 + 0.3 * draws[:, 0], np.where(stepped, 0.9 + 0.1 * draws[:, 0], 1.0))
+    depths *= np.where(tower, 0.7 + 0.3 * draws[:, 1], np.where(stepped, 0.9 + 0.1 * draws[:, 0], 1.0))
+
+    smallest, largest = np.minimum(widths, depths), np.maximum(widths, depths)
+    widths = np.where(is_type['circular'], smallest, np.where(is_type['pyramid'], largest, widths))
+    depths = np.where(is_type['circular'], smallest, np.where(is_type['pyramid'], largest, depths))
+    return templates.astype(np.int8), widths, depths, ratios
+
+
+def sample_buildings(widths, depths, base_heights, zone_codes, variety, max_floors, height_variation,
+                     draws, type_codes=None):
+    """Type, hauteur et variante d'empreinte de N lots en une passe
+
+    draws: tirages (N, HEIGHT_DRAWS + TYPE_DRAWS + FOOTPRINT_DRAWS) (voir lot_draws);
+    type_codes impose les types (mode de forme fixe). Retourne un dict de colonnes
+    'type', 'height', 'template' (code dans FOOTPRINT_TEMPLATES), 'width', 'depth', 'ratio'.
+    """
+    draws = np.asarray(draws, dtype=np.float64).reshape(len(np.asarray(widths)), -1)
+    heights = sample_heights(base_heights, max_floors, height_variation, zone_codes, draws[:, :HEIGHT_DRAWS])
+    if type_codes is None:
+        type_codes = sample_building_types(widths, depths, heights, zone_codes, variety,
+                                           draws[:, HEIGHT_DRAWS:HEIGHT_DRAWS + TYPE_DRAWS])
+    type_codes = np.broadcast_to(np.asarray(type_codes, dtype=np.int8), heights.shape)
+    templates, footprint_widths, footprint_depths, ratios = sample_footprints(
+        type_codes, widths, depths, draws[:, HEIGHT_DRAWS + TYPE_DRAWS:])
+    return {'type': type_codes, 'height': heights, 'template': templates,
+            'width': footprint_widths, 'depth': footprint_depths, 'ratio': ratios}
@@ -0,0 +1,233 @@
+"""
+Bibliothèque de gabarits de formes de bâtiments (sans dépendance à bpy).
+
+Les bâtiments en L, U/F, T et complexes étaient assemblés à partir de 2 ou 3
+cubes créés par opérateur puis fusionnés par bpy.ops.object.join. Ici chaque
+forme est décrite par ses empreintes et leurs niveaux de hauteur, fusionnés en
+un volume fermé (building_footprints), puis compilée une seule fois en tableaux
+de sommets et de faces normalisés (emprise [-0.5, 0.5]², hauteur [0, 1],
+origine au centre bas). Une instance
+n'est qu'une transformation affine du gabarit: échelle (largeur, profondeur,
+hauteur), rotation autour de Z et translation, plus un paramètre de variante
+(hauteur relative des sommets marqués "stretch", ex. l'aile secondaire du L).
+Des milliers d'instances d'un même gabarit s'obtiennent en une passe NumPy.
+"""
+
+import random
+
+import numpy as np
+
+# Parties des gabarits: ('box', cx, cy, largeur, profondeur, z_bas, hauteur, stretch)
+# ou ('cylinder', rayon_x, rayon_y, top_scale, segments), en unités normalisées.
+# stretch: la hauteur de la partie suit le paramètre de variante de l'instance.
+TEMPLATE_PARTS = {
+    'rectangular': (
+        ('box', 0.0, 0.0, 1.0, 1.0, 0.0, 1.0, False),
+    ),
+    'l_shaped': (
+        ('box', -0.15, -0.2, 0.7, 0.6, 0.0, 1.0, False),
+        ('box', 0.25, 0.3, 0.5, 0.4, 0.0, 1.0, True),
+    ),
+    'u_shaped': (
+        ('box', -0.375, 0.0, 0.25, 0.8, 0.0, 1.0, False),
+        ('box', 0.375, 0.0, 0.25, 0.8, 0.0, 1.0, False),
+        ('box', 0.0, 0.4, 0.5, 0.2, 0.0, 1.0, False),
+    ),
+    'f_shaped': (
+        ('box', -0.35, 0.0, 0.3, 1.0, 0.0, 1.0, False),
+        ('box', 0.15, 0.4, 0.7, 0.2, 0.7, 0.3, False),
+        ('box', 0.05, 0.4, 0.5, 0.2, 0.375, 0.25, False),
+    ),
+    't_shaped': (
+        ('box', 0.0, 0.35, 1.0, 0.3, 0.6, 0.4, False),
+        ('box', 0.0, -0.15, 0.3, 0.7, 0.0, 1.0, False),
+    ),
+    'complex': (
+        ('box', 0.0, 0.0, 1.0, 1.0, 0.0, 0.6, False),
+        ('box', 0.0, 0.0, 0.4, 0.4, 0.6, 0.8, False),
+    ),
+    'tiered': (
+        ('box', 0.0, 0.0, 1.0, 1.0, 0.0, 0.3, False),
+        ('box', 0.0, 0.0, 0.7, 0.7, 0.3, 0.7, False),
+    ),
+    'cylinder': (
+        ('cylinder', 0.5, 0.5, 1.0, 32),
+    ),
+    'cone': (
+        ('cylinder', 0.5, 0.5, 0.0, 32),
+    ),
+}
+
+# Altitude de pose des gabarits (les formes en cubes sont posées sur le trottoir)
+TEMPLATE_BASE_Z = {'cylinder': 0.0, 'cone': 0.0}
+DEFAULT_BASE_Z = 0.02
+
+# Hauteur relative de compilation des parties stretch (ratio de variante < 1 en pratique)
+STRETCH_NOMINAL = 0.85
+
+# Gabarit de chaque type de bâtiment hors variantes (tour et étagé: rectangulaire réduit)
+TYPE_TEMPLATE_NAMES = {
+    'l_shaped': 'l_shaped', 'u_shaped': 'u_shaped', 't_shaped': 't_shaped', 'complex': 'complex',
+    'circular': 'cylinder', 'elliptical': 'cylinder', 'pyramid': 'cone',
+}
+
+_compiled = {}
+
+
+class BuildingTemplate:
+    """Gabarit compilé: sommets normalisés (V, 3), masque stretch (V,), faces à plat"""
+
+    def __init__(self, name, verts, stretch, loops, totals, base_z=DEFAULT_BASE_Z):
+        self.name = name
+        self.verts = verts
+        self.stretch = stretch
+        self.loops = loops
+        self.totals = totals
+        self.base_z = base_z
+
+    @property
+    def vertex_count(self):
+        return len(self.verts)
+
+    @property
+    def face_count(self):
+        return len(self.totals)
+
+    def stamp(self, positions, sizes, rotations=None, ratios=None):
+        """Instancie le gabarit N fois: retourne (verts (N*V, 3), loops, totals)
+
+        positions (N, 2 ou 3): centre bas au sol (base_z est ajouté); sizes (N, 3):
+        largeur, profondeur, hauteur; rotations (N,) autour de Z; ratios (N,):
+        hauteur relative des parties stretch (1 par défaut).
+        """
+        positions = np.asarray(positions, dtype=np.float64)
+        positions = positions.reshape(len(positions), -1)
+        sizes = np.asarray(sizes, dtype=np.float64).reshape(-1, 3)
+        count = len(sizes)
+
+        verts = np.broadcast_to(self.verts, (count,) + self.verts.shape) * sizes[:, None, :]
+        if ratios is not None:
+            ratios = np.asarray(ratios, dtype=np.float64).reshape(-1)
+            verts[:, :, 2] *= np.where(self.stretch[None, :], ratios[:, None], 1.0)
+        if rotations is not None:
+            rotations = np.asarray(rotations, dtype=np.float64).reshape(-1)
+            cos_a, sin_a = np.cos(rotations)[:, None], np.sin(rotations)[:, None]
+            x, y = verts[:, :, 0].copy(), verts[:, :, 1]
+            verts[:, :, 0] = x * cos_a - y * sin_a
+            verts[:, :, 1] = x * sin_a + y * cos_a
+        verts[:, :, :2] += positions[:, None, :2]
+        verts[:, :, 2] += self.base_z + (positions[:, 2:3] if positions.shape[1] > 2 else 0.0)
+
+        loops = (self.loops[None, :] + (np.arange(count) * self.vertex_count)[:, None]).ravel()
+        totals = np.tile(self.totals, count)
+        return verts.reshape(-1, 3), loops, totals
+
+
+def compile_template(name, parts):
+    """Compile une liste de parties en BuildingTemplate
+
+    Les parties en boîtes sont fusionnées par building_footprints.union_mesh (mesh
+    fermé, sans faces internes); les parties stretch (posées au sol) sont
+    compilées à STRETCH_NOMINAL de leur hauteur pour garder leur propre niveau de toit.
+    """
+    from .building_footprints import extrude_footprints, footprint_boxes, union_mesh
+    from .mesh_batch import MeshBatch, regular_polygon
+
+    base_z = TEMPLATE_BASE_Z.get(name, DEFAULT_BASE_Z)
+    if all(part[0] == 'box' for part in parts):
+        boxes = footprint_boxes(parts)
+        stretched = np.array([part[7] for part in parts], dtype=bool)
+        boxes[stretched, 5] = boxes[stretched, 4] + (boxes[stretched, 5] - boxes[stretched, 4]) * STRETCH_NOMINAL
+        verts, loops, totals = union_mesh(boxes)
+        stretch = np.zeros(len(verts), dtype=bool)
+        for box in boxes[stretched]:
+            stretch |= (np.isclose(verts[:, 2], box[5]) &
+                        (verts[:, 0] >= box[0] - 1e-9) & (verts[:, 0] <= box[1] + 1e-9) &
+                        (verts[:, 1] >= box[2] - 1e-9) & (verts[:, 1] <= box[3] + 1e-9))
+        verts[stretch, 2] /= STRETCH_NOMINAL
+        return BuildingTemplate(name, verts, stretch, loops, totals, base_z)
+
+    batch = MeshBatch(f"template_{name}")
+    for _, radius_x, radius_y, top_scale, segments in parts:
+        if top_scale == 1.0:
+            # Empreinte polygonale extrudée (murs + couvercles)
+            batch.add_geometry(*extrude_footprints([regular_polygon(segments, radius_x, radius_y)], 0.0, 1.0))
+        else:
+            batch.add_cylinder(radius_x, radius_y, 1.0, segments=segments, top_scale=top_scale)
+    verts, loops, totals, _ = batch.arrays()
+    return BuildingTemplate(name, verts, np.zeros(len(verts), dtype=bool), loops, totals, base_z)
+
+
+def get_template(name):
+    """Gabarit compilé (mis en cache) par nom"""
+    template = _compiled.get(name)
+    if template is None:
+        template = _compiled[name] = compile_template(name, TEMPLATE_PARTS[name])
+    return template
+
+
+def nominal_template(building_type):
+    """(nom du gabarit, ratio) de la forme moyenne d'un type, sans tirage aléatoire
+
+    Sert aux gabarits partagés par toutes les instances (Geometry Nodes).
+    """
+    name = TYPE_TEMPLATE_NAMES.get(building_type, building_type if building_type in TEMPLATE_PARTS else 'rectangular')
+    return name, STRETCH_NOMINAL if get_template(name).stretch.any() else 1.0
+
+
+def resolve_building(building_type, width, depth, height, rng=random):
+    """Gabarit et paramètres d'instance d'un type de bâtiment
+
+    Reproduit les tirages aléatoires des générateurs par objet (aile du L, variante F,
+    proportions des tours et bâtiments étagés). Retourne (nom du gabarit, taille (3,), ratio).
+    """
+    ratio = 1.0
+    if building_type == 'l_shaped':
+        name = 'l_shaped'
+        ratio = rng.uniform(0.7, 1.0)
+    elif building_type == 'u_shaped':
+        name = 'f_shaped' if rng.random() < 0.4 else 'u_shaped'
+    elif building_type == 'tower':
+        name = 'rectangular'
+        width, depth = width * rng.uniform(0.7, 1.0), depth * rng.uniform(0.7, 1.0)
+    elif building_type == 'stepped':
+        name = 'rectangular'
+        base_scale = rng.uniform(0.9, 1.0)
+        width, depth = width * base_scale, depth * base_scale
+    elif building_type == 'circular':
+        name = 'cylinder'
+        width = depth = min(width, depth)
+    elif building_type == 'elliptical':
+        name = 'cylinder'
+    elif building_type == 'pyramid':
+        name = 'cone'
+        width = depth = max(width, depth)
+    elif building_type in TEMPLATE_PARTS:
+        name = building_type
+    else:
+        name = 'rectangular'
+    return name, (width, depth, height), ratio
+
+
+def stamp_buildings(template_names, positions, sizes, rotations=None, ratios=None):
+    """Géométrie de N bâtiments aux gabarits déjà choisis, une passe vectorisée par gabarit
+
+    template_names, sizes (N, 3) et ratios viennent de resolve_building ou du plan
+    (building_sampler.sample_buildings). Retourne une liste de (nom du gabarit,
+    indices des bâtiments, verts, loops, totals).
+    """
+    template_names = np.asarray(template_names)
+    positions = np.asarray(positions, dtype=np.float64)
+    positions = positions.reshape(len(positions), -1)
+    sizes = np.asarray(sizes, dtype=np.float64).reshape(-1, 3)
+    rotations = None if rotations is None else np.asarray(rotations, dtype=np.float64).reshape(-1)
+    ratios = np.ones(len(sizes)) if ratios is None else np.asarray(ratios, dtype=np.float64).reshape(-1)
+
+    stamped = []
+    for name in np.unique(template_names):
+        indices = np.flatnonzero(template_names == name)
+        verts, loops, totals = get_template(str(name)).stamp(
+            positions[indices], sizes[indices], None if rotations is None else rotations[indices], ratios[indices])
+        stamped.append((str(name), indices, verts, loops, totals))
+    return stamped
+
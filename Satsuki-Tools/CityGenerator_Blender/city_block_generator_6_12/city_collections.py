@@ -0,0 +1,156 @@
+"""
+Collections propres à la ville générée.
+
+Chaque objet généré est lié à une hiérarchie de collections dédiée
+(CityGen_City > Roads, Blocks, Buildings, Details). Le nettoyage supprime
+exactement ces objets, leurs meshes et leurs matériaux devenus orphelins avec
+bpy.data.batch_remove, sans parcourir la scène ni toucher aux autres objets.
+"""
+
+import functools
+
+import bpy
+
+from .city_log import log
+
+CITY_COLLECTION = "CityGen_City"
+CITY_PROP = "citygen_city"
+CHILD_COLLECTIONS = ('roads', 'blocks', 'buildings', 'details')
+
+# Catégorie d'émission -> collection enfant
+CATEGORY_COLLECTIONS = {
+    'roads': 'roads',
+    'intersections': 'roads',
+    'junctions': 'roads',
+    'sidewalks': 'blocks',
+    'blocks': 'blocks',
+    'buildings': 'buildings',
+    'details': 'details',
+}
+
+
+def _child_name(root_name, child):
+    return f"{root_name}_{child.capitalize()}"
+
+
+def ensure_city_collections(scene, root_name=CITY_COLLECTION):
+    """Crée (si besoin) la hiérarchie de collections de la ville et la retourne en dict"""
+    root = bpy.data.collections.get(root_name)
+    if root is None:
+        root = bpy.data.collections.new(root_name)
+        root[CITY_PROP] = True
+    if root.name not in scene.collection.children:
+        scene.collection.children.link(root)
+
+    collections = {'root': root}
+    for child in CHILD_COLLECTIONS:
+        name = _child_name(root_name, child)
+        collection = bpy.data.collections.get(name)
+        if collection is None:
+            collection = bpy.data.collections.new(name)
+            collection[CITY_PROP] = True
+        if collection.name not in root.children:
+            root.children.link(collection)
+        collections[child] = collection
+    return collections
+
+
+def category_collection(collections, category):
+    """Collection cible d'une catégorie d'émission (racine si inconnue)"""
+    return collections.get(CATEGORY_COLLECTIONS.get(category, ''), collections['root'])
+
+
+def _find_layer_collection(layer_collection, collection):
+    if layer_collection.collection == collection:
+        return layer_collection
+    for child in layer_collection.children:
+        found = _find_layer_collection(child, collection)
+        if found is not None:
+            return found
+    return None
+
+
+def activate_collection(context, collection):
+    """Rend la collection active: les objets créés par bpy.ops y sont liés"""
+    layer_collection = _find_layer_collection(context.view_layer.layer_collection, collection)
+    if layer_collection is not None:
+        context.view_layer.active_layer_collection = layer_collection
+    return layer_collection is not None
+
+
+def in_city_collection(func):
+    """Décorateur: func(context, ...) crée ses objets dans la collection de la ville
+
+    La collection active de l'utilisateur est restaurée à la fin, même en cas d'erreur.
+    """
+    @functools.wraps(func)
+    def wrapper(context, *args, **kwargs):
+        view_layer = context.view_layer
+        previous = view_layer.active_layer_collection
+        collections = ensure_city_collections(context.scene)
+        activate_collection(context, collections['root'])
+        try:
+            return func(context, *args, **kwargs)
+        finally:
+            try:
+                view_layer.active_layer_collection = previous
+            except (ReferenceError, RuntimeError, TypeError):
+                pass
+    return wrapper
+
+
+def city_objects(root_name=CITY_COLLECTION):
+    """Objets appartenant à la ville (toute la hiérarchie)"""
+    root = bpy.data.collections.get(root_name)
+    if root is None:
+        return []
+    return list(root.all_objects)
+
+
+def remove_city_objects(objects, materials=True):
+    """Supprime des objets ainsi que leurs meshes et matériaux devenus orphelins
+
+    materials=False garde les matériaux: une mise à jour incrémentale les a déjà
+    créés (ou récupérés) pour les objets qu'elle va émettre.
+    """
+    if not objects:
+        return 0
+    data_blocks = set()
+    used_materials = set()
+    for obj in objects:
+        if obj.data is not None:
+            data_blocks.add(obj.data)
+        if not materials:
+            continue
+        for slot in obj.material_slots:
+            if slot.material is not None:
+                used_materials.add(slot.material)
+        if obj.data is not None and hasattr(obj.data, 'materials'):
+            used_materials.update(mat for mat in obj.data.materials if mat is not None)
+
+    count = len(objects)
+    bpy.data.batch_remove(objects)
+    orphan_data = [data for data in data_blocks if data.users == 0]
+    if orphan_data:
+        bpy.data.batch_remove(orphan_data)
+    orphan_materials = [mat for mat in used_materials if mat.users == 0 and not mat.use_fake_user]
+    if orphan_materials:
+        bpy.data.batch_remove(orphan_materials)
+    return count
+
+
+def clear_city(scene=None, root_name=CITY_COLLECTION, remove_collections=True):
+    """Supprime tous les objets de la ville et, par défaut, ses collections"""
+    objects = city_objects(root_name)
+    count = remove_city_objects(objects)
+
+    if remove_collections:
+        root = bpy.data.collections.get(root_name)
+        if root is not None:
+            owned = [child for child in root.children_recursive if child.get(CITY_PROP)]
+            bpy.data.batch_remove(owned + [root])
+
+    if scene is not None and "citygen_plan" in scene:
+        del scene["citygen_plan"]
+    log.info("🧹 %s objets de ville supprimés", count)
+    return count
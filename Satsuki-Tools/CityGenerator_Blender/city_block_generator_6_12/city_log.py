@@ -0,0 +1,95 @@
+"""
+Journalisation à niveaux du City Block Generator (sans dépendance à bpy).
+
+Les messages utilisent le formatage paresseux "%": les arguments ne sont
+formatés que si le niveau est actif, un message désactivé ne coûte qu'une
+comparaison d'entiers. Les boucles chaudes peuvent aussi tester
+log.debug_enabled avant de préparer un message coûteux.
+"""
+
+import time
+
+SILENT = 0
+ERROR = 1
+WARNING = 2
+INFO = 3
+DEBUG = 4
+
+LEVEL_NAMES = {
+    'SILENT': SILENT,
+    'ERROR': ERROR,
+    'WARNING': WARNING,
+    'INFO': INFO,
+    'DEBUG': DEBUG,
+}
+
+
+class CityLogger:
+    """Journal à niveaux avec suivi de progression"""
+
+    def __init__(self, level=INFO):
+        self.level = level
+        self._progress_state = {}
+
+    def set_level(self, level):
+        """Accepte un entier ou un nom ('SILENT', 'ERROR', 'WARNING', 'INFO', 'DEBUG')"""
+        if isinstance(level, str):
+            level = LEVEL_NAMES.get(level.upper(), INFO)
+        self.level = level
+
+    @property
+    def debug_enabled(self):
+        return self.level >= DEBUG
+
+    @property
+    def info_enabled(self):
+        return self.level >= INFO
+
+    def _emit(self, message, args):
+        print(message % args if args else message)
+
+    def error(self, message, *args):
+        if self.level >= ERROR:
+            self._emit(message, args)
+
+    def warning(self, message, *args):
+        if self.level >= WARNING:
+            self._emit(message, args)
+
+    def info(self, message, *args):
+        if self.level >= INFO:
+            self._emit(message, args)
+
+    def debug(self, message, *args):
+        if self.level >= DEBUG:
+            self._emit(message, args)
+
+    def progress(self, label, done, total, step=10):
+        """Affiche l'avancement par paliers de step % (niveau INFO)"""
+        if self.level < INFO or total <= 0:
+            return
+        percent = int(done * 100 / total)
+        state = self._progress_state.get(label)
+        if state is None or done < state[1]:
+            state = [-step, 0, time.perf_counter()]
+            self._progress_state[label] = state
+        if percent - state[0] < step and done < total:
+            state[1] = done
+            return
+        state[0] = percent
+        state[1] = done
+        filled = percent // 5
+        elapsed = time.perf_counter() - state[2]
+        print(f"⏳ {label}: [{'#' * filled}{'.' * (20 - filled)}] {percent:3d}% ({done}/{total}) {elapsed:.1f}s")
+        if done >= total:
+            del self._progress_state[label]
+
+
+# Journal partagé par tous les modules du générateur
+log = CityLogger()
+
+
+def configure_from_scene(scene):
+    """Applique la verbosité choisie dans la scène (citygen_verbosity)"""
+    log.set_level(getattr(scene, 'citygen_verbosity', 'INFO'))
+    return log.level
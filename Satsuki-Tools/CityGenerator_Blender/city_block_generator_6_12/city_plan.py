@@ -0,0 +1,465 @@
+"""
+Modèle de plan de ville (CityPlan) sans dépendance à bpy.
+
+Le plan décrit toute la ville sous forme de tables en colonnes NumPy (blocs,
+routes, carrefours, jonctions, lots, bâtiments) au lieu de listes de
+dictionnaires. Il peut être calculé, mesuré et mis en cache hors de Blender;
+les émetteurs de plan_emitters.py le transforment ensuite en objets Blender.
+Avec une graine, chaque bloc et chaque lot tirent dans leur propre flux
+(city_rng.py): le plan est reproductible et un bloc peut être recalculé seul.
+"""
+
+import math
+import random
+
+import numpy as np
+
+from .building_sampler import FOOTPRINT_DRAWS, HEIGHT_DRAWS, TYPE_DRAWS, lot_draws, sample_buildings
+from .city_log import log
+from .city_rng import keyed_uniform, rng_for
+from .grid_layout import GridLayout, block_size_arrays
+from .layout_rules import BUILDING_TYPES, SHAPE_MODE_TYPES, ZONE_TYPES, generate_block_sizes
+from .road_crossings import find_road_crossings
+
+# Types de routes de la table roads
+ROAD_HORIZONTAL = 0
+ROAD_VERTICAL = 1
+ROAD_DIAGONAL = 2
+
+
+class ColumnTable:
+    """Table en colonnes: une liste par colonne pendant la construction, un tableau NumPy à la lecture"""
+
+    def __init__(self, columns):
+        self.dtypes = dict(columns)
+        self._buffers = {name: [] for name in self.dtypes}
+        self._arrays = None
+
+    def append(self, **values):
+        for name in self.dtypes:
+            self._buffers[name].append(values[name])
+        self._arrays = None
+        return len(self._buffers[next(iter(self.dtypes))]) - 1
+
+    def extend(self, **columns):
+        """Ajoute plusieurs lignes d'un coup (un tableau par colonne)"""
+        for name, dtype in self.dtypes.items():
+            self._buffers[name].extend(np.asarray(columns[name], dtype=dtype).tolist())
+        self._arrays = None
+
+    def _materialize(self):
+        if self._arrays is None:
+            self._arrays = {name: np.asarray(self._buffers[name], dtype=dtype)
+                            for name, dtype in self.dtypes.items()}
+        return self._arrays
+
+    def __len__(self):
+        return len(self._buffers[next(iter(self.dtypes))])
+
+    def __getitem__(self, name):
+        return self._materialize()[name]
+
+    def row(self, index):
+        """Retourne la ligne index sous forme de dict (valeurs Python)"""
+        arrays = self._materialize()
+        return {name: arrays[name][index].item() for name in self.dtypes}
+
+    def rows(self):
+        for index in range(len(self)):
+            yield self.row(index)
+
+    @property
+    def nbytes(self):
+        return sum(array.nbytes for array in self._materialize().values())
+
+    def to_lists(self):
+        """Colonnes sous forme de listes Python (sérialisables en JSON)"""
+        return {name: array.tolist() for name, array in self._materialize().items()}
+
+    def load_lists(self, data):
+        # Colonnes absentes (plan stocké par une version antérieure): zéros
+        length = max((len(values) for values in data.values()), default=0)
+        self._buffers = {name: list(data.get(name, [0] * length)) for name in self.dtypes}
+        self._arrays = None
+
+
+class CityPlan:
+    """Plan complet d'une ville en tables colonnes"""
+
+    def __init__(self, grid_width, grid_length, road_width):
+        self.grid_width = grid_width
+        self.grid_length = grid_length
+        self.road_width = road_width
+        self.zone_profiles = {}
+        self.seed = None
+        self.params = {}
+        self.blocks = ColumnTable((
+            ('i', np.int32), ('j', np.int32), ('x', np.float32), ('y', np.float32),
+            ('width', np.float32), ('depth', np.float32), ('zone', np.int8),
+        ))
+        self.roads = ColumnTable((
+            ('x', np.float32), ('y', np.float32), ('width', np.float32),
+            ('length', np.float32), ('rotation', np.float32), ('kind', np.int8),
+        ))
+        self.intersections = ColumnTable((
+            ('x', np.float32), ('y', np.float32), ('size', np.float32),
+        ))
+        # Croisements des diagonales avec les autres routes (road_crossings): largeur et angle des deux routes
+        self.junctions = ColumnTable((
+            ('x', np.float32), ('y', np.float32), ('width_a', np.float32), ('width_b', np.float32),
+            ('angle_a', np.float32), ('angle_b', np.float32),
+        ))
+        self.lots = ColumnTable((
+            ('block', np.int32), ('x', np.float32), ('y', np.float32),
+            ('width', np.float32), ('depth', np.float32),
+        ))
+        # template: code dans building_sampler.FOOTPRINT_TEMPLATES; footprint_*: emprise du gabarit
+        # (variantes tirées au plan), ratio: hauteur relative des parties stretch
+        self.buildings = ColumnTable((
+            ('lot', np.int32), ('block', np.int32), ('x', np.float32), ('y', np.float32),
+            ('width', np.float32), ('depth', np.float32), ('height', np.float32),
+            ('type', np.int8), ('zone', np.int8), ('template', np.int8),
+            ('footprint_width', np.float32), ('footprint_depth', np.float32), ('ratio', np.float32),
+        ))
+
+    def tables(self):
+        return {
+            'blocks': self.blocks, 'roads': self.roads, 'intersections': self.intersections,
+            'junctions': self.junctions, 'lots': self.lots, 'buildings': self.buildings,
+        }
+
+    @property
+    def nbytes(self):
+        return sum(table.nbytes for table in self.tables().values())
+
+    def to_dict(self):
+        """Plan sérialisable (paramètres + tables), pour le stocker dans le fichier .blend"""
+        return {
+            'grid_width': self.grid_width, 'grid_length': self.grid_length, 'road_width': self.road_width,
+            'seed': self.seed, 'params': dict(self.params),
+            'tables': {name: table.to_lists() for name, table in self.tables().items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        plan = cls(data['grid_width'], data['grid_length'], data['road_width'])
+        plan.seed = data.get('seed')
+        plan.params = dict(data.get('params', {}))
+        for name, table in plan.tables().items():
+            table.load_lists(data.get('tables', {}).get(name, {}))
+        return plan
+
+    def block_keys(self):
+        """Clé stable 'i_j' de chaque bloc"""
+        return [f"{i}_{j}" for i, j in zip(self.blocks['i'].tolist(), self.blocks['j'].tolist())]
+
+    def summary(self):
+        counts = ", ".join(f"{name}={len(table)}" for name, table in self.tables().items())
+        return f"CityPlan {self.grid_width}x{self.grid_length}: {counts} ({self.nbytes / 1024:.1f} Ko)"
+
+
+def plan_parameters_from_scene(scene):
+    """Lit les paramètres de plan depuis la scène (mêmes valeurs par défaut que generate_city)"""
+    def read_int(name, default):
+        try:
+            return int(getattr(scene, name, default))
+        except (TypeError, ValueError):
+            return default
+
+    def read_float(name, default):
+        try:
+            return float(getattr(scene, name, default))
+        except (TypeError, ValueError):
+            return default
+
+    seamless_roads = bool(getattr(scene, 'citygen_seamless_roads', True))
+    return {
+        'width': read_int('citygen_width', 5),
+        'length': read_int('citygen_length', 5),
+        'max_floors': read_int('citygen_max_floors', 8),
+        'road_width': read_float('citygen_road_width', 4.0),
+        'base_size': 10.0,
+        'block_variety': 'MEDIUM',
+        'district_mode': False,
+        'district_type': 'MIXED',
+        'commercial_ratio': 0.2,
+        'residential_ratio': 0.6,
+        'industrial_ratio': 0.2,
+        'sidewalk_width': 0.0 if seamless_roads else 1.0,
+        'buildings_per_block': read_int('citygen_buildings_per_block', 1),
+        'building_variety': getattr(scene, 'citygen_building_variety', 'MEDIUM'),
+        'height_variation': read_float('citygen_height_variation', 0.5),
+        'shape_mode': 'AUTO',
+        'enable_intersections': True,
+        'intersection_size_factor': 1.2,
+        'enable_diagonal_roads': False,
+        'diagonal_road_frequency': 30.0,
+        'seed': read_int('citygen_seed', 0),
+    }
+
+
+def plan_city(width, length, max_floors=8, road_width=4.0, base_size=10.0, block_variety='MEDIUM',
+              district_mode=False, district_type='MIXED', commercial_ratio=0.2, residential_ratio=0.6,
+              industrial_ratio=0.2, sidewalk_width=0.0, buildings_per_block=1, building_variety='MEDIUM',
+              height_variation=0.5, shape_mode='AUTO', enable_intersections=True, intersection_size_factor=1.2,
+              enable_diagonal_roads=False, diagonal_road_frequency=30.0, regen_only=False, rng=random, seed=None,
+              building_seed=None):
+    """Calcule le plan complet d'une ville en grille (routes traversantes, blocs, lots, bâtiments)
+
+    Avec seed, tous les tirages sont indexés par (seed, étape, i, j, lot) et rng est ignoré.
+    building_seed (par défaut seed) ne concerne que les bâtiments: le changer redessine
+    les bâtiments sans toucher aux blocs ni aux routes.
+    """
+    params = {name: value for name, value in locals().items() if name != 'rng'}
+    block_sizes = generate_block_sizes(
+        width, length, base_size, block_variety, district_mode,
+        commercial_ratio, residential_ratio, industrial_ratio, district_type, rng, seed
+    )
+    if not block_sizes:
+        return None
+
+    plan = CityPlan(width, length, road_width)
+    plan.seed = seed
+    plan.params = params
+    if building_seed is None:
+        building_seed = seed
+    layout = GridLayout(*block_size_arrays(block_sizes), road_width)
+    widths, depths = layout.widths, layout.depths
+    zones = [[block['zone_type'] for block in row] for row in block_sizes]
+    for row in block_sizes:
+        for block in row:
+            plan.zone_profiles.setdefault(block['zone_type'], block['zone_info'])
+
+    # Routes traversant toute la grille
+    for x, y, road_length in zip(*layout.horizontal_roads()):
+        plan.roads.append(x=x, y=y, width=road_width, length=road_length, rotation=0.0, kind=ROAD_HORIZONTAL)
+    for x, y, road_length in zip(*layout.vertical_roads()):
+        plan.roads.append(x=x, y=y, width=road_width, length=road_length, rotation=0.0, kind=ROAD_VERTICAL)
+
+    # Blocs
+    for i in range(width):
+        for j in range(length):
+            plan.blocks.append(i=i, j=j, x=layout.block_x[i, j], y=layout.block_y[i, j],
+                               width=widths[i, j], depth=depths[i, j], zone=ZONE_TYPES.index(zones[i][j]))
+
+    # Lots et bâtiments de tous les blocs en une passe
+    if not regen_only:
+        _plan_buildings(plan, layout.lot_rects(buildings_per_block, sidewalk_width), max_floors,
+                        buildings_per_block, building_variety, height_variation, shape_mode, rng, building_seed,
+                        seamless=sidewalk_width <= 0)
+
+    if enable_intersections:
+        size = road_width * intersection_size_factor
+        for x, y in zip(*(centers.ravel() for centers in layout.intersections())):
+            plan.intersections.append(x=x, y=y, size=size)
+
+    if enable_diagonal_roads and diagonal_road_frequency > 0:
+        # Diagonales entre centres de blocs voisins (sud-ouest -> nord-est puis nord-ouest -> sud-est)
+        for step in (1, -1):
+            if seed is not None:
+                # Tirages vectorisés: une chance par bloc, indépendante de l'ordre de parcours
+                chances = keyed_uniform(seed, 'diagonal', np.arange(width)[:, None], np.arange(length)[None, :],
+                                        step, high=100.0)
+            for i in range(width - 1):
+                for j in (range(length - 1) if step == 1 else range(1, length)):
+                    chance = chances[i, j] if seed is not None else rng.random() * 100
+                    if chance < diagonal_road_frequency:
+                        x1 = layout.block_x[i, j]
+                        y1 = layout.block_y[i, j]
+                        x2 = layout.block_x[i + 1, j + step]
+                        y2 = layout.block_y[i + 1, j + step]
+                        plan.roads.append(x=(x1 + x2) / 2, y=(y1 + y2) / 2, width=road_width * 0.7,
+                                          length=math.hypot(x2 - x1, y2 - y1),
+                                          rotation=math.atan2(y2 - y1, x2 - x1), kind=ROAD_DIAGONAL)
+        _plan_junctions(plan, cell_size=float(layout.column_widths.mean()) + road_width)
+
+    log.info("📐 %s", plan.summary())
+    return plan
+
+
+def road_polylines(plan):
+    """Lignes médianes [(début), (fin)] de chaque route de la table roads"""
+    polylines = []
+    for x, y, length, rotation, kind in zip(*(plan.roads[name].tolist()
+                                              for name in ('x', 'y', 'length', 'rotation', 'kind'))):
+        if kind == ROAD_HORIZONTAL:
+            dx, dy = length / 2, 0.0
+        elif kind == ROAD_VERTICAL:
+            dx, dy = 0.0, length / 2
+        else:
+            dx, dy = math.cos(rotation) * length / 2, math.sin(rotation) * length / 2
+        polylines.append([(x - dx, y - dy), (x + dx, y + dy)])
+    return polylines
+
+
+def _plan_junctions(plan, cell_size=None):
+    """Ajoute au plan les jonctions des diagonales avec la grille et entre elles
+
+    Les croisements de la grille sont déjà couverts par les carrefours (table intersections).
+    """
+    kinds = ['diagonal' if kind == ROAD_DIAGONAL else 'grid' for kind in plan.roads['kind'].tolist()]
+    if 'diagonal' not in kinds:
+        return
+    crossings = find_road_crossings(road_polylines(plan), plan.roads['width'].tolist(), kinds, cell_size=cell_size)
+    for crossing in crossings:
+        (x, y), (width_a, width_b) = crossing['point'], crossing['widths']
+        (ax, ay), (bx, by) = crossing['directions']
+        plan.junctions.append(x=x, y=y, width_a=width_a, width_b=width_b,
+                              angle_a=math.atan2(ay, ax), angle_b=math.atan2(by, bx))
+
+
+def _block_base_heights(plan, max_floors, rng, seed=None):
+    """Hauteur de base (W, L) de chaque bloc selon le profil de sa zone"""
+    heights = np.empty((plan.grid_width, plan.grid_length))
+    zone_codes = plan.blocks['zone'].reshape(heights.shape)
+    for i in range(plan.grid_width):
+        for j in range(plan.grid_length):
+            block_rng = rng_for(seed, rng, 'block_height', i, j)
+            zone_info = plan.zone_profiles.get(ZONE_TYPES[zone_codes[i, j]], {})
+            if zone_info:
+                min_floors = zone_info.get('min_floors', 1)
+                zone_max_floors = max(min_floors, int(max_floors * zone_info.get('max_floors_multiplier', 1.0)))
+                heights[i, j] = block_rng.randint(min_floors, zone_max_floors) * 3
+            else:
+                heights[i, j] = max(3, block_rng.randint(max(1, max_floors // 4), max_floors) * 3)
+    return heights
+
+
+def _plan_buildings(plan, lots, max_floors, buildings_per_block, building_variety, height_variation,
+                    shape_mode, rng, seed=None, seamless=False):
+    """Ajoute au plan les lots et bâtiments de tous les blocs
+
+    lots contient les tableaux (x, y, largeur, profondeur) de forme (W, L, n) de
+    GridLayout.lot_rects. Hauteurs, types et variantes de gabarit sont tirés pour tous
+    les lots d'un coup (building_sampler); avec une graine, les tirages d'un lot restent
+    indexés par (i, j, lot). seamless (routes sans trottoir) colle les bâtiments d'un
+    bloc les uns aux autres: leurs murs mitoyens coïncident et sont retirés par face_culling.
+    """
+    shape = lots[0].shape
+    lot_x, lot_y, sub_width, sub_depth = (np.asarray(rect, dtype=np.float64).ravel() for rect in lots)
+    i, j, lot = (index.ravel() for index in np.indices(shape))
+    # Les blocs sont rangés i puis j: index de bloc = i * longueur + j
+    blocks = i * shape[1] + j
+    first_lot = len(plan.lots)
+    plan.lots.extend(block=blocks, x=lot_x, y=lot_y, width=sub_width, depth=sub_depth)
+
+    zone_codes = plan.blocks['zone'][blocks]
+    base_heights = _block_base_heights(plan, max_floors, rng, seed)[i, j]
+    draws = lot_draws(HEIGHT_DRAWS + TYPE_DRAWS + FOOTPRINT_DRAWS, 'lot', (i, j, lot), seed, rng)
+
+    margin = 0.5 if buildings_per_block > 1 and not seamless else 0.0
+    final_width = np.maximum(0.5, sub_width - margin)
+    final_depth = np.maximum(0.5, sub_depth - margin)
+
+    building_type = SHAPE_MODE_TYPES.get(shape_mode)
+    sampled = sample_buildings(final_width, final_depth, base_heights, zone_codes, building_variety, max_floors,
+                               height_variation, draws,
+                               None if building_type is None else BUILDING_TYPES.index(building_type))
+
+    built = sampled['height'] > 0
+    plan.buildings.extend(lot=first_lot + np.flatnonzero(built), block=blocks[built], x=lot_x[built], y=lot_y[built],
+                          width=final_width[built], depth=final_depth[built], height=sampled['height'][built],
+                          type=sampled['type'][built], zone=zone_codes[built], template=sampled['template'][built],
+                          footprint_width=sampled['width'][built], footprint_depth=sampled['depth'][built],
+                          ratio=sampled['ratio'][built])
+
+
+# Catégories d'objets émis et table du plan correspondante
+PLAN_CATEGORIES = (
+    ('roads', 'roads'),
+    ('sidewalks', 'blocks'),
+    ('buildings', 'buildings'),
+    ('intersections', 'intersections'),
+    ('junctions', 'junctions'),
+)
+
+# Précision de comparaison des plans (1 mm)
+DIFF_DECIMALS = 3
+
+
+def _signature(*values):
+    return tuple(round(float(value), DIFF_DECIMALS) for value in values)
+
+
+def _indexed_entries(table, shape_columns):
+    """{clé: (forme, position, index)} pour une table indexée par numéro de ligne"""
+    arrays = {name: table[name].tolist() for name in ('x', 'y') + shape_columns}
+    return {
+        str(index): (_signature(*(arrays[name][index] for name in shape_columns)),
+                     _signature(arrays['x'][index], arrays['y'][index]), [index])
+        for index in range(len(table))
+    }
+
+
+def _block_entries(plan):
+    """{clé 'i_j': (forme, position, index)} des blocs"""
+    keys = plan.block_keys()
+    arrays = {name: plan.blocks[name].tolist() for name in ('x', 'y', 'width', 'depth', 'zone')}
+    return {
+        key: (_signature(arrays['width'][index], arrays['depth'][index], arrays['zone'][index]),
+              _signature(arrays['x'][index], arrays['y'][index]), [index])
+        for index, key in enumerate(keys)
+    }
+
+
+def _building_entries(plan):
+    """{clé 'i_j': (bâtiments relatifs au bloc, position du bloc, index)} des bâtiments groupés par bloc"""
+    keys = plan.block_keys()
+    block_x = plan.blocks['x'].tolist()
+    block_y = plan.blocks['y'].tolist()
+    shape_columns = ('width', 'depth', 'height', 'type', 'zone', 'template', 'footprint_width', 'footprint_depth',
+                     'ratio')
+    columns = {name: plan.buildings[name].tolist() for name in ('block', 'x', 'y') + shape_columns}
+    grouped = {}
+    for index, block in enumerate(columns['block']):
+        grouped.setdefault(block, []).append(index)
+
+    entries = {}
+    for block, indices in grouped.items():
+        shape = tuple(_signature(columns['x'][index] - block_x[block], columns['y'][index] - block_y[block],
+                                 *(columns[name][index] for name in shape_columns))
+                      for index in indices)
+        entries[keys[block]] = (shape, _signature(block_x[block], block_y[block]), indices)
+    return entries
+
+
+def _diff_entries(old_entries, new_entries):
+    created = []
+    removed = []
+    moved = {}
+    for key, (shape, position, indices) in new_entries.items():
+        old = old_entries.get(key)
+        if old is None:
+            created.extend(indices)
+        elif old[0] != shape:
+            removed.append(key)
+            created.extend(indices)
+        elif old[1] != position:
+            moved[key] = (position[0] - old[1][0], position[1] - old[1][1])
+    removed.extend(key for key in old_entries if key not in new_entries)
+    return {'create': sorted(created), 'remove': removed, 'move': moved}
+
+
+def diff_plans(old, new):
+    """Compare deux plans et retourne, par catégorie, les éléments à créer, supprimer ou déplacer
+
+    Routes, carrefours et jonctions sont indexés par numéro de ligne, trottoirs et bâtiments
+    par bloc (i, j). Les bâtiments sont comparés relativement à leur bloc: un bloc
+    simplement décalé (routes élargies) déplace ses bâtiments sans les recréer.
+    'create' contient des index de lignes du nouveau plan, 'remove' et 'move' des clés.
+    """
+    road_shape = ('width', 'length', 'rotation', 'kind')
+    junction_shape = ('width_a', 'width_b', 'angle_a', 'angle_b')
+    return {
+        'roads': _diff_entries(_indexed_entries(old.roads, road_shape), _indexed_entries(new.roads, road_shape)),
+        'sidewalks': _diff_entries(_block_entries(old), _block_entries(new)),
+        'buildings': _diff_entries(_building_entries(old), _building_entries(new)),
+        'intersections': _diff_entries(_indexed_entries(old.intersections, ('size',)),
+                                       _indexed_entries(new.intersections, ('size',))),
+        'junctions': _diff_entries(_indexed_entries(old.junctions, junction_shape),
+                                   _indexed_entries(new.junctions, junction_shape)),
+    }
+
+
+def diff_is_empty(diff):
+    return not any(changes['create'] or changes['remove'] or changes['move'] for changes in diff.values())
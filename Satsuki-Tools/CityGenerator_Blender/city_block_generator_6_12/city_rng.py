@@ -0,0 +1,128 @@
+"""
+Générateur aléatoire hiérarchique à compteur (sans dépendance à bpy).
+
+Chaque tirage est une fonction pure de (graine, étape, i, j, lot, ...): la clé
+est obtenue en mélangeant ces coordonnées avec splitmix64, puis le flux est
+produit en hachant (clé, compteur). Le contenu d'un bloc ne dépend donc que de
+ses coordonnées, ce qui permet de générer les blocs dans n'importe quel ordre,
+de régénérer un seul bloc ou de mettre un résultat en cache. Le module random
+global n'est jamais touché.
+"""
+
+import random
+import zlib
+
+import numpy as np
+
+MASK64 = 0xFFFFFFFFFFFFFFFF
+GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+_MIX_1 = 0xBF58476D1CE4E5B9
+_MIX_2 = 0x94D049BB133111EB
+_TO_UNIT = 1.0 / (1 << 53)
+
+
+def mix64(value):
+    """Finaliseur splitmix64: mélange un entier 64 bits"""
+    value = (value + GOLDEN_GAMMA) & MASK64
+    value = ((value ^ (value >> 30)) * _MIX_1) & MASK64
+    value = ((value ^ (value >> 27)) * _MIX_2) & MASK64
+    return value ^ (value >> 31)
+
+
+def stage_id(stage):
+    """Identifiant stable d'une étape de génération (nom ou entier)"""
+    if isinstance(stage, str):
+        return zlib.crc32(stage.encode('utf-8'))
+    return int(stage) & MASK64
+
+
+def derive_key(seed, stage, *coords):
+    """Clé 64 bits de (graine, étape, coordonnées...)"""
+    key = mix64((int(seed) & MASK64) ^ stage_id(stage))
+    for coord in coords:
+        key = mix64(key ^ (int(coord) & MASK64))
+    return key
+
+
+class KeyedRandom(random.Random):
+    """random.Random à compteur: le n-ième tirage vaut hash(clé, n)
+
+    Toutes les méthodes de random.Random (randint, uniform, choice, shuffle...)
+    sont disponibles car elles reposent sur random() et getrandbits().
+    """
+
+    def __init__(self, key=0):
+        self._key = 0
+        self._counter = 0
+        super().__init__(key)
+
+    def seed(self, a=None, version=2):
+        self._key = (int(a) if a is not None else random.getrandbits(64)) & MASK64
+        self._counter = 0
+
+    def _next64(self):
+        self._counter += 1
+        return mix64((self._key + self._counter * GOLDEN_GAMMA) & MASK64)
+
+    def random(self):
+        return (self._next64() >> 11) * _TO_UNIT
+
+    def getrandbits(self, k):
+        if k < 0:
+            raise ValueError("Le nombre de bits doit être positif")
+        bits = 0
+        filled = 0
+        while filled < k:
+            bits |= self._next64() << filled
+            filled += 64
+        return bits & ((1 << k) - 1)
+
+    def getstate(self):
+        return (self._key, self._counter)
+
+    def setstate(self, state):
+        self._key, self._counter = state
+
+
+def keyed_rng(seed, stage, *coords):
+    """Flux aléatoire indépendant pour (graine, étape, coordonnées...)"""
+    return KeyedRandom(derive_key(seed, stage, *coords))
+
+
+def rng_for(seed, fallback, stage, *coords):
+    """Flux indexé si une graine est fournie, sinon le générateur séquentiel fallback"""
+    if seed is None:
+        return fallback
+    return keyed_rng(seed, stage, *coords)
+
+
+def _mix64_array(values):
+    """Version NumPy de mix64 (uint64, débordements modulo 2**64 voulus)"""
+    values = values + np.uint64(GOLDEN_GAMMA)
+    values = (values ^ (values >> np.uint64(30))) * np.uint64(_MIX_1)
+    values = (values ^ (values >> np.uint64(27))) * np.uint64(_MIX_2)
+    return values ^ (values >> np.uint64(31))
+
+
+def keyed_uniform(seed, stage, *coords, draw=1, low=0.0, high=1.0):
+    """Version vectorisée: tirage numéro draw du flux de chaque jeu de coordonnées
+
+    Les coordonnées peuvent être des tableaux (diffusés entre eux); le résultat
+    est identique à keyed_rng(seed, stage, *coords) tiré draw fois.
+    """
+    arrays = np.broadcast_arrays(*[np.asarray(coord, dtype=np.int64) for coord in coords]) if coords else []
+    shape = arrays[0].shape if coords else ()
+    key = np.full(shape, mix64((int(seed) & MASK64) ^ stage_id(stage)), dtype=np.uint64)
+    counter = np.uint64((draw * GOLDEN_GAMMA) & MASK64)
+    # Les scalaires NumPy (coordonnées 0-d) signalent les débordements, voulus ici
+    with np.errstate(over='ignore'):
+        for coord in arrays:
+            key = _mix64_array(key ^ coord.astype(np.uint64))
+        values = _mix64_array(key + counter)
+    unit = (values >> np.uint64(11)).astype(np.float64) * _TO_UNIT
+    return low + (high - low) * unit
+
+
+def new_seed():
+    """Tire une nouvelle graine positive (pour une propriété Blender 31 bits)"""
+    return random.SystemRandom().randint(1, 2 ** 31 - 1)
@@ -0,0 +1,148 @@
+"""
+Shader partagé de la ville.
+
+Un seul matériau (CityGen_Shader) pour tous les éléments: la couleur, la rugosité
+et la zone viennent des attributs du mesh (écrits en bloc par MeshBatch), des
+attributs d'instance (nuage de points Geometry Nodes) ou, à défaut, de la couleur
+d'objet (Object.color) et de la propriété citygen_roughness de l'objet. Plus
+besoin d'un matériau par zone, par hauteur ou par couleur: la géométrie fusionnée
+ou instanciée garde ses couleurs sans jongler avec les slots de matériaux.
+
+Convention: l'alpha de l'attribut citygen_color vaut 1 là où une couleur a été
+écrite, 0 ailleurs (la couleur d'objet s'applique alors).
+"""
+
+import bpy
+import numpy as np
+
+from .city_log import log
+
+SHADER_NAME = "CityGen_Shader"
+COLOR_ATTR = "citygen_color"
+ROUGHNESS_ATTR = "citygen_roughness"
+ZONE_ATTR = "citygen_zone"
+DEFAULT_ROUGHNESS = 0.5
+
+# Aspect de chaque zone en mode district: (couleur, rugosité)
+ZONE_LOOKS = {
+    'COMMERCIAL': ((0.3, 0.8, 0.0), 0.1),   # Vert pomme foncé
+    'RESIDENTIAL': ((0.5, 1.0, 0.0), 0.3),  # Vert pomme
+    'INDUSTRIAL': ((0.7, 1.0, 0.2), 0.5),   # Vert pomme clair
+}
+
+
+def zone_look(zone_type):
+    """(couleur, rugosité, index de zone) d'une zone, aspect résidentiel par défaut
+
+    Le résultat se passe tel quel à set_look(*look) des lots (MeshBatch, nuage de points).
+    """
+    from .city_plan import ZONE_TYPES
+
+    color, roughness = ZONE_LOOKS.get(zone_type, ZONE_LOOKS['RESIDENTIAL'])
+    return color, roughness, ZONE_TYPES.index(zone_type) if zone_type in ZONE_TYPES else -1
+
+
+def _attribute_node(nodes, attr_name, attribute_type, location):
+    node = nodes.new('ShaderNodeAttribute')
+    node.attribute_name = attr_name
+    node.attribute_type = attribute_type
+    node.location = location
+    return node
+
+
+def _mix(nodes, links, factor, socket_a, socket_b, location):
+    """Mélange linéaire a -> b selon factor (couleurs comme valeurs scalaires)"""
+    node = nodes.new('ShaderNodeMixRGB')
+    node.location = location
+    links.new(factor, node.inputs[0])
+    links.new(socket_a, node.inputs[1])
+    links.new(socket_b, node.inputs[2])
+    return node.outputs[0]
+
+
+def _build_shader_tree(mat):
+    nodes = mat.node_tree.nodes
+    links = mat.node_tree.links
+    nodes.clear()
+
+    output = nodes.new('ShaderNodeOutputMaterial')
+    output.location = (900, 0)
+    principled = nodes.new('ShaderNodeBsdfPrincipled')
+    principled.location = (600, 0)
+    links.new(principled.outputs[0], output.inputs['Surface'])
+
+    # Niveau objet: Object.color et propriété personnalisée citygen_roughness
+    object_info = nodes.new('ShaderNodeObjectInfo')
+    object_info.location = (-600, 200)
+    object_roughness = _attribute_node(nodes, ROUGHNESS_ATTR, 'OBJECT', (-600, -200))
+
+    # Niveau instance (nuage de points) puis niveau géométrie (faces fusionnées)
+    instance_color = _attribute_node(nodes, COLOR_ATTR, 'INSTANCER', (-400, 300))
+    instance_roughness = _attribute_node(nodes, ROUGHNESS_ATTR, 'INSTANCER', (-400, -300))
+    geometry_color = _attribute_node(nodes, COLOR_ATTR, 'GEOMETRY', (-200, 300))
+    geometry_roughness = _attribute_node(nodes, ROUGHNESS_ATTR, 'GEOMETRY', (-200, -300))
+
+    color = _mix(nodes, links, instance_color.outputs['Alpha'], object_info.outputs['Color'],
+                 instance_color.outputs['Color'], (0, 200))
+    color = _mix(nodes, links, geometry_color.outputs['Alpha'], color, geometry_color.outputs['Color'], (200, 200))
+    roughness = _mix(nodes, links, instance_color.outputs['Alpha'], object_roughness.outputs['Fac'],
+                     instance_roughness.outputs['Fac'], (0, -200))
+    roughness = _mix(nodes, links, geometry_color.outputs['Alpha'], roughness, geometry_roughness.outputs['Fac'],
+                     (200, -200))
+    links.new(color, principled.inputs['Base Color'])
+    links.new(roughness, principled.inputs['Roughness'])
+
+    # Zone exposée en AOV pour les masques de compositing
+    zone = _attribute_node(nodes, ZONE_ATTR, 'GEOMETRY', (600, -400))
+    try:
+        aov = nodes.new('ShaderNodeOutputAOV')
+        aov.location = (900, -400)
+        aov.name = aov.label = ZONE_ATTR
+        if hasattr(aov, 'aov_name'):
+            aov.aov_name = ZONE_ATTR
+        links.new(zone.outputs['Fac'], aov.inputs['Value'])
+    except RuntimeError:
+        pass
+
+
+def ensure_city_shader():
+    """Retourne le matériau partagé de la ville (construit une seule fois)"""
+    mat = bpy.data.materials.get(SHADER_NAME)
+    if mat is not None:
+        return mat
+    try:
+        mat = bpy.data.materials.new(SHADER_NAME)
+        mat.use_nodes = True
+        _build_shader_tree(mat)
+        mat.diffuse_color = (0.8, 0.8, 0.8, 1.0)
+        log.info("🎨 Shader de ville '%s' créé", SHADER_NAME)
+        return mat
+    except Exception as e:
+        log.error("Erreur lors de la création du shader de ville: %s", e)
+        return mat
+
+
+def set_object_look(obj, color, roughness=DEFAULT_ROUGHNESS, zone_type=None, material=None):
+    """Applique le shader partagé à un objet et écrit sa couleur / rugosité d'objet"""
+    material = material or ensure_city_shader()
+    if obj.data is not None and hasattr(obj.data, 'materials'):
+        obj.data.materials.clear()
+        obj.data.materials.append(material)
+    obj.color = (*color[:3], 1.0)
+    obj[ROUGHNESS_ATTR] = float(roughness)
+    if zone_type is not None:
+        obj["citygen_zone"] = zone_type
+    return material
+
+
+def write_look_attributes(mesh, domain, rgba, roughness, zones):
+    """Écrit en bloc les attributs couleur / rugosité / zone d'un mesh (foreach_set)"""
+    for attr_name, attr_type, key, values in (
+        (COLOR_ATTR, 'FLOAT_COLOR', 'color', rgba),
+        (ROUGHNESS_ATTR, 'FLOAT', 'value', roughness),
+        (ZONE_ATTR, 'INT', 'value', zones),
+    ):
+        attribute = mesh.attributes.get(attr_name)
+        if attribute is None:
+            attribute = mesh.attributes.new(attr_name, attr_type, domain)
+        attribute.data.foreach_set(key, np.ascontiguousarray(values).ravel())
@@ -0,0 +1,154 @@
+"""
+Régénération incrémentale de la ville.
+
+Le dernier plan émis est stocké dans la scène (propriété JSON citygen_plan,
+sauvegardée dans le fichier .blend). Une mise à jour recalcule le plan avec les
+paramètres courants et la même graine, le compare à l'ancien (diff_plans) et ne
+touche que les éléments concernés: changer le nombre d'étages ne recrée que les
+bâtiments, élargir les routes recrée les routes et déplace les blocs existants.
+"""
+
+import json
+
+import bpy
+
+from .city_collections import city_objects, ensure_city_collections, in_city_collection, remove_city_objects
+from .city_log import log
+from .city_plan import PLAN_CATEGORIES, CityPlan, diff_is_empty, diff_plans, plan_city, plan_parameters_from_scene
+
+PLAN_PROP = "citygen_plan"
+
+
+def save_plan(scene, plan, mesh_backend):
+    """Stocke le plan et le backend utilisé dans la scène"""
+    data = plan.to_dict()
+    data['mesh_backend'] = mesh_backend
+    scene[PLAN_PROP] = json.dumps(data, separators=(',', ':'))
+
+
+def load_plan(scene):
+    """Retourne (plan, backend) du dernier plan émis, ou (None, None)"""
+    raw = scene.get(PLAN_PROP)
+    if not raw:
+        return None, None
+    try:
+        data = json.loads(raw)
+        return CityPlan.from_dict(data), data.get('mesh_backend', 'OBJECTS')
+    except Exception as e:
+        log.warning("⚠️ Plan stocké illisible, régénération complète: %s", e)
+        return None, None
+
+
+def collect_tagged_objects():
+    """Regroupe les objets de la ville par (catégorie, clé)"""
+    tagged = {}
+    for obj in city_objects():
+        kind = obj.get('citygen_kind')
+        if kind is not None:
+            tagged.setdefault((kind, obj.get('citygen_key')), []).append(obj)
+    return tagged
+
+
+def has_city_objects():
+    return any(obj.get('citygen_kind') is not None for obj in city_objects())
+
+
+def can_update_city(scene, seed, mesh_backend):
+    """Vrai si la ville existante provient de la même graine et du même backend"""
+    plan, backend = load_plan(scene)
+    if plan is None or plan.seed != seed or backend != mesh_backend:
+        return False
+    return has_city_objects()
+
+
+def apply_plan_diff(scene, plan, diff, emitter):
+    """Applique un diff de plan aux objets de la scène et retourne les compteurs"""
+    tagged = collect_tagged_objects()
+    to_remove = []
+    selection = {}
+    stats = {'created': 0, 'removed': 0, 'moved': 0}
+
+    for category, table_name in PLAN_CATEGORIES:
+        changes = diff[category]
+        if not (changes['create'] or changes['remove'] or changes['move']):
+            continue
+
+        if not emitter.per_object:
+            # Un seul mesh par catégorie: on le reconstruit entièrement
+            to_remove.extend(tagged.get((category, '*'), ()))
+            selection[category] = range(len(getattr(plan, table_name)))
+            continue
+
+        for key in changes['remove']:
+            to_remove.extend(tagged.get((category, key), ()))
+        for key, (dx, dy) in changes['move'].items():
+            for obj in tagged.get((category, key), ()):
+                obj.location.x += dx
+                obj.location.y += dy
+                stats['moved'] += 1
+        selection[category] = changes['create']
+
+    stats['removed'] = len(to_remove)
+    # Les matériaux de l'émetteur existent déjà: seuls objets et meshes sont supprimés
+    remove_city_objects(to_remove, materials=False)
+    if selection:
+        counts = emitter.emit(plan, selection)
+        stats['created'] = sum(counts.values())
+    return stats
+
+
+@in_city_collection
+def update_city(context, building_seed=None):
+    """Met à jour la ville existante à partir des paramètres courants de la scène
+
+    building_seed redessine les bâtiments (nouvelle graine) sans toucher aux blocs.
+    Sans ville existante (ou sans plan stocké), la ville est générée entièrement.
+    """
+    from .generator import create_city_materials, create_district_materials, generate_city
+
+    scene = context.scene
+    old_plan, mesh_backend = load_plan(scene)
+    if old_plan is None or not has_city_objects():
+        log.info("Aucune ville existante: génération complète")
+        return generate_city(context)
+
+    try:
+        params = plan_parameters_from_scene(scene)
+        params['seed'] = old_plan.seed
+        params['building_seed'] = old_plan.params.get('building_seed') if building_seed is None else building_seed
+        new_plan = plan_city(**params)
+        if new_plan is None:
+            log.error("❌ Échec du calcul du nouveau plan")
+            return False
+
+        diff = diff_plans(old_plan, new_plan)
+        if diff_is_empty(diff):
+            log.info("✅ Ville déjà à jour")
+            return True
+
+        road_mat, side_mat, build_mat = create_city_materials()
+        district_materials = create_district_materials() if params.get('district_mode') else {}
+
+        from .plan_emitters import PlanEmitter
+
+        shared_snap = float(getattr(scene, 'citygen_shared_snap', 0.0))
+        emitter = PlanEmitter(road_mat, side_mat, build_mat, district_materials, mesh_backend, shared_snap,
+                              collections=ensure_city_collections(scene))
+        stats = apply_plan_diff(scene, new_plan, diff, emitter)
+        save_plan(scene, new_plan, mesh_backend)
+        log.info("♻️ Mise à jour incrémentale: %s créés, %s supprimés, %s déplacés",
+                 stats['created'], stats['removed'], stats['moved'])
+        return True
+
+    except Exception as e:
+        import traceback
+        log.error("❌ Erreur lors de la mise à jour incrémentale: %s", e)
+        log.error("Traceback: %s", traceback.format_exc())
+        return False
+
+
+def regenerate_buildings(context):
+    """Redessine les bâtiments avec une nouvelle graine en gardant blocs et routes"""
+    from .city_rng import new_seed
+
+    return update_city(context, building_seed=new_seed())
@@ -0,0 +1,94 @@
+"""
+Élimination des faces cachées des bâtiments groupés (sans dépendance à bpy).
+
+Chaque bâtiment garde une face inférieure posée sur le trottoir et tous ses
+murs, y compris ceux collés au voisin (routes sans coupure: les lots d'un bloc
+se touchent sans marge). Cette passe sur la géométrie d'un lot retire:
+- les faces tournées vers le bas au niveau du sol;
+- les murs recouverts par un mur opposé coplanaire d'un autre bâtiment.
+
+Les murs sont rangés dans une table de hachage par plan quantifié (normale,
+distance à l'origine): seuls les murs du plan opposé exact sont comparés.
+"""
+
+import numpy as np
+
+# Altitude maximale (m) d'une face inférieure considérée comme posée au sol
+GROUND_Z = 0.05
+
+# Pas de quantification des plans de murs (m)
+PLANE_QUANTUM = 0.001
+
+
+def _face_cycle(totals):
+    """Index de face de chaque loop et index du loop suivant dans sa face"""
+    starts = np.concatenate(([0], np.cumsum(totals)[:-1]))
+    face = np.repeat(np.arange(len(totals)), totals)
+    position = np.arange(len(face)) - starts[face]
+    return face, starts[face] + (position + 1) % totals[face]
+
+
+def face_planes(verts, loops, totals):
+    """Normales unitaires (F, 3) (méthode de Newell) et centres (F, 3) des faces"""
+    face, following = _face_cycle(totals)
+    current = verts[loops]
+    normals = np.zeros((len(totals), 3))
+    np.add.at(normals, face, np.cross(current, verts[loops[following]]))
+    normals /= np.maximum(np.linalg.norm(normals, axis=1), 1e-12)[:, None]
+    centres = np.zeros((len(totals), 3))
+    np.add.at(centres, face, current)
+    centres /= totals[:, None]
+    return normals, centres
+
+
+def hidden_faces(verts, loops, totals, ground_z=GROUND_Z, quantum=PLANE_QUANTUM):
+    """Masque (F,) des faces cachées: dessous au sol et murs couverts par un mur opposé"""
+    verts = np.asarray(verts, dtype=np.float64).reshape(-1, 3)
+    loops = np.asarray(loops, dtype=np.int64)
+    totals = np.asarray(totals, dtype=np.int64)
+    hidden = np.zeros(len(totals), dtype=bool)
+    if len(totals) == 0:
+        return hidden
+
+    normals, centres = face_planes(verts, loops, totals)
+    face, following = _face_cycle(totals)
+    z = verts[loops, 2]
+    low_z, top = np.full(len(totals), np.inf), np.full(len(totals), -np.inf)
+    np.minimum.at(low_z, face, z)
+    np.maximum.at(top, face, z)
+    hidden |= (normals[:, 2] < -0.999) & (top <= ground_z)
+
+    walls = np.flatnonzero(np.abs(normals[:, 2]) < 1e-3)
+    if len(walls) < 2:
+        return hidden
+
+    # Étendue (u, z) de chaque mur dans son plan, u horizontal le long du mur
+    tangent = np.column_stack((-normals[:, 1], normals[:, 0]))
+    u = (verts[loops, :2] * tangent[face]).sum(axis=1)
+    low_u, high_u = np.full(len(totals), np.inf), np.full(len(totals), -np.inf)
+    np.minimum.at(low_u, face, u)
+    np.maximum.at(high_u, face, u)
+    # Un mur ne couvre son vis-à-vis que s'il est plein (aire = celle de sa boîte englobante)
+    area = np.zeros(len(totals))
+    np.add.at(area, face, u * z[following] - u[following] * z)
+    solid = np.isclose(np.abs(area) / 2, (high_u - low_u) * (top - low_z), rtol=1e-6, atol=1e-9)
+
+    # Table de hachage des plans quantifiés: direction de la normale et distance à l'origine
+    directions = np.round(normals[walls, :2] * 1000).astype(np.int64)
+    offsets = np.round((centres[walls] * normals[walls]).sum(axis=1) / quantum).astype(np.int64)
+    planes = {}
+    for index, key in zip(walls.tolist(), zip(directions[:, 0].tolist(), directions[:, 1].tolist(), offsets.tolist())):
+        planes.setdefault(key, []).append(index)
+
+    for (dx, dy, offset), faces in planes.items():
+        covers = [other for other in planes.get((-dx, -dy, -offset), ()) if solid[other]]
+        if not covers:
+            continue
+        # Le u du plan opposé est retourné: son étendue devient [-high, -low]
+        cover_low, cover_high = -high_u[covers], -low_u[covers]
+        cover_bottom, cover_top = low_z[covers], top[covers]
+        for index in faces:
+            inside = ((cover_low <= low_u[index] + quantum) & (cover_high >= high_u[index] - quantum) &
+                      (cover_bottom <= low_z[index] + quantum) & (cover_top >= top[index] - quantum))
+            hidden[index] = inside.any()
+    return hidden
@@ -2,12 +2,26 @@ import bpy
 import random
 import traceback
 
+from .city_collections import ensure_city_collections, in_city_collection
+from .city_log import configure_from_scene, log
+from .city_shader import ensure_city_shader, set_object_look, zone_look
+from .material_palette import assign_palette_material, palette, palette_material
+from .layout_rules import (
+    calculate_building_subdivisions, choose_building_type, calculate_height_with_variation,
+    generate_uniform_district, generate_block_sizes, generate_district_zones,
+    generate_zone_centers, generate_district_variation,
+)
+
 # Compteur global pour les bâtiments
 building_counter = 0
 
 # Validation des paramètres
-def validate_parameters(width, length, max_floors):
-    """Valide les paramètres d'entrée pour la génération de ville"""
+def validate_parameters(width, length, max_floors, max_blocks=100):
+    """Valide les paramètres d'entrée pour la génération de ville
+
+    max_blocks limite la taille de ville pour la génération synchrone; l'opérateur
+    modal, qui ne bloque pas Blender, l'augmente.
+    """
     errors = []
     
     if width < 1 or width > 50:
@@ -21,8 +35,8 @@ def validate_parameters(width, length, max_floors):
     
     # Vérifier si nous avons trop de blocs (limite de performance)
     total_blocks = width * length
-    if total_blocks > 100:
-        errors.append(f"Trop de blocs: {total_blocks}. Maximum recommandé: 100 (10x10).")
+    if total_blocks > max_blocks:
+        errors.append(f"Trop de blocs: {total_blocks}. Maximum recommandé: {max_blocks}.")
     
     return errors
 
@@ -61,7 +75,7 @@ def safe_float(value, default=0.0):
                 return float(str(value))
             except (TypeError, ValueError):
                 # En cas d'échec complet, retourner la valeur par défaut
-                print(f"Conversion en float échouée, utilisation de la valeur par défaut: {default}")
+                log.debug("Conversion en float échouée, utilisation de la valeur par défaut: %s", default)
                 return default
 
 def safe_int(value, default=0):
@@ -78,7 +92,7 @@ def safe_int(value, default=0):
                 return int(str(value))
             except (TypeError, ValueError):
                 # En cas d'échec complet, retourner la valeur par défaut
-                print(f"Conversion en entier échouée, utilisation de la valeur par défaut: {default}")
+                log.debug("Conversion en entier échouée, utilisation de la valeur par défaut: %s", default)
                 return default
 
 def create_material(name, color):
@@ -96,15 +110,15 @@ def create_material(name, color):
                 if principled:
                     # Définir la couleur de base (Base Color)
                     principled.inputs[0].default_value = (*color, 1.0)
-                    print(f"Matériau '{name}' créé avec couleur {color}")
+                    log.debug("Matériau '%s' créé avec couleur %s", name, color)
                 else:
-                    print(f"Node Principled BSDF introuvable pour {name}")
+                    log.debug("Node Principled BSDF introuvable pour %s", name)
             
             # Fallback pour compatibilité
             mat.diffuse_color = (*color, 1.0)
-        else:
-            print(f"Matériau '{name}' existe déjà, mise à jour de la couleur")
-            # Mettre à jour la couleur même si le matériau existe
+        elif tuple(round(channel, 4) for channel in mat.diffuse_color[:3]) != tuple(round(channel, 4) for channel in color):
+            log.debug("Matériau '%s' existe déjà, mise à jour de la couleur", name)
+            # Le node tree n'est réécrit que si la couleur a changé
             if mat.use_nodes and mat.node_tree:
                 principled = mat.node_tree.nodes.get("Principled BSDF")
                 if principled:
@@ -113,7 +127,7 @@ def create_material(name, color):
             
         return mat
     except Exception as e:
-        print(f"Erreur lors de la création du matériau '{name}': {str(e)}")
+        log.error("Erreur lors de la création du matériau '%s': %s", name, str(e))
         # Retourner un matériau par défaut ou None
         try:
             # Essayer de créer un matériau de base
@@ -133,15 +147,15 @@ def safe_object_creation(creation_func, *args, **kwargs):
     try:
         return creation_func(*args, **kwargs)
     except Exception as e:
-        print(f"Erreur lors de la création d'objet: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
+        log.error("Erreur lors de la création d'objet: %s", str(e))
+        log.error("Traceback: %s", traceback.format_exc())
         return None
 
 def safe_mesh_operation(operation_func, obj, *args, **kwargs):
     """Wrapper sécurisé pour les opérations sur les mesh"""
     try:
         if not obj or not obj.data:
-            print("Objet ou mesh invalide pour l'opération")
+            log.debug("Objet ou mesh invalide pour l'opération")
             return False
             
         # S'assurer que l'objet est sélectionné et actif
@@ -150,307 +164,125 @@ def safe_mesh_operation(operation_func, obj, *args, **kwargs):
         
         return operation_func(*args, **kwargs)
     except Exception as e:
-        print(f"Erreur lors de l'opération mesh: {str(e)}")
+        log.error("Erreur lors de l'opération mesh: %s", str(e))
         return False
 
-def calculate_building_subdivisions(block_width, block_depth, buildings_per_block):
-    """Calcule les subdivisions d'un bloc pour placer plusieurs bâtiments"""
-    import math
-    
-    if buildings_per_block <= 1:
-        return [(0, 0, block_width, block_depth)]
-    
-    # Calculer une grille optimale pour le nombre de bâtiments
-    if buildings_per_block == 2:
-        # 2 bâtiments : côte à côte ou l'un au-dessus de l'autre selon les proportions
-        if block_width >= block_depth:
-            # Diviser horizontalement
-            sub_width = block_width / 2
-            return [
-                (0, 0, sub_width, block_depth),
-                (sub_width, 0, sub_width, block_depth)
-            ]
-        else:
-            # Diviser verticalement
-            sub_depth = block_depth / 2
-            return [
-                (0, 0, block_width, sub_depth),
-                (0, sub_depth, block_width, sub_depth)
-            ]
-    
-    elif buildings_per_block == 3:
-        # 3 bâtiments : disposition 3x1 ou 1x3
-        if block_width >= block_depth:
-            sub_width = block_width / 3
-            return [
-                (0, 0, sub_width, block_depth),
-                (sub_width, 0, sub_width, block_depth),
-                (sub_width * 2, 0, sub_width, block_depth)
-            ]
-        else:
-            sub_depth = block_depth / 3
-            return [
-                (0, 0, block_width, sub_depth),
-                (0, sub_depth, block_width, sub_depth),
-                (0, sub_depth * 2, block_width, sub_depth)
-            ]
-    
-    elif buildings_per_block == 4:
-        # 4 bâtiments : grille 2x2
-        sub_width = block_width / 2
-        sub_depth = block_depth / 2
-        return [
-            (0, 0, sub_width, sub_depth),
-            (sub_width, 0, sub_width, sub_depth),
-            (0, sub_depth, sub_width, sub_depth),
-            (sub_width, sub_depth, sub_width, sub_depth)
-        ]
-    
-    else:
-        # Pour 5-9 bâtiments : grille 3x3 ou 3x2
-        if buildings_per_block <= 6:
-            # Grille 3x2
-            sub_width = block_width / 3
-            sub_depth = block_depth / 2
-            subdivisions = []
-            for i in range(3):
-                for j in range(2):
-                    if len(subdivisions) < buildings_per_block:
-                        subdivisions.append((i * sub_width, j * sub_depth, sub_width, sub_depth))
-            return subdivisions
-        else:
-            # Grille 3x3
-            sub_width = block_width / 3
-            sub_depth = block_depth / 3
-            subdivisions = []
-            for i in range(3):
-                for j in range(3):
-                    if len(subdivisions) < buildings_per_block:
-                        subdivisions.append((i * sub_width, j * sub_depth, sub_width, sub_depth))
-            return subdivisions
-
-def choose_building_type(variety_level, zone_type, width, depth, height, building_index=0):
-    """Choisit intelligemment le type de bâtiment selon la variété demandée"""
-    import random
-    
-    # Types de bâtiments disponibles avec leurs conditions
-    building_types = {
-        'rectangular': {'weight': 35, 'min_size': 2.0},
-        'tower': {'weight': 15, 'min_size': 3.0, 'min_height': 15},
-        'stepped': {'weight': 12, 'min_size': 4.0, 'min_height': 12},
-        'l_shaped': {'weight': 15, 'min_size': 5.0},  # Augmenté de 8 à 15
-        'u_shaped': {'weight': 10, 'min_size': 6.0},  # Augmenté de 6 à 10 (utilisé comme F-shaped)
-        't_shaped': {'weight': 12, 'min_size': 5.0},  # Augmenté de 5 à 12
-        'circular': {'weight': 4, 'min_size': 4.0},
-        'elliptical': {'weight': 3, 'min_size': 4.0},
-        'complex': {'weight': 2, 'min_size': 6.0, 'min_height': 18},
-        'pyramid': {'weight': 2, 'min_size': 4.0, 'min_height': 12}
-        # cone supprimé comme demandé
-    }
-    
-    # Ajuster les poids selon le niveau de variété avec plus de L, T et U shapes
-    if variety_level == 'LOW':
-        # Principalement rectangulaires mais avec quelques L et T
-        weights = ['rectangular'] * 50 + ['tower'] * 20 + ['l_shaped'] * 20 + ['t_shaped'] * 10
-    elif variety_level == 'MEDIUM':
-        # Équilibre avec forte présence de L, T, U
-        weights = (['rectangular'] * 20 + ['tower'] * 15 + ['stepped'] * 10 + 
-                  ['l_shaped'] * 20 + ['u_shaped'] * 15 + ['t_shaped'] * 15 + 
-                  ['circular'] * 3 + ['elliptical'] * 2)
-    elif variety_level == 'HIGH':
-        # Maximum de variété avec dominance L, T, U
-        weights = (['rectangular'] * 10 + ['tower'] * 10 + ['stepped'] * 10 + 
-                  ['l_shaped'] * 25 + ['u_shaped'] * 20 + ['t_shaped'] * 20 + 
-                  ['circular'] * 3 + ['elliptical'] * 2)
-    elif variety_level == 'MODERN':
-        # Tours et formes modernes avec L et T
-        weights = (['tower'] * 30 + ['stepped'] * 20 + ['complex'] * 15 + 
-                  ['l_shaped'] * 15 + ['t_shaped'] * 15 + ['rectangular'] * 5)
-    elif variety_level == 'CREATIVE':
-        # Formes créatives avec L, T, U dominants
-        weights = (['l_shaped'] * 25 + ['t_shaped'] * 25 + ['u_shaped'] * 20 + 
-                  ['circular'] * 10 + ['elliptical'] * 8 + ['pyramid'] * 7 + 
-                  ['complex'] * 3 + ['tower'] * 2)
-    else:
-        # Fallback avec forte présence de L et T
-        weights = ['rectangular'] * 25 + ['l_shaped'] * 25 + ['t_shaped'] * 20 + ['tower'] * 15 + ['u_shaped'] * 15
-    
-    # Choisir un type aléatoire
-    chosen_type = random.choice(weights)
-    
-    # Vérifier si le type choisi est approprié pour les dimensions
-    type_info = building_types.get(chosen_type, building_types['rectangular'])
-    min_size = type_info.get('min_size', 2.0)
-    min_height = type_info.get('min_height', 0)
-    
-    # Si les dimensions ne conviennent pas, choisir un type plus simple
-    if min(width, depth) < min_size or height < min_height:
-        if min(width, depth) >= 3.0:
-            chosen_type = random.choice(['rectangular', 'tower', 'stepped'])
-        else:
-            chosen_type = 'rectangular'
-    
-    # Ajustement selon le type de zone
-    if zone_type == 'COMMERCIAL' and chosen_type in ['rectangular', 'stepped']:
-        if random.random() < 0.3:  # 30% de chance
-            chosen_type = 'tower'
-    elif zone_type == 'INDUSTRIAL' and chosen_type in ['tower', 'complex']:
-        if random.random() < 0.5:  # 50% de chance
-            chosen_type = random.choice(['rectangular', 'l_shaped'])
-    
-    print(f"   🎯 Type choisi: {chosen_type} (variété: {variety_level}, zone: {zone_type})")
-    return chosen_type
+def generate_building_with_type(x, y, width, depth, height, mat, zone_type='RESIDENTIAL', district_materials=None, building_type='rectangular',
+                                template=None):
+    """Génère un bâtiment avec un type spécifique au lieu de AUTO
 
-def calculate_height_with_variation(base_height, max_floors, height_variation, zone_type, building_type):
-    """Calcule la hauteur d'un bâtiment avec variation intelligente"""
-    import random
-    
-    # Facteurs de base selon le type de zone
-    zone_factors = {
-        'COMMERCIAL': {'min_mult': 0.8, 'max_mult': 1.5, 'bonus': 6},
-        'RESIDENTIAL': {'min_mult': 0.6, 'max_mult': 1.2, 'bonus': 3},
-        'INDUSTRIAL': {'min_mult': 0.3, 'max_mult': 0.8, 'bonus': 0}
-    }
-    
-    # Facteurs selon le type de bâtiment
-    building_factors = {
-        'tower': {'min_mult': 1.5, 'max_mult': 2.5},
-        'stepped': {'min_mult': 1.2, 'max_mult': 1.8},
-        'complex': {'min_mult': 1.3, 'max_mult': 2.0},
-        'pyramid': {'min_mult': 1.0, 'max_mult': 1.6}
-        # cone supprimé définitivement de la base de code
-    }
-    
-    # Appliquer les facteurs de zone
-    zone_info = zone_factors.get(zone_type, zone_factors['RESIDENTIAL'])
-    min_height = max(3, int(base_height * zone_info['min_mult']))
-    max_height = min(max_floors * 3, int(base_height * zone_info['max_mult']) + zone_info['bonus'])
-    
-    # Appliquer les facteurs de bâtiment
-    if building_type in building_factors:
-        building_info = building_factors[building_type]
-        min_height = max(min_height, int(base_height * building_info['min_mult']))
-        max_height = max(max_height, int(base_height * building_info['max_mult']))
-    
-    # Appliquer la variation
-    if height_variation > 0:
-        variation_range = int((max_height - min_height) * height_variation)
-        if variation_range > 0:
-            height_offset = random.randint(-variation_range//2, variation_range//2)
-            final_height = base_height + height_offset
-        else:
-            final_height = base_height
-    else:
-        final_height = base_height
-    
-    # S'assurer que la hauteur reste dans les limites
-    final_height = max(min_height, min(max_height, final_height))
-    
-    print(f"   📏 Hauteur calculée: base={base_height}, final={final_height} (zone={zone_type}, type={building_type})")
-    return final_height
-
-def generate_building_with_type(x, y, width, depth, height, mat, zone_type='RESIDENTIAL', district_materials=None, building_type='rectangular'):
-    """Génère un bâtiment avec un type spécifique au lieu de AUTO"""
+    template = (gabarit, taille, ratio) déjà tirés (colonnes du plan): la variante n'est pas retirée.
+    """
     global building_counter
     building_counter += 1
     
     try:
         # Validation des paramètres
         if width <= 0 or depth <= 0 or height <= 0:
-            print(f"❌ ERREUR: Paramètres de bâtiment invalides pour bâtiment {building_counter}: w={width}, d={depth}, h={height}")
+            log.error("❌ ERREUR: Paramètres de bâtiment invalides pour bâtiment %s: w=%s, d=%s, h=%s", building_counter, width, depth, height)
             return None
             
         if not mat:
-            print(f"❌ ERREUR: Matériau invalide pour le bâtiment {building_counter}")
+            log.error("❌ ERREUR: Matériau invalide pour le bâtiment %s", building_counter)
             return None
         
-        print(f"🏗️ DÉBUT génération bâtiment {building_counter} (type: {building_type})")
-        print(f"   Paramètres: pos=({x:.1f},{y:.1f}), taille=({width:.1f}x{depth:.1f}x{height:.1f})")
-        print(f"   Matériau: {mat.name if mat else 'None'}, Zone: {zone_type}")
-        print(f"   🚨 DEBUG: ENTRÉE dans generate_building_with_type - FONCTION APPELÉE")
+        log.debug("🏗️ DÉBUT génération bâtiment %s (type: %s)", building_counter, building_type)
+        log.debug("   Paramètres: pos=(%.1f,%.1f), taille=(%.1fx%.1fx%.1f)", x, y, width, depth, height)
+        log.debug("   Matériau: %s, Zone: %s", mat.name if mat else 'None', zone_type)
+        log.debug("   🚨 DEBUG: ENTRÉE dans generate_building_with_type - FONCTION APPELÉE")
         
         # Choisir le matériau approprié en fonction du type de zone
         final_mat = mat  # Matériau par défaut
         if district_materials and zone_type in district_materials:
             final_mat = district_materials[zone_type]
-            print(f"   Application du matériau de district {zone_type}: {final_mat.name}")
+            log.debug("   Application du matériau de district %s: %s", zone_type, final_mat.name)
         
-        print(f"   Type de bâtiment spécifié: {building_type}")
-        print(f"   🚨 DEBUG: Avant appel fonction de génération spécifique")
+        log.debug("   Type de bâtiment spécifié: %s", building_type)
+        log.debug("   🚨 DEBUG: Avant appel fonction de génération spécifique")
         
         result = None
-        if building_type == 'rectangular':
-            print(f"   ➡️ Appel generate_rectangular_building...")
+        if template is not None:
+            result = create_template_building(building_type, x, y, width, depth, height, final_mat,
+                                              f"batiment_{building_type}_{building_counter}", template)
+        elif building_type == 'rectangular':
+            log.debug("   ➡️ Appel generate_rectangular_building...")
             result = generate_rectangular_building(x, y, width, depth, height, final_mat, building_counter)
-            print(f"   🚨 DEBUG: generate_rectangular_building retourné: {result}")
+            log.debug("   🚨 DEBUG: generate_rectangular_building retourné: %s", result)
         elif building_type == 'tower':
-            print(f"   ➡️ Appel generate_simple_tower_building...")
+            log.debug("   ➡️ Appel generate_simple_tower_building...")
             result = generate_simple_tower_building(x, y, width, depth, height, final_mat, building_counter)
         elif building_type == 'stepped':
-            print(f"   ➡️ Appel generate_simple_stepped_building...")
+            log.debug("   ➡️ Appel generate_simple_stepped_building...")
             result = generate_simple_stepped_building(x, y, width, depth, height, final_mat, building_counter)
         elif building_type == 'l_shaped':
-            print(f"   ➡️ Appel generate_l_shaped_building...")
+            log.debug("   ➡️ Appel generate_l_shaped_building...")
             result = generate_l_shaped_building(x, y, width, depth, height, final_mat, building_counter)
         elif building_type == 'u_shaped':
-            print(f"   ➡️ Appel generate_u_shaped_building...")
+            log.debug("   ➡️ Appel generate_u_shaped_building...")
             result = generate_u_shaped_building(x, y, width, depth, height, final_mat, building_counter)
         elif building_type == 't_shaped':
-            print(f"   ➡️ Appel generate_t_shaped_building...")
+            log.debug("   ➡️ Appel generate_t_shaped_building...")
             result = generate_t_shaped_building(x, y, width, depth, height, final_mat, building_counter)
         elif building_type == 'circular':
-            print(f"   ➡️ Appel generate_circular_building...")
+            log.debug("   ➡️ Appel generate_circular_building...")
             result = generate_circular_building(x, y, width, depth, height, final_mat, building_counter)
         elif building_type == 'elliptical':
-            print(f"   ➡️ Appel generate_elliptical_building...")
+            log.debug("   ➡️ Appel generate_elliptical_building...")
             result = generate_elliptical_building(x, y, width, depth, height, final_mat, building_counter)
         elif building_type == 'pyramid':
-            print(f"   ➡️ Appel generate_pyramid_building...")
+            log.debug("   ➡️ Appel generate_pyramid_building...")
             result = generate_pyramid_building(x, y, width, depth, height, final_mat, building_counter)
         elif building_type == 'complex':
-            print(f"   ➡️ Appel generate_complex_building...")
+            log.debug("   ➡️ Appel generate_complex_building...")
             result = generate_complex_building(x, y, width, depth, height, final_mat, building_counter)
         else:
-            print(f"   ⚠️ Type de bâtiment non reconnu: {building_type}, utilisation du type rectangulaire")
+            log.warning("   ⚠️ Type de bâtiment non reconnu: %s, utilisation du type rectangulaire", building_type)
             result = generate_rectangular_building(x, y, width, depth, height, final_mat, building_counter)
         
-        print(f"   🚨 DEBUG: Résultat final de génération: {result}")
+        log.debug("   🚨 DEBUG: Résultat final de génération: %s", result)
         
         if result:
-            print(f"✅ Bâtiment {building_counter} créé avec succès: {result.name}")
+            if district_materials and zone_type in district_materials:
+                # Shader partagé: la couleur de zone est portée par l'objet
+                color, roughness, _ = zone_look(zone_type)
+                set_object_look(result, color, roughness, zone_type, final_mat)
+            log.debug("✅ Bâtiment %s créé avec succès: %s", building_counter, result.name)
             return result
         else:
-            print(f"❌ ÉCHEC: Bâtiment {building_counter} - Objet None retourné")
+            log.error("❌ ÉCHEC: Bâtiment %s - Objet None retourné", building_counter)
             return None
             
     except Exception as e:
-        print(f"❌ EXCEPTION lors de génération bâtiment {building_counter}: {str(e)}")
+        log.error("❌ EXCEPTION lors de génération bâtiment %s: %s", building_counter, str(e))
         return None
 
-def generate_building(x, y, width, depth, height, mat, zone_type='RESIDENTIAL', district_materials=None, shape_mode='AUTO', building_variety='MEDIUM'):
-    """Génère un bâtiment avec une forme selon le mode choisi et le système de variété intelligent"""
+def generate_building(x, y, width, depth, height, mat, zone_type='RESIDENTIAL', district_materials=None, shape_mode='AUTO', building_variety='MEDIUM', batch=None):
+    """Génère un bâtiment avec une forme selon le mode choisi et le système de variété intelligent
+
+    Si batch (MeshBatch) est fourni, la géométrie est ajoutée au lot au lieu de créer un objet.
+    """
     global building_counter
     building_counter += 1
     
     try:
         # Validation des paramètres
         if width <= 0 or depth <= 0 or height <= 0:
-            print(f"❌ ERREUR: Paramètres de bâtiment invalides pour bâtiment {building_counter}: w={width}, d={depth}, h={height}")
+            log.error("❌ ERREUR: Paramètres de bâtiment invalides pour bâtiment %s: w=%s, d=%s, h=%s", building_counter, width, depth, height)
             return None
             
         if not mat:
-            print(f"❌ ERREUR: Matériau invalide pour le bâtiment {building_counter}")
+            log.error("❌ ERREUR: Matériau invalide pour le bâtiment %s", building_counter)
             return None
         
-        print(f"🏗️ DÉBUT génération bâtiment {building_counter}")
-        print(f"   Paramètres: pos=({x:.1f},{y:.1f}), taille=({width:.1f}x{depth:.1f}x{height:.1f})")
-        print(f"   Matériau: {mat.name if mat else 'None'}, Zone: {zone_type}, Variété: {building_variety}")
+        log.debug("🏗️ DÉBUT génération bâtiment %s", building_counter)
+        log.debug("   Paramètres: pos=(%.1f,%.1f), taille=(%.1fx%.1fx%.1f)", x, y, width, depth, height)
+        log.debug("   Matériau: %s, Zone: %s, Variété: %s", mat.name if mat else 'None', zone_type, building_variety)
         
         # Choisir le matériau approprié en fonction du type de zone
         final_mat = mat  # Matériau par défaut
         if district_materials and zone_type in district_materials:
             final_mat = district_materials[zone_type]
-            print(f"   Application du matériau de district {zone_type}: {final_mat.name}")
+            log.debug("   Application du matériau de district %s: %s", zone_type, final_mat.name)
         
         # Choisir le type de bâtiment selon le mode de forme
         if shape_mode == 'RECT':
@@ -468,352 +300,169 @@ def generate_building(x, y, width, depth, height, mat, zone_type='RESIDENTIAL',
         else:  # shape_mode == 'AUTO' - Utiliser le système de variété intelligent
             building_type = choose_building_type(building_variety, zone_type, width, depth, height)
         
-        print(f"   Type de bâtiment sélectionné: {building_type} (mode: {shape_mode})")
-        
+        log.debug("   Type de bâtiment sélectionné: %s (mode: %s)", building_type, shape_mode)
+
+        if batch is not None:
+            look = zone_look(zone_type) if district_materials and zone_type in district_materials else None
+            return append_building_to_batch(batch, building_type, x, y, width, depth, height, final_mat, zone_type, look)
+
         # Utiliser le système amélioré de génération avec type
         result = generate_building_with_type(x, y, width, depth, height, final_mat, zone_type, district_materials, building_type)
         
         if result:
-            print(f"✅ Bâtiment {building_counter} créé avec succès: {result.name}")
+            log.debug("✅ Bâtiment %s créé avec succès: %s", building_counter, result.name)
             return result
         else:
-            print(f"❌ ÉCHEC: Bâtiment {building_counter} - Objet None retourné")
+            log.error("❌ ÉCHEC: Bâtiment %s - Objet None retourné", building_counter)
             return None
             
     except Exception as e:
-        print(f"Erreur critique lors de la génération du bâtiment {building_counter}: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
+        log.error("Erreur critique lors de la génération du bâtiment %s: %s", building_counter, str(e))
+        log.error("Traceback: %s", traceback.format_exc())
         return None
 
 def generate_rectangular_building(x, y, width, depth, height, mat, building_num):
     """Génère un bâtiment rectangulaire avec origine au centre bas"""
     try:
-        print(f"🏢 DÉBUT generate_rectangular_building #{building_num}")
-        print(f"   Paramètres reçus: pos=({x:.1f},{y:.1f}), taille=({width:.1f}x{depth:.1f}x{height:.1f})")
+        log.debug("🏢 DÉBUT generate_rectangular_building #%s", building_num)
+        log.debug("   Paramètres reçus: pos=(%.1f,%.1f), taille=(%.1fx%.1fx%.1f)", x, y, width, depth, height)
         
         # Validation des paramètres
         if width <= 0 or depth <= 0 or height <= 0:
-            print(f"❌ Paramètres invalides pour le bâtiment {building_num}: w={width}, d={depth}, h={height}")
+            log.error("❌ Paramètres invalides pour le bâtiment %s: w=%s, d=%s, h=%s", building_num, width, depth, height)
             return None
             
         if not mat:
-            print(f"❌ Matériau invalide pour le bâtiment {building_num}")
+            log.error("❌ Matériau invalide pour le bâtiment %s", building_num)
             return None
         
-        print(f"   ➡️ Appel create_cube_with_center_bottom_origin...")
+        log.debug("   ➡️ Appel create_cube_with_center_bottom_origin...")
         # Créer le cube avec origine au centre bas
         obj = create_cube_with_center_bottom_origin(width, depth, height, (x, y, 0.02))
         
         if not obj:
-            print(f"❌ Échec de création du cube pour le bâtiment {building_num}")
+            log.error("❌ Échec de création du cube pour le bâtiment %s", building_num)
             return None
         
-        print(f"   ✅ Cube créé: {obj.name}")
-        print(f"   📍 Position: ({obj.location.x:.1f}, {obj.location.y:.1f}, {obj.location.z:.1f})")
-        print(f"   📏 Échelle: ({obj.scale.x:.1f}, {obj.scale.y:.1f}, {obj.scale.z:.1f})")
+        if log.debug_enabled:
+            log.debug("   ✅ Cube créé: %s", obj.name)
+            log.debug("   📍 Position: (%.1f, %.1f, %.1f)", obj.location.x, obj.location.y, obj.location.z)
+            log.debug("   📏 Échelle: (%.1f, %.1f, %.1f)", obj.scale.x, obj.scale.y, obj.scale.z)
         
         obj.name = f"batiment_rectangular_{building_num}"
-        print(f"   🏷️ Nom assigné: {obj.name}")
+        log.debug("   🏷️ Nom assigné: %s", obj.name)
 
         # Appliquer le matériau avec validation
         try:
             if mat and obj.data:
                 obj.data.materials.append(mat)
-                print(f"   🎨 Matériau appliqué: {mat.name}")
+                log.debug("   🎨 Matériau appliqué: %s", mat.name)
             else:
-                print(f"   ⚠️ Problème matériau: mat={mat}, obj.data={obj.data}")
+                log.warning("   ⚠️ Problème matériau: mat=%s, obj.data=%s", mat, obj.data)
         except Exception as e:
-            print(f"❌ Erreur lors de l'application du matériau pour le bâtiment {building_num}: {e}")
+            log.error("❌ Erreur lors de l'application du matériau pour le bâtiment %s: %s", building_num, e)
 
         # Vérifications finales
-        print(f"   🔍 Vérifications finales:")
-        print(f"     - Objet visible viewport: {not getattr(obj, 'hide_viewport', True)}")
-        print(f"     - Objet visible rendu: {not getattr(obj, 'hide_render', True)}")
-        print(f"     - Dans collection: {obj.users_collection}")
-        print(f"     - Données mesh valides: {obj.data is not None}")
-        
-        print(f"✅ generate_rectangular_building #{building_num} TERMINÉ avec succès")
+        if log.debug_enabled:
+            log.debug("   🔍 Vérifications finales:")
+            log.debug("     - Objet visible viewport: %s", not getattr(obj, 'hide_viewport', True))
+            log.debug("     - Objet visible rendu: %s", not getattr(obj, 'hide_render', True))
+            log.debug("     - Dans collection: %s", obj.users_collection)
+            log.debug("     - Données mesh valides: %s", obj.data is not None)
+        
+        log.debug("✅ generate_rectangular_building #%s TERMINÉ avec succès", building_num)
         return obj
         
     except Exception as e:
-        print(f"❌ Erreur critique lors de la génération du bâtiment rectangulaire {building_num}: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
+        log.error("❌ Erreur critique lors de la génération du bâtiment rectangulaire %s: %s", building_num, str(e))
+        log.error("Traceback: %s", traceback.format_exc())
+        return None
+
+def create_template_building(building_type, x, y, width, depth, height, mat, name, template=None):
+    """Crée un bâtiment d'un seul objet à partir de son gabarit (building_templates)
+
+    Une transformation affine du gabarit précompilé: pas d'opérateur, pas d'objet
+    temporaire ni de join. Origine au centre bas du bâtiment. template = (gabarit,
+    taille, ratio) déjà tirés, sinon resolve_building tire la variante.
+    """
+    from .building_templates import get_template, resolve_building
+    from .mesh_batch import MeshBatch
+
+    template_name, size, ratio = template or resolve_building(building_type, width, depth, height)
+    base_z = get_template(template_name).base_z
+    batch = MeshBatch(name, mat)
+    if not batch.add_template(template_name, *size, location=(0.0, 0.0, -base_z), ratio=ratio):
         return None
+    obj = bpy.data.objects.new(name, batch.to_mesh())
+    obj.location = (x, y, base_z)
+    bpy.context.collection.objects.link(obj)
+    return obj
 
 def generate_l_shaped_building(x, y, width, depth, height, mat, building_num):
     """Génère un bâtiment en forme de L - seulement orientation verticale (axe Z)"""
     try:
-        print(f"🅻 Génération bâtiment L #{building_num} - Orientation verticale uniquement")
+        log.debug("🅻 Génération bâtiment L #%s - Orientation verticale uniquement", building_num)
         
-        # Dimensions des parties - L classique vertical
-        main_width = width * 0.7
-        main_depth = depth * 0.6
-        secondary_width = width * 0.5  
-        secondary_depth = depth * 0.4
-        secondary_height = height * random.uniform(0.7, 1.0)
-        
-        parts = []
-        
-        # Partie principale (verticale du L)
-        main_obj = create_cube_with_center_bottom_origin(
-            main_width, main_depth, height,
-            (x - width*0.15, y - depth*0.2, 0.02)
-        )
-        if main_obj:
-            parts.append(main_obj)
-        
-        # Partie secondaire (horizontale du L)
-        secondary_obj = create_cube_with_center_bottom_origin(
-            secondary_width, secondary_depth, secondary_height,
-            (x + width*0.25, y + depth*0.3, 0.02)
-        )
-        if secondary_obj:
-            parts.append(secondary_obj)
-        
-        # Joindre les parties si nous en avons plusieurs
-        if len(parts) >= 2:
-            bpy.context.view_layer.objects.active = parts[0]
-            bpy.ops.object.select_all(action='DESELECT')
-            for part in parts:
-                part.select_set(True)
-            
-            try:
-                bpy.ops.object.join()
-                final_obj = bpy.context.object
-                final_obj.name = f"batiment_L_{building_num}_vertical"
-                
-                # Appliquer le matériau
-                if mat and final_obj.data:
-                    final_obj.data.materials.append(mat)
-                    
-                print(f"L-shaped building {final_obj.name} created at: x={x}, y={y}")
-                return final_obj
-                
-            except Exception as e:
-                print(f"Erreur jointure L {building_num}: {e}")
-                return parts[0]
-                
-        elif len(parts) == 1:
-            obj = parts[0]
-            obj.name = f"batiment_L_{building_num}_vertical"
-            obj.data.materials.append(mat)
-            return obj
-        else:
-            print(f"Échec création bâtiment L {building_num}")
+        # Partie principale (verticale du L) et aile secondaire, d'un seul gabarit
+        obj = create_template_building('l_shaped', x, y, width, depth, height, mat, f"batiment_L_{building_num}_vertical")
+        if not obj:
+            log.error("Échec création bâtiment L %s", building_num)
             return None
         
+        log.debug("L-shaped building %s created at: x=%s, y=%s", obj.name, x, y)
+        return obj
+        
     except Exception as e:
-        print(f"Erreur lors de la création du bâtiment en L {building_num}: {str(e)}")
+        log.error("Erreur lors de la création du bâtiment en L %s: %s", building_num, str(e))
         return None
 
 def generate_u_shaped_building(x, y, width, depth, height, mat, building_num):
-    """Génère un bâtiment en forme de U ou F - seulement orientation verticale (axe Z)"""
-    import random
-    
-    # 40% de chance de créer un F-shaped au lieu d'un U-shaped
-    is_f_shaped = random.random() < 0.4
-    
+    """Génère un bâtiment en forme de U ou F - seulement orientation verticale (axe Z)
+
+    40% de F (tige + 2 barres), sinon U (2 tiges + barre de liaison): variante tirée par le gabarit.
+    """
     try:
-        parts = []
+        log.debug("🅄 Génération bâtiment U/F #%s - Orientation verticale", building_num)
         
-        if is_f_shaped:
-            print(f"🅵 Génération bâtiment F-shaped #{building_num} - Orientation verticale")
-            # F vertical classique : tige verticale + 2 barres horizontales
-            
-            # Tige principale verticale (gauche)
-            main_width = width * 0.3
-            main = create_cube_with_center_bottom_origin(
-                main_width, depth, height, 
-                (x - width*0.35, y, 0.02)
-            )
-            if main:
-                parts.append(main)
-            
-            # Barre horizontale haute
-            top_bar = create_cube_with_center_bottom_origin(
-                width * 0.7, depth * 0.2, height * 0.3, 
-                (x + width*0.15, y + depth*0.4, height*0.7)
-            )
-            if top_bar:
-                parts.append(top_bar)
-            
-            # Barre horizontale milieu
-            mid_bar = create_cube_with_center_bottom_origin(
-                width * 0.5, depth * 0.2, height * 0.25, 
-                (x + width*0.05, y + depth*0.4, height*0.375)
-            )
-            if mid_bar:
-                parts.append(mid_bar)
-                
-        else:
-            print(f"� Génération bâtiment U-shaped #{building_num} - Orientation verticale")
-            # U vertical classique : 2 tiges + barre de liaison
-            
-            # Tige gauche
-            left_width = width * 0.25
-            left_part = create_cube_with_center_bottom_origin(
-                left_width, depth * 0.8, height, 
-                (x - width*0.375, y, 0.02)
-            )
-            if left_part:
-                parts.append(left_part)
-            
-            # Tige droite
-            right_part = create_cube_with_center_bottom_origin(
-                left_width, depth * 0.8, height, 
-                (x + width*0.375, y, 0.02)
-            )
-            if right_part:
-                parts.append(right_part)
-            
-            # Barre de liaison (arrière)
-            back_part = create_cube_with_center_bottom_origin(
-                width * 0.5, depth * 0.2, height, 
-                (x, y + depth*0.4, 0.02)
-            )
-            if back_part:
-                parts.append(back_part)
-        
-        # Joindre toutes les parties
-        if len(parts) > 1:
-            bpy.context.view_layer.objects.active = parts[0]
-            for part in parts:
-                part.select_set(True)
-            try:
-                bpy.ops.object.join()
-                obj = bpy.context.active_object
-                obj.name = f"batiment_u_shaped_{building_num}_vertical"
-                
-                # Appliquer le matériau
-                obj.data.materials.append(mat)
-                return obj
-            except Exception as e:
-                print(f"Erreur jointure U/F {building_num}: {e}")
-                return parts[0]
-        elif len(parts) == 1:
-            obj = parts[0]
-            obj.name = f"batiment_u_shaped_{building_num}_vertical"
-            obj.data.materials.append(mat)
-            return obj
-        else:
-            print(f"Échec création bâtiment U/F {building_num}")
+        obj = create_template_building('u_shaped', x, y, width, depth, height, mat, f"batiment_u_shaped_{building_num}_vertical")
+        if not obj:
+            log.error("Échec création bâtiment U/F %s", building_num)
             return None
+        return obj
             
     except Exception as e:
-        print(f"Erreur création bâtiment U/F {building_num}: {str(e)}")
+        log.error("Erreur création bâtiment U/F %s: %s", building_num, str(e))
         return None
 
 def generate_tower_building(x, y, width, depth, height, mat):
-    """Génère un bâtiment tour avec plusieurs niveaux"""
-    # Base large
-    base_height = height * 0.3
-    
-    # Créer la base
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 0))
-    base_obj = bpy.context.object
-    base_obj.scale = (width/2, depth/2, base_height/2)
-    bpy.context.view_layer.objects.active = base_obj
-    bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-    
-    # Ajuster la position Z des sommets
-    mesh = base_obj.data
-    z_min = min(v.co.z for v in mesh.vertices)
-    for v in mesh.vertices:
-        v.co.z -= z_min
-    
-    base_obj.location = (x, y, 0.02)  # Hauteur ajustée
-    
-    # Tour principale (plus étroite)
-    tower_width = width * 0.7
-    tower_depth = depth * 0.7
-    tower_height = height * 0.7
-    
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 0))
-    tower_obj = bpy.context.object
-    tower_obj.scale = (tower_width/2, tower_depth/2, tower_height/2)
-    bpy.context.view_layer.objects.active = tower_obj
-    bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-    
-    # Ajuster la position Z des sommets
-    mesh = tower_obj.data
-    z_min = min(v.co.z for v in mesh.vertices)
-    for v in mesh.vertices:
-        v.co.z -= z_min
-    
-    tower_obj.location = (x, y, base_height + 0.02)  # Hauteur ajustée
-    
-    # Joindre les parties
-    bpy.context.view_layer.objects.active = base_obj
-    base_obj.select_set(True)
-    tower_obj.select_set(True)
-    bpy.ops.object.join()
-    
-    # Appliquer le matériau
-    base_obj.data.materials.append(mat)
+    """Génère un bâtiment tour avec plusieurs niveaux (base large, tour plus étroite)"""
+    try:
+        return create_template_building('tiered', x, y, width, depth, height, mat, "batiment_tower")
+    except Exception as e:
+        log.error("Erreur bâtiment tour à niveaux: %s", e)
+        return None
 
 def generate_simple_tower_building(x, y, width, depth, height, mat, building_num):
     """Génère un bâtiment tour simple avec variation de hauteur et gestion d'erreurs"""
     try:
         # Validation des paramètres
         if width <= 0 or depth <= 0 or height <= 0:
-            print(f"Paramètres tour invalides: w={width}, d={depth}, h={height}")
+            log.debug("Paramètres tour invalides: w=%s, d=%s, h=%s", width, depth, height)
             return None
             
         if not mat:
-            print(f"Matériau invalide pour la tour {building_num}")
+            log.debug("Matériau invalide pour la tour %s", building_num)
             return None
         
-        # Variation simple : juste changer les proportions
-        tower_width = width * random.uniform(0.7, 1.0)
-        tower_depth = depth * random.uniform(0.7, 1.0)
-        
-        # Créer le cube à l'origine
-        result = safe_object_creation(bpy.ops.mesh.primitive_cube_add, size=1, location=(0, 0, 0))
-        if not bpy.context.object:
-            print(f"Échec de création du cube pour la tour {building_num}")
-            return None
-            
-        obj = bpy.context.object
-        obj.name = f"batiment_tower_{building_num}"
-
-        # Appliquer l'échelle
-        obj.scale.x = tower_width/2
-        obj.scale.y = tower_depth/2
-        obj.scale.z = height/2
-
-        # Appliquer l'échelle avec gestion d'erreurs
-        if not safe_mesh_operation(bpy.ops.object.transform_apply, obj, location=False, rotation=False, scale=True):
-            print(f"Échec de l'application de l'échelle pour la tour {building_num}")
-            return None
-
-        # Ajuster la position Z des sommets avec validation
-        mesh = obj.data
-        if not mesh or not mesh.vertices:
-            print(f"Mesh invalide pour la tour {building_num}")
+        # Variation simple (proportions de 70 à 100%) tirée par le gabarit
+        obj = create_template_building('tower', x, y, width, depth, height, mat, f"batiment_tower_{building_num}")
+        if not obj:
+            log.error("Échec de création du cube pour la tour %s", building_num)
             return None
-            
-        try:
-            z_min = min(v.co.z for v in mesh.vertices)
-            for v in mesh.vertices:
-                v.co.z -= z_min
-        except Exception as e:
-            print(f"Erreur lors de l'ajustement des sommets pour la tour {building_num}: {e}")
-
-        # Positionner l'objet
-        obj.location.x = x
-        obj.location.y = y
-        obj.location.z = 0.02  # Hauteur légèrement au-dessus du trottoir
-
-        # Appliquer le matériau
-        try:
-            obj.data.materials.append(mat)
-        except Exception as e:
-            print(f"Erreur lors de l'application du matériau pour la tour {building_num}: {e}")
-        
         return obj
         
     except Exception as e:
-        print(f"Erreur critique lors de la génération de la tour {building_num}: {str(e)}")
+        log.error("Erreur critique lors de la génération de la tour %s: %s", building_num, str(e))
         return None
 
 def generate_simple_stepped_building(x, y, width, depth, height, mat, building_num):
@@ -821,281 +470,147 @@ def generate_simple_stepped_building(x, y, width, depth, height, mat, building_n
     try:
         # Validation des paramètres
         if width <= 0 or depth <= 0 or height <= 0:
-            print(f"Paramètres bâtiment étagé invalides: w={width}, d={depth}, h={height}")
+            log.debug("Paramètres bâtiment étagé invalides: w=%s, d=%s, h=%s", width, depth, height)
             return None
             
         if not mat:
-            print(f"Matériau invalide pour le bâtiment étagé {building_num}")
+            log.debug("Matériau invalide pour le bâtiment étagé %s", building_num)
             return None
         
-        # Variation simple : base plus large, sommet plus étroit
-        base_scale = random.uniform(0.9, 1.0)
-        base_width = width * base_scale
-        base_depth = depth * base_scale
-        
-        # Créer le cube à l'origine
-        result = safe_object_creation(bpy.ops.mesh.primitive_cube_add, size=1, location=(0, 0, 0))
-        if not bpy.context.object:
-            print(f"Échec de création du cube pour le bâtiment étagé {building_num}")
-            return None
-            
-        obj = bpy.context.object
-        obj.name = f"batiment_stepped_{building_num}"
-
-        # Appliquer l'échelle
-        obj.scale.x = base_width/2
-        obj.scale.y = base_depth/2
-        obj.scale.z = height/2
-
-        # Appliquer l'échelle avec gestion d'erreurs
-        if not safe_mesh_operation(bpy.ops.object.transform_apply, obj, location=False, rotation=False, scale=True):
-            print(f"Échec de l'application de l'échelle pour le bâtiment étagé {building_num}")
-            return None
-
-        # Ajuster la position Z des sommets avec validation
-        mesh = obj.data
-        if not mesh or not mesh.vertices:
-            print(f"Mesh invalide pour le bâtiment étagé {building_num}")
+        # Variation simple (base de 90 à 100%) tirée par le gabarit
+        obj = create_template_building('stepped', x, y, width, depth, height, mat, f"batiment_stepped_{building_num}")
+        if not obj:
+            log.error("Échec de création du cube pour le bâtiment étagé %s", building_num)
             return None
-            
-        try:
-            z_min = min(v.co.z for v in mesh.vertices)
-            for v in mesh.vertices:
-                v.co.z -= z_min
-        except Exception as e:
-            print(f"Erreur lors de l'ajustement des sommets pour le bâtiment étagé {building_num}: {e}")
-
-        # Positionner l'objet
-        obj.location.x = x
-        obj.location.y = y
-        obj.location.z = 0.02  # Hauteur légèrement au-dessus du trottoir
-
-        # Appliquer le matériau
-        try:
-            obj.data.materials.append(mat)
-        except Exception as e:
-            print(f"Erreur lors de l'application du matériau pour le bâtiment étagé {building_num}: {e}")
-        
         return obj
         
     except Exception as e:
-        print(f"Erreur critique lors de la génération du bâtiment étagé {building_num}: {str(e)}")
+        log.error("Erreur critique lors de la génération du bâtiment étagé %s: %s", building_num, str(e))
         return None
 
 def generate_circular_building(x, y, width, depth, height, mat, building_num):
     """Génère un bâtiment circulaire"""
     try:
-        print(f"🔵 Génération bâtiment circulaire #{building_num}")
+        log.debug("🔵 Génération bâtiment circulaire #%s", building_num)
         
-        # Utiliser le diamètre moyen pour le rayon
-        radius = min(width, depth) / 2
-        
-        # Créer le cylindre avec origine au bottom-center
-        result = safe_object_creation(bpy.ops.mesh.primitive_cylinder_add, 
-                                    radius=radius, depth=height, location=(x, y, 0))
-        if not bpy.context.object:
-            print(f"Échec création cylindre pour bâtiment circulaire {building_num}")
+        obj = create_template_building('circular', x, y, width, depth, height, mat, f"batiment_circular_{building_num}")
+        if not obj:
+            log.error("Échec création bâtiment circulaire %s", building_num)
             return None
-            
-        obj = bpy.context.object
-        obj.name = f"batiment_circular_{building_num}"
-        obj.location.z = height/2  # Placer le centre du cylindre à mi-hauteur (bottom à z=0)
-        
-        # Appliquer le matériau
-        try:
-            obj.data.materials.append(mat)
-        except Exception as e:
-            print(f"Erreur matériau bâtiment circulaire {building_num}: {e}")
-        
         return obj
         
     except Exception as e:
-        print(f"Erreur bâtiment circulaire {building_num}: {str(e)}")
+        log.error("Erreur bâtiment circulaire %s: %s", building_num, str(e))
         return None
 
 def generate_elliptical_building(x, y, width, depth, height, mat, building_num):
     """Génère un bâtiment elliptique (cylindre écrasé)"""
     try:
-        print(f"🥚 Génération bâtiment elliptique #{building_num}")
+        log.debug("🥚 Génération bâtiment elliptique #%s", building_num)
         
-        # Créer un cylindre avec origine au bottom-center
-        result = safe_object_creation(bpy.ops.mesh.primitive_cylinder_add, 
-                                    radius=1, depth=height, location=(x, y, 0))
-        if not bpy.context.object:
-            print(f"Échec création cylindre pour bâtiment elliptique {building_num}")
+        obj = create_template_building('elliptical', x, y, width, depth, height, mat, f"batiment_elliptical_{building_num}")
+        if not obj:
+            log.error("Échec création bâtiment elliptique %s", building_num)
             return None
-            
-        obj = bpy.context.object
-        obj.name = f"batiment_elliptical_{building_num}"
-        
-        # Écraser pour faire une ellipse et positionner correctement
-        obj.scale.x = width / 2
-        obj.scale.y = depth / 2
-        obj.location.z = height/2  # Placer le centre à mi-hauteur (bottom à z=0)
-        
-        # Appliquer le matériau
-        try:
-            obj.data.materials.append(mat)
-        except Exception as e:
-            print(f"Erreur matériau bâtiment elliptique {building_num}: {e}")
-        
         return obj
         
     except Exception as e:
-        print(f"Erreur bâtiment elliptique {building_num}: {str(e)}")
+        log.error("Erreur bâtiment elliptique %s: %s", building_num, str(e))
         return None
 
 def generate_pyramid_building(x, y, width, depth, height, mat, building_num):
     """Génère un bâtiment en forme de pyramide"""
     try:
-        print(f"🔺 Génération bâtiment pyramide #{building_num}")
-        
-        # Créer un cône avec origine au bottom-center
-        result = safe_object_creation(bpy.ops.mesh.primitive_cone_add, 
-                                    radius1=max(width, depth)/2, radius2=0, 
-                                    depth=height, location=(x, y, 0))
-        if not bpy.context.object:
-            print(f"Échec création cône pour bâtiment pyramide {building_num}")
-            return None
-            
-        obj = bpy.context.object
-        obj.name = f"batiment_pyramid_{building_num}"
-        obj.location.z = height/2  # Placer le centre à mi-hauteur (bottom à z=0)
-        
-        # Appliquer le matériau
-        try:
-            obj.data.materials.append(mat)
-        except Exception as e:
-            print(f"Erreur matériau bâtiment pyramide {building_num}: {e}")
+        log.debug("🔺 Génération bâtiment pyramide #%s", building_num)
         
+        obj = create_template_building('pyramid', x, y, width, depth, height, mat, f"batiment_pyramid_{building_num}")
+        if not obj:
+            log.error("Échec création bâtiment pyramide %s", building_num)
+            return None
         return obj
         
     except Exception as e:
-        print(f"Erreur bâtiment pyramide {building_num}: {str(e)}")
+        log.error("Erreur bâtiment pyramide %s: %s", building_num, str(e))
         return None
 
 def generate_t_shaped_building(x, y, width, depth, height, mat, building_num):
     """Génère un bâtiment en forme de T - seulement orientation verticale (axe Z)"""
-    import random
-    
     try:
-        print(f"🅃 Génération bâtiment T #{building_num} - Orientation verticale uniquement")
-        
-        parts = []
+        log.debug("🅃 Génération bâtiment T #%s - Orientation verticale uniquement", building_num)
         
-        # T classique vertical : barre horizontale en haut, tige verticale en bas
-        # Barre horizontale (partie supérieure du T)
-        horizontal_width = width
-        horizontal_depth = depth * 0.3
-        horizontal = create_cube_with_center_bottom_origin(
-            horizontal_width, horizontal_depth, height * 0.4, 
-            (x, y + depth * 0.35, height * 0.6)  # Placée en haut
-        )
-        
-        # Tige verticale (partie inférieure du T)
-        vertical_width = width * 0.3
-        vertical_depth = depth * 0.7
-        vertical = create_cube_with_center_bottom_origin(
-            vertical_width, vertical_depth, height, 
-            (x, y - depth * 0.15, 0.02)  # Base au sol
-        )
-        
-        # Collecter les parties créées
-        if horizontal:
-            parts.append(horizontal)
-        if vertical:
-            parts.append(vertical)
-        
-        # Joindre les parties si nous en avons plusieurs
-        if len(parts) >= 2:
-            bpy.context.view_layer.objects.active = parts[0]
-            for part in parts:
-                part.select_set(True)
-            
-            try:
-                bpy.ops.object.join()
-                obj = bpy.context.active_object
-                obj.name = f"batiment_t_shaped_{building_num}_vertical"
-                
-                # Appliquer le matériau
-                obj.data.materials.append(mat)
-                return obj
-                
-            except Exception as e:
-                print(f"Erreur jointure T {building_num}: {e}")
-                return parts[0]  # Retourner au moins une partie
-        elif len(parts) == 1:
-            obj = parts[0]
-            obj.name = f"batiment_t_shaped_{building_num}_vertical"
-            obj.data.materials.append(mat)
-            return obj
-        else:
-            print(f"Échec création bâtiment T {building_num}")
+        # Barre horizontale en haut et tige verticale au sol, d'un seul gabarit
+        obj = create_template_building('t_shaped', x, y, width, depth, height, mat, f"batiment_t_shaped_{building_num}_vertical")
+        if not obj:
+            log.error("Échec création bâtiment T %s", building_num)
             return None
+        return obj
         
     except Exception as e:
-        print(f"Erreur bâtiment T {building_num}: {str(e)}")
+        log.error("Erreur bâtiment T %s: %s", building_num, str(e))
         return None
 
 def generate_complex_building(x, y, width, depth, height, mat, building_num):
     """Génère un bâtiment complexe avec plusieurs éléments"""
     try:
-        print(f"🏗️ Génération bâtiment complexe #{building_num}")
-        
-        # Base principale
-        base_height = height * 0.6
-        base = create_cube_with_center_bottom_origin(
-            width, depth, base_height, (x, y, 0.02)
-        )
+        log.debug("🏗️ Génération bâtiment complexe #%s", building_num)
         
-        if not base:
-            print(f"Échec création base complexe {building_num}")
+        # Base principale et tour centrale plus haute, d'un seul gabarit
+        obj = create_template_building('complex', x, y, width, depth, height, mat, f"batiment_complex_{building_num}")
+        if not obj:
+            log.error("Échec création base complexe %s", building_num)
             return None
-        
-        # Tour centrale plus haute
-        tower_width = width * 0.4
-        tower_depth = depth * 0.4
-        tower_height = height * 0.8
-        tower = create_cube_with_center_bottom_origin(
-            tower_width, tower_depth, tower_height, 
-            (x, y, base_height + 0.01)
-        )
-        
-        if tower:
-            # Joindre base et tour
-            bpy.context.view_layer.objects.active = base
-            base.select_set(True)
-            tower.select_set(True)
-            
-            try:
-                bpy.ops.object.join()
-                obj = bpy.context.active_object
-                obj.name = f"batiment_complex_{building_num}"
-                
-                # Appliquer le matériau
-                obj.data.materials.append(mat)
-                return obj
-                
-            except Exception as e:
-                print(f"Erreur jointure complexe {building_num}: {e}")
-                return base
-        
-        return base
+        return obj
         
     except Exception as e:
-        print(f"Erreur bâtiment complexe {building_num}: {str(e)}")
+        log.error("Erreur bâtiment complexe %s: %s", building_num, str(e))
         return None
 
-def generate_sidewalk(x, y, width, depth, mat, sidewalk_width=1.0):
-    """Génère un trottoir avec origine au centre bas"""
+def append_building_to_batch(batch, building_type, x, y, width, depth, height, mat, zone_type='RESIDENTIAL', look=None,
+                             template=None):
+    """Ajoute la géométrie d'un bâtiment typé dans un MeshBatch (mêmes proportions que les générateurs par objet)
+
+    look = (couleur, rugosité, index de zone) est écrit en attributs lus par le shader partagé;
+    template = (gabarit, taille, ratio) déjà tirés (plan), sinon resolve_building.
+    """
+    from .building_templates import resolve_building
+
+    try:
+        if hasattr(batch, 'set_look'):
+            # Réinitialisé à chaque bâtiment: pas d'aspect hérité du précédent
+            if look:
+                batch.set_look(*look)
+            else:
+                batch.set_look()
+
+        # Nuage de points Geometry Nodes: un point par bâtiment, la forme vient du gabarit
+        if hasattr(batch, 'add_building'):
+            if template is not None:
+                # Emprise tirée au plan; la forme reste le gabarit nominal du type
+                width, depth = template[1][:2]
+            return batch.add_building(building_type, x, y, width, depth, height, mat, zone_type)
+
+        # Gabarit précompilé: une seule géométrie par bâtiment, sans cubes superposés
+        template_name, size, ratio = template or resolve_building(building_type, width, depth, height)
+        batch.add_template(template_name, *size, location=(x, y, 0.0), ratio=ratio, material=mat)
+        return True
+
+    except Exception as e:
+        log.error("Erreur ajout bâtiment %s au lot: %s", building_type, str(e))
+        return False
+
+def generate_sidewalk(x, y, width, depth, mat, sidewalk_width=1.0, batch=None):
+    """Génère un trottoir avec origine au centre bas (ajouté au lot si batch est fourni)"""
     try:
         if width <= 0 or depth <= 0:
-            print(f"Paramètres trottoir invalides: w={width}, d={depth}")
+            log.debug("Paramètres trottoir invalides: w=%s, d=%s", width, depth)
             return False
             
         if not mat:
-            print("Matériau trottoir invalide")
+            log.debug("Matériau trottoir invalide")
             return False
+
+        if batch is not None:
+            return batch.add_box(width, depth, 0.02, (x, y, 0.01), material=mat)
         
         # Créer un cube pour le trottoir avec origine centre bas
         obj = create_cube_with_center_bottom_origin(
@@ -1104,7 +619,7 @@ def generate_sidewalk(x, y, width, depth, mat, sidewalk_width=1.0):
         )
         
         if not obj:
-            print("Échec de création du cube trottoir")
+            log.error("Échec de création du cube trottoir")
             return False
             
         obj.name = f"sidewalk_{x:.1f}_{y:.1f}"
@@ -1112,26 +627,32 @@ def generate_sidewalk(x, y, width, depth, mat, sidewalk_width=1.0):
         # Appliquer le matériau
         try:
             obj.data.materials.append(mat)
-            print(f"Sidewalk created at: x={x}, y={y} (origin: center bottom)")
-            return True
+            log.debug("Sidewalk created at: x=%s, y=%s (origin: center bottom)", x, y)
+            return obj
         except Exception as e:
-            print(f"Erreur application matériau trottoir: {e}")
+            log.error("Erreur application matériau trottoir: %s", e)
             return False
             
     except Exception as e:
-        print(f"Erreur création trottoir: {str(e)}")
+        log.error("Erreur création trottoir: %s", str(e))
         return False
 
-def generate_road(x, y, width, length, mat, is_horizontal=True, rotation=0.0):
-    """Génère une route avec origine au centre bas et rotation possible"""
+def generate_road(x, y, width, length, mat, is_horizontal=True, rotation=0.0, batch=None):
+    """Génère une route avec origine au centre bas et rotation possible (ajoutée au lot si batch est fourni)"""
     try:
         if width <= 0 or length <= 0:
-            print(f"Paramètres route invalides: w={width}, l={length}")
+            log.debug("Paramètres route invalides: w=%s, l=%s", width, length)
             return False
             
         if not mat:
-            print("Matériau route invalide")
+            log.debug("Matériau route invalide")
             return False
+
+        if batch is not None:
+            if abs(rotation) < 0.01 and not is_horizontal:
+                return batch.add_box(width, length, 0.005, (x, y, 0.001), material=mat)
+            return batch.add_box(length, width, 0.005, (x, y, 0.001),
+                                 rotation_z=rotation if abs(rotation) >= 0.01 else 0.0, material=mat)
         
         # Créer un cube pour la route avec origine centre bas
         if abs(rotation) < 0.01:  # Route standard (horizontale/verticale)
@@ -1158,7 +679,7 @@ def generate_road(x, y, width, length, mat, is_horizontal=True, rotation=0.0):
                 obj.rotation_euler[2] = rotation
         
         if not obj:
-            print("Échec de création du cube route")
+            log.error("Échec de création du cube route")
             return False
             
         # Nom selon le type de route
@@ -1171,26 +692,29 @@ def generate_road(x, y, width, length, mat, is_horizontal=True, rotation=0.0):
         try:
             obj.data.materials.append(mat)
             road_type = "diagonale" if abs(rotation) > 0.01 else ("horizontale" if is_horizontal else "verticale")
-            print(f"Road created at: x={x}, y={y}, {road_type} (rotation: {rotation:.2f})")
-            return True
+            log.debug("Road created at: x=%s, y=%s, %s (rotation: %.2f)", x, y, road_type, rotation)
+            return obj
         except Exception as e:
-            print(f"Erreur application matériau route: {e}")
+            log.error("Erreur application matériau route: %s", e)
             return False
             
     except Exception as e:
-        print(f"Erreur création route: {str(e)}")
+        log.error("Erreur création route: %s", str(e))
         return False
 
-def generate_intersection(x, y, size, mat):
-    """Génère un carrefour (intersection) à la position donnée"""
+def generate_intersection(x, y, size, mat, batch=None):
+    """Génère un carrefour (intersection) à la position donnée (ajouté au lot si batch est fourni)"""
     try:
         if size <= 0:
-            print(f"Taille carrefour invalide: {size}")
+            log.debug("Taille carrefour invalide: %s", size)
             return False
             
         if not mat:
-            print("Matériau carrefour invalide")
+            log.debug("Matériau carrefour invalide")
             return False
+
+        if batch is not None:
+            return batch.add_box(size, size, 0.006, (x, y, 0.001), material=mat)
         
         # Créer un cube carré pour le carrefour
         obj = create_cube_with_center_bottom_origin(
@@ -1199,7 +723,7 @@ def generate_intersection(x, y, size, mat):
         )
         
         if not obj:
-            print("Échec de création du cube carrefour")
+            log.error("Échec de création du cube carrefour")
             return False
             
         obj.name = f"intersection_{x:.1f}_{y:.1f}"
@@ -1207,17 +731,44 @@ def generate_intersection(x, y, size, mat):
         # Appliquer le matériau
         try:
             obj.data.materials.append(mat)
-            print(f"Intersection created at: x={x}, y={y}, size={size}")
-            return True
+            log.debug("Intersection created at: x=%s, y=%s, size=%s", x, y, size)
+            return obj
         except Exception as e:
-            print(f"Erreur application matériau carrefour: {e}")
+            log.error("Erreur application matériau carrefour: %s", e)
             return False
             
     except Exception as e:
-        print(f"Erreur création carrefour: {str(e)}")
+        log.error("Erreur création carrefour: %s", str(e))
+        return False
+
+def generate_junction_patch(crossing, mat, height=0.007, z=0.001, batch=None):
+    """Patch de jonction posé sur la zone commune de deux routes qui se croisent
+
+    crossing vient de road_crossings.find_road_crossings; le patch dépasse le dessus
+    des deux chaussées (routes à 0.006, carrefours à 0.007) pour supprimer le z-fighting.
+    """
+    from .road_crossings import junction_patch
+
+    try:
+        if not mat:
+            log.debug("Matériau jonction invalide")
+            return False
+        x, y = (float(value) for value in crossing['point'])
+        outline = junction_patch(crossing)
+
+        if batch is not None:
+            return batch.add_prism(outline, height, (x, y, z), material=mat)
+
+        from .mesh_batch import MeshBatch
+        patch = MeshBatch(f"junction_{x:.1f}_{y:.1f}", mat)
+        patch.add_prism(outline, height, (x, y, z))
+        return patch.build_object() or False
+
+    except Exception as e:
+        log.error("Erreur création jonction: %s", str(e))
         return False
 
-def generate_diagonal_road(start_x, start_y, end_x, end_y, width, mat):
+def generate_diagonal_road(start_x, start_y, end_x, end_y, width, mat, batch=None):
     """Génère une route diagonale entre deux points"""
     try:
         import math
@@ -1228,7 +779,7 @@ def generate_diagonal_road(start_x, start_y, end_x, end_y, width, mat):
         length = math.sqrt(dx * dx + dy * dy)
         
         if length <= 0:
-            print("Longueur route diagonale invalide")
+            log.debug("Longueur route diagonale invalide")
             return False
         
         # Calculer l'angle de rotation
@@ -1239,1128 +790,281 @@ def generate_diagonal_road(start_x, start_y, end_x, end_y, width, mat):
         center_y = (start_y + end_y) / 2
         
         # Générer la route avec rotation
-        return generate_road(center_x, center_y, width, length, mat, is_horizontal=True, rotation=angle)
+        return generate_road(center_x, center_y, width, length, mat, is_horizontal=True, rotation=angle, batch=batch)
         
     except Exception as e:
-        print(f"Erreur création route diagonale: {str(e)}")
-        return False
-
-def generate_unified_city_grid(block_sizes, road_width, road_mat, side_mat, build_mat, max_floors, regen_only, district_materials=None, sidewalk_width=1.0, shape_mode='AUTO', enable_diagonal_roads=False, diagonal_road_frequency=30.0, enable_intersections=True, intersection_size_factor=1.2, buildings_per_block=1, seamless_roads=True, building_variety='MEDIUM', height_variation=0.5):
-    """Génère une grille unifiée de ville avec blocs et routes parfaitement alignés et gestion d'erreurs"""
-    
-    try:
-        if not block_sizes or not isinstance(block_sizes, list):
-            print("ERREUR: block_sizes invalide")
-            return False
-            
-        grid_width = len(block_sizes)
-        grid_length = len(block_sizes[0]) if block_sizes else 0
-        
-        if grid_width == 0 or grid_length == 0:
-            print("ERREUR: Dimensions de grille invalides")
-            return False
-        
-        print(f"Génération grille {grid_width}x{grid_length}")
-        
-        # Calculer les positions absolues de début de chaque élément
-        x_starts = []  # Position de début X pour chaque colonne
-        y_starts = []  # Position de début Y pour chaque rangée
-        
-        # Calculer les positions X avec validation
-        current_x = 0
-        for i in range(grid_width):
-            x_starts.append(current_x)
-            try:
-                # Prendre la largeur maximale de cette colonne
-                # Adaptation pour la nouvelle structure de données
-                max_width = max(
-                    block_sizes[i][j]['size'][0] if isinstance(block_sizes[i][j], dict) else block_sizes[i][j][0] 
-                    for j in range(grid_length)
-                )
-                if max_width <= 0:
-                    print(f"AVERTISSEMENT: Largeur invalide à la position [{i}], utilisation valeur par défaut")
-                    max_width = 10
-                current_x += max_width
-                if i < grid_width - 1:  # Ajouter une route sauf après la dernière colonne
-                    current_x += road_width
-            except (IndexError, TypeError, ValueError) as e:
-                print(f"ERREUR lors du calcul position X pour colonne {i}: {e}")
-                return False
-        
-        # Calculer les positions Y avec validation
-        current_y = 0
-        for j in range(grid_length):
-            y_starts.append(current_y)
-            try:
-                # Prendre la profondeur maximale de cette rangée
-                # Adaptation pour la nouvelle structure de données
-                max_depth = max(
-                    block_sizes[i][j]['size'][1] if isinstance(block_sizes[i][j], dict) else block_sizes[i][j][1] 
-                    for i in range(grid_width)
-                )
-                if max_depth <= 0:
-                    print(f"AVERTISSEMENT: Profondeur invalide à la position [{j}], utilisation valeur par défaut")
-                    max_depth = 10
-                current_y += max_depth
-                if j < grid_length - 1:  # Ajouter une route sauf après la dernière rangée
-                    current_y += road_width
-            except (IndexError, TypeError, ValueError) as e:
-                print(f"ERREUR lors du calcul position Y pour rangée {j}: {e}")
-                return False
-        
-        # Générer les routes horizontales (entre les rangées)
-        roads_created = 0
-        print(f"Génération de {grid_length - 1} routes horizontales...")
-        for j in range(grid_length - 1):
-            try:
-                # Position Y de la route entre les rangées j et j+1
-                # Adaptation pour la nouvelle structure de données
-                max_depth_j = max(
-                    block_sizes[i][j]['size'][1] if isinstance(block_sizes[i][j], dict) else block_sizes[i][j][1] 
-                    for i in range(grid_width)
-                )
-                y_road_start = y_starts[j] + max_depth_j  # Route commence directement après le bloc
-                
-                # Position du centre de la route (origine centre bas)
-                y_road_center = y_road_start + road_width/2
-                
-                # La route s'étend sur TOUTE la largeur, incluant les intersections
-                x_road_start = 0
-                # Calculer la largeur totale incluant blocs ET routes verticales
-                total_width = 0
-                for i in range(grid_width):
-                    max_width = max(
-                        block_sizes[i][k]['size'][0] if isinstance(block_sizes[i][k], dict) else block_sizes[i][k][0] 
-                        for k in range(grid_length)
-                    )
-                    total_width += max_width
-                    if i < grid_width - 1:  # Ajouter largeur route verticale sauf après dernière colonne
-                        total_width += road_width
-                
-                road_length = total_width
-                x_road_center = x_road_start + road_length/2
-                
-                print(f"Route horizontale {j}: centre=({x_road_center}, {y_road_center}), largeur={road_width}, longueur={road_length}")
-                
-                if generate_road(x_road_center, y_road_center, road_width, road_length, road_mat, is_horizontal=True):
-                    roads_created += 1
-                    print(f"  ✓ Route horizontale {j} créée avec succès")
-                else:
-                    print(f"  ✗ AVERTISSEMENT: Échec création route horizontale {j}")
-                    
-            except Exception as e:
-                print(f"ERREUR lors de la création route horizontale {j}: {e}")
-        
-        # Générer les routes verticales (entre les colonnes)
-        print(f"Génération de {grid_width - 1} routes verticales...")
-        for i in range(grid_width - 1):
-            try:
-                # Position X de la route entre les colonnes i et i+1
-                # Adaptation pour la nouvelle structure de données
-                max_width_i = max(
-                    block_sizes[i][j]['size'][0] if isinstance(block_sizes[i][j], dict) else block_sizes[i][j][0] 
-                    for j in range(grid_length)
-                )
-                x_road_start = x_starts[i] + max_width_i  # Route commence directement après le bloc
-                
-                # Position du centre de la route (origine centre bas)
-                x_road_center = x_road_start + road_width/2
-                
-                # La route s'étend sur TOUTE la hauteur, incluant les intersections
-                y_road_start = 0
-                # Calculer la hauteur totale incluant blocs ET routes horizontales
-                total_height = 0
-                for j in range(grid_length):
-                    max_depth = max(
-                        block_sizes[k][j]['size'][1] if isinstance(block_sizes[k][j], dict) else block_sizes[k][j][1] 
-                        for k in range(grid_width)
-                    )
-                    total_height += max_depth
-                    if j < grid_length - 1:  # Ajouter largeur route horizontale sauf après dernière rangée
-                        total_height += road_width
-                
-                road_length = total_height
-                y_road_center = y_road_start + road_length/2
-                
-                print(f"Route verticale {i}: centre=({x_road_center}, {y_road_center}), largeur={road_width}, longueur={road_length}")
-                
-                if generate_road(x_road_center, y_road_center, road_width, road_length, road_mat, is_horizontal=False):
-                    roads_created += 1
-                    print(f"  ✓ Route verticale {i} créée avec succès")
-                else:
-                    print(f"  ✗ AVERTISSEMENT: Échec création route verticale {i}")
-                    
-            except Exception as e:
-                print(f"ERREUR lors de la création route verticale {i}: {e}")
-        
-        print(f"Routes créées: {roads_created}")
-        
-        # Générer les blocs et trottoirs
-        print(f"🏗️ DÉBUT GÉNÉRATION DES BLOCS ET BÂTIMENTS")
-        print(f"📐 Grille: {grid_width}x{grid_length} = {grid_width * grid_length} blocs à traiter")
-        print(f"🔧 Paramètres: regen_only={regen_only}, max_floors={max_floors}")
-        print(f"🎨 Matériaux: road={road_mat.name if road_mat else None}, side={side_mat.name if side_mat else None}, build={build_mat.name if build_mat else None}")
-        
-        blocks_created = 0
-        buildings_created = 0
-        
-        for i in range(grid_width):
-            for j in range(grid_length):
-                print(f"\n🔄 TRAITEMENT BLOC [{i}][{j}]:")
-                try:
-                    # Extraire les informations du bloc (nouvelle structure)
-                    if isinstance(block_sizes[i][j], dict):
-                        block_info = block_sizes[i][j]
-                        block_width, block_depth = block_info['size']
-                        zone_type = block_info.get('zone_type', 'RESIDENTIAL')
-                        zone_info = block_info.get('zone_info', {})
-                    else:
-                        # Support de l'ancienne structure pour compatibilité
-                        block_width, block_depth = block_sizes[i][j]
-                        zone_type = 'RESIDENTIAL'
-                        zone_info = {
-                            'size_multiplier': 1.0,
-                            'min_floors': 1,
-                            'max_floors_multiplier': 1.0,
-                            'shape_preference': ['RECT']
-                        }
-                        zone_info = {}
-                    
-                    if block_width <= 0 or block_depth <= 0:
-                        print(f"AVERTISSEMENT: Taille de bloc invalide à [{i}][{j}]: {block_width}x{block_depth}")
-                        continue
-                    
-                    # Position du bloc (coordonnées du coin)
-                    x_block = x_starts[i]
-                    y_block = y_starts[j]
-                    
-                    # Position du centre du bloc pour le trottoir (origine centre bas)
-                    x_center_sidewalk = x_block + block_width/2
-                    y_center_sidewalk = y_block + block_depth/2
-                    
-                    # Générer le trottoir aux coordonnées du centre
-                    if generate_sidewalk(x_center_sidewalk, y_center_sidewalk, block_width, block_depth, side_mat, sidewalk_width):
-                        blocks_created += 1
-                    else:
-                        print(f"AVERTISSEMENT: Échec création trottoir à [{i}][{j}]")
-                    
-                    # Position du centre du bloc pour le bâtiment (identique au trottoir)
-                    x_center = x_center_sidewalk
-                    y_center = y_center_sidewalk
-                    
-                    # Générer le bâtiment si ce n'est pas une régénération
-                    print(f"   🏠 SECTION BÂTIMENT pour bloc [{i}][{j}]:")
-                    print(f"      regen_only = {regen_only}")
-                    print(f"      zone_type = {zone_type}")
-                    print(f"      zone_info = {zone_info}")
-                    print(f"      🔍 DÉBOGAGE: Condition 'not regen_only' = {not regen_only}")
-                    print(f"      🔍 DÉBOGAGE: Type regen_only = {type(regen_only)}")
-                    print(f"      🔍 DÉBOGAGE: Valeur regen_only = '{regen_only}'")
-                    
-                    if not regen_only:
-                        print(f"      ✅ ENTRÉE dans génération bâtiment (pas de régénération)")
-                        try:
-                            # Calculer la hauteur avec le nouveau système de variation
-                            print(f"         📏 Calcul hauteur avec variété: max_floors={max_floors}, variation={height_variation}")
-                            
-                            # Hauteur de base selon la zone
-                            if zone_info and len(zone_info) > 0:
-                                print(f"         ➡️ Utilisation zone_info pour hauteur de base")
-                                min_floors = zone_info.get('min_floors', 1)
-                                max_floors_multiplier = zone_info.get('max_floors_multiplier', 1.0)
-                                zone_max_floors = max(min_floors, int(max_floors * max_floors_multiplier))
-                                base_height = random.randint(min_floors, zone_max_floors) * 3
-                            else:
-                                print(f"         ➡️ Utilisation logique par défaut pour hauteur de base")
-                                min_height = max(1, max_floors // 4)
-                                base_height = random.randint(min_height, max_floors) * 3
-                                if base_height < 3:
-                                    base_height = 3
-                            
-                            print(f"         📐 Hauteur de base calculée: {base_height}m pour bloc [{i}][{j}]")
-                            
-                            # Appliquer la variation de hauteur
-                            height = calculate_height_with_variation(base_height, max_floors, height_variation, zone_type, building_variety)
-                            print(f"         🎯 Hauteur finale avec variation: {height}m")
-                            
-                            # Bâtiment légèrement plus petit que le bloc, en tenant compte de la largeur du trottoir
-                            total_building_width = block_width - (2 * sidewalk_width)
-                            total_building_depth = block_depth - (2 * sidewalk_width)
-                            
-                            # S'assurer que les dimensions du bâtiment sont positives
-                            if total_building_width <= 0 or total_building_depth <= 0:
-                                print(f"  AVERTISSEMENT: Dimensions bloc invalides [{i}][{j}]: {total_building_width}x{total_building_depth}")
-                                total_building_width = max(1, total_building_width)
-                                total_building_depth = max(1, total_building_depth)
-                            
-                            # Calculer les subdivisions pour placer plusieurs bâtiments
-                            subdivisions = calculate_building_subdivisions(total_building_width, total_building_depth, buildings_per_block)
-                            
-                            print(f"  📐 GÉNÉRATION {len(subdivisions)} BÂTIMENT(S) dans le bloc [{i}][{j}]:")
-                            print(f"    Zone: {zone_type}, Matériau: {build_mat.name if build_mat else 'None'}")
-                            
-                            # Générer chaque bâtiment dans ses subdivisions
-                            buildings_created_in_block = 0
-                            for sub_idx, (sub_x, sub_y, sub_width, sub_depth) in enumerate(subdivisions):
-                                # Position absolue de ce sous-bâtiment
-                                sub_x_center = x_center - total_building_width/2 + sub_x + sub_width/2
-                                sub_y_center = y_center - total_building_depth/2 + sub_y + sub_depth/2
-                                
-                                # Calculer une hauteur spécifique pour ce sous-bâtiment (avec variation)
-                                sub_height = calculate_height_with_variation(base_height, max_floors, height_variation, zone_type, building_variety)
-                                
-                                # Ajouter un petit espace entre les bâtiments s'il y en a plusieurs
-                                margin = 0.5 if buildings_per_block > 1 else 0.0
-                                final_width = max(0.5, sub_width - margin)
-                                final_depth = max(0.5, sub_depth - margin)
-                                
-                                print(f"    Sous-bâtiment {sub_idx + 1}: ({sub_x_center:.1f}, {sub_y_center:.1f}) - {final_width:.1f}x{final_depth:.1f}x{sub_height:.1f}")
-                                
-                                # DÉBOGAGE: Vérifier les paramètres avant génération
-                                if final_width <= 0 or final_depth <= 0 or sub_height <= 0:
-                                    print(f"    ❌ ERREUR: Paramètres invalides - sous-bâtiment {sub_idx + 1} non créé")
-                                    continue
-                                
-                                try:
-                                    building_obj = generate_building(sub_x_center, sub_y_center, final_width, final_depth, sub_height, build_mat, zone_type, district_materials, shape_mode, building_variety)
-                                    
-                                    if building_obj:
-                                        buildings_created += 1
-                                        buildings_created_in_block += 1
-                                        print(f"    ✅ Sous-bâtiment {sub_idx + 1} créé: {building_obj.name}")
-                                        print(f"    � Position finale: ({building_obj.location.x:.1f}, {building_obj.location.y:.1f}, {building_obj.location.z:.1f})")
-                                        
-                                        # Vérifier que l'objet est visible
-                                        if hasattr(building_obj, 'hide_viewport'):
-                                            if building_obj.hide_viewport:
-                                                print(f"    ⚠️ AVERTISSEMENT: Bâtiment masqué dans viewport")
-                                                building_obj.hide_viewport = False
-                                        if hasattr(building_obj, 'hide_render'):
-                                            if building_obj.hide_render:
-                                                print(f"    ⚠️ AVERTISSEMENT: Bâtiment masqué au rendu")
-                                                building_obj.hide_render = False
-                                    else:
-                                        print(f"    ❌ ÉCHEC génération sous-bâtiment {sub_idx + 1} - Objet None retourné")
-                                        
-                                except Exception as e:
-                                    print(f"❌ ERREUR lors de la création du sous-bâtiment {sub_idx + 1}: {e}")
-                            
-                            print(f"  📊 Bloc [{i}][{j}] terminé: {buildings_created_in_block}/{len(subdivisions)} bâtiments créés")
-                            
-                        except Exception as e:
-                            print(f"❌ ERREUR lors de la création des bâtiments du bloc [{i}][{j}]: {e}")
-                    else:
-                        print(f"      ❌ SKIP bâtiment [{i}][{j}] - Mode régénération activé (regen_only={regen_only})")
-                        print(f"      ⚠️ ALERTE: Les bâtiments ne seront PAS générés car regen_only=True")
-                
-                except Exception as e:
-                    print(f"ERREUR lors de la création bloc à [{i}][{j}]: {e}")
-        
-        print(f"Blocs créés: {blocks_created}, Bâtiments créés: {buildings_created}")
-        
-        # Générer les carrefours aux intersections (si activé)
-        intersections_created = 0
-        if enable_intersections:
-            print("Génération des carrefours...")
-            intersection_size = road_width * intersection_size_factor
-            
-            # Carrefours aux intersections des routes horizontales et verticales
-            for i in range(grid_width - 1):
-                for j in range(grid_length - 1):
-                    try:
-                        # Position de l'intersection
-                        # Calculer position X de la route verticale i
-                        max_width_i = max(
-                            block_sizes[i][k]['size'][0] if isinstance(block_sizes[i][k], dict) else block_sizes[i][k][0] 
-                            for k in range(grid_length)
-                        )
-                        x_road_start = x_starts[i] + max_width_i
-                        x_intersection = x_road_start + road_width/2
-                        
-                        # Calculer position Y de la route horizontale j
-                        max_depth_j = max(
-                            block_sizes[k][j]['size'][1] if isinstance(block_sizes[k][j], dict) else block_sizes[k][j][1] 
-                            for k in range(grid_width)
-                        )
-                        y_road_start = y_starts[j] + max_depth_j
-                        y_intersection = y_road_start + road_width/2
-                        
-                        if generate_intersection(x_intersection, y_intersection, intersection_size, road_mat):
-                            intersections_created += 1
-                            
-                    except Exception as e:
-                        print(f"ERREUR lors de la création carrefour [{i}][{j}]: {e}")
-            
-            print(f"Carrefours créés: {intersections_created}")
-        
-        # Générer les routes diagonales (si activé)
-        diagonal_roads_created = 0
-        if enable_diagonal_roads and diagonal_road_frequency > 0:
-            print(f"Génération des routes diagonales (fréquence: {diagonal_road_frequency}%)...")
-            
-            # Routes diagonales entre blocs adjacents
-            for i in range(grid_width - 1):
-                for j in range(grid_length - 1):
-                    # Chance de générer une route diagonale
-                    if random.random() * 100 < diagonal_road_frequency:
-                        try:
-                            # Position du bloc [i][j]
-                            block_info_1 = block_sizes[i][j]
-                            if isinstance(block_info_1, dict):
-                                block_width_1, block_depth_1 = block_info_1['size']
-                            else:
-                                block_width_1, block_depth_1 = block_info_1
-                            
-                            # Position du bloc [i+1][j+1] (diagonalement opposé)
-                            block_info_2 = block_sizes[i+1][j+1]
-                            if isinstance(block_info_2, dict):
-                                block_width_2, block_depth_2 = block_info_2['size']
-                            else:
-                                block_width_2, block_depth_2 = block_info_2
-                            
-                            # Centre du premier bloc
-                            x_center_1 = x_starts[i] + block_width_1/2
-                            y_center_1 = y_starts[j] + block_depth_1/2
-                            
-                            # Centre du bloc diagonalement opposé
-                            x_center_2 = x_starts[i+1] + block_width_2/2
-                            y_center_2 = y_starts[j+1] + block_depth_2/2
-                            
-                            # Créer route diagonale entre les centres des blocs
-                            if generate_diagonal_road(x_center_1, y_center_1, x_center_2, y_center_2, road_width * 0.7, road_mat):
-                                diagonal_roads_created += 1
-                                
-                        except Exception as e:
-                            print(f"ERREUR lors de la création route diagonale [{i}][{j}] -> [{i+1}][{j+1}]: {e}")
-            
-            # Routes diagonales dans l'autre direction (du nord-est au sud-ouest)
-            for i in range(grid_width - 1):
-                for j in range(1, grid_length):
-                    # Chance de générer une route diagonale
-                    if random.random() * 100 < diagonal_road_frequency:
-                        try:
-                            # Position du bloc [i][j] (en haut à gauche)
-                            block_info_1 = block_sizes[i][j]
-                            if isinstance(block_info_1, dict):
-                                block_width_1, block_depth_1 = block_info_1['size']
-                            else:
-                                block_width_1, block_depth_1 = block_info_1
-                            
-                            # Position du bloc [i+1][j-1] (en bas à droite)
-                            block_info_2 = block_sizes[i+1][j-1]
-                            if isinstance(block_info_2, dict):
-                                block_width_2, block_depth_2 = block_info_2['size']
-                            else:
-                                block_width_2, block_depth_2 = block_info_2
-                            
-                            # Centre du premier bloc
-                            x_center_1 = x_starts[i] + block_width_1/2
-                            y_center_1 = y_starts[j] + block_depth_1/2
-                            
-                            # Centre du bloc diagonalement opposé
-                            x_center_2 = x_starts[i+1] + block_width_2/2
-                            y_center_2 = y_starts[j-1] + block_depth_2/2
-                            
-                            # Créer route diagonale entre les centres des blocs
-                            if generate_diagonal_road(x_center_1, y_center_1, x_center_2, y_center_2, road_width * 0.7, road_mat):
-                                diagonal_roads_created += 1
-                                
-                        except Exception as e:
-                            print(f"ERREUR lors de la création route diagonale [{i}][{j}] -> [{i+1}][{j-1}]: {e}")
-            
-            print(f"Routes diagonales créées: {diagonal_roads_created}")
-        
-        print(f"=== RÉSUMÉ DE GÉNÉRATION ===")
-        print(f"Routes standard: {roads_created}")
-        print(f"Carrefours: {intersections_created}")
-        print(f"Routes diagonales: {diagonal_roads_created}")
-        print(f"Blocs: {blocks_created}")
-        print(f"Bâtiments: {buildings_created}")
-        
-        return True
-        
-    except Exception as e:
-        print(f"ERREUR CRITIQUE lors de la génération de grille: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
+        log.error("Erreur création route diagonale: %s", str(e))
         return False
 
 def safe_delete_objects(object_filter=None):
-    """Supprime les objets de manière sécurisée avec filtrage optionnel"""
+    """Supprime les objets de la ville (collection dédiée) avec filtrage optionnel"""
     try:
-        # Désélectionner tout d'abord
-        bpy.ops.object.select_all(action='DESELECT')
-        
-        objects_to_delete = []
-        
+        from .city_collections import city_objects, remove_city_objects
+
+        # Seuls les objets possédés par la ville sont candidats: pas de parcours de la scène
+        objects_to_delete = city_objects()
         if object_filter:
-            # Filtrer les objets selon les critères fournis
-            for obj in bpy.context.scene.objects:
-                if object_filter(obj):
-                    objects_to_delete.append(obj)
-        else:
-            # Par défaut, supprimer tous les objets mesh
-            for obj in bpy.context.scene.objects:
-                if obj.type == 'MESH':
-                    objects_to_delete.append(obj)
-        
-        print(f"Suppression de {len(objects_to_delete)} objets...")
-        
-        # Sélectionner et supprimer les objets
-        for obj in objects_to_delete:
-            try:
-                obj.select_set(True)
-            except Exception as e:
-                print(f"Impossible de sélectionner l'objet {obj.name}: {e}")
-        
-        if objects_to_delete:
-            try:
-                bpy.ops.object.delete(use_global=False)
-                print(f"Suppression réussie de {len(objects_to_delete)} objets")
-            except Exception as e:
-                print(f"Erreur lors de la suppression des objets: {e}")
-                return False
+            objects_to_delete = [obj for obj in objects_to_delete if object_filter(obj)]
         
+        log.debug("Suppression de %s objets...", len(objects_to_delete))
+        remove_city_objects(objects_to_delete)
         return True
         
     except Exception as e:
-        print(f"Erreur critique lors de la suppression des objets: {str(e)}")
+        log.error("Erreur critique lors de la suppression des objets: %s", str(e))
         return False
 
 def regenerate_roads_and_sidewalks(context):
     """Régénère seulement les routes et trottoirs"""
     try:
-        # Créer un filtre pour ne supprimer que routes et trottoirs, carrefours
-        def road_sidewalk_filter(obj):
-            return any(keyword in obj.name.lower() for keyword in ['road', 'route', 'sidewalk', 'trottoir', 'intersection'])
-        
-        # Supprimer seulement les routes, trottoirs et carrefours
-        if safe_delete_objects(road_sidewalk_filter):
-            return generate_city(context, regen_only=True)
-        else:
-            print("Échec de la suppression des routes, trottoirs et carrefours")
-            return False
+        # Le plan stocké est comparé aux paramètres courants: routes recréées, blocs déplacés
+        from .city_update import update_city
+        return update_city(context)
             
     except Exception as e:
-        print(f"Erreur lors de la régénération des routes et trottoirs: {str(e)}")
+        log.error("Erreur lors de la régénération des routes et trottoirs: %s", str(e))
         return False
 
+@in_city_collection
 def generate_city(context, regen_only=False):
     """Génère une ville complète avec gestion d'erreurs robuste"""
+    try:
+        prepared = prepare_city_generation(context, regen_only)
+        if isinstance(prepared, bool):
+            # Mise à jour incrémentale effectuée, ou échec de préparation
+            return prepared
+        plan, emitter, mesh_backend = prepared
+        
+        # Émettre le plan avec le backend choisi
+        try:
+            emitter.emit(plan)
+            if not regen_only:
+                from .city_update import save_plan
+                save_plan(context.scene, plan, mesh_backend)
+        except Exception as e:
+            log.error("ERREUR lors de la génération de la grille: %s", str(e))
+            log.error("Traceback: %s", traceback.format_exc())
+            return False
+        
+        log.info("=== Génération terminée avec succès ===")
+        return True
+        
+    except Exception as e:
+        log.error("ERREUR CRITIQUE lors de la génération de ville: %s", str(e))
+        log.error("Traceback: %s", traceback.format_exc())
+        return False
+
+def prepare_city_generation(context, regen_only=False, max_blocks=100):
+    """Prépare une génération: paramètres, matériaux, nettoyage, plan et émetteur
+
+    Retourne (plan, emitter, mesh_backend), ou un booléen si la génération est déjà
+    terminée (mise à jour incrémentale) ou a échoué. Utilisé par generate_city et
+    par l'opérateur modal.
+    """
     try:
         # Réinitialiser le compteur de bâtiments
         global building_counter
         building_counter = 0
+        configure_from_scene(context.scene)
+        palette.reset()
         
-        print("=== Début de génération de ville ===")
+        log.info("=== Début de génération de ville ===")
         
         # Vérifications préliminaires
         state_errors = check_blender_state()
         if state_errors:
             for error in state_errors:
-                print(f"ERREUR ÉTAT: {error}")
+                log.error("ERREUR ÉTAT: %s", error)
             return False
         
         # Accéder aux propriétés directement depuis la scène (nouvelle architecture)
         scene = context.scene
         
-        # Utiliser notre fonction utilitaire pour convertir de façon sécurisée
-        width = safe_int(getattr(scene, 'citygen_width', 5), 5)
-        length = safe_int(getattr(scene, 'citygen_length', 5), 5)
-        max_floors = safe_int(getattr(scene, 'citygen_max_floors', 8), 8)
-        shape_mode = "AUTO"  # Valeur par défaut pour l'instant
-        
-        # Nouvelles propriétés pour bâtiments multiples et routes collées
-        buildings_per_block = safe_int(getattr(scene, 'citygen_buildings_per_block', 1), 1)
+        # Paramètres du plan (lecture partagée avec la mise à jour incrémentale)
+        from .city_plan import plan_parameters_from_scene
+        params = plan_parameters_from_scene(scene)
+        width = params['width']
+        length = params['length']
+        max_floors = params['max_floors']
+        shape_mode = params['shape_mode']
+        buildings_per_block = params['buildings_per_block']
         seamless_roads = getattr(scene, 'citygen_seamless_roads', True)
-        building_variety = getattr(scene, 'citygen_building_variety', 'MEDIUM')
-        height_variation = safe_float(getattr(scene, 'citygen_height_variation', 0.5), 0.5)
-        
-        # Nouveaux paramètres pour la variété des blocs (valeurs par défaut)
-        base_size = 10.0
-        block_variety = "MEDIUM"
-        district_mode = False
-        district_type = "MIXED"
-        commercial_ratio = 0.2
-        residential_ratio = 0.6
-        industrial_ratio = 0.2
-        
-        # Nouveaux paramètres pour les largeurs des routes et trottoirs
-        road_width = safe_float(getattr(scene, 'citygen_road_width', 4.0), 4.0)
-        sidewalk_width = 0.0 if seamless_roads else 1.0  # Routes collées = pas de trottoirs
-        
-        # Nouveaux paramètres pour les routes diagonales et carrefours (valeurs par défaut)
-        enable_diagonal_roads = False
-        diagonal_road_frequency = 30.0
-        enable_intersections = True
-        intersection_size_factor = 1.2  # Valeur par défaut pour l'instant
+        mesh_backend = getattr(scene, 'citygen_mesh_backend', 'OBJECTS')
+        shared_snap = safe_float(getattr(scene, 'citygen_shared_snap', 0.0), 0.0)
+        building_variety = params['building_variety']
+        height_variation = params['height_variation']
+        district_mode = params['district_mode']
+        road_width = params['road_width']
+        sidewalk_width = params['sidewalk_width']
+        enable_diagonal_roads = params['enable_diagonal_roads']
+        diagonal_road_frequency = params['diagonal_road_frequency']
+        enable_intersections = params['enable_intersections']
+        intersection_size_factor = params['intersection_size_factor']
+        
+        # Graine de la ville: 0 = nouvelle graine à chaque génération
+        seed = params['seed']
+        if seed <= 0:
+            from .city_rng import new_seed
+            seed = new_seed()
+        params['seed'] = seed
+        scene['citygen_last_seed'] = seed
         
         # Validation des paramètres
-        param_errors = validate_parameters(width, length, max_floors)
+        param_errors = validate_parameters(width, length, max_floors, max_blocks)
         if param_errors:
             for error in param_errors:
-                print(f"ERREUR PARAMÈTRE: {error}")
+                log.error("ERREUR PARAMÈTRE: %s", error)
             return False
         
-        print(f"Paramètres validés: width={width}, length={length}, max_floors={max_floors}, shape={shape_mode}")
-        print(f"Infrastructure: road_width={road_width}, sidewalk_width={sidewalk_width}, seamless_roads={seamless_roads}")
-        print(f"Bâtiments: {buildings_per_block} par bloc, variété={building_variety}, variation_hauteur={height_variation}")
-        print(f"Routes avancées: diagonales={enable_diagonal_roads} ({diagonal_road_frequency}%), carrefours={enable_intersections} (x{intersection_size_factor})")
+        log.info("Paramètres validés: width=%s, length=%s, max_floors=%s, shape=%s", width, length, max_floors, shape_mode)
+        log.info("Infrastructure: road_width=%s, sidewalk_width=%s, seamless_roads=%s", road_width, sidewalk_width, seamless_roads)
+        log.info("Bâtiments: %s par bloc, variété=%s, variation_hauteur=%s", buildings_per_block, building_variety, height_variation)
+        log.info("Routes avancées: diagonales=%s (%s%%), carrefours=%s (x%s)", enable_diagonal_roads, diagonal_road_frequency, enable_intersections, intersection_size_factor)
+        log.info("🎲 Graine: %s", seed)
+
+        # Même graine et ville existante: seuls les éléments modifiés sont reconstruits
+        if not regen_only:
+            from .city_update import can_update_city, update_city
+            if can_update_city(scene, seed, mesh_backend):
+                log.info("♻️ Ville existante avec la même graine: mise à jour incrémentale")
+                return update_city(context)
 
         # Créer les matériaux avec gestion d'erreurs
         # Forcer la suppression des anciens matériaux pour s'assurer des nouvelles couleurs
         old_materials = ["RoadMat", "SidewalkMat", "BuildingMat"]
         for mat_name in old_materials:
             if mat_name in bpy.data.materials:
-                print(f"Suppression de l'ancien matériau: {mat_name}")
+                log.info("Suppression de l'ancien matériau: %s", mat_name)
                 bpy.data.materials.remove(bpy.data.materials[mat_name])
         
-        road_mat = create_material("RoadMat", (1.0, 0.75, 0.8))  # Rose pâle pour les routes
-        side_mat = create_material("SidewalkMat", (0.6, 0.6, 0.6))  # Gris pour les trottoirs
-        build_mat = create_material("BuildingMat", (0.5, 1.0, 0.0))  # Vert pomme pour les bâtiments
+        road_mat, side_mat, build_mat = create_city_materials()
         
-        print(f"Matériaux créés - Route: {road_mat}, Trottoir: {side_mat}, Bâtiment: {build_mat}")
+        log.info("Matériaux créés - Route: %s, Trottoir: %s, Bâtiment: %s", road_mat, side_mat, build_mat)
         
         # Vérifier que les matériaux ont été créés avec succès
         if not road_mat or not side_mat or not build_mat:
-            print("ERREUR: Échec de création des matériaux")
+            log.error("ERREUR: Échec de création des matériaux")
             return False
 
         # Suppression sélective des objets
         if not regen_only:
-            print("Suppression de tous les objets mesh...")
+            log.info("Suppression de tous les objets mesh...")
             if not safe_delete_objects():
-                print("AVERTISSEMENT: Problème lors de la suppression des objets")
+                log.warning("AVERTISSEMENT: Problème lors de la suppression des objets")
         
         # Créer les matériaux de districts si nécessaire
         district_materials = {}
-        if district_mode:
-            district_materials = create_district_materials()
-        
-        # Générer les tailles variables des blocs avec les nouveaux paramètres
-        try:
-            block_sizes = generate_block_sizes(
-                width, length, base_size, block_variety, district_mode,
-                commercial_ratio, residential_ratio, industrial_ratio, district_type
-            )
-            if not block_sizes:
-                print("ERREUR: Échec de génération des tailles de blocs")
-                return False
-        except Exception as e:
-            print(f"ERREUR lors de la génération des tailles de blocs: {str(e)}")
-            return False
-        
-        # Générer la grille unifiée de ville
-        print(f"🚀 APPEL generate_unified_city_grid avec regen_only={regen_only}")
-        try:
-            success = generate_unified_city_grid(
-                block_sizes, road_width, road_mat, side_mat, build_mat, max_floors, regen_only, 
-                district_materials, sidewalk_width, shape_mode, 
-                enable_diagonal_roads, diagonal_road_frequency, enable_intersections, intersection_size_factor,
-                buildings_per_block, seamless_roads, building_variety, height_variation
-            )
-            if not success:
-                print("ERREUR: Échec de génération de la grille de ville")
-                return False
-        except Exception as e:
-            print(f"ERREUR lors de la génération de la grille: {str(e)}")
-            print(f"Traceback: {traceback.format_exc()}")
-            return False
-        
-        print("=== Génération terminée avec succès ===")
-        return True
-        
-    except Exception as e:
-        print(f"ERREUR CRITIQUE lors de la génération de ville: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
-        return False
-
-def generate_uniform_district(grid_width, grid_length, district_type):
-    """Génère un district uniforme du type spécifié"""
-    # Mapper les types de district aux types de zone
-    district_mapping = {
-        'RESIDENTIAL': 'RESIDENTIAL',
-        'COMMERCIAL': 'COMMERCIAL', 
-        'INDUSTRIAL': 'INDUSTRIAL',
-        'DOWNTOWN': 'COMMERCIAL',     # Centre-ville = commercial dense
-        'SUBURBAN': 'RESIDENTIAL',    # Banlieue = résidentiel
-        'BUSINESS': 'COMMERCIAL'      # Affaires = commercial
-    }
-    
-    zone_type = district_mapping.get(district_type, 'RESIDENTIAL')
-    
-    # Créer une grille uniforme du type spécifié
-    zone_assignments = []
-    for i in range(grid_width):
-        row = []
-        for j in range(grid_length):
-            row.append(zone_type)
-        zone_assignments.append(row)
-    
-    return zone_assignments
-
-def generate_block_sizes(grid_width, grid_length, base_size=10, variety='MEDIUM', district_mode=False, 
-                        commercial_ratio=0.2, residential_ratio=0.6, industrial_ratio=0.2, district_type='MIXED'):
-    """Génère une grille de tailles de blocs variées avec différents modes de variation"""
-    try:
-        if grid_width <= 0 or grid_length <= 0:
-            print(f"Dimensions de grille invalides: {grid_width}x{grid_length}")
-            return None
-            
-        if base_size <= 0:
-            print(f"Taille de base invalide: {base_size}")
-            return None
-        
-        print(f"Génération blocs - Mode: {variety}, Districts: {district_mode}, Base: {base_size}")
-        
-        # Définir les variations selon le mode choisi
-        variation_ranges = {
-            'UNIFORM': (1.0, 1.0),      # Pas de variation
-            'LOW': (0.8, 1.2),          # ±20%
-            'MEDIUM': (0.6, 1.4),       # ±40%
-            'HIGH': (0.4, 1.6),         # ±60%
-            'EXTREME': (0.25, 2.0),     # -75% à +100%
-            'DISTRICTS': (0.7, 1.3),    # ±30% mais par zones
-        }
-        
-        min_var, max_var = variation_ranges.get(variety, (0.6, 1.4))
-        
-        # Définir les types de zones et leurs caractéristiques étendues
-        zone_types = {
-            'COMMERCIAL': {
-                'size_multiplier': 1.5,     # 50% plus grand
-                'min_floors': 4,            # Bâtiments moyens à hauts
-                'max_floors_multiplier': 1.5,
-                'shape_preference': ['RECT', 'L', 'U']
-            },
-            'RESIDENTIAL': {
-                'size_multiplier': 1.0,     # Taille normale
-                'min_floors': 1,            # Bâtiments bas à moyens
-                'max_floors_multiplier': 1.0,
-                'shape_preference': ['RECT', 'L', 'T']
-            },
-            'INDUSTRIAL': {
-                'size_multiplier': 2.0,     # Double de taille
-                'min_floors': 1,            # Bâtiments bas
-                'max_floors_multiplier': 0.3,  # Peu d'étages
-                'shape_preference': ['RECT', 'L']
-            }
-        }
-        
-        # Ajuster les caractéristiques selon le type de district spécialisé
-        if district_mode and district_type != 'MIXED':
-            zone_adjustments = {
-                'DOWNTOWN': {
-                    'size_multiplier': 0.8,     # Blocs plus compacts
-                    'min_floors': 8,            # Gratte-ciels
-                    'max_floors_multiplier': 3.0,  # Très hauts
-                    'shape_preference': ['RECT']
-                },
-                'SUBURBAN': {
-                    'size_multiplier': 1.3,     # Blocs plus grands
-                    'min_floors': 1,            # Maisons basses
-                    'max_floors_multiplier': 0.5,  # 1-2 étages max
-                    'shape_preference': ['RECT', 'L']
-                },
-                'BUSINESS': {
-                    'size_multiplier': 1.2,     # Taille moyenne-grande
-                    'min_floors': 6,            # Tours de bureaux
-                    'max_floors_multiplier': 2.5,  # Hauts
-                    'shape_preference': ['RECT', 'T']
-                }
-            }
-            
-            if district_type in zone_adjustments:
-                # Appliquer les ajustements à tous les types de zones
-                adjustments = zone_adjustments[district_type]
-                for zone_type in zone_types:
-                    zone_types[zone_type].update(adjustments)
-        
-        block_sizes = []
-        zone_assignments = []
-        
-        # Générer les assignations de zones si mode districts activé
-        if district_mode:
-            if district_type == 'MIXED':
-                # Mode mixte : utiliser les ratios comme avant
-                zone_assignments = generate_district_zones(grid_width, grid_length, 
-                                                         commercial_ratio, residential_ratio, industrial_ratio)
-            else:
-                # Mode spécialisé : tout le district est du même type
-                zone_assignments = generate_uniform_district(grid_width, grid_length, district_type)
-        
-        for i in range(grid_width):
-            row = []
-            zone_row = []
-            for j in range(grid_length):
-                try:
-                    # Déterminer le type de zone
-                    if district_mode and i < len(zone_assignments) and j < len(zone_assignments[i]):
-                        zone_type = zone_assignments[i][j]
-                    else:
-                        zone_type = 'RESIDENTIAL'  # Type par défaut
-                    
-                    zone_row.append(zone_type)
-                    zone_info = zone_types[zone_type]
-                    
-                    # Calcul de la taille avec variation
-                    if variety == 'DISTRICTS':
-                        # Mode districts : variation par zones cohérentes
-                        size_variation = generate_district_variation(i, j, grid_width, grid_length, min_var, max_var)
-                    else:
-                        # Mode normal : variation aléatoire
-                        size_variation = random.uniform(min_var, max_var)
-                    
-                    # Appliquer le multiplicateur de zone
-                    total_multiplier = size_variation * zone_info['size_multiplier']
-                    
-                    # Générer largeur et profondeur avec variations indépendantes
-                    width_variation = random.uniform(0.8, 1.2)  # Variation fine supplémentaire
-                    depth_variation = random.uniform(0.8, 1.2)
-                    
-                    width = base_size * total_multiplier * width_variation
-                    depth = base_size * total_multiplier * depth_variation
-                    
-                    # Validation et ajustement des tailles
-                    width = max(2.0, min(width, base_size * 3))  # Limites raisonnables
-                    depth = max(2.0, min(depth, base_size * 3))
-                    
-                    # Stocker les informations étendues du bloc
-                    block_info = {
-                        'size': (width, depth),
-                        'zone_type': zone_type,
-                        'zone_info': zone_info,
-                        'base_variation': size_variation
-                    }
-                    
-                    row.append(block_info)
-                    
-                except Exception as e:
-                    print(f"Erreur génération bloc à [{i}][{j}]: {e}, utilisation valeurs par défaut")
-                    row.append({
-                        'size': (base_size, base_size),
-                        'zone_type': 'RESIDENTIAL',
-                        'zone_info': zone_types['RESIDENTIAL'],
-                        'base_variation': 1.0
-                    })
-            
-            block_sizes.append(row)
-        
-        # Afficher un résumé de la génération
-        total_blocks = grid_width * grid_length
-        if district_mode:
-            commercial_count = sum(1 for row in zone_assignments for zone in row if zone == 'COMMERCIAL')
-            residential_count = sum(1 for row in zone_assignments for zone in row if zone == 'RESIDENTIAL')
-            industrial_count = sum(1 for row in zone_assignments for zone in row if zone == 'INDUSTRIAL')
-            
-            print(f"Districts générés - Commercial: {commercial_count}/{total_blocks}, "
-                  f"Résidentiel: {residential_count}/{total_blocks}, "
-                  f"Industriel: {industrial_count}/{total_blocks}")
-        
-        print(f"Grille de blocs {grid_width}x{grid_length} générée avec variété '{variety}'")
-        return block_sizes
-        
-    except Exception as e:
-        print(f"Erreur critique lors de la génération des tailles de blocs: {str(e)}")
-        return None
-
-def generate_district_zones(grid_width, grid_length, commercial_ratio, residential_ratio, industrial_ratio):
-    """Génère des zones de districts cohérentes avec algorithme amélioré"""
-    try:
-        print(f"Génération districts - Ratios: C={commercial_ratio:.2f}, R={residential_ratio:.2f}, I={industrial_ratio:.2f}")
-        
-        # Normaliser les ratios pour qu'ils totalisent 1.0
-        total_ratio = commercial_ratio + residential_ratio + industrial_ratio
-        if total_ratio > 0:
-            commercial_ratio /= total_ratio
-            residential_ratio /= total_ratio
-            industrial_ratio /= total_ratio
-        else:
-            # Valeurs par défaut si ratios invalides
-            commercial_ratio, residential_ratio, industrial_ratio = 0.2, 0.6, 0.2
-        
-        print(f"Ratios normalisés: C={commercial_ratio:.2f}, R={residential_ratio:.2f}, I={industrial_ratio:.2f}")
-        
-        zones = []
-        total_blocks = grid_width * grid_length
-        
-        # Calculer le nombre de blocs pour chaque type
-        commercial_blocks = int(total_blocks * commercial_ratio)
-        industrial_blocks = int(total_blocks * industrial_ratio)
-        residential_blocks = total_blocks - commercial_blocks - industrial_blocks
-        
-        print(f"Blocs prévus - Commercial: {commercial_blocks}, Industriel: {industrial_blocks}, Résidentiel: {residential_blocks}")
-        
-        # Améliorer la génération des centres de zones
-        # Plus de centres pour une meilleure distribution
-        num_commercial_centers = max(1, commercial_blocks // 8) if commercial_blocks > 0 else 0
-        num_industrial_centers = max(1, industrial_blocks // 12) if industrial_blocks > 0 else 0
-        
-        commercial_centers = generate_zone_centers(grid_width, grid_length, num_commercial_centers)
-        industrial_centers = generate_zone_centers(grid_width, grid_length, num_industrial_centers)
-        
-        print(f"Centres générés - Commercial: {len(commercial_centers)}, Industriel: {len(industrial_centers)}")
-        
-        # Utiliser un algorithme de Voronoi simplifié pour une meilleure distribution
-        zone_counts = {'COMMERCIAL': 0, 'INDUSTRIAL': 0, 'RESIDENTIAL': 0}
-        
-        for i in range(grid_width):
-            row = []
-            for j in range(grid_length):
-                zone_type = 'RESIDENTIAL'  # Type par défaut
-                min_distance = float('inf')
-                
-                # Vérifier la distance aux centres commerciaux
-                for cx, cy in commercial_centers:
-                    distance = abs(i - cx) + abs(j - cy)  # Distance Manhattan
-                    if distance < min_distance and zone_counts['COMMERCIAL'] < commercial_blocks:
-                        min_distance = distance
-                        zone_type = 'COMMERCIAL'
-                
-                # Vérifier la distance aux centres industriels (avec priorité sur commercial si très proche)
-                for cx, cy in industrial_centers:
-                    distance = abs(i - cx) + abs(j - cy)
-                    if distance < min_distance and zone_counts['INDUSTRIAL'] < industrial_blocks:
-                        min_distance = distance
-                        zone_type = 'INDUSTRIAL'
-                    elif distance <= 1 and zone_counts['INDUSTRIAL'] < industrial_blocks:  # Force industriel si très proche
-                        zone_type = 'INDUSTRIAL'
-                        break
-                
-                # Assigner le type et mettre à jour les compteurs
-                zone_counts[zone_type] += 1
-                row.append(zone_type)
-            
-            zones.append(row)
-        
-        # Afficher le résultat de la distribution
-        print(f"Distribution finale - Commercial: {zone_counts['COMMERCIAL']}, "
-              f"Industriel: {zone_counts['INDUSTRIAL']}, Résidentiel: {zone_counts['RESIDENTIAL']}")
+        if district_mode:
+            district_materials = create_district_materials()
         
-        return zones
+        # Calculer le plan de la ville (sans bpy) et préparer son émetteur
+        from .city_plan import plan_city
+        from .plan_emitters import PlanEmitter
+
+        plan = plan_city(regen_only=regen_only, **params)
+        if plan is None:
+            log.error("ERREUR: Échec de génération du plan de ville")
+            return False
+
+        emitter = PlanEmitter(road_mat, side_mat, build_mat, district_materials, mesh_backend, shared_snap,
+                              collections=ensure_city_collections(scene))
+        return plan, emitter, mesh_backend
         
     except Exception as e:
-        print(f"Erreur génération zones de districts: {e}")
-        print(f"Traceback: {traceback.format_exc()}")
-        # Retourner une assignation par défaut
-        return [['RESIDENTIAL' for _ in range(grid_length)] for _ in range(grid_width)]
-
-def generate_zone_centers(grid_width, grid_length, num_centers):
-    """Génère des centres de zones aléatoires avec distribution améliorée"""
-    centers = []
-    if num_centers <= 0:
-        return centers
-    
-    # S'assurer que les centres sont bien distribués
-    if num_centers == 1:
-        # Un seul centre au milieu
-        x = grid_width // 2
-        y = grid_length // 2
-        centers.append((x, y))
-    else:
-        # Distribuer les centres avec un espacement minimal
-        min_distance = max(2, min(grid_width, grid_length) // num_centers)
-        
-        for _ in range(num_centers * 3):  # Essayer plusieurs fois
-            if len(centers) >= num_centers:
-                break
-                
-            x = random.randint(0, grid_width - 1)
-            y = random.randint(0, grid_length - 1)
-            
-            # Vérifier que le nouveau centre n'est pas trop proche des existants
-            too_close = False
-            for cx, cy in centers:
-                if abs(x - cx) + abs(y - cy) < min_distance:
-                    too_close = True
-                    break
-            
-            if not too_close:
-                centers.append((x, y))
-    
-    print(f"Centres générés: {centers}")
-    return centers
-
-def generate_district_variation(i, j, grid_width, grid_length, min_var, max_var):
-    """Génère une variation basée sur la position pour créer des zones cohérentes"""
-    # Utiliser la position pour créer des zones de tailles similaires
-    zone_x = i // 3  # Diviser en zones de 3x3
-    zone_y = j // 3
-    
-    # Utiliser la position de la zone comme seed pour la cohérence
-    random.seed(zone_x * 1000 + zone_y)
-    variation = random.uniform(min_var, max_var)
-    
-    # Restaurer le seed aléatoire
-    random.seed()
-    
-    return variation
+        log.error("ERREUR CRITIQUE lors de la préparation de la ville: %s", str(e))
+        log.error("Traceback: %s", traceback.format_exc())
+        return False
+
+def create_city_materials():
+    """Crée (ou récupère) les matériaux route, trottoir et bâtiment"""
+    road_mat = create_material("RoadMat", (1.0, 0.75, 0.8))  # Rose pâle pour les routes
+    side_mat = create_material("SidewalkMat", (0.6, 0.6, 0.6))  # Gris pour les trottoirs
+    build_mat = create_material("BuildingMat", (0.5, 1.0, 0.0))  # Vert pomme pour les bâtiments
+    return road_mat, side_mat, build_mat
 
 def create_district_materials():
-    """Crée des matériaux distinctifs pour chaque type de zone en mode district."""
-    materials = {}
-    
+    """Matériau de chaque type de zone en mode district
+
+    Toutes les zones partagent le shader de ville: la couleur et la rugosité de
+    zone (city_shader.ZONE_LOOKS) sont écrites sur chaque objet ou chaque face.
+    """
     try:
-        # Matériau commercial (vert pomme foncé)
-        if "Commercial_District" not in bpy.data.materials:
-            mat_commercial = bpy.data.materials.new(name="Commercial_District")
-            mat_commercial.use_nodes = True
-            principled = mat_commercial.node_tree.nodes.get("Principled BSDF")
-            if principled:
-                principled.inputs[0].default_value = (0.3, 0.8, 0.0, 1.0)  # Vert pomme foncé
-                principled.inputs[7].default_value = 0.1  # Roughness
-        materials['COMMERCIAL'] = bpy.data.materials["Commercial_District"]
-        
-        # Matériau résidentiel (vert pomme)
-        if "Residential_District" not in bpy.data.materials:
-            mat_residential = bpy.data.materials.new(name="Residential_District")
-            mat_residential.use_nodes = True
-            principled = mat_residential.node_tree.nodes.get("Principled BSDF")
-            if principled:
-                principled.inputs[0].default_value = (0.5, 1.0, 0.0, 1.0)  # Vert pomme
-                principled.inputs[7].default_value = 0.3  # Roughness
-        materials['RESIDENTIAL'] = bpy.data.materials["Residential_District"]
-        
-        # Matériau industriel (vert pomme clair)
-        if "Industrial_District" not in bpy.data.materials:
-            mat_industrial = bpy.data.materials.new(name="Industrial_District")
-            mat_industrial.use_nodes = True
-            principled = mat_industrial.node_tree.nodes.get("Principled BSDF")
-            if principled:
-                principled.inputs[0].default_value = (0.7, 1.0, 0.2, 1.0)  # Vert pomme clair
-                principled.inputs[7].default_value = 0.5  # Roughness
-        materials['INDUSTRIAL'] = bpy.data.materials["Industrial_District"]
-        
-        print("✓ Matériaux de districts créés avec succès")
-        return materials
+        shader = ensure_city_shader()
+        if shader is None:
+            return {}
+        log.info("✓ Shader de ville partagé par les districts")
+        return {zone_type: shader for zone_type in ('COMMERCIAL', 'RESIDENTIAL', 'INDUSTRIAL')}
         
     except Exception as e:
-        print(f"Erreur lors de la création des matériaux de districts: {e}")
+        log.error("Erreur lors de la création des matériaux de districts: %s", e)
         return {}
 def set_origin_to_center_bottom(obj):
-    """Déplace l'origine de l'objet au centre bas (center bottom)"""
+    """Déplace l'origine de l'objet au centre bas (center bottom)
+
+    Voir mesh_batch.set_origins_to_center_bottom pour traiter plusieurs objets d'un coup.
+    """
+    from .mesh_batch import set_origins_to_center_bottom
+
     try:
         if not obj or not obj.data:
             return False
-            
-        # Sauvegarder la position actuelle
-        current_location = obj.location.copy()
-        
-        # Aller en mode édition pour calculer les limites
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.mode_set(mode='EDIT')
-        
-        # Revenir en mode objet
-        bpy.ops.object.mode_set(mode='OBJECT')
-        
-        # Calculer les limites du mesh
-        mesh = obj.data
-        if not mesh.vertices:
-            return False
-            
-        # Trouver les limites
-        x_coords = [v.co.x for v in mesh.vertices]
-        y_coords = [v.co.y for v in mesh.vertices]
-        z_coords = [v.co.z for v in mesh.vertices]
-        
-        x_min, x_max = min(x_coords), max(x_coords)
-        y_min, y_max = min(y_coords), max(y_coords)
-        z_min = min(z_coords)
-        
-        # Calculer le centre en X et Y, mais garder le minimum en Z
-        center_x = (x_min + x_max) / 2
-        center_y = (y_min + y_max) / 2
-        
-        # Déplacer tous les sommets pour ajuster l'origine
-        for vertex in mesh.vertices:
-            vertex.co.x -= center_x
-            vertex.co.y -= center_y
-            vertex.co.z -= z_min  # Le bas devient z=0
-        
-        # Ajuster la position de l'objet pour compenser le déplacement
-        obj.location.x = current_location.x + center_x
-        obj.location.y = current_location.y + center_y
-        obj.location.z = current_location.z + z_min
-        
-        # Mettre à jour le mesh
-        mesh.update()
-        
-        return True
-        
+        return set_origins_to_center_bottom([obj]) > 0
+
     except Exception as e:
-        print(f"Erreur lors du réglage de l'origine: {e}")
+        log.error("Erreur lors du réglage de l'origine: %s", e)
         return False
 
 def create_cube_with_center_bottom_origin(size_x, size_y, size_z, location=(0, 0, 0)):
-    """Crée un cube avec l'origine au centre bas - Version simplifiée"""
+    """Crée un cube avec l'origine au centre bas
+
+    Les sommets sont construits directement avec z dans [0, size_z] (sans
+    primitive_cube_add ni transform_apply); l'objet devient le seul sélectionné
+    et l'objet actif, comme après l'opérateur, pour les join qui suivent.
+    """
+    from .mesh_batch import MeshBatch
+
     try:
-        print(f"🔨 create_cube_with_center_bottom_origin: taille=({size_x:.1f},{size_y:.1f},{size_z:.1f}), pos=({location[0]:.1f},{location[1]:.1f},{location[2]:.1f})")
-        
-        # Calculer la position finale directement (centre bas)
-        final_x = location[0]
-        final_y = location[1] 
-        final_z = location[2] + (size_z / 2)  # Décaler vers le haut de la moitié de la hauteur
-        
-        print(f"   📍 Position finale calculée: ({final_x:.1f}, {final_y:.1f}, {final_z:.1f})")
-        
-        # Créer le cube directement à la bonne position
-        bpy.ops.mesh.primitive_cube_add(size=2, location=(final_x, final_y, final_z))
-        obj = bpy.context.object
-        
-        if not obj:
-            print(f"   ❌ Échec création cube primitif")
-            return None
-        
-        print(f"   ✅ Cube primitif créé: {obj.name}")
-        print(f"   📏 Position avant échelle: ({obj.location.x:.1f}, {obj.location.y:.1f}, {obj.location.z:.1f})")
-        
-        # Appliquer les dimensions en redimensionnant
-        obj.scale.x = size_x / 2  # Diviser par 2 car le cube fait size=2
-        obj.scale.y = size_y / 2
-        obj.scale.z = size_z / 2
-        
-        print(f"   🔧 Échelle appliquée: ({obj.scale.x:.1f}, {obj.scale.y:.1f}, {obj.scale.z:.1f})")
-        
-        # Optionnel: appliquer l'échelle définitivement
-        try:
-            bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-            print(f"   ✅ Transformation appliquée")
-        except Exception as e:
-            print(f"   ⚠️ Avertissement transformation: {e}")
-        
-        print(f"   📍 Position finale: ({obj.location.x:.1f}, {obj.location.y:.1f}, {obj.location.z:.1f})")
-        print(f"   📐 Dimensions finales: échelle=({obj.scale.x:.1f}, {obj.scale.y:.1f}, {obj.scale.z:.1f})")
-        
+        log.debug("🔨 create_cube_with_center_bottom_origin: taille=(%.1f,%.1f,%.1f), pos=(%.1f,%.1f,%.1f)", size_x, size_y, size_z, location[0], location[1], location[2])
+
+        cube = MeshBatch("Cube")
+        cube.add_boxes([(size_x, size_y, size_z)], [(0.0, 0.0, 0.0)])
+        obj = bpy.data.objects.new("Cube", cube.to_mesh())
+        obj.location = location
+        bpy.context.collection.objects.link(obj)
+
+        for selected in bpy.context.selected_objects:
+            selected.select_set(False)
+        obj.select_set(True)
+        bpy.context.view_layer.objects.active = obj
+
+        log.debug("   ✅ Cube créé: %s à (%.1f, %.1f, %.1f)", obj.name, obj.location.x, obj.location.y, obj.location.z)
         return obj
         
     except Exception as e:
-        print(f"❌ Erreur lors de la création du cube avec origine centre bas: {e}")
+        log.error("❌ Erreur lors de la création du cube avec origine centre bas: %s", e)
         return None
 
-def generate_polygonal_block(center_x, center_y, vertices, width, depth, mat):
-    """Génère un bloc polygonal avec un nombre variable d'arêtes"""
-    import random
-    import math
+def generate_polygonal_block(center_x, center_y, vertices, width, depth, mat, batch=None):
+    """Génère un bloc polygonal avec un nombre variable d'arêtes (prisme elliptique calculé directement)
+
+    Ajouté au lot si batch est fourni, sinon un objet construit sans opérateur.
+    """
+    from .mesh_batch import MeshBatch
     
     try:
-        print(f"🔷 Génération bloc polygonal {vertices} côtés au centre ({center_x:.1f}, {center_y:.1f})")
-        
-        # Créer le mesh polygonal avec une hauteur visible
-        bpy.ops.mesh.primitive_cylinder_add(
-            vertices=vertices, 
-            radius=min(width, depth)/2, 
-            depth=0.5,  # Hauteur plus visible pour le bloc
-            location=(center_x, center_y, 0.25)  # Centré sur Z
-        )
+        log.debug("🔷 Génération bloc polygonal %s côtés au centre (%.1f, %.1f)", vertices, center_x, center_y)
         
-        obj = bpy.context.object
+        # Hauteur plus visible pour le bloc (0.5), origine au centre bas
+        if batch is not None:
+            return batch.add_cylinder(width / 2, depth / 2, 0.5, (center_x, center_y, 0.0), segments=vertices, material=mat)
+        
+        block = MeshBatch(f"PolygonalBlock_{vertices}sides_{center_x:.1f}_{center_y:.1f}", mat)
+        if not block.add_cylinder(width / 2, depth / 2, 0.5, (center_x, center_y, 0.0), segments=vertices):
+            return None
+        obj = block.build_object()
         if not obj:
             return None
         
-        # Adapter les dimensions
-        obj.scale.x = width / min(width, depth)
-        obj.scale.y = depth / min(width, depth)
-        obj.name = f"PolygonalBlock_{vertices}sides_{center_x:.1f}_{center_y:.1f}"
-        
         # Stocker les informations du bloc pour l'orientation des bâtiments
         obj["block_sides"] = vertices
         obj["block_width"] = width
@@ -2368,16 +1072,11 @@ def generate_polygonal_block(center_x, center_y, vertices, width, depth, mat):
         obj["block_center_x"] = center_x
         obj["block_center_y"] = center_y
         
-        # Appliquer le matériau de trottoir
-        if mat and obj.data:
-            obj.data.materials.clear()
-            obj.data.materials.append(mat)
-        
-        print(f"✅ Bloc polygonal créé: {vertices} côtés, dimensions {width:.1f}x{depth:.1f}")
+        log.debug("✅ Bloc polygonal créé: %s côtés, dimensions %.1fx%.1f", vertices, width, depth)
         return obj
         
     except Exception as e:
-        print(f"Erreur création bloc polygonal: {e}")
+        log.error("Erreur création bloc polygonal: %s", e)
         return None
 
 def calculate_building_orientation_for_polygon(block_sides, building_x, building_y, block_center_x, block_center_y):
@@ -2408,7 +1107,7 @@ def calculate_building_orientation_for_polygon(block_sides, building_x, building
             return 0.0
             
     except Exception as e:
-        print(f"Erreur calcul orientation: {e}")
+        log.error("Erreur calcul orientation: %s", e)
         return 0.0
 
 def generate_oriented_building(x, y, width, depth, height, mat, block_sides, block_center_x, block_center_y, variety='MEDIUM'):
@@ -2421,7 +1120,7 @@ def generate_oriented_building(x, y, width, depth, height, mat, block_sides, blo
             block_sides, x, y, block_center_x, block_center_y
         )
         
-        print(f"🏢 Bâtiment orienté: rotation {math.degrees(rotation):.1f}° pour bloc {block_sides} côtés")
+        log.debug("🏢 Bâtiment orienté: rotation %.1f° pour bloc %s côtés", math.degrees(rotation), block_sides)
         
         # Créer le bâtiment standard
         building = generate_building(x, y, width, depth, height, mat, building_variety=variety)
@@ -2434,16 +1133,27 @@ def generate_oriented_building(x, y, width, depth, height, mat, block_sides, blo
         return building
         
     except Exception as e:
-        print(f"Erreur génération bâtiment orienté: {e}")
+        log.error("Erreur génération bâtiment orienté: %s", e)
         return None
 
-def generate_organic_road_network(block_zones, road_width, road_mat, curve_intensity):
-    """Génère un réseau de routes organiques qui épousent les formes des blocs"""
+def generate_organic_road_network(block_zones, road_width, road_mat, curve_intensity, extra_ratio=0.2, ring_batch=None):
+    """Génère un réseau de routes organiques qui épousent les formes des blocs
+
+    Les blocs sont reliés selon l'arbre couvrant minimal de la triangulation de
+    Delaunay de leurs centres, plus extra_ratio d'arêtes supplémentaires. Les
+    anneaux périphériques et les patches de jonction aux croisements des routes
+    vont dans ring_batch s'il est fourni.
+    """
     import math
+    from .mesh_batch import regular_polygon
+    from .road_connectivity import sparse_connections
+    from .road_crossings import find_road_crossings
     
     try:
         roads_created = 0
-        print(f"🛣️ Génération réseau de routes organiques pour {len(block_zones)} blocs...")
+        # Lignes médianes (polyligne, largeur) des routes créées, pour les jonctions
+        centrelines = []
+        log.debug("🛣️ Génération réseau de routes organiques pour %s blocs...", len(block_zones))
         
         # Créer des routes qui contournent les blocs polygonaux
         for i, zone in enumerate(block_zones):
@@ -2454,91 +1164,88 @@ def generate_organic_road_network(block_zones, road_width, road_mat, curve_inten
             if random.random() < 0.7:  # 70% de chance d'avoir une route périphérique
                 road_ring = generate_polygonal_road_ring(
                     zone['x'], zone['y'], zone['sides'], 
-                    block_radius + road_width, road_width, road_mat
+                    block_radius + road_width, road_width, road_mat, batch=ring_batch
                 )
                 if road_ring:
                     roads_created += 1
-            
-            # Connecter aux blocs voisins avec des routes courbes
-            for j, other_zone in enumerate(block_zones[i+1:], i+1):
-                distance = math.sqrt((zone['x'] - other_zone['x'])**2 + (zone['y'] - other_zone['y'])**2)
-                
-                # Connecter seulement les blocs proches
-                if distance < 20:  # Distance augmentée
-                    if random.random() < curve_intensity:
-                        # Route courbe adaptative
-                        roads = generate_adaptive_curved_road(
-                            zone, other_zone, road_width, road_mat
-                        )
-                        if roads:
-                            roads_created += len(roads)
-                    else:
-                        # Route droite simple
-                        road = generate_diagonal_road(
-                            zone['x'], zone['y'], other_zone['x'], other_zone['y'], 
-                            road_width, road_mat
-                        )
-                        if road:
-                            roads_created += 1
+                    ring_radius = block_radius + road_width - road_width / (2 * math.cos(math.pi / zone['sides']))
+                    ring = [(zone['x'] + px, zone['y'] + py) for px, py in regular_polygon(zone['sides'], ring_radius).tolist()]
+                    centrelines.append((ring + ring[:1], road_width))
+        
+        # Connecter les blocs voisins (graphe clairsemé, blocs proches seulement)
+        centers = [(zone['x'], zone['y']) for zone in block_zones]
+        connections = sparse_connections(centers, extra_ratio, max_length=20)
+        log.debug("🔗 %s connexions entre blocs (Delaunay + arbre couvrant)", len(connections))
+        for i, j in connections:
+            zone, other_zone = block_zones[i], block_zones[j]
+            if random.random() < curve_intensity:
+                # Route courbe adaptative
+                roads = generate_adaptive_curved_road(
+                    zone, other_zone, road_width, road_mat, centrelines=centrelines
+                )
+                if roads:
+                    roads_created += len(roads)
+            else:
+                # Route droite simple
+                road = generate_diagonal_road(
+                    zone['x'], zone['y'], other_zone['x'], other_zone['y'], 
+                    road_width, road_mat
+                )
+                if road:
+                    roads_created += 1
+                    centrelines.append(([(zone['x'], zone['y']), (other_zone['x'], other_zone['y'])], road_width))
+        
+        # Patches de jonction aux croisements (anneaux, diagonales et courbes)
+        crossings = find_road_crossings([points for points, _ in centrelines],
+                                        [width for _, width in centrelines], cell_size=12.0)
+        junctions_created = sum(1 for crossing in crossings
+                                if generate_junction_patch(crossing, road_mat, height=0.102, z=0.0, batch=ring_batch))
+        log.debug("✖️ %s croisements, %s jonctions créées", len(crossings), junctions_created)
         
         return roads_created
         
     except Exception as e:
-        print(f"Erreur génération réseau organique: {e}")
+        log.error("Erreur génération réseau organique: %s", e)
         return 0
 
-def generate_polygonal_road_ring(center_x, center_y, sides, radius, width, mat):
-    """Génère un anneau de route polygonal autour d'un bloc"""
+def generate_polygonal_road_ring(center_x, center_y, sides, radius, width, mat, batch=None):
+    """Génère un anneau de route polygonal autour d'un bloc (sans mode édition ni opérateur)
+
+    Contour extérieur de rayon radius, contour intérieur décalé de width
+    perpendiculairement aux arêtes: sides quads par face. Ajouté au lot si batch
+    est fourni, sinon un objet.
+    """
     import math
+    from .mesh_batch import MeshBatch, regular_polygon
     
     try:
-        # Créer un cylindre polygonal pour l'anneau de route
-        bpy.ops.mesh.primitive_cylinder_add(
-            vertices=sides,
-            radius=radius,
-            depth=0.1,  # Hauteur fine pour la route
-            location=(center_x, center_y, 0.05)
-        )
-        
-        road_ring = bpy.context.object
-        if not road_ring:
+        inner_radius = radius - width / math.cos(math.pi / sides)
+        if sides < 3 or inner_radius <= 0:
+            log.debug("Anneau de route invalide: %s côtés, rayon %.1f, largeur %.1f", sides, radius, width)
             return None
+        outer = regular_polygon(sides, radius)
+        inner = regular_polygon(sides, inner_radius)
         
-        # Passer en mode édition pour créer l'anneau
-        bpy.context.view_layer.objects.active = road_ring
-        bpy.ops.object.mode_set(mode='EDIT')
-        
-        # Sélectionner tout et faire un inset pour créer l'anneau
-        bpy.ops.mesh.select_all(action='SELECT')
-        bpy.ops.mesh.inset_faces(thickness=width/radius, depth=0)
-        
-        # Supprimer les faces intérieures pour créer l'anneau
-        bpy.ops.mesh.select_all(action='DESELECT')
-        bpy.ops.mesh.select_face_by_sides(number=sides, type='EQUAL')
-        bpy.ops.mesh.delete(type='FACE')
+        # Hauteur fine pour la route (0.1), origine au sol
+        if batch is not None:
+            return batch.add_ring(outer, inner, 0.1, (center_x, center_y, 0.0), material=mat)
         
-        bpy.ops.object.mode_set(mode='OBJECT')
+        ring = MeshBatch(f"PolygonalRoadRing_{sides}sides_{center_x:.1f}_{center_y:.1f}", mat)
+        ring.add_ring(outer, inner, 0.1, (center_x, center_y, 0.0))
+        road_ring = ring.build_object()
         
-        # Nommer et matériau
-        road_ring.name = f"PolygonalRoadRing_{sides}sides_{center_x:.1f}_{center_y:.1f}"
-        if mat and road_ring.data:
-            road_ring.data.materials.clear()
-            road_ring.data.materials.append(mat)
-        
-        print(f"✅ Anneau de route polygonal créé: {sides} côtés")
+        log.debug("✅ Anneau de route polygonal créé: %s côtés", sides)
         return road_ring
         
     except Exception as e:
-        print(f"Erreur création anneau de route: {e}")
-        # Retourner en mode objet si erreur
-        try:
-            bpy.ops.object.mode_set(mode='OBJECT')
-        except:
-            pass
+        log.error("Erreur création anneau de route: %s", e)
         return None
 
-def generate_adaptive_curved_road(zone1, zone2, width, mat):
-    """Génère une route courbe qui s'adapte aux formes des blocs connectés"""
+def generate_adaptive_curved_road(zone1, zone2, width, mat, centrelines=None):
+    """Génère une route courbe qui s'adapte aux formes des blocs connectés
+
+    Si centrelines est fourni, la ligne médiane (polyligne, largeur) de la route y est ajoutée.
+    """
     import math
     import random
     
@@ -2567,26 +1274,32 @@ def generate_adaptive_curved_road(zone1, zone2, width, mat):
             curve_y = mid_y + perp_y * deviation
             
             # Générer la route courbe
-            return generate_angled_road(start_x, start_y, end_x, end_y, width, mat, 
-                                      curve_points=[(curve_x, curve_y)])
+            roads = generate_angled_road(start_x, start_y, end_x, end_y, width, mat, 
+                                       curve_points=[(curve_x, curve_y)])
+            if roads and centrelines is not None:
+                centrelines.append(([(start_x, start_y), (curve_x, curve_y), (end_x, end_y)], width))
+            return roads
         
         return []
         
     except Exception as e:
-        print(f"Erreur route courbe adaptative: {e}")
+        log.error("Erreur route courbe adaptative: %s", e)
         return []
 
 def generate_angled_road(start_x, start_y, end_x, end_y, width, mat, curve_points=None):
-    """Génère une route avec angles variables et courbes optionnelles"""
+    """Génère une route coudée en un seul ruban (create_ribbon_road)
+
+    curve_points: points intermédiaires entre le départ et l'arrivée; sans eux,
+    un coude est tiré au hasard. Retourne la liste des objets créés.
+    """
     import random
     import math
     
     try:
-        print(f"🛣️ Génération route angulaire de ({start_x:.1f},{start_y:.1f}) à ({end_x:.1f},{end_y:.1f})")
+        log.debug("🛣️ Génération route angulaire de (%.1f,%.1f) à (%.1f,%.1f)", start_x, start_y, end_x, end_y)
         
-        # Si pas de points de courbe spécifiés, créer une route avec angle aléatoire
+        # Si pas de points de courbe spécifiés, créer un coude avec angle aléatoire
         if not curve_points:
-            # Créer un point de courbe intermédiaire
             mid_x = (start_x + end_x) / 2
             mid_y = (start_y + end_y) / 2
             
@@ -2595,42 +1308,27 @@ def generate_angled_road(start_x, start_y, end_x, end_y, width, mat, curve_point
             perpendicular_angle = math.atan2(end_y - start_y, end_x - start_x) + math.pi/2
             mid_x += deviation * math.cos(perpendicular_angle)
             mid_y += deviation * math.sin(perpendicular_angle)
-            
-            curve_points = [(start_x, start_y), (mid_x, mid_y), (end_x, end_y)]
-        
-        # Créer les segments de route
-        road_objects = []
-        for i in range(len(curve_points) - 1):
-            x1, y1 = curve_points[i]
-            x2, y2 = curve_points[i + 1]
-            
-            # Calculer position et angle du segment
-            seg_x = (x1 + x2) / 2
-            seg_y = (y1 + y2) / 2
-            length = math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
-            angle = math.atan2(y2 - y1, x2 - x1)
-            
-            # Créer le segment
-            result = generate_road(seg_x, seg_y, width, length, mat, True, angle)
-            if result:
-                obj = bpy.context.object
-                if obj:
-                    obj.name = f"angled_road_seg_{i}_{seg_x:.1f}_{seg_y:.1f}"
-                    road_objects.append(obj)
+            curve_points = [(mid_x, mid_y)]
         
-        return road_objects
+        # Ruban continu: virages arrondis, dessus au niveau des routes droites (0.006)
+        points = [(start_x, start_y)] + list(curve_points) + [(end_x, end_y)]
+        road = create_ribbon_road(f"angled_road_{start_x:.1f}_{start_y:.1f}", points, width, 'angled_road',
+                                  (0.3, 0.3, 0.3), mat=mat, join='ROUND', z=0.006)
+        return [road] if road else []
         
     except Exception as e:
-        print(f"Erreur création route angulaire: {e}")
+        log.error("Erreur création route angulaire: %s", e)
         return []
 
+@in_city_collection
 def generate_organic_city_layout(context):
     """Génère un layout de ville organique avec blocs polygonaux et routes angulaires"""
     import random
     import math
     
     try:
-        print("🌿 Début génération layout organique")
+        log.info("🌿 Début génération layout organique")
+        palette.reset()
         
         # Nettoyage de la scène avant génération
         safe_delete_objects()
@@ -2647,7 +1345,7 @@ def generate_organic_city_layout(context):
         road_curve_intensity = getattr(scene, 'citygen_road_curve_intensity', 0.5)
         block_size_variation = getattr(scene, 'citygen_block_size_variation', 0.3)
         
-        print(f"🌿 Paramètres organiques: {width}x{length}, sides:{polygon_min_sides}-{polygon_max_sides}, curves:{road_curve_intensity}")
+        log.info("🌿 Paramètres organiques: %sx%s, sides:%s-%s, curves:%s", width, length, polygon_min_sides, polygon_max_sides, road_curve_intensity)
         
         # Créer les matériaux nécessaires
         road_mat = create_material("RoadMat_Organic", (1.0, 0.75, 0.8))  # Rose pâle pour les routes
@@ -2658,7 +1356,7 @@ def generate_organic_city_layout(context):
         block_zones = []
         block_size = 8.0  # Taille de base d'un bloc
         
-        print(f"🌿 Grille {width}x{length} -> Génération blocs organiques")
+        log.info("🌿 Grille %sx%s -> Génération blocs organiques", width, length)
         
         # Créer une grille de blocs organiques
         for i in range(width):
@@ -2688,7 +1386,7 @@ def generate_organic_city_layout(context):
                     'buildings_count': default_buildings  # Nombre de base qui sera modifié par la densité
                 })
         
-        print(f"🌿 Génération de {len(block_zones)} blocs organiques")
+        log.info("🌿 Génération de %s blocs organiques", len(block_zones))
         
         # === APPLIQUER LE RÉALISME URBAIN (VERSION SÉCURISÉE) ===
         # Récupérer les paramètres de réalisme avec valeurs par défaut sécurisées
@@ -2703,9 +1401,9 @@ def generate_organic_city_layout(context):
             irregular_lots = getattr(scene, 'citygen_irregular_lots', False)
             growth_pattern = getattr(scene, 'citygen_growth_pattern', 'ORGANIC')
             
-            print(f"🎨 Paramètres réalisme chargés avec succès")
+            log.info("🎨 Paramètres réalisme chargés avec succès")
         except Exception as param_error:
-            print(f"⚠️ Erreur paramètres réalisme, utilisation valeurs par défaut: {param_error}")
+            log.error("⚠️ Erreur paramètres réalisme, utilisation valeurs par défaut: %s", param_error)
             density_variation = 0.4
             age_variation = True
             mixed_use = True
@@ -2720,11 +1418,11 @@ def generate_organic_city_layout(context):
         try:
             if density_variation > 0:
                 block_zones = generate_realistic_city_density(block_zones, density_variation)
-                print(f"✅ Densité réaliste appliquée")
+                log.info("✅ Densité réaliste appliquée")
             else:
-                print(f"⏩ Densité réaliste désactivée")
+                log.info("⏩ Densité réaliste désactivée")
         except Exception as density_error:
-            print(f"⚠️ Erreur densité réaliste, mode standard: {density_error}")
+            log.error("⚠️ Erreur densité réaliste, mode standard: %s", density_error)
         
         # Créer matériaux supplémentaires pour le réalisme (version sécurisée)
         try:
@@ -2732,11 +1430,16 @@ def generate_organic_city_layout(context):
             tree_mat = create_material("TreeMat_Realistic", (0.2, 0.8, 0.2))   # Vert pour végétation
             landmark_mat = create_material("LandmarkMat_Realistic", (0.9, 0.8, 0.6))  # Doré pour monuments
         except Exception as mat_error:
-            print(f"⚠️ Erreur création matériaux réalisme: {mat_error}")
+            log.error("⚠️ Erreur création matériaux réalisme: %s", mat_error)
             plaza_mat = side_mat  # Fallback
             tree_mat = build_mat  # Fallback
             landmark_mat = build_mat  # Fallback
         
+        # Blocs et anneaux de routes calculés directement dans des lots (un mesh chacun)
+        from .mesh_batch import MeshBatch
+        block_batch = MeshBatch("Organic_PolygonalBlocks", side_mat)
+        ring_batch = MeshBatch("Organic_RoadRings", road_mat)
+        
         # Créer les blocs polygonaux avec bâtiments
         buildings_created = 0
         blocks_created = 0
@@ -2746,7 +1449,7 @@ def generate_organic_city_layout(context):
             # Créer le bloc polygonal (fondation)
             block = generate_polygonal_block(
                 zone['x'], zone['y'], zone['sides'], 
-                zone['width'], zone['depth'], side_mat
+                zone['width'], zone['depth'], side_mat, batch=block_batch
             )
             if block:
                 blocks_created += 1
@@ -2760,10 +1463,10 @@ def generate_organic_city_layout(context):
                             plaza_mat, tree_mat
                         )
                         if plaza:
-                            print(f"🌳 Place publique créée à la place du bloc")
+                            log.info("🌳 Place publique créée à la place du bloc")
                             continue  # Passer au bloc suivant
                 except Exception as plaza_error:
-                    print(f"⚠️ Erreur création place publique: {plaza_error}")
+                    log.error("⚠️ Erreur création place publique: %s", plaza_error)
                 
                 # Ajouter des bâtiments dans le bloc (utiliser la densité calculée avec sécurité)
                 try:
@@ -2795,7 +1498,7 @@ def generate_organic_city_layout(context):
                                     building_x, building_y, 1.5, landmark_mat
                                 )
                             except Exception as landmark_error:
-                                print(f"⚠️ Erreur création monument, bâtiment standard: {landmark_error}")
+                                log.error("⚠️ Erreur création monument, bâtiment standard: %s", landmark_error)
                                 building = None
                         else:
                             building = None
@@ -2852,18 +1555,21 @@ def generate_organic_city_layout(context):
                             building["parent_block_center"] = (zone['x'], zone['y'])
                             
                     except Exception as building_error:
-                        print(f"⚠️ Erreur création bâtiment {b}: {building_error}")
+                        log.error("⚠️ Erreur création bâtiment %s: %s", b, building_error)
                         continue  # Passer au bâtiment suivant
         
         # Créer un réseau de routes organiques connectant les blocs
         roads_created = 0
-        print(f"🛣️ Génération de routes organiques entre {len(block_zones)} blocs...")
+        log.info("🛣️ Génération de routes organiques entre %s blocs...", len(block_zones))
         
         # Utiliser le nouveau système de routes organiques qui épousent les blocs
         organic_roads_count = generate_organic_road_network(
-            block_zones, road_width, road_mat, road_curve_intensity
+            block_zones, road_width, road_mat, road_curve_intensity,
+            safe_float(getattr(scene, 'citygen_organic_extra_roads', 0.2), 0.2), ring_batch
         )
         roads_created += organic_roads_count
+        block_batch.build_object()
+        ring_batch.build_object()
         
         # Ajouter quelques routes principales droites pour connecter le tout
         block_size = 8.0
@@ -2892,25 +1598,25 @@ def generate_organic_city_layout(context):
         roads_created += main_roads_created
         
         # === APPLIQUER LES EFFETS FINAUX DE RÉALISME (VERSION SÉCURISÉE) ===
-        print(f"🎨 Application des effets de réalisme urbain...")
+        log.info("🎨 Application des effets de réalisme urbain...")
         
         # Ajouter le mobilier urbain (version sécurisée)
         try:
             if street_life:
                 add_street_furniture(block_zones, street_life)
             else:
-                print(f"⏩ Mobilier urbain désactivé")
+                log.info("⏩ Mobilier urbain désactivé")
         except Exception as furniture_error:
-            print(f"⚠️ Erreur mobilier urbain: {furniture_error}")
+            log.error("⚠️ Erreur mobilier urbain: %s", furniture_error)
         
         # Appliquer le vieillissement aux bâtiments (version sécurisée)
         try:
             if weathering > 0 and all_buildings:
                 apply_building_aging(all_buildings, weathering)
             else:
-                print(f"⏩ Vieillissement désactivé ou pas de bâtiments")
+                log.info("⏩ Vieillissement désactivé ou pas de bâtiments")
         except Exception as aging_error:
-            print(f"⚠️ Erreur vieillissement: {aging_error}")
+            log.error("⚠️ Erreur vieillissement: %s", aging_error)
         
         # Statistiques finales avec réalisme (version sécurisée)
         try:
@@ -2918,25 +1624,25 @@ def generate_organic_city_layout(context):
             plazas_count = len([obj for obj in bpy.context.scene.objects if 'Plaza_' in obj.name])
             furniture_count = len([obj for obj in bpy.context.scene.objects if any(furniture in obj.name for furniture in ['Lamppost_', 'Bench_', 'TrashBin_', 'Sign_'])])
         except Exception as stats_error:
-            print(f"⚠️ Erreur calcul statistiques: {stats_error}")
+            log.error("⚠️ Erreur calcul statistiques: %s", stats_error)
             landmarks_count = 0
             plazas_count = 0 
             furniture_count = 0
         
-        print(f"✅ Ville organique réaliste créée:")
-        print(f"   📐 {blocks_created} blocs polygonaux")
-        print(f"   🏢 {buildings_created} bâtiments (dont {landmarks_count} monuments)")
-        print(f"   🛣️ {roads_created} segments de routes organiques")
-        print(f"   🌳 {plazas_count} places publiques")
-        print(f"   🪑 {furniture_count} éléments de mobilier urbain")
-        print(f"   🎨 Densité variable, vieillissement, zones mixtes appliqués")
+        log.info("✅ Ville organique réaliste créée:")
+        log.info("   📐 %s blocs polygonaux", blocks_created)
+        log.info("   🏢 %s bâtiments (dont %s monuments)", buildings_created, landmarks_count)
+        log.info("   🛣️ %s segments de routes organiques", roads_created)
+        log.info("   🌳 %s places publiques", plazas_count)
+        log.info("   🪑 %s éléments de mobilier urbain", furniture_count)
+        log.info("   🎨 Densité variable, vieillissement, zones mixtes appliqués")
         
         return True
         
     except Exception as e:
-        print(f"❌ Erreur génération layout organique: {e}")
+        log.error("❌ Erreur génération layout organique: %s", e)
         import traceback
-        print(f"Traceback: {traceback.format_exc()}")
+        log.error("Traceback: %s", traceback.format_exc())
         return False
 
 # =============================================
@@ -2975,11 +1681,11 @@ def generate_realistic_city_density(zones, density_variation):
             base_buildings = zone.get('buildings_count', 1)
             zone['buildings_count'] = max(1, int(base_buildings * final_density))
             
-        print(f"✅ Densités réalistes calculées pour {len(zones)} zones")
+        log.debug("✅ Densités réalistes calculées pour %s zones", len(zones))
         return zones
         
     except Exception as e:
-        print(f"Erreur calcul densité réaliste: {e}")
+        log.error("Erreur calcul densité réaliste: %s", e)
         return zones
 
 def create_landmark_building(x, y, size_multiplier, mat, variety='LANDMARK'):
@@ -3004,12 +1710,12 @@ def create_landmark_building(x, y, size_multiplier, mat, variety='LANDMARK'):
         
         if building:
             building.name = f"Landmark_{selected_variety}_{x:.1f}_{y:.1f}"
-            print(f"🏛️ Monument {selected_variety} créé en ({x:.1f}, {y:.1f})")
+            log.debug("🏛️ Monument %s créé en (%.1f, %.1f)", selected_variety, x, y)
             
         return building
         
     except Exception as e:
-        print(f"Erreur création monument (fallback standard): {e}")
+        log.error("Erreur création monument (fallback standard): %s", e)
         # Fallback - créer un bâtiment normal mais plus grand
         try:
             width = 6.0
@@ -3017,7 +1723,7 @@ def create_landmark_building(x, y, size_multiplier, mat, variety='LANDMARK'):
             height = 12.0
             return generate_building(x, y, width, depth, height, mat, building_variety='TOWER')
         except Exception as fallback_error:
-            print(f"Erreur fallback monument: {fallback_error}")
+            log.error("Erreur fallback monument: %s", fallback_error)
             return None
 
 def create_public_plaza(x, y, size, plaza_mat, tree_mat=None):
@@ -3066,13 +1772,13 @@ def create_public_plaza(x, y, size, plaza_mat, tree_mat=None):
                             tree.data.materials.clear()
                             tree.data.materials.append(tree_mat)
             except Exception as tree_error:
-                print(f"⚠️ Erreur création arbres: {tree_error}")
+                log.error("⚠️ Erreur création arbres: %s", tree_error)
         
-        print(f"🌳 Place publique créée en ({x:.1f}, {y:.1f})")
+        log.debug("🌳 Place publique créée en (%.1f, %.1f)", x, y)
         return plaza
         
     except Exception as e:
-        print(f"Erreur création place publique: {e}")
+        log.error("Erreur création place publique: %s", e)
         return None
 
 def add_street_furniture(zones, street_life_enabled):
@@ -3147,10 +1853,10 @@ def add_street_furniture(zones, street_life_enabled):
                 
                 furniture_count += 1
         
-        print(f"🪑 {furniture_count} éléments de mobilier urbain ajoutés")
+        log.debug("🪑 %s éléments de mobilier urbain ajoutés", furniture_count)
         
     except Exception as e:
-        print(f"Erreur ajout mobilier urbain: {e}")
+        log.error("Erreur ajout mobilier urbain: %s", e)
 
 def apply_building_aging(buildings, weathering_factor):
     """Applique des effets de vieillissement aux bâtiments"""
@@ -3180,158 +1886,195 @@ def apply_building_aging(buildings, weathering_factor):
                 
             aged_count += 1
         
-        print(f"🏚️ {aged_count} bâtiments vieillis (facteur: {weathering_factor:.2f})")
+        log.debug("🏚️ %s bâtiments vieillis (facteur: %.2f)", aged_count, weathering_factor)
         
     except Exception as e:
-        print(f"Erreur vieillissement bâtiments: {e}")
+        log.error("Erreur vieillissement bâtiments: %s", e)
 
 # =============================================
 # NOUVEAU GÉNÉRATEUR : ROUTES D'ABORD
 # =============================================
 
+@in_city_collection
 def generate_road_network_first(context):
     """Nouvelle approche : générer d'abord le réseau de routes, puis remplir les espaces"""
-    print("🔥🔥🔥 V6.13.0 FONCTION ANTI-CRASH APPELÉE ! 🔥🔥🔥")
+    configure_from_scene(context.scene)
+    palette.reset()
+    log.info("🔥🔥🔥 V6.13.0 FONCTION ANTI-CRASH APPELÉE ! 🔥🔥🔥")
     
     try:
-        print("✅ V6.13.0 Étape 1/10: Récupération contexte...")
+        log.info("✅ V6.13.0 Étape 1/10: Récupération contexte...")
         scene = context.scene
         
-        print("✅ V6.13.0 Étape 2/10: Récupération paramètres...")
+        log.info("✅ V6.13.0 Étape 2/10: Récupération paramètres...")
         # Récupérer les paramètres avec protection
         width = safe_int(getattr(scene, 'citygen_width', 3), 3)  # 3x3 plus sûr
         length = safe_int(getattr(scene, 'citygen_length', 3), 3)
         road_width = getattr(scene, 'citygen_road_width', 2.0)  # Plus petit
         
-        print("✅ V6.13.0 Étape 3/10: Paramètres organiques...")
+        log.info("✅ V6.13.0 Étape 3/10: Paramètres organiques...")
         # Paramètres organiques
         organic_mode = getattr(scene, 'citygen_organic_mode', False)
         road_curve_intensity = getattr(scene, 'citygen_road_curve_intensity', 0.2)  # Plus faible
+        live_curve_roads = bool(getattr(scene, 'citygen_live_curve_roads', False))
+        mesh_backend = getattr(scene, 'citygen_mesh_backend', 'OBJECTS')
         
-        print(f"🛣️ V6.13.0 SYSTÈME SÉCURISÉ: Génération routes d'abord ({width}x{length})")
+        log.info("🛣️ V6.13.0 SYSTÈME SÉCURISÉ: Génération routes d'abord (%sx%s)", width, length)
         
-        print("✅ V6.13.0 Étape 4/10: Création matériaux...")
+        log.info("✅ V6.13.0 Étape 4/10: Création matériaux...")
         # Créer les matériaux avec protection
         try:
             road_mat = create_material("RoadMat_First", (0.3, 0.3, 0.3))
             block_mat = create_material("BlockMat_First", (0.7, 0.7, 0.7))
             build_mat = create_material("BuildingMat_First", (0.8, 0.6, 0.4))
-            print("✅ V6.13.0 Matériaux créés avec succès")
+            log.info("✅ V6.13.0 Matériaux créés avec succès")
         except Exception as e:
-            print(f"❌ V6.13.0 Erreur matériaux: {e}")
+            log.error("❌ V6.13.0 Erreur matériaux: %s", e)
             return False
+
+        # Lots de géométrie (un mesh par catégorie) si le backend groupé est actif
+        batches = None
+        if mesh_backend in ('BATCHED', 'SHARED', 'INSTANCED'):
+            from .mesh_batch import create_city_batches
+            shared_snap = safe_float(getattr(scene, 'citygen_shared_snap', 0.0), 0.0)
+            batches = create_city_batches("RoadFirst", road_mat, block_mat, build_mat, mesh_backend, shared_snap)
+            log.info("📦 Backend géométrie actif: %s", mesh_backend)
         
         # ÉTAPE 1: Créer le réseau de routes
-        print(f"✅ V6.13.0 Étape 5/10: Début création routes...")
+        log.info("✅ V6.13.0 Étape 5/10: Début création routes...")
         try:
-            road_network = create_primary_road_network_rf(width, length, road_width, road_mat, organic_mode, road_curve_intensity)
-            print(f"✅ V6.13.0 Étape 6/10: {len(road_network)} routes créées - CONTINUONS...")
+            road_network = create_primary_road_network_rf(width, length, road_width, road_mat, organic_mode, road_curve_intensity,
+                                                          batches['roads'] if batches else None, live_curve_roads)
+            log.info("✅ V6.13.0 Étape 6/10: %s routes créées - CONTINUONS...", len(road_network))
         except Exception as e:
-            print(f"❌ V6.13.0 CRASH dans création routes: {e}")
+            log.error("❌ V6.13.0 CRASH dans création routes: %s", e)
             import traceback
-            print(f"🔥 TRACEBACK ROUTES: {traceback.format_exc()}")
+            log.error("🔥 TRACEBACK ROUTES: %s", traceback.format_exc())
             return False
+
+        # Jonctions aux croisements des routes (courbes et diagonales comprises)
+        junctions_created = add_road_junctions_rf(road_network, road_mat, batches['intersections'] if batches else None)
         
         # ÉTAPE 2: Identifier les zones entre les routes
-        print(f"�🔥🔥 V6.12.8 ÉTAPE 2 DÉBUT: IDENTIFICATION ZONES ===")
+        log.info("�🔥🔥 V6.12.8 ÉTAPE 2 DÉBUT: IDENTIFICATION ZONES ===")
         try:
-            print(f"   🔥 Appel identify_block_zones_from_roads_rf...")
-            block_zones = identify_block_zones_from_roads_rf(road_network, width, length, road_width)
-            print(f"🔥🔥� V6.12.8 ZONES IDENTIFIÉES: {len(block_zones)} ===")
+            log.info("   🔥 Appel identify_block_zones_from_roads_rf...")
+            sidewalk_width = safe_float(getattr(scene, 'citygen_sidewalk_width', 1.0), 1.0)
+            block_zones = identify_block_zones_from_roads_rf(road_network, width, length, road_width, sidewalk_width)
+            log.info("🔥🔥� V6.12.8 ZONES IDENTIFIÉES: %s ===", len(block_zones))
         except Exception as e:
-            print(f"❌ ERREUR identification zones: {e}")
+            log.error("❌ ERREUR identification zones: %s", e)
             import traceback
-            print(f"Traceback zones: {traceback.format_exc()}")
+            log.error("Traceback zones: %s", traceback.format_exc())
             block_zones = []
         
         # ÉTAPE 3: Créer les blocs dans ces zones
-        print(f"🏗️ === DÉBUT CRÉATION BLOCS ===")
+        log.info("🏗️ === DÉBUT CRÉATION BLOCS ===")
         try:
-            blocks_created = create_blocks_in_zones_rf(block_zones, block_mat)
-            print(f"🏗️ === BLOCS CRÉÉS: {blocks_created} ===")
+            blocks_created = create_blocks_in_zones_rf(block_zones, block_mat, batches['sidewalks'] if batches else None)
+            log.info("🏗️ === BLOCS CRÉÉS: %s ===", blocks_created)
         except Exception as e:
-            print(f"❌ ERREUR création blocs: {e}")
+            log.error("❌ ERREUR création blocs: %s", e)
             blocks_created = 0
         
         # ÉTAPE 4: Ajouter les bâtiments dans les blocs
-        print(f"🏢 === DÉBUT CRÉATION BÂTIMENTS ===")
+        log.info("🏢 === DÉBUT CRÉATION BÂTIMENTS ===")
         try:
-            buildings_created = add_buildings_to_blocks_rf(block_zones, build_mat, scene)
-            print(f"🏢 === BÂTIMENTS CRÉÉS: {buildings_created} ===")
+            buildings_created = add_buildings_to_blocks_rf(block_zones, build_mat, scene, batches['buildings'] if batches else None)
+            log.info("🏢 === BÂTIMENTS CRÉÉS: %s ===", buildings_created)
         except Exception as e:
-            print(f"❌ ERREUR création bâtiments: {e}")
+            log.error("❌ ERREUR création bâtiments: %s", e)
             buildings_created = 0
+
+        if batches:
+            from .mesh_batch import build_city_batches
+            batch_objects = build_city_batches(batches)
+            log.info("📦 %s objets groupés créés", len(batch_objects))
         
-        print(f"✅ Système routes-first complété:")
-        print(f"   🛣️ {len(road_network)} segments de routes")
-        print(f"   📐 {len(block_zones)} zones de blocs identifiées") 
-        print(f"   🏗️ {blocks_created} blocs créés")
-        print(f"   🏢 {buildings_created} bâtiments générés")
+        log.info("✅ Système routes-first complété:")
+        log.info("   🛣️ %s segments de routes", len(road_network))
+        log.info("   ✖️ %s jonctions", junctions_created)
+        log.info("   📐 %s zones de blocs identifiées", len(block_zones)) 
+        log.info("   🏗️ %s blocs créés", blocks_created)
+        log.info("   🏢 %s bâtiments générés", buildings_created)
         
-        print(f"🔥 V6.12.8 SUCCÈS COMPLET - TOUTES ÉTAPES TERMINÉES !")
+        log.info("🔥 V6.12.8 SUCCÈS COMPLET - TOUTES ÉTAPES TERMINÉES !")
         return True
         
     except Exception as e:
-        print(f"❌ CRASH V6.12.8 génération routes-first: {e}")
+        log.error("❌ CRASH V6.12.8 génération routes-first: %s", e)
         import traceback
-        print(f"🔥 TRACEBACK COMPLET V6.12.8:")
-        print(f"{traceback.format_exc()}")
+        log.info("🔥 TRACEBACK COMPLET V6.12.8:")
+        log.info("%s", traceback.format_exc())
         return False
 
-def create_primary_road_network_rf(width, length, road_width, road_mat, organic_mode, curve_intensity):
-    """Crée le réseau principal de routes"""
+def create_primary_road_network_rf(width, length, road_width, road_mat, organic_mode, curve_intensity, batch=None,
+                                   live_curves=False):
+    """Crée le réseau principal de routes
+
+    live_curves: routes Bézier gardées en courbes vivantes (Geometry Nodes), sans conversion en mesh.
+    """
     road_network = []
     block_size = 12.0  # Taille d'un bloc avec sa route
     
     try:
-        print(f"🛣️ Création réseau de routes principal...")
+        log.debug("🛣️ Création réseau de routes principal...")
+        
+        if live_curves:
+            road_network = create_organic_road_grid_rf(width, length, block_size, road_width, road_mat,
+                                                       curve_intensity, live_curves=True)
+            log.debug("✅ %s routes courbes vivantes créées", len(road_network))
+            return road_network
         
         # FORCER TOUJOURS LE SYSTÈME ULTRA-ORGANIQUE pour résultats satisfaisants
-        print(f"� ACTIVATION FORCÉE du système ULTRA-ORGANIQUE (intensité: {curve_intensity})")
-        road_network = create_smart_organic_road_grid_rf(width, length, block_size, road_width, road_mat, curve_intensity)
+        log.debug("� ACTIVATION FORCÉE du système ULTRA-ORGANIQUE (intensité: %s)", curve_intensity)
+        road_network = create_smart_organic_road_grid_rf(width, length, block_size, road_width, road_mat, curve_intensity, batch)
         
-        print(f"✅ {len(road_network)} segments de routes créés")
+        log.debug("✅ %s segments de routes créés", len(road_network))
         return road_network
         
     except Exception as e:
-        print(f"Erreur création réseau routes: {e}")
+        log.error("Erreur création réseau routes: %s", e)
         return []
 
-def create_smart_organic_road_grid_rf(width, length, block_size, road_width, road_mat, curve_intensity):
-    """Système hybride intelligent AMÉLIORÉ - courbes réelles + diagonales"""
+def _rf_centerline(center, length, angle):
+    """Extrémités de la ligne médiane d'une route rectiligne (centre, longueur, orientation)"""
+    import math
+    dx = math.cos(angle) * length / 2
+    dy = math.sin(angle) * length / 2
+    return [(center[0] - dx, center[1] - dy), (center[0] + dx, center[1] + dy)]
+
+def create_smart_organic_road_grid_rf(width, length, block_size, road_width, road_mat, curve_intensity, batch=None):
+    """Système hybride intelligent AMÉLIORÉ - courbes réelles + diagonales
+
+    Routes rectilignes (mode subtil) et rubans courbes sont ajoutés au MeshBatch si batch est fourni.
+    """
     road_network = []
     import math
     import random
-    import bmesh
     
     try:
-        print(f"🧠🌊 === SYSTÈME ULTRA-HYBRIDE AMÉLIORÉ ===")
-        print(f"   🎯 Grille urbaine + VRAIES courbes + diagonales organiques")
-        print(f"   📊 Paramètres: {width}x{length}, intensité={curve_intensity}")
+        log.debug("🧠🌊 === SYSTÈME ULTRA-HYBRIDE AMÉLIORÉ ===")
+        log.debug("   🎯 Grille urbaine + VRAIES courbes + diagonales organiques")
+        log.debug("   📊 Paramètres: %sx%s, intensité=%s", width, length, curve_intensity)
         
         # Intensité adaptative - plus d'intensité si demandée
         if curve_intensity > 0.6:
             smart_intensity = min(0.4, curve_intensity)  # Plus de courbes
-            print(f"   🌊 Mode ULTRA-ORGANIQUE activé (intensité: {smart_intensity})")
+            log.debug("   🌊 Mode ULTRA-ORGANIQUE activé (intensité: %s)", smart_intensity)
         else:
             smart_intensity = min(0.15, curve_intensity * 0.5)  # Mode subtil
             
         variation_range = block_size * smart_intensity
-        print(f"   🌿 Variation range: ±{variation_range:.1f}m")
+        log.debug("   🌿 Variation range: ±%.1fm", variation_range)
         
         # === ROUTES PRINCIPALES COURBES ===
-        # Routes verticales avec VRAIES courbes (using bmesh)
+        # Routes verticales avec VRAIES courbes (rubans continus)
         for i in range(width + 1):
             base_x = (i - width/2) * block_size
             
             if curve_intensity > 0.6:
-                # VRAIES COURBES avec bmesh
-                mesh = bpy.data.meshes.new(f"CurvedRoad_V_{i}")
-                obj = bpy.data.objects.new(f"CurvedRoad_V_{i}", mesh)
-                bpy.context.collection.objects.link(obj)
-                
-                bm = bmesh.new()
-                
+                # VRAIES COURBES: ruban continu le long de la ligne médiane
                 # Créer courbe avec points multiples
                 points = []
                 for p in range(21):  # 21 points pour courbe fluide
@@ -3345,23 +2088,13 @@ def create_smart_organic_road_grid_rf(width, length, block_size, road_width, roa
                     final_x = base_x + curve1 + curve2
                     points.append((final_x, y, 0.05))
                 
-                # Créer géométrie courbe
-                for j, (x, y, z) in enumerate(points):
-                    v = bm.verts.new((x, y, z))
-                    if j > 0:
-                        bm.edges.new([prev_v, v])
-                    prev_v = v
-                
-                # Appliquer et matériau
-                bm.to_mesh(mesh)
-                bm.free()
-                
-                # Matériau courbe
-                mat = create_material(f"CurvedMat_V_{i}", (0.2 + i*0.1, 0.4, 0.6))
-                if obj.data:
-                    obj.data.materials.append(mat)
+                # Géométrie courbe et matériau
+                obj = create_ribbon_road(f"CurvedRoad_V_{i}", [(x, y) for x, y, _ in points], road_width,
+                                         'curved_road_v', (min(1.0, 0.2 + i*0.1), 0.4, 0.6), base_color=(0.2, 0.4, 0.6),
+                                         batch=batch, join='ROUND', z=0.05)
                     
-                road_network.append({'object': obj, 'type': 'curved_vertical', 'x': base_x})
+                road_network.append({'object': obj, 'type': 'curved_vertical', 'x': base_x,
+                                     'points': [(x, y) for x, y, _ in points], 'width': road_width})
                 
             else:
                 # Mode subtil comme avant
@@ -3372,6 +2105,16 @@ def create_smart_organic_road_grid_rf(width, length, block_size, road_width, roa
                 )
                 
                 final_x = base_x + organic_var
+
+                if batch is not None:
+                    width_var = 1.0 + random.uniform(-0.1, 0.1)
+                    mat = palette_material('smart_road_v', (0.3 + (i % 3) * 0.05, 0.3, 0.4))
+                    batch.add_box(road_width * width_var, length * block_size, 0.1, (final_x, 0, 0.0),
+                                  rotation_z=organic_var / block_size * 0.05, material=mat)
+                    road_network.append({'object': None, 'type': 'vertical', 'x': final_x,
+                                         'points': _rf_centerline((final_x, 0), length * block_size, math.pi / 2 + organic_var / block_size * 0.05),
+                                         'width': road_width * width_var})
+                    continue
                 
                 bpy.ops.mesh.primitive_cube_add(size=2.0, location=(final_x, 0, 0.05))
                 road = bpy.context.object
@@ -3383,12 +2126,11 @@ def create_smart_organic_road_grid_rf(width, length, block_size, road_width, roa
                     road.rotation_euler[2] = organic_var / block_size * 0.05
                     road.name = f"SmartRoad_V_{i}"
                     
-                    mat = create_material(f"SmartMat_V_{i}", (0.3 + (i % 3) * 0.05, 0.3, 0.4))
-                    if road.data:
-                        road.data.materials.clear()
-                        road.data.materials.append(mat)
+                    assign_palette_material(road, 'smart_road_v', (0.3 + (i % 3) * 0.05, 0.3, 0.4), base_color=(0.3, 0.3, 0.4))
                     
-                    road_network.append({'object': road, 'type': 'vertical', 'x': final_x})
+                    road_network.append({'object': road, 'type': 'vertical', 'x': final_x,
+                                         'points': _rf_centerline((final_x, 0), length * block_size, math.pi / 2 + road.rotation_euler[2]),
+                                         'width': road_width * width_var})
         
         # Routes horizontales (même logique)
         for j in range(length + 1):
@@ -3396,11 +2138,6 @@ def create_smart_organic_road_grid_rf(width, length, block_size, road_width, roa
             
             if curve_intensity > 0.6:
                 # VRAIES COURBES horizontales
-                mesh = bpy.data.meshes.new(f"CurvedRoad_H_{j}")
-                obj = bpy.data.objects.new(f"CurvedRoad_H_{j}", mesh)
-                bpy.context.collection.objects.link(obj)
-                
-                bm = bmesh.new()
                 points = []
                 for p in range(21):
                     t = p / 20.0
@@ -3412,20 +2149,12 @@ def create_smart_organic_road_grid_rf(width, length, block_size, road_width, roa
                     final_y = base_y + curve1 + curve2
                     points.append((x, final_y, 0.05))
                 
-                for k, (x, y, z) in enumerate(points):
-                    v = bm.verts.new((x, y, z))
-                    if k > 0:
-                        bm.edges.new([prev_v, v])
-                    prev_v = v
-                
-                bm.to_mesh(mesh)
-                bm.free()
-                
-                mat = create_material(f"CurvedMat_H_{j}", (0.6, 0.3 + j*0.1, 0.2))
-                if obj.data:
-                    obj.data.materials.append(mat)
+                obj = create_ribbon_road(f"CurvedRoad_H_{j}", [(x, y) for x, y, _ in points], road_width,
+                                         'curved_road_h', (0.6, min(1.0, 0.3 + j*0.1), 0.2), base_color=(0.6, 0.3, 0.2),
+                                         batch=batch, join='ROUND', z=0.05)
                     
-                road_network.append({'object': obj, 'type': 'curved_horizontal', 'y': base_y})
+                road_network.append({'object': obj, 'type': 'curved_horizontal', 'y': base_y,
+                                     'points': [(x, y) for x, y, _ in points], 'width': road_width})
                 
             else:
                 # Mode subtil
@@ -3436,6 +2165,16 @@ def create_smart_organic_road_grid_rf(width, length, block_size, road_width, roa
                 )
                 
                 final_y = base_y + organic_var
+
+                if batch is not None:
+                    width_var = 1.0 + random.uniform(-0.08, 0.08)
+                    mat = palette_material('smart_road_h', (0.5, 0.4 + (j % 4) * 0.04, 0.3))
+                    batch.add_box(width * block_size, road_width * width_var, 0.1, (0, final_y, 0.0),
+                                  rotation_z=organic_var / block_size * 0.04, material=mat)
+                    road_network.append({'object': None, 'type': 'horizontal', 'y': final_y,
+                                         'points': _rf_centerline((0, final_y), width * block_size, organic_var / block_size * 0.04),
+                                         'width': road_width * width_var})
+                    continue
                 
                 bpy.ops.mesh.primitive_cube_add(size=2.0, location=(0, final_y, 0.05))
                 road = bpy.context.object
@@ -3447,23 +2186,17 @@ def create_smart_organic_road_grid_rf(width, length, block_size, road_width, roa
                     road.rotation_euler[2] = organic_var / block_size * 0.04
                     road.name = f"SmartRoad_H_{j}"
                     
-                    mat = create_material(f"SmartMat_H_{j}", (0.5, 0.4 + (j % 4) * 0.04, 0.3))
-                    if road.data:
-                        road.data.materials.clear()
-                        road.data.materials.append(mat)
+                    assign_palette_material(road, 'smart_road_h', (0.5, 0.4 + (j % 4) * 0.04, 0.3), base_color=(0.5, 0.4, 0.3))
                     
-                    road_network.append({'object': road, 'type': 'horizontal', 'y': final_y})
+                    road_network.append({'object': road, 'type': 'horizontal', 'y': final_y,
+                                         'points': _rf_centerline((0, final_y), width * block_size, road.rotation_euler[2]),
+                                         'width': road_width * width_var})
         
         # === ROUTES DIAGONALES ORGANIQUES (si intensité élevée) ===
         if curve_intensity > 0.7 and width >= 4 and length >= 4:
-            print(f"   🔀 Ajout de routes diagonales organiques...")
+            log.debug("   🔀 Ajout de routes diagonales organiques...")
             
             # Diagonale principale
-            mesh = bpy.data.meshes.new(f"DiagonalRoad_Main")
-            obj = bpy.data.objects.new(f"DiagonalRoad_Main", mesh)
-            bpy.context.collection.objects.link(obj)
-            
-            bm = bmesh.new()
             points = []
             for p in range(15):
                 t = p / 14.0
@@ -3477,34 +2210,25 @@ def create_smart_organic_road_grid_rf(width, length, block_size, road_width, roa
                 final_y = base_y + diag_curve * 0.8
                 points.append((final_x, final_y, 0.05))
             
-            for k, (x, y, z) in enumerate(points):
-                v = bm.verts.new((x, y, z))
-                if k > 0:
-                    bm.edges.new([prev_v, v])
-                prev_v = v
-            
-            bm.to_mesh(mesh)
-            bm.free()
-            
-            mat = create_material(f"DiagonalMat", (0.8, 0.6, 0.3))
-            if obj.data:
-                obj.data.materials.append(mat)
+            obj = create_ribbon_road("DiagonalRoad_Main", [(x, y) for x, y, _ in points], road_width,
+                                     'diagonal_road', (0.8, 0.6, 0.3), batch=batch, join='ROUND', z=0.05)
                 
-            road_network.append({'object': obj, 'type': 'diagonal'})
+            road_network.append({'object': obj, 'type': 'diagonal',
+                                 'points': [(x, y) for x, y, _ in points], 'width': road_width})
         
-        print(f"✅ {len(road_network)} routes ULTRA-hybrides créées")
+        log.debug("✅ %s routes ULTRA-hybrides créées", len(road_network))
         if curve_intensity > 0.6:
-            print(f"   🌊 VRAIES courbes avec bmesh générées")
+            log.debug("   🌊 VRAIES courbes en rubans continus générées")
         if curve_intensity > 0.7:
-            print(f"   🔀 Routes diagonales organiques ajoutées")
-        print(f"   🧠 Système adaptatif selon l'intensité demandée")
+            log.debug("   🔀 Routes diagonales organiques ajoutées")
+        log.debug("   🧠 Système adaptatif selon l'intensité demandée")
         
         return road_network
         
     except Exception as e:
-        print(f"❌ Erreur routes ULTRA-hybrides: {e}")
+        log.error("❌ Erreur routes ULTRA-hybrides: %s", e)
         import traceback
-        print(f"Traceback: {traceback.format_exc()}")
+        log.error("Traceback: %s", traceback.format_exc())
         return []
 
 def create_realistic_organic_road_grid_rf(width, length, block_size, road_width, road_mat, curve_intensity):
@@ -3513,9 +2237,9 @@ def create_realistic_organic_road_grid_rf(width, length, block_size, road_width,
     import math
     
     try:
-        print(f"🌿 === GÉNÉRATION ROUTES ORGANIQUES RÉALISTES ===")
-        print(f"   Paramètres: {width}x{length}, intensité={curve_intensity}")
-        print(f"   🎯 Objectif: Routes urbaines avec légères courbes naturelles")
+        log.debug("🌿 === GÉNÉRATION ROUTES ORGANIQUES RÉALISTES ===")
+        log.debug("   Paramètres: %sx%s, intensité=%s", width, length, curve_intensity)
+        log.debug("   🎯 Objectif: Routes urbaines avec légères courbes naturelles")
         
         # Intensité modérée pour garder l'aspect urbain
         curve_intensity = min(0.3, curve_intensity)  # Maximum 30% de courbure
@@ -3544,10 +2268,7 @@ def create_realistic_organic_road_grid_rf(width, length, block_size, road_width,
                 
                 # Matériau avec couleur variable
                 color_var = 0.7 + (i % 3) * 0.1  # Variation subtile
-                org_mat = create_material(f"OrganicMat_V_{i}", (color_var, 0.2, 0.1))
-                if road.data:
-                    road.data.materials.clear()
-                    road.data.materials.append(org_mat)
+                assign_palette_material(road, 'organic_road_v', (color_var, 0.2, 0.1), base_color=(0.7, 0.2, 0.1))
                 
                 road_network.append({
                     'object': road,
@@ -3579,10 +2300,7 @@ def create_realistic_organic_road_grid_rf(width, length, block_size, road_width,
                 
                 # Matériau avec couleur variable
                 color_var = 0.5 + (j % 4) * 0.1
-                org_mat = create_material(f"OrganicMat_H_{j}", (0.2, color_var, 0.1))
-                if road.data:
-                    road.data.materials.clear()
-                    road.data.materials.append(org_mat)
+                assign_palette_material(road, 'organic_road_h', (0.2, color_var, 0.1), base_color=(0.2, 0.5, 0.1))
                 
                 road_network.append({
                     'object': road,
@@ -3590,12 +2308,12 @@ def create_realistic_organic_road_grid_rf(width, length, block_size, road_width,
                     'y': final_y
                 })
         
-        print(f"✅ {len(road_network)} routes organiques réalistes créées")
-        print(f"   🌿 Courbes légères préservant la logique urbaine")
+        log.debug("✅ %s routes organiques réalistes créées", len(road_network))
+        log.debug("   🌿 Courbes légères préservant la logique urbaine")
         return road_network
         
     except Exception as e:
-        print(f"❌ Erreur routes organiques réalistes: {e}")
+        log.error("❌ Erreur routes organiques réalistes: %s", e)
         return []
 
 def create_rectangular_road_grid_rf(width, length, block_size, road_width, road_mat):
@@ -3668,7 +2386,7 @@ def create_rectangular_road_grid_rf(width, length, block_size, road_width, road_
         return road_network
         
     except Exception as e:
-        print(f"Erreur grille rectangulaire: {e}")
+        log.error("Erreur grille rectangulaire: %s", e)
         return []
 
 def create_highway_road(x, y, direction, width, length, road_mat, index):
@@ -3687,10 +2405,7 @@ def create_highway_road(x, y, direction, width, length, road_mat, index):
             road.name = f"Highway_{direction}_{index}"
             
             # Matériau autoroute plus sombre
-            highway_mat = create_material(f"HighwayMat_{index}", (0.15, 0.15, 0.15))
-            if road.data:
-                road.data.materials.clear()
-                road.data.materials.append(highway_mat)
+            assign_palette_material(road, 'highway', (0.15, 0.15, 0.15))
             
             return {
                 'object': road,
@@ -3702,84 +2417,69 @@ def create_highway_road(x, y, direction, width, length, road_mat, index):
                 'length': length if direction == 'vertical' else width
             }
     except Exception as e:
-        print(f"Erreur création autoroute: {e}")
+        log.error("Erreur création autoroute: %s", e)
+        return None
+
+def create_ribbon_road(name, points, width, role, color, base_color=None, batch=None, mat=None, **options):
+    """Route en un seul ruban continu le long d'une polyligne (road_ribbon)
+
+    Ajoutée au lot si batch est fourni (retourne None), sinon un objet avec le
+    matériau de palette du rôle, ou mat s'il est fourni. options: join, z,
+    curb_width, sidewalk_width...
+    """
+    from .mesh_batch import MeshBatch
+
+    if batch is not None:
+        batch.add_ribbon(points, width, material=mat or palette_material(role, color, base_color), **options)
+        return None
+    ribbon = MeshBatch(name, mat)
+    if not ribbon.add_ribbon(points, width, **options):
         return None
+    obj = ribbon.build_object()
+    if obj and mat is None:
+        assign_palette_material(obj, role, color, base_color)
+    return obj
 
 def create_sinusoidal_road(x, y, direction, width, length, road_mat, curve_intensity, index):
-    """Crée une route avec des courbes sinusoïdales organiques"""
+    """Crée une route avec des courbes sinusoïdales organiques (un seul ruban)"""
     import math
     try:
-        # Créer plusieurs segments pour faire une courbe
-        segments = []
         num_segments = max(5, int(length / 20))  # Plus de segments = plus fluide
+        segment_length = length / num_segments
         
-        for i in range(num_segments):
-            segment_length = length / num_segments
-            
+        points = []
+        for i in range(num_segments + 1):
+            along = (i - num_segments/2) * segment_length
+            # Courbe sinusoïdale
+            curve_offset = math.sin(i * 0.8) * curve_intensity * 3
             if direction == 'vertical':
-                segment_y = y + (i - num_segments/2) * segment_length
-                # Courbe sinusoïdale
-                curve_offset = math.sin(i * 0.8) * curve_intensity * 3
-                segment_x = x + curve_offset
-                
-                bpy.ops.mesh.primitive_cube_add(size=2.0, location=(segment_x, segment_y, 0.05))
-                segment = bpy.context.object
-                if segment:
-                    segment.scale = (width/2, segment_length/2, 0.05)
-                    bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-                    segment.name = f"Avenue_Sin_V_{index}_{i}"
-                    
-                    # Matériau avenue
-                    avenue_mat = create_material(f"AvenueMat_{index}_{i}", (0.25, 0.25, 0.25))
-                    if segment.data:
-                        segment.data.materials.clear()
-                        segment.data.materials.append(avenue_mat)
-                    
-                    segments.append({
-                        'object': segment,
-                        'type': 'vertical',
-                        'road_type': 'avenue',
-                        'x': segment_x,
-                        'y': segment_y,
-                        'width': width,
-                        'length': segment_length
-                    })
+                points.append((x + curve_offset, y + along))
             else:  # horizontal
-                segment_x = x + (i - num_segments/2) * segment_length
-                curve_offset = math.sin(i * 0.8) * curve_intensity * 3
-                segment_y = y + curve_offset
-                
-                bpy.ops.mesh.primitive_cube_add(size=2.0, location=(segment_x, segment_y, 0.05))
-                segment = bpy.context.object
-                if segment:
-                    segment.scale = (segment_length/2, width/2, 0.05)
-                    bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-                    segment.name = f"Avenue_Sin_H_{index}_{i}"
-                    
-                    avenue_mat = create_material(f"AvenueMat_{index}_{i}", (0.25, 0.25, 0.25))
-                    if segment.data:
-                        segment.data.materials.clear()
-                        segment.data.materials.append(avenue_mat)
-                    
-                    segments.append({
-                        'object': segment,
-                        'type': 'horizontal',
-                        'road_type': 'avenue',
-                        'x': segment_x,
-                        'y': segment_y,
-                        'width': segment_length,
-                        'length': width
-                    })
-        
-        # Retourner le premier segment comme représentant
-        return segments[0] if segments else None
+                points.append((x + along, y + curve_offset))
+        
+        suffix = 'V' if direction == 'vertical' else 'H'
+        road = create_ribbon_road(f"Avenue_Sin_{suffix}_{index}", points, width, 'avenue', (0.25, 0.25, 0.25),
+                                  join='ROUND', z=0.1)
+        if not road:
+            return None
+        
+        return {
+            'object': road,
+            'type': direction,
+            'road_type': 'avenue',
+            'x': x,
+            'y': y,
+            'width': width if direction == 'vertical' else length,
+            'length': length if direction == 'vertical' else width,
+            'points': points
+        }
         
     except Exception as e:
-        print(f"Erreur route sinusoïdale: {e}")
+        log.error("Erreur route sinusoïdale: %s", e)
         return None
 
 def create_broken_road(start_x, start_y, end_x, end_y, direction, width, road_mat, index):
-    """Crée une route brisée avec plusieurs segments"""
+    """Crée une route brisée (plusieurs segments joints en onglet, un seul ruban)"""
     import math
     try:
         # Points de brisure aléatoires
@@ -3798,163 +2498,96 @@ def create_broken_road(start_x, start_y, end_x, end_y, direction, width, road_ma
         
         points.append((end_x, end_y))
         
-        # Créer des segments entre les points
-        for i in range(len(points) - 1):
-            p1, p2 = points[i], points[i + 1]
-            segment_x = (p1[0] + p2[0]) / 2
-            segment_y = (p1[1] + p2[1]) / 2
-            
-            segment_length = math.sqrt((p2[0] - p1[0])**2 + (p2[1] - p1[1])**2)
-            
-            bpy.ops.mesh.primitive_cube_add(size=2.0, location=(segment_x, segment_y, 0.05))
-            segment = bpy.context.object
-            if segment:
-                if direction == 'vertical':
-                    segment.scale = (width/2, segment_length/2, 0.05)
-                else:
-                    segment.scale = (segment_length/2, width/2, 0.05)
-                
-                # Rotation pour aligner avec la direction
-                angle = math.atan2(p2[1] - p1[1], p2[0] - p1[0])
-                if direction == 'vertical':
-                    segment.rotation_euler[2] = angle
-                
-                bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-                segment.name = f"Street_Broken_{direction}_{index}_{i}"
-                
-                street_mat = create_material(f"StreetMat_{index}_{i}", (0.35, 0.35, 0.35))
-                if segment.data:
-                    segment.data.materials.clear()
-                    segment.data.materials.append(street_mat)
+        road = create_ribbon_road(f"Street_Broken_{direction}_{index}", points, width, 'street', (0.35, 0.35, 0.35),
+                                  join='MITER', z=0.1)
         
-        # Retourner une info basique
         return {
-            'object': None,  # Segments multiples
+            'object': road,
             'type': direction,
             'road_type': 'street',
-            'x': segment_x,
-            'y': segment_y,
+            'x': (start_x + end_x) / 2,
+            'y': (start_y + end_y) / 2,
             'width': width,
-            'length': segment_length
-        }
+            'length': sum(math.dist(p1, p2) for p1, p2 in zip(points, points[1:])),
+            'points': points
+        } if road else None
         
     except Exception as e:
-        print(f"Erreur route brisée: {e}")
+        log.error("Erreur route brisée: %s", e)
         return None
 
 def create_serpentine_lane(start_x, start_y, direction, width, road_mat, curve_intensity, index):
-    """Crée une ruelle qui serpente de manière organique"""
-    import math
+    """Crée une ruelle qui serpente de manière organique (un seul ruban)"""
     try:
         current_x, current_y = start_x, start_y
-        segments = []
+        points = [(current_x, current_y)]
         
         for i in range(random.randint(3, 6)):  # 3-6 segments de ruelle
             # Avancer dans la direction avec déviation
             if direction in ['north', 'south']:
                 step = 15 if direction == 'north' else -15
-                next_y = current_y + step
-                next_x = current_x + random.uniform(-8, 8) * curve_intensity
+                current_y = current_y + step
+                current_x = current_x + random.uniform(-8, 8) * curve_intensity
             elif direction in ['east', 'west']:
                 step = 15 if direction == 'east' else -15
-                next_x = current_x + step
-                next_y = current_y + random.uniform(-8, 8) * curve_intensity
+                current_x = current_x + step
+                current_y = current_y + random.uniform(-8, 8) * curve_intensity
             else:  # diagonal
-                next_x = current_x + random.uniform(-10, 10)
-                next_y = current_y + random.uniform(-10, 10)
-            
-            # Créer le segment
-            segment_x = (current_x + next_x) / 2
-            segment_y = (current_y + next_y) / 2
-            segment_length = math.sqrt((next_x - current_x)**2 + (next_y - current_y)**2)
-            
-            bpy.ops.mesh.primitive_cube_add(size=2.0, location=(segment_x, segment_y, 0.05))
-            segment = bpy.context.object
-            if segment:
-                segment.scale = (width/2, segment_length/2, 0.05)
-                
-                # Rotation pour suivre la direction
-                angle = math.atan2(next_y - current_y, next_x - current_x)
-                segment.rotation_euler[2] = angle
-                
-                bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-                segment.name = f"Lane_Serpent_{index}_{i}"
-                
-                lane_mat = create_material(f"LaneMat_{index}_{i}", (0.45, 0.45, 0.45))
-                if segment.data:
-                    segment.data.materials.clear()
-                    segment.data.materials.append(lane_mat)
-                
-                segments.append(segment)
-            
-            current_x, current_y = next_x, next_y
+                current_x = current_x + random.uniform(-10, 10)
+                current_y = current_y + random.uniform(-10, 10)
+            points.append((current_x, current_y))
+        
+        lane = create_ribbon_road(f"Lane_Serpent_{index}", points, width, 'lane', (0.45, 0.45, 0.45),
+                                  join='ROUND', z=0.1)
         
         return {
-            'object': segments[0] if segments else None,
+            'object': lane,
             'type': 'serpentine',
             'road_type': 'lane',
             'x': start_x,
             'y': start_y,
             'width': width,
-            'length': 10
+            'length': 10,
+            'points': points
         }
         
     except Exception as e:
-        print(f"Erreur ruelle serpentante: {e}")
+        log.error("Erreur ruelle serpentante: %s", e)
         return None
 
 def create_diagonal_curved_road(start_x, start_y, end_x, end_y, width, road_mat, curve_intensity, index):
-    """Crée une route diagonale avec courbe"""
+    """Crée une route diagonale avec courbe (Bézier quadratique, un seul ruban)"""
     import math
     try:
         # Point de contrôle pour la courbe
         mid_x = (start_x + end_x) / 2 + random.uniform(-5, 5) * curve_intensity
         mid_y = (start_y + end_y) / 2 + random.uniform(-5, 5) * curve_intensity
         
-        # Créer plusieurs segments pour la courbe
-        num_segments = 5
-        for i in range(num_segments):
-            t = i / (num_segments - 1)
-            
-            # Courbe de Bézier quadratique
+        # Courbe de Bézier quadratique échantillonnée
+        num_segments = 12
+        points = []
+        for i in range(num_segments + 1):
+            t = i / num_segments
             x = (1-t)**2 * start_x + 2*(1-t)*t * mid_x + t**2 * end_x
             y = (1-t)**2 * start_y + 2*(1-t)*t * mid_y + t**2 * end_y
-            
-            bpy.ops.mesh.primitive_cube_add(size=2.0, location=(x, y, 0.05))
-            segment = bpy.context.object
-            if segment:
-                segment_length = math.sqrt((end_x - start_x)**2 + (end_y - start_y)**2) / num_segments
-                segment.scale = (width/2, segment_length/2, 0.05)
-                
-                # Rotation selon la direction locale
-                if i < num_segments - 1:
-                    t_next = (i + 1) / (num_segments - 1)
-                    x_next = (1-t_next)**2 * start_x + 2*(1-t_next)*t_next * mid_x + t_next**2 * end_x
-                    y_next = (1-t_next)**2 * start_y + 2*(1-t_next)*t_next * mid_y + t_next**2 * end_y
-                    
-                    angle = math.atan2(y_next - y, x_next - x)
-                    segment.rotation_euler[2] = angle
-                
-                bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-                segment.name = f"Diagonal_Curved_{index}_{i}"
-                
-                diag_mat = create_material(f"DiagonalMat_{index}_{i}", (0.3, 0.3, 0.3))
-                if segment.data:
-                    segment.data.materials.clear()
-                    segment.data.materials.append(diag_mat)
+            points.append((x, y))
+        
+        road = create_ribbon_road(f"Diagonal_Curved_{index}", points, width, 'diagonal_road', (0.3, 0.3, 0.3),
+                                  join='MITER', z=0.1)
         
         return {
-            'object': None,
+            'object': road,
             'type': 'diagonal',
             'road_type': 'diagonal',
             'x': mid_x,
             'y': mid_y,
             'width': width,
-            'length': math.sqrt((end_x - start_x)**2 + (end_y - start_y)**2)
+            'length': math.sqrt((end_x - start_x)**2 + (end_y - start_y)**2),
+            'points': points
         }
         
     except Exception as e:
-        print(f"Erreur route diagonale: {e}")
+        log.error("Erreur route diagonale: %s", e)
         return None
 
 def create_cul_de_sac(center_x, center_y, width, road_mat, index):
@@ -3987,10 +2620,7 @@ def create_cul_de_sac(center_x, center_y, width, road_mat, index):
             bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
             access_road.name = f"CulDeSac_Access_{index}"
             
-            access_mat = create_material(f"CulDeSacAccessMat_{index}", (0.4, 0.4, 0.4))
-            if access_road.data:
-                access_road.data.materials.clear()
-                access_road.data.materials.append(access_mat)
+            assign_palette_material(access_road, 'cul_de_sac_access', (0.4, 0.4, 0.4))
             
             cul_roads.append({
                 'object': access_road,
@@ -4008,10 +2638,7 @@ def create_cul_de_sac(center_x, center_y, width, road_mat, index):
         if circle:
             circle.name = f"CulDeSac_Circle_{index}"
             
-            circle_mat = create_material(f"CulDeSacCircleMat_{index}", (0.35, 0.35, 0.35))
-            if circle.data:
-                circle.data.materials.clear()
-                circle.data.materials.append(circle_mat)
+            assign_palette_material(circle, 'cul_de_sac', (0.35, 0.35, 0.35))
             
             cul_roads.append({
                 'object': circle,
@@ -4026,277 +2653,259 @@ def create_cul_de_sac(center_x, center_y, width, road_mat, index):
         return cul_roads
         
     except Exception as e:
-        print(f"Erreur cul-de-sac: {e}")
+        log.error("Erreur cul-de-sac: %s", e)
         return []
 
-def create_organic_road_grid_rf(width, length, block_size, road_width, road_mat, curve_intensity):
-    """Crée une grille organique de routes - COURBES BLENDER NATIVES MEGA VISIBLES"""
+def create_organic_road_grid_rf(width, length, block_size, road_width, road_mat, curve_intensity,
+                                tolerance=0.05, live_curves=False):
+    """Crée une grille organique de routes - COURBES BÉZIER MEGA VISIBLES
+
+    Les courbes sont tessellées selon leur courbure (écart <= tolerance en mètres)
+    et maillées en rubans plats dans un seul mesh. live_curves garde des splines
+    vivantes maillées par Geometry Nodes (aucune conversion).
+    """
+    from .bezier_roads import build_live_curve_roads, sample_bezier_path
+    from .mesh_batch import MeshBatch
+
     road_network = []
     import math
     
     try:
-        print(f"🎯🔥 === COURBES BLENDER NATIVES MEGA VISIBLES === 🔥🎯")
-        print(f"   Paramètres: width={width}, length={length}, block_size={block_size}")
-        print(f"   road_width={road_width}, curve_intensity={curve_intensity}")
+        log.debug("🎯🔥 === COURBES BÉZIER ADAPTATIVES MEGA VISIBLES === 🔥🎯")
+        log.debug("   Paramètres: width=%s, length=%s, block_size=%s", width, length, block_size)
+        log.debug("   road_width=%s, curve_intensity=%s, tolérance=%sm", road_width, curve_intensity, tolerance)
         
         # FORCER une intensité EXTREME pour garantir la visibilité
         curve_intensity = max(1.5, curve_intensity * 3)  # TRIPLER l'intensité !
-        print(f"   🔥🔥🔥 COURBE INTENSITÉ EXTREME: {curve_intensity}")
+        curve_amplitude = curve_intensity * block_size * 1.2  # MEGA amplitude !
+        segments = 12  # Plus de segments = plus de courbes
+        log.debug("   🔥🔥🔥 COURBE INTENSITÉ EXTREME: %s", curve_intensity)
         
-        # === COURBES BLENDER NATIVES - 100% GARANTIES VISIBLES ===
+        # Points de contrôle: (nom, points, couleur, entrée du réseau)
+        roads = []
         
-        # Routes verticales - COURBES BLENDER NATIVES
-        print(f"   🎯 Génération routes verticales COURBES BLENDER NATIVES...")
+        # Routes verticales - courbes sinusoïdales EXTREMES multiples
         for i in range(width + 1):
             base_x = (i - width/2) * block_size
-            
-            # Créer une courbe Bézier native Blender
-            curve_data = bpy.data.curves.new(f"SuperCurve_V_{i}", type='CURVE')
-            curve_data.dimensions = '3D'
-            curve_data.fill_mode = 'BOTH'
-            curve_data.bevel_depth = road_width / 2  # Largeur automatique
-            curve_data.resolution_u = 64  # MEGA haute résolution
-            curve_data.bevel_resolution = 16  # Résolution du biseau
-            
-            # Créer un spline Bézier
-            spline = curve_data.splines.new('BEZIER')
-            
-            # Points de contrôle pour des courbes ENORMES et visibles
             total_length = length * block_size
-            segments = 12  # Plus de segments = plus de courbes
-            
-            # Redimensionner le spline
-            spline.bezier_points.add(segments)
-            
-            # Définir les points avec des courbes GIGANTESQUES
+            points = []
             for seg in range(segments + 1):
                 t = seg / segments
                 y = (t - 0.5) * total_length
-                
-                # COURBES GIGANTESQUES - IMPOSSIBLE DE LES RATER !
-                curve_amplitude = curve_intensity * block_size * 1.2  # MEGA amplitude !
-                
-                # Courbes sinusoïdales EXTREMES multiples
                 curve_offset = math.sin(t * 6 * math.pi + i * 1.2) * curve_amplitude
                 curve_offset += math.sin(t * 3 * math.pi + i * 2.1) * curve_amplitude * 0.8
                 curve_offset += math.sin(t * 9 * math.pi + i * 0.7) * curve_amplitude * 0.5
-                
                 # Variation random EXTREME
                 curve_offset += random.uniform(-0.4, 0.4) * curve_amplitude
-                
-                final_x = base_x + curve_offset
-                
-                # Définir le point de contrôle
-                point = spline.bezier_points[seg]
-                point.co = (final_x, y, 0)
-                
-                # Handles pour des courbes naturelles
-                point.handle_left_type = 'AUTO'
-                point.handle_right_type = 'AUTO'
-                
-                if seg % 3 == 0:  # Debug
-                    print(f"      Point {seg}: x={final_x:.1f} (offset={curve_offset:.1f})")
+                points.append((base_x + curve_offset, y))
             
-            # Créer l'objet courbe
-            curve_obj = bpy.data.objects.new(f"SuperCurveRoad_V_{i}", curve_data)
-            bpy.context.collection.objects.link(curve_obj)
-            
-            # Convertir en mesh pour les matériaux
-            bpy.context.view_layer.objects.active = curve_obj
-            curve_obj.select_set(True)
-            bpy.ops.object.convert(target='MESH')
-            
-            # Matériau MEGA vif
             hue = (i % 6) / 6.0
-            road_color = (1.0, 0.3 + hue * 0.7, 0.8 - hue * 0.3)  # Couleurs vives
-            
-            road_material = create_material(f"SuperCurveMat_V_{i}", road_color)
-            if curve_obj.data:
-                curve_obj.data.materials.clear()
-                curve_obj.data.materials.append(road_material)
-            
-            print(f"         🔥✅ SUPER COURBE BLENDER V_{i} créée - MEGA VISIBLE !")
-            
-            road_network.append({
-                'object': curve_obj,
+            roads.append((f"SuperCurveRoad_V_{i}", points, (1.0, 0.3 + hue * 0.7, 0.8 - hue * 0.3), {
                 'road_type': 'super_bezier_vertical',
-                'curve_type': 'blender_native_mega',
                 'x': base_x,
                 'y': 0,
-                'width': road_width,
                 'length': total_length,
-                'curve_segments': segments + 1,
-                'curve_amplitude': curve_amplitude
-            })
+            }))
         
-        # Routes horizontales - COURBES BLENDER NATIVES
-        print(f"   🎯 Génération routes horizontales COURBES BLENDER NATIVES...")
+        # Routes horizontales
         for j in range(length + 1):
             base_y = (j - length/2) * block_size
-            
-            # Créer une courbe Bézier native Blender
-            curve_data = bpy.data.curves.new(f"SuperCurve_H_{j}", type='CURVE')
-            curve_data.dimensions = '3D'
-            curve_data.fill_mode = 'BOTH'
-            curve_data.bevel_depth = road_width / 2
-            curve_data.resolution_u = 64
-            curve_data.bevel_resolution = 16
-            
-            # Créer un spline Bézier
-            spline = curve_data.splines.new('BEZIER')
-            
-            # Points de contrôle
             total_length = width * block_size
-            segments = 12
-            
-            # Redimensionner le spline
-            spline.bezier_points.add(segments)
-            
-            # Définir les points avec des courbes GIGANTESQUES
+            points = []
             for seg in range(segments + 1):
                 t = seg / segments
                 x = (t - 0.5) * total_length
-                
-                # COURBES GIGANTESQUES horizontales
-                curve_amplitude = curve_intensity * block_size * 1.2
-                
-                # Courbes sinusoïdales EXTREMES multiples
                 curve_offset = math.sin(t * 5 * math.pi + j * 1.4) * curve_amplitude
                 curve_offset += math.sin(t * 8 * math.pi + j * 1.8) * curve_amplitude * 0.7
                 curve_offset += math.sin(t * 4 * math.pi + j * 0.9) * curve_amplitude * 0.6
-                
-                # Variation random EXTREME
                 curve_offset += random.uniform(-0.4, 0.4) * curve_amplitude
-                
-                final_y = base_y + curve_offset
-                
-                # Définir le point de contrôle
-                point = spline.bezier_points[seg]
-                point.co = (x, final_y, 0)
-                
-                # Handles pour des courbes naturelles
-                point.handle_left_type = 'AUTO'
-                point.handle_right_type = 'AUTO'
-            
-            # Créer l'objet courbe
-            curve_obj = bpy.data.objects.new(f"SuperCurveRoad_H_{j}", curve_data)
-            bpy.context.collection.objects.link(curve_obj)
+                points.append((x, base_y + curve_offset))
             
-            # Convertir en mesh
-            bpy.context.view_layer.objects.active = curve_obj
-            curve_obj.select_set(True)
-            bpy.ops.object.convert(target='MESH')
-            
-            # Matériau MEGA vif
             hue = (j % 6) / 6.0
-            road_color = (0.8 - hue * 0.3, 1.0, 0.3 + hue * 0.7)  # Couleurs vives
-            
-            road_material = create_material(f"SuperCurveMat_H_{j}", road_color)
-            if curve_obj.data:
-                curve_obj.data.materials.clear()
-                curve_obj.data.materials.append(road_material)
-            
-            print(f"         🔥✅ SUPER COURBE BLENDER H_{j} créée - MEGA VISIBLE !")
-            
-            road_network.append({
-                'object': curve_obj,
+            roads.append((f"SuperCurveRoad_H_{j}", points, (0.8 - hue * 0.3, 1.0, 0.3 + hue * 0.7), {
                 'road_type': 'super_bezier_horizontal',
-                'curve_type': 'blender_native_mega',
                 'x': 0,
                 'y': base_y,
-                'width': road_width,
                 'length': total_length,
+            }))
+        
+        materials = [palette_material('super_curve', color) for _, _, color, _ in roads]
+        # Lignes médianes tessellées: ruban du mesh et détection des jonctions
+        polylines = [sample_bezier_path(points, tolerance) for _, points, _, _ in roads]
+        if live_curves:
+            # Splines vivantes: Geometry Nodes les maille à la volée
+            obj = build_live_curve_roads("SuperCurveRoads", [points for _, points, _, _ in roads], road_width,
+                                         materials, tolerance)
+            vertex_counts = [None] * len(roads)
+        else:
+            # Tessellation adaptative puis un seul mesh pour toutes les routes
+            batch = MeshBatch("SuperCurveRoads")
+            vertex_counts = []
+            for polyline, material in zip(polylines, materials):
+                batch.add_ribbon(polyline, road_width, material=material, z=0.0)
+                vertex_counts.append(len(polyline) * 2)
+            obj = batch.build_object()
+        
+        for (name, _, _, info), polyline, vertices in zip(roads, polylines, vertex_counts):
+            road_network.append({
+                'object': obj,
+                'name': name,
+                'curve_type': 'bezier_live' if live_curves else 'bezier_adaptive',
+                'width': road_width,
                 'curve_segments': segments + 1,
-                'curve_amplitude': curve_amplitude
+                'curve_amplitude': curve_amplitude,
+                'points': [tuple(point) for point in polyline.tolist()],
+                'vertex_count': vertices,
+                **info
             })
         
-        print(f"🔥🎯 === COURBES BLENDER NATIVES CRÉÉES === 🎯🔥")
-        print(f"   ✅ {width + 1} routes verticales MEGA courbes")
-        print(f"   ✅ {length + 1} routes horizontales MEGA courbes")
-        print(f"   🔥 AMPLITUDE MAXIMALE: {curve_intensity * block_size * 1.2:.1f}")
-        print(f"   🎯 IMPOSSIBLE DE LES RATER - COURBES GIGANTESQUES !")
+        log.debug("🔥🎯 === COURBES BÉZIER ADAPTATIVES CRÉÉES === 🎯🔥")
+        if not live_curves:
+            log.debug("   📉 %s sommets au total (tolérance %sm)", sum(vertex_counts), tolerance)
+        log.debug("   ✅ %s routes verticales MEGA courbes", width + 1)
+        log.debug("   ✅ %s routes horizontales MEGA courbes", length + 1)
+        log.debug("   🔥 AMPLITUDE MAXIMALE: %.1f", curve_intensity * block_size * 1.2)
+        log.debug("   🎯 IMPOSSIBLE DE LES RATER - COURBES GIGANTESQUES !")
         
         return road_network
         
     except Exception as e:
-        print(f"❌ Erreur courbes: {e}")
+        log.error("❌ Erreur courbes: %s", e)
         import traceback
         traceback.print_exc()
         return []
 
 
-def identify_block_zones_from_roads_rf(road_network, width, length, road_width):
-    """Identifie les zones de blocs entre les routes - GRILLE COMPLÈTE CORRIGÉE V6.12.7"""
-    block_zones = []
+def add_road_junctions_rf(road_network, road_mat, batch=None):
+    """Pose un patch de jonction à chaque croisement du réseau routes-first
+
+    Les croisements sont trouvés par hachage spatial sur les lignes médianes; les
+    routes restent entières, le patch recouvre leur zone commune.
+    """
+    from .road_crossings import find_road_crossings
+
+    try:
+        roads = [road for road in road_network if road.get('points')]
+        if not roads:
+            return 0
+        crossings = find_road_crossings([road['points'] for road in roads],
+                                        [road.get('width', 1.0) for road in roads], cell_size=12.0)
+
+        junctions_created = 0
+        for crossing in crossings:
+            # Routes subtiles: pavés de 0.1 posés au sol
+            if generate_junction_patch(crossing, road_mat, height=0.102, z=0.0, batch=batch):
+                junctions_created += 1
+        log.debug("✖️ %s croisements, %s jonctions créées", len(crossings), junctions_created)
+        return junctions_created
+
+    except Exception as e:
+        log.error("❌ Erreur jonctions routes-first: %s", e)
+        return 0
+
+def _rf_zone_type(i, j, width, length):
+    """Type de zone d'une cellule de grille routes-first"""
+    if i == 0 or i == width-1 or j == 0 or j == length-1:
+        return 'commercial'  # Bordures = commercial
+    if (i + j) % 3 == 0:
+        return 'industrial'  # Quelques zones industrielles
+    return 'residential'  # Majorité résidentiel
+
+def identify_block_zones_from_roads_rf(road_network, width, length, road_width, sidewalk_width=1.0):
+    """Identifie les zones de blocs entre les routes à partir des faces du graphe routier
+
+    Les lignes médianes des routes forment un graphe planaire (road_graph): chaque
+    face fermée est un vrai îlot, rétréci de la demi-largeur de route et du trottoir.
+    Retour à la grille régulière si aucune face n'est trouvée.
+    """
+    from .road_graph import RoadGraph
+
     block_size = 12.0
     
     try:
-        print(f"🔥🔥🔥 FONCTION CORRIGÉE V6.12.7 APPELÉE ! 🔥🔥🔥")
-        print(f"🔍 Identification zones bâtiments entre routes courbes...")
-        print(f"   Paramètres: grille {width}x{length}, block_size={block_size}")
-        print(f"   📊 CALCUL ATTENDU: {width} × {length} = {width * length} zones")
-        
-        # CRÉER UNE GRILLE COMPLÈTE DE ZONES
-        # Au lieu d'essayer de détecter entre les routes courbes, 
-        # on crée une grille régulière adaptée à nos routes
-        
-        print(f"   🏗️ Création grille complète {width}x{length} zones...")
-        
-        for i in range(width):
-            for j in range(length):
-                # Position de base de cette zone (centre de chaque cellule de grille)
-                base_x = (i - width/2 + 0.5) * block_size
-                base_y = (j - length/2 + 0.5) * block_size
-                
-                # Dimensions de la zone (plus petites que le bloc pour éviter les routes)
-                zone_width = block_size * 0.6   # 60% du bloc pour éviter les routes
-                zone_height = block_size * 0.6
-                
-                print(f"      🎯 Zone [{i},{j}]: centre=({base_x:.1f}, {base_y:.1f}), taille={zone_width:.1f}x{zone_height:.1f}")
-                
-                # Déterminer le type de zone selon la position
-                if i == 0 or i == width-1 or j == 0 or j == length-1:
-                    zone_type = 'commercial'  # Bordures = commercial
-                elif (i + j) % 3 == 0:
-                    zone_type = 'industrial'  # Quelques zones industrielles
-                else:
-                    zone_type = 'residential'  # Majorité résidentiel
-                
-                block_zones.append({
-                    'x': base_x,
-                    'y': base_y,
-                    'width': zone_width,
-                    'height': zone_height,
-                    'grid_i': i,
-                    'grid_j': j,
-                    'zone_type': zone_type
-                })
-        
-        print(f"   ✅🔥🔥 {len(block_zones)} zones de bâtiments créées ! 🔥🔥")
-        print(f"   📊 Répartition: {width} x {length} = {width*length} zones au total")
-        print(f"   🎉 SUCCÈS - Notre fonction corrigée fonctionne !")
-        
-        # Afficher quelques exemples pour debug
-        if len(block_zones) >= 3:
-            print(f"   🔍 Exemples de zones créées:")
-            for idx in [0, len(block_zones)//2, -1]:
-                zone = block_zones[idx]
-                print(f"      Zone {idx}: ({zone['x']:.1f}, {zone['y']:.1f}) - {zone['zone_type']}")
-        
+        polylines = [road['points'] for road in road_network if road.get('points')]
+        widths = [road.get('width', road_width) for road in road_network if road.get('points')]
+        log.debug("🔍 Graphe routier: %s lignes médianes", len(polylines))
+        if not polylines:
+            return _grid_block_zones_rf(width, length)
+
+        graph = RoadGraph.from_polylines(polylines, widths, extend=block_size * 0.25)
+        pruned = graph.prune_dead_ends()
+        blocks = graph.block_polygons(sidewalk_width)
+        log.debug("   📐 %s nœuds, %s arêtes (%s impasses retirées), %s îlots",
+                  len(graph.nodes), len(graph.edges), pruned, len(blocks))
+        if not blocks:
+            log.warning("⚠️ Aucun îlot fermé dans le graphe routier - grille régulière")
+            return _grid_block_zones_rf(width, length)
+
+        block_zones = []
+        for block in blocks:
+            cx, cy = block['centroid']
+            # Cellule de grille la plus proche (pour la répartition des types de zones)
+            i = min(width - 1, max(0, int((cx / block_size) + width / 2)))
+            j = min(length - 1, max(0, int((cy / block_size) + length / 2)))
+            half_x, half_y = block['half_size']
+            block_zones.append({
+                'x': float(cx),
+                'y': float(cy),
+                'width': float(2 * half_x),
+                'height': float(2 * half_y),
+                'polygon': block['polygon'],
+                'area': block['area'],
+                'grid_i': i,
+                'grid_j': j,
+                'zone_type': _rf_zone_type(i, j, width, length)
+            })
+
+        log.debug("   ✅ %s zones de bâtiments issues des faces du graphe", len(block_zones))
         return block_zones
         
     except Exception as e:
-        print(f"❌ Erreur identification zones: {e}")
+        log.error("❌ Erreur identification zones: %s", e)
         import traceback
-        print(f"Traceback: {traceback.format_exc()}")
+        log.error("Traceback: %s", traceback.format_exc())
         return []
 
-def create_blocks_in_zones_rf(block_zones, block_mat):
-    """Crée les blocs dans les zones identifiées"""
+def _grid_block_zones_rf(width, length):
+    """Grille régulière de zones (60% de chaque cellule), sans lecture des routes"""
+    block_size = 12.0
+    block_zones = []
+    for i in range(width):
+        for j in range(length):
+            block_zones.append({
+                'x': (i - width/2 + 0.5) * block_size,
+                'y': (j - length/2 + 0.5) * block_size,
+                'width': block_size * 0.6,   # 60% du bloc pour éviter les routes
+                'height': block_size * 0.6,
+                'grid_i': i,
+                'grid_j': j,
+                'zone_type': _rf_zone_type(i, j, width, length)
+            })
+    return block_zones
+
+def create_blocks_in_zones_rf(block_zones, block_mat, batch=None):
+    """Crée les blocs dans les zones identifiées (dans un MeshBatch si batch est fourni)"""
     blocks_created = 0
     
     try:
+        polygon_batch = None
         for i, zone in enumerate(block_zones):
+            polygon = zone.get('polygon')
+            if polygon is not None:
+                # Îlot réel: prisme du polygone de la face (un seul objet en mode objets)
+                if batch is None and polygon_batch is None:
+                    from .mesh_batch import MeshBatch
+                    polygon_batch = MeshBatch("Block_Zones", block_mat)
+                target = batch if batch is not None else polygon_batch
+                if target.add_prism(polygon - (zone['x'], zone['y']), 0.2, (zone['x'], zone['y'], 0.0), material=block_mat):
+                    blocks_created += 1
+                continue
+
+            if batch is not None:
+                if batch.add_box(zone['width'], zone['height'], 0.2, (zone['x'], zone['y'], 0.0), material=block_mat):
+                    blocks_created += 1
+                continue
+
             # Créer un bloc qui remplit exactement la zone
             bpy.ops.mesh.primitive_cube_add(
                 size=2.0,
@@ -4319,31 +2928,37 @@ def create_blocks_in_zones_rf(block_zones, block_mat):
                 
                 # Stocker les informations dans la zone
                 zone['block_object'] = block
+
+        if polygon_batch is not None:
+            block = polygon_batch.build_object()
+            for zone in block_zones:
+                if zone.get('polygon') is not None:
+                    zone['block_object'] = block
         
         return blocks_created
         
     except Exception as e:
-        print(f"Erreur création blocs: {e}")
+        log.error("Erreur création blocs: %s", e)
         return 0
 
-def add_buildings_to_blocks_rf(block_zones, build_mat, scene):
-    """Ajoute des bâtiments dans chaque bloc - VERSION ÉNORME POUR DEBUG"""
+def add_buildings_to_blocks_rf(block_zones, build_mat, scene, batch=None):
+    """Ajoute des bâtiments dans chaque bloc - VERSION ÉNORME POUR DEBUG (dans un MeshBatch si batch est fourni)"""
     buildings_created = 0
     
     try:
-        print(f"🏢 === CRÉATION BÂTIMENTS ÉNORMES DEBUG ===")
-        print(f"🏢 Création bâtiments dans {len(block_zones)} zones...")
+        log.debug("🏢 === CRÉATION BÂTIMENTS ÉNORMES DEBUG ===")
+        log.debug("🏢 Création bâtiments dans %s zones...", len(block_zones))
         
         # Paramètres des bâtiments
         buildings_per_block = safe_int(getattr(scene, 'citygen_buildings_per_block', 2), 2)
         max_floors = safe_int(getattr(scene, 'citygen_max_floors', 8), 8)
         
-        print(f"   Paramètres: {buildings_per_block} bâtiments/bloc, {max_floors} étages max")
-        print(f"   🔍 Zones reçues: {len(block_zones)}")
+        log.debug("   Paramètres: %s bâtiments/bloc, %s étages max", buildings_per_block, max_floors)
+        log.debug("   🔍 Zones reçues: %s", len(block_zones))
         
         # FORCER AU MOINS UN BÂTIMENT GÉANT POUR TEST
         if len(block_zones) == 0:
-            print("   🚨 AUCUNE ZONE - Création bâtiment de test au centre")
+            log.debug("   🚨 AUCUNE ZONE - Création bâtiment de test au centre")
             # Créer un bâtiment géant au centre pour test
             bpy.ops.mesh.primitive_cube_add(size=2.0, location=(0, 0, 25))
             giant_building = bpy.context.object
@@ -4352,10 +2967,10 @@ def add_buildings_to_blocks_rf(block_zones, build_mat, scene):
                 bpy.ops.object.transform_apply(scale=True)
                 giant_building.name = "GIANT_DEBUG_BUILDING"
                 buildings_created = 1
-                print(f"   ✅ Bâtiment géant de test créé: {giant_building.name}")
+                log.debug("   ✅ Bâtiment géant de test créé: %s", giant_building.name)
         
         for zone_idx, zone in enumerate(block_zones):
-            print(f"   🏗️ ZONE {zone_idx}: centre=({zone['x']:.1f}, {zone['y']:.1f}), taille={zone['width']:.1f}x{zone['height']:.1f}")
+            log.debug("   🏗️ ZONE %s: centre=(%.1f, %.1f), taille=%.1fx%.1f", zone_idx, zone['x'], zone['y'], zone['width'], zone['height'])
             
             # FORCER 2 BÂTIMENTS ÉNORMES PAR ZONE
             for b in range(2):  # Toujours 2 bâtiments
@@ -4371,7 +2986,22 @@ def add_buildings_to_blocks_rf(block_zones, build_mat, scene):
                 floors = random.randint(8, 20)  # 8-20 étages !
                 building_height = floors * 4.0  # 4m par étage = 32-80m !
                 
-                print(f"      🏢 Bâtiment {b}: pos=({building_x:.1f}, {building_y:.1f}), taille={building_width:.1f}x{building_depth:.1f}x{building_height:.1f}")
+                log.debug("      🏢 Bâtiment %s: pos=(%.1f, %.1f), taille=%.1fx%.1fx%.1f", b, building_x, building_y, building_width, building_depth, building_height)
+
+                if batch is not None:
+                    if floors < 12:
+                        building_color = (1.0, 0.5, 0.5)
+                    elif floors < 16:
+                        building_color = (0.5, 1.0, 0.5)
+                    else:
+                        building_color = (0.5, 0.5, 1.0)
+                    if hasattr(batch, 'begin_block'):
+                        batch.begin_block(zone_idx)
+                    if append_building_to_batch(batch, 'rectangular', building_x, building_y, building_width,
+                                                building_depth, building_height, ensure_city_shader(),
+                                                look=(building_color, 0.5, -1)):
+                        buildings_created += 1
+                    continue
                 
                 # Créer le bâtiment ÉNORME
                 bpy.ops.mesh.primitive_cube_add(
@@ -4396,29 +3026,26 @@ def add_buildings_to_blocks_rf(block_zones, build_mat, scene):
                     else:
                         building_color = (0.5, 0.5, 1.0)  # BLEU vif (haut)
                     
-                    building_material = create_material(f"MEGA_BuildingMat_{zone_idx}_{b}", building_color)
-                    if building.data:
-                        building.data.materials.clear()
-                        building.data.materials.append(building_material)
+                    set_object_look(building, building_color)
                     
                     buildings_created += 1
                     
-                    print(f"         ✅ MEGA BÂTIMENT créé: {building.name}")
-                    print(f"         📍 Position: ({building_x:.1f}, {building_y:.1f}, {building_height/2:.1f})")
-                    print(f"         📐 Échelle: ({building_width/2:.1f}, {building_depth/2:.1f}, {building_height/2:.1f})")
-                    print(f"         🎨 Couleur: {building_color}")
-        
-        print(f"   🎯 === RÉSUMÉ CRÉATION BÂTIMENTS ===")
-        print(f"   ✅ Total: {buildings_created} MEGA bâtiments créés!")
-        print(f"   🏗️ Zones traitées: {len(block_zones)}")
-        print(f"   🎨 Couleurs: ROUGE (bas), VERT (moyen), BLEU (haut)")
-        print(f"   📏 Tailles: 15x15x32-80m (ÉNORMES !)")
-        print(f"   👀 Les bâtiments DOIVENT être visibles maintenant !")
+                    log.debug("         ✅ MEGA BÂTIMENT créé: %s", building.name)
+                    log.debug("         📍 Position: (%.1f, %.1f, %.1f)", building_x, building_y, building_height/2)
+                    log.debug("         📐 Échelle: (%.1f, %.1f, %.1f)", building_width/2, building_depth/2, building_height/2)
+                    log.debug("         🎨 Couleur: %s", building_color)
+        
+        log.info("   🎯 === RÉSUMÉ CRÉATION BÂTIMENTS ===")
+        log.debug("   ✅ Total: %s MEGA bâtiments créés!", buildings_created)
+        log.debug("   🏗️ Zones traitées: %s", len(block_zones))
+        log.debug("   🎨 Couleurs: ROUGE (bas), VERT (moyen), BLEU (haut)")
+        log.debug("   📏 Tailles: 15x15x32-80m (ÉNORMES !)")
+        log.debug("   👀 Les bâtiments DOIVENT être visibles maintenant !")
         
         return buildings_created
         
     except Exception as e:
-        print(f"❌ Erreur création MEGA bâtiments: {e}")
+        log.error("❌ Erreur création MEGA bâtiments: %s", e)
         import traceback
-        print(f"Traceback: {traceback.format_exc()}")
+        log.error("Traceback: %s", traceback.format_exc())
         return 0
\ No newline at end of file
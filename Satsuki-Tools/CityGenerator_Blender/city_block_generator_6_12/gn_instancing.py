@@ -0,0 +1,348 @@
+"""
+Mode proxy par instanciation Geometry Nodes pour le City Block Generator.
+
+Tous les bâtiments d'une ville sont émis dans un unique nuage de points: chaque
+point porte ses attributs (largeur, profondeur, hauteur, rotation, type de
+bâtiment, type de zone, bloc). Un arbre Geometry Nodes construit par programme
+instancie les gabarits de formes sur ces points. Les points peuvent ensuite être
+"réalisés" en objets Blender classiques pour l'édition manuelle.
+"""
+
+import numpy as np
+
+from .city_log import log
+# Ordre des gabarits dans la collection = index de l'attribut building_type
+from .city_plan import BUILDING_TYPES, ZONE_TYPES
+
+# Attributs portés par chaque point: (nom, type Blender, dtype NumPy)
+POINT_ATTRIBUTES = (
+    ('width', 'FLOAT', np.float32),
+    ('depth', 'FLOAT', np.float32),
+    ('height', 'FLOAT', np.float32),
+    ('rotation', 'FLOAT', np.float32),
+    ('building_type', 'INT', np.int32),
+    ('zone_type', 'INT', np.int32),
+    ('block_id', 'INT', np.int32),
+)
+
+TEMPLATE_COLLECTION = "CityGen_Templates"
+NODE_GROUP_NAME = "CityGen_Instancer"
+POINT_CLOUD_PROP = "citygen_point_cloud"
+
+# Version des gabarits de la collection (les anciennes collections sont reconstruites)
+TEMPLATE_VERSION_PROP = "citygen_template_version"
+TEMPLATE_VERSION = 2
+
+
+class CityPointCloud:
+    """Accumule un point par bâtiment avec ses attributs d'instanciation"""
+
+    def __init__(self, name, material=None):
+        self.name = name
+        self.material = material
+        self.block_id = -1
+        self._look = None
+        self._looks = []
+        self._positions = []
+        self._values = {attr_name: [] for attr_name, _, _ in POINT_ATTRIBUTES}
+
+    @property
+    def item_count(self):
+        return len(self._positions)
+
+    @property
+    def is_empty(self):
+        return not self._positions
+
+    def begin_block(self, block_id):
+        """Les bâtiments suivants appartiennent au bloc block_id"""
+        self.block_id = block_id
+
+    def set_look(self, color=None, roughness=0.5, zone=-1):
+        """Aspect des bâtiments ajoutés ensuite, transmis aux instances (attributs de points)"""
+        self._look = None if color is None else (tuple(color[:3]), float(roughness), int(zone))
+
+    def add_building(self, building_type, x, y, width, depth, height, material=None, zone_type='RESIDENTIAL', rotation=0.0):
+        """Ajoute un point bâtiment (origine centre bas, posé à l'altitude de base de son gabarit)"""
+        from .building_templates import get_template, nominal_template
+
+        if width <= 0 or depth <= 0 or height <= 0:
+            return False
+        type_index = BUILDING_TYPES.index(building_type) if building_type in BUILDING_TYPES else 0
+        zone_index = ZONE_TYPES.index(zone_type) if zone_type in ZONE_TYPES else 0
+
+        base_z = get_template(nominal_template(BUILDING_TYPES[type_index])[0]).base_z
+        self._positions.append((x, y, base_z))
+        self._values['width'].append(width)
+        self._values['depth'].append(depth)
+        self._values['height'].append(height)
+        self._values['rotation'].append(rotation)
+        self._values['building_type'].append(type_index)
+        self._values['zone_type'].append(zone_index)
+        self._values['block_id'].append(self.block_id)
+        self._looks.append(self._look)
+        return True
+
+    def arrays(self):
+        """Retourne (positions (N, 3), dict d'attributs NumPy)"""
+        positions = np.asarray(self._positions, dtype=np.float32).reshape(-1, 3)
+        attributes = {attr_name: np.asarray(self._values[attr_name], dtype=dtype)
+                      for attr_name, _, dtype in POINT_ATTRIBUTES}
+        return positions, attributes
+
+    def build_object(self, collection=None):
+        """Crée l'objet nuage de points avec le modificateur d'instanciation"""
+        import bpy
+
+        if self.is_empty:
+            return None
+        positions, attributes = self.arrays()
+        mesh = bpy.data.meshes.new(self.name)
+        material = self.material
+        looks = None
+        if any(look is not None for look in self._looks):
+            from .city_shader import ensure_city_shader
+            # Les gabarits lisent la couleur des instances (attributs INSTANCER du shader partagé)
+            material = ensure_city_shader()
+            looks = (
+                np.array([(*look[0], 1.0) if look else (0.0, 0.0, 0.0, 0.0) for look in self._looks], dtype=np.float32),
+                np.array([look[1] if look else 0.5 for look in self._looks], dtype=np.float32),
+                np.array([look[2] if look else -1 for look in self._looks], dtype=np.int32),
+            )
+        write_point_cloud(mesh, positions, attributes, looks)
+
+        obj = bpy.data.objects.new(self.name, mesh)
+        obj[POINT_CLOUD_PROP] = True
+        if collection is None:
+            collection = bpy.context.collection
+        collection.objects.link(obj)
+
+        templates = ensure_template_collection(material)
+        modifier = obj.modifiers.new("CityGen Instances", 'NODES')
+        modifier.node_group = ensure_instancing_node_group(templates)
+        log.info("✅ Nuage '%s': %s bâtiments instanciés", self.name, len(positions))
+        return obj
+
+
+def write_point_cloud(mesh, positions, attributes, looks=None):
+    """Remplit un mesh (sommets seuls) avec les positions et attributs de points
+
+    looks = (rgba (N, 4), rugosité (N,), zone (N,)) réécrit les attributs d'aspect
+    (clear_geometry les efface avec le reste de la géométrie).
+    """
+    mesh.clear_geometry()
+    mesh.vertices.add(len(positions))
+    mesh.vertices.foreach_set("co", np.asarray(positions, dtype=np.float32).ravel())
+    for attr_name, attr_type, dtype in POINT_ATTRIBUTES:
+        attribute = mesh.attributes.get(attr_name)
+        if attribute is None:
+            attribute = mesh.attributes.new(attr_name, attr_type, 'POINT')
+        attribute.data.foreach_set("value", np.asarray(attributes[attr_name], dtype=dtype))
+    if looks is not None:
+        from .city_shader import write_look_attributes
+        write_look_attributes(mesh, 'POINT', *looks)
+    mesh.update()
+
+
+def read_point_cloud(mesh):
+    """Lit les positions et attributs d'un nuage de points"""
+    count = len(mesh.vertices)
+    positions = np.zeros(count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", positions)
+    attributes = {}
+    for attr_name, _, dtype in POINT_ATTRIBUTES:
+        values = np.zeros(count, dtype=dtype)
+        attribute = mesh.attributes.get(attr_name)
+        if attribute is not None:
+            attribute.data.foreach_get("value", values)
+        attributes[attr_name] = values
+    return positions.reshape(-1, 3), attributes
+
+
+def read_point_looks(mesh):
+    """Lit les attributs d'aspect des points: (rgba (N, 4), rugosité, zone), ou None sans aspect"""
+    from .city_shader import COLOR_ATTR, ROUGHNESS_ATTR, ZONE_ATTR
+
+    color = mesh.attributes.get(COLOR_ATTR)
+    if color is None:
+        return None
+    count = len(mesh.vertices)
+    rgba = np.zeros(count * 4, dtype=np.float32)
+    color.data.foreach_get("color", rgba)
+    roughness = np.full(count, 0.5, dtype=np.float32)
+    zones = np.full(count, -1, dtype=np.int32)
+    for attr_name, values in ((ROUGHNESS_ATTR, roughness), (ZONE_ATTR, zones)):
+        attribute = mesh.attributes.get(attr_name)
+        if attribute is not None:
+            attribute.data.foreach_get("value", values)
+    return rgba.reshape(-1, 4), roughness, zones
+
+
+def ensure_template_collection(material=None):
+    """Crée (une fois) la collection des gabarits unitaires, un objet par type"""
+    import bpy
+    from .building_templates import get_template, nominal_template
+    from .mesh_batch import MeshBatch
+
+    collection = bpy.data.collections.get(TEMPLATE_COLLECTION)
+    if (collection is not None and len(collection.objects) == len(BUILDING_TYPES)
+            and collection.get(TEMPLATE_VERSION_PROP) == TEMPLATE_VERSION):
+        if material is not None:
+            # Le matériau des gabarits suit celui de la génération courante
+            for obj in collection.objects:
+                if obj.data.materials and obj.data.materials[0] != material:
+                    obj.data.materials[0] = material
+        return collection
+    if collection is None:
+        collection = bpy.data.collections.new(TEMPLATE_COLLECTION)
+
+    for obj in list(collection.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+
+    # Gabarits 1x1x1 (origine centre bas, base à z = 0), forme nominale de chaque type:
+    # toutes les instances d'un type partagent ce gabarit, aucune variante aléatoire n'y est figée
+    for index, building_type in enumerate(BUILDING_TYPES):
+        name, ratio = nominal_template(building_type)
+        batch = MeshBatch(f"CityGen_Template_{index:02d}_{building_type}", material)
+        batch.add_template(name, 1.0, 1.0, 1.0, location=(0.0, 0.0, -get_template(name).base_z),
+                           ratio=ratio, material=material)
+        obj = bpy.data.objects.new(batch.name, batch.to_mesh())
+        collection.objects.link(obj)
+    collection[TEMPLATE_VERSION_PROP] = TEMPLATE_VERSION
+    return collection
+
+
+def _new_group_socket(node_group, name, in_out, socket_type):
+    """Ajoute une entrée/sortie au groupe (API Blender 4.x et 3.x)"""
+    if hasattr(node_group, "interface"):
+        return node_group.interface.new_socket(name=name, in_out=in_out, socket_type=socket_type)
+    sockets = node_group.inputs if in_out == 'INPUT' else node_group.outputs
+    return sockets.new(socket_type, name)
+
+
+def _named_attribute(nodes, attr_name, data_type='FLOAT', location=(0, 0)):
+    node = nodes.new('GeometryNodeInputNamedAttribute')
+    node.data_type = data_type
+    node.inputs['Name'].default_value = attr_name
+    node.location = location
+    return node
+
+
+def ensure_instancing_node_group(template_collection):
+    """Construit l'arbre Geometry Nodes: Instance on Points piloté par les attributs"""
+    import bpy
+
+    node_group = bpy.data.node_groups.get(NODE_GROUP_NAME)
+    if node_group is not None:
+        # La collection de gabarits a pu être recréée: repointer le nœud Collection Info
+        for node in node_group.nodes:
+            if node.bl_idname == 'GeometryNodeCollectionInfo':
+                if node.inputs['Collection'].default_value != template_collection:
+                    node.inputs['Collection'].default_value = template_collection
+        return node_group
+
+    node_group = bpy.data.node_groups.new(NODE_GROUP_NAME, 'GeometryNodeTree')
+    _new_group_socket(node_group, "Geometry", 'INPUT', 'NodeSocketGeometry')
+    _new_group_socket(node_group, "Geometry", 'OUTPUT', 'NodeSocketGeometry')
+
+    nodes = node_group.nodes
+    links = node_group.links
+
+    group_in = nodes.new('NodeGroupInput')
+    group_in.location = (-900, 0)
+    group_out = nodes.new('NodeGroupOutput')
+    group_out.location = (400, 0)
+
+    templates = nodes.new('GeometryNodeCollectionInfo')
+    templates.location = (-500, 200)
+    templates.inputs['Collection'].default_value = template_collection
+    templates.inputs['Separate Children'].default_value = True
+    templates.inputs['Reset Children'].default_value = True
+
+    instancer = nodes.new('GeometryNodeInstanceOnPoints')
+    instancer.location = (100, 0)
+    instancer.inputs['Pick Instance'].default_value = True
+
+    type_attr = _named_attribute(nodes, 'building_type', 'INT', (-500, -50))
+    width_attr = _named_attribute(nodes, 'width', location=(-700, -250))
+    depth_attr = _named_attribute(nodes, 'depth', location=(-700, -400))
+    height_attr = _named_attribute(nodes, 'height', location=(-700, -550))
+    rotation_attr = _named_attribute(nodes, 'rotation', location=(-700, -150))
+
+    scale = nodes.new('ShaderNodeCombineXYZ')
+    scale.location = (-300, -400)
+    rotation = nodes.new('ShaderNodeCombineXYZ')
+    rotation.location = (-300, -150)
+
+    links.new(group_in.outputs[0], instancer.inputs['Points'])
+    links.new(templates.outputs[0], instancer.inputs['Instance'])
+    links.new(type_attr.outputs['Attribute'], instancer.inputs['Instance Index'])
+    links.new(width_attr.outputs['Attribute'], scale.inputs['X'])
+    links.new(depth_attr.outputs['Attribute'], scale.inputs['Y'])
+    links.new(height_attr.outputs['Attribute'], scale.inputs['Z'])
+    links.new(rotation_attr.outputs['Attribute'], rotation.inputs['Z'])
+    links.new(scale.outputs[0], instancer.inputs['Scale'])
+    links.new(rotation.outputs[0], instancer.inputs['Rotation'])
+    links.new(instancer.outputs[0], group_out.inputs[0])
+    return node_group
+
+
+def realize_point_cloud(obj, only_selected=True, collection=None):
+    """Convertit les points (sélectionnés) du nuage en objets bâtiments réels
+
+    Les points réalisés sont retirés du nuage. Retourne la liste des objets créés.
+    """
+    import bpy
+
+    mesh = obj.data
+    count = len(mesh.vertices)
+    if count == 0:
+        return []
+
+    positions, attributes = read_point_cloud(mesh)
+    looks = read_point_looks(mesh)
+    selected = np.ones(count, dtype=bool)
+    if only_selected:
+        flags = np.zeros(count, dtype=bool)
+        mesh.vertices.foreach_get("select", flags)
+        if flags.any():
+            selected = flags
+
+    templates = bpy.data.collections.get(TEMPLATE_COLLECTION)
+    if templates is None:
+        log.error("❌ Collection de gabarits introuvable")
+        return []
+    template_objects = sorted(templates.objects, key=lambda template: template.name)
+    if collection is None:
+        collection = obj.users_collection[0] if obj.users_collection else bpy.context.collection
+
+    if looks is not None:
+        from .city_shader import set_object_look
+
+    world = np.asarray(obj.matrix_world)
+    created = []
+    for index in np.flatnonzero(selected):
+        type_index = int(attributes['building_type'][index])
+        template = template_objects[min(max(type_index, 0), len(template_objects) - 1)]
+        building = bpy.data.objects.new(f"Building_Realized_{obj.name}_{index:05d}", template.data.copy())
+        location = world @ np.append(positions[index], 1.0)
+        building.location = location[:3]
+        building.rotation_euler[2] = float(attributes['rotation'][index])
+        building.scale = (float(attributes['width'][index]),
+                          float(attributes['depth'][index]),
+                          float(attributes['height'][index]))
+        building["citygen_block_id"] = int(attributes['block_id'][index])
+        zone_type = ZONE_TYPES[int(attributes['zone_type'][index]) % len(ZONE_TYPES)]
+        building["citygen_zone"] = zone_type
+        if looks is not None and looks[0][index, 3] > 0:
+            # L'aspect d'instance devient l'aspect d'objet (couleur d'objet lue par le shader partagé)
+            set_object_look(building, looks[0][index, :3], float(looks[1][index]), zone_type)
+        collection.objects.link(building)
+        created.append(building)
+
+    # Retirer les points réalisés du nuage
+    keep = ~selected
+    write_point_cloud(mesh, positions[keep], {name: values[keep] for name, values in attributes.items()},
+                      None if looks is None else tuple(values[keep] for values in looks))
+    log.info("✅ %s bâtiments réalisés depuis '%s' (%s restent instanciés)", len(created), obj.name, int(keep.sum()))
+    return created
@@ -0,0 +1,92 @@
+"""
+Croissance de régions par inondation multi-sources (sans dépendance à bpy).
+
+Le zonage des districts comparait chaque cellule à tous les centres et
+remplissait les quotas dans l'ordre de parcours de la grille: les zones
+poussaient ligne par ligne au lieu de grandir autour de leurs centres, en
+O(cellules x centres). Ici chaque type de zone part de tous ses centres à la
+fois et avance par couches de parcours en largeur (distance de Manhattan, 4
+voisins). Une couche est une opération NumPy sur les index de la frontière;
+chaque cellule n'est prise qu'une fois, le coût total est en O(cellules). Un
+type s'arrête dès que son quota est atteint: la dernière couche est tirée au
+hasard (cellules les plus entourées d'abord) pour ne pas favoriser un côté.
+"""
+
+import random
+
+import numpy as np
+
+# Valeur des cellules non attribuées
+UNCLAIMED = -1
+
+
+def _sides(cells, width, length):
+    """(index aplatis des voisins, masque dans la grille) des 4 côtés de chaque cellule"""
+    i, j = np.divmod(cells, length)
+    return [
+        (cells - length, i > 0), (cells + length, i < width - 1),
+        (cells - 1, j > 0), (cells + 1, j < length - 1),
+    ]
+
+
+def _neighbours(cells, width, length):
+    """Index aplatis (uniques) des 4 voisins des cellules (index aplatis)"""
+    return np.unique(np.concatenate([side[valid] for side, valid in _sides(cells, width, length)]))
+
+
+def _neighbour_count(labels, region, cells, width, length):
+    """Nombre de voisins (4-connexité) de chaque cellule déjà attribués à region"""
+    count = np.zeros(len(cells), dtype=np.int64)
+    for side, valid in _sides(cells, width, length):
+        count[valid] += labels[side[valid]] == region
+    return count
+
+
+def flood_regions(width, length, sources, quotas, rng=random):
+    """Étiquettes (width, length) des régions grandies depuis leurs sources
+
+    sources: une liste de cellules (i, j) par région; quotas: nombre de cellules
+    visé par région. Les régions avancent couche par couche dans l'ordre de la
+    liste (la première gagne les égalités). Une région enfermée avant son quota
+    repart d'une cellule libre tirée au hasard. Les cellules restantes valent UNCLAIMED.
+    """
+    labels = np.full(width * length, UNCLAIMED, dtype=np.int8)
+    counts = [0] * len(quotas)
+    frontiers = []
+    for region, cells in enumerate(sources):
+        cells = np.asarray(cells, dtype=np.int64).reshape(-1, 2)
+        inside = (cells[:, 0] >= 0) & (cells[:, 0] < width) & (cells[:, 1] >= 0) & (cells[:, 1] < length)
+        frontiers.append(np.unique(cells[inside, 0] * length + cells[inside, 1]))
+
+    def claim(region, cells):
+        cells = cells[labels[cells] == UNCLAIMED]
+        remaining = quotas[region] - counts[region]
+        if len(cells) > remaining:
+            # Dernière couche: d'abord les cellules les plus entourées par la région, puis au hasard
+            score = _neighbour_count(labels, region, cells, width, length)
+            jitter = np.array([rng.random() for _ in range(len(cells))])
+            cells = np.sort(cells[np.lexsort((jitter, -score))[:remaining]])
+        labels[cells] = region
+        counts[region] += len(cells)
+        return cells
+
+    # Sources d'abord (couche 0), puis une couche par région et par tour
+    frontiers = [claim(region, frontier) for region, frontier in enumerate(frontiers)]
+    while True:
+        growing = False
+        for region in range(len(quotas)):
+            if counts[region] >= quotas[region]:
+                frontiers[region] = frontiers[region][:0]
+                continue
+            if len(frontiers[region]) == 0:
+                free = np.flatnonzero(labels == UNCLAIMED)
+                if len(free) == 0:
+                    continue
+                # Région enfermée (ou sans source): nouveau départ sur une cellule libre
+                frontiers[region] = claim(region, np.array([free[rng.randrange(len(free))]], dtype=np.int64))
+            else:
+                frontiers[region] = claim(region, _neighbours(frontiers[region], width, length))
+            growing = True
+        if not growing:
+            break
+    return labels.reshape(width, length), counts
@@ -0,0 +1,123 @@
+"""
+Moteur de disposition de la grille de ville (sans dépendance à bpy).
+
+La grille de tailles de blocs est convertie une seule fois en tableaux NumPy;
+largeurs de colonnes, profondeurs de rangées, décalages cumulés (sommes
+préfixes), centres des routes, des carrefours, des blocs et rectangles des lots
+en sont dérivés par opérations vectorisées. Les émetteurs n'ont plus qu'à lire
+ces tableaux: le calcul reste négligeable même pour une grille 200x200.
+"""
+
+import numpy as np
+
+# Taille utilisée quand une colonne ou une rangée n'a que des blocs invalides
+DEFAULT_BLOCK_SIZE = 10.0
+
+
+def block_size_arrays(block_sizes):
+    """Tableaux (largeurs, profondeurs) de forme (W, L) à partir de block_sizes
+
+    Accepte la structure actuelle ({'size': (w, d), ...}) et l'ancienne ((w, d)).
+    """
+    sizes = [[block['size'] if isinstance(block, dict) else block for block in row] for row in block_sizes]
+    array = np.asarray(sizes, dtype=np.float64).reshape(len(sizes), -1, 2)
+    return array[:, :, 0], array[:, :, 1]
+
+
+def subdivision_cells(buildings_per_block, wide):
+    """Cellules (ix, iy, nx, ny) des lots, dans l'ordre de calculate_building_subdivisions
+
+    wide indique un bloc plus large que profond (seuls 2 et 3 lots en dépendent).
+    """
+    if buildings_per_block <= 1:
+        return [(0, 0, 1, 1)]
+    if buildings_per_block in (2, 3):
+        n = buildings_per_block
+        return [(k, 0, n, 1) for k in range(n)] if wide else [(0, k, 1, n) for k in range(n)]
+    if buildings_per_block == 4:
+        return [(0, 0, 2, 2), (1, 0, 2, 2), (0, 1, 2, 2), (1, 1, 2, 2)]
+    rows = 2 if buildings_per_block <= 6 else 3
+    cells = [(i, j, 3, rows) for i in range(3) for j in range(rows)]
+    return cells[:buildings_per_block]
+
+
+class GridLayout:
+    """Disposition d'une grille de blocs séparés par des routes de largeur constante
+
+    Les tableaux par bloc ont la forme (W, L): indice i de colonne (axe X),
+    indice j de rangée (axe Y), comme block_sizes[i][j].
+    """
+
+    def __init__(self, widths, depths, road_width):
+        self.widths = np.asarray(widths, dtype=np.float64)
+        self.depths = np.asarray(depths, dtype=np.float64)
+        self.road_width = float(road_width)
+        self.grid_width, self.grid_length = self.widths.shape
+
+        # Largeur de chaque colonne / profondeur de chaque rangée = maximum des blocs
+        column_widths = self.widths.max(axis=1)
+        row_depths = self.depths.max(axis=0)
+        self.column_widths = np.where(column_widths > 0, column_widths, DEFAULT_BLOCK_SIZE)
+        self.row_depths = np.where(row_depths > 0, row_depths, DEFAULT_BLOCK_SIZE)
+
+        # Sommes préfixes: début de chaque colonne / rangée
+        self.x_starts = np.concatenate(([0.0], np.cumsum(self.column_widths + road_width)[:-1]))
+        self.y_starts = np.concatenate(([0.0], np.cumsum(self.row_depths + road_width)[:-1]))
+        self.total_width = self.column_widths.sum() + road_width * (self.grid_width - 1)
+        self.total_depth = self.row_depths.sum() + road_width * (self.grid_length - 1)
+
+        # Axes des routes: verticales entre colonnes, horizontales entre rangées
+        self.road_x = self.x_starts[:-1] + self.column_widths[:-1] + road_width / 2
+        self.road_y = self.y_starts[:-1] + self.row_depths[:-1] + road_width / 2
+
+        # Centres des blocs (chaque bloc est calé sur le coin de sa cellule)
+        self.block_x = self.x_starts[:, None] + self.widths / 2
+        self.block_y = self.y_starts[None, :] + self.depths / 2
+
+    @classmethod
+    def from_block_sizes(cls, block_sizes, road_width):
+        widths, depths = block_size_arrays(block_sizes)
+        return cls(widths, depths, road_width)
+
+    @property
+    def shape(self):
+        return self.grid_width, self.grid_length
+
+    def horizontal_roads(self):
+        """Routes horizontales (x, y, longueur): toute la largeur de la ville"""
+        count = len(self.road_y)
+        return (np.full(count, self.total_width / 2), self.road_y, np.full(count, self.total_width))
+
+    def vertical_roads(self):
+        """Routes verticales (x, y, longueur): toute la profondeur de la ville"""
+        count = len(self.road_x)
+        return (self.road_x, np.full(count, self.total_depth / 2), np.full(count, self.total_depth))
+
+    def intersections(self):
+        """Centres des carrefours, tableaux de forme (W-1, L-1)"""
+        return np.meshgrid(self.road_x, self.road_y, indexing='ij')
+
+    def valid_blocks(self):
+        """Masque (W, L) des blocs de taille strictement positive"""
+        return (self.widths > 0) & (self.depths > 0)
+
+    def lot_rects(self, buildings_per_block, sidewalk_width=0.0):
+        """Rectangles des lots (x, y, largeur, profondeur), tableaux de forme (W, L, n)
+
+        Mêmes règles que calculate_building_subdivisions appliqué à la surface
+        constructible de chaque bloc (bloc moins le trottoir, minimum 1 m).
+        """
+        usable_width = np.maximum(1.0, self.widths - 2 * sidewalk_width)
+        usable_depth = np.maximum(1.0, self.depths - 2 * sidewalk_width)
+
+        # Cellules selon l'orientation du bloc (les deux listes ont la même longueur)
+        wide = np.array(subdivision_cells(buildings_per_block, True), dtype=np.float64)
+        tall = np.array(subdivision_cells(buildings_per_block, False), dtype=np.float64)
+        cells = np.where((usable_width >= usable_depth)[:, :, None, None], wide, tall)
+        ix, iy, nx, ny = (cells[..., k] for k in range(4))
+
+        lot_width = usable_width[:, :, None] / nx
+        lot_depth = usable_depth[:, :, None] / ny
+        x = self.block_x[:, :, None] - usable_width[:, :, None] / 2 + ix * lot_width + lot_width / 2
+        y = self.block_y[:, :, None] - usable_depth[:, :, None] / 2 + iy * lot_depth + lot_depth / 2
+        return x, y, lot_width, lot_depth
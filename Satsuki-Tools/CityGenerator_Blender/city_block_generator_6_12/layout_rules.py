@@ -0,0 +1,519 @@
+"""
+Règles de mise en page du City Block Generator (sans dépendance à bpy).
+
+Tailles de blocs, zonage des districts, subdivisions en lots, choix du type et
+de la hauteur des bâtiments. Ces règles sont partagées par generator.py et par
+le modèle CityPlan, et peuvent être exécutées hors de Blender. Chaque fonction
+tirant des nombres aléatoires accepte un paramètre rng (module random par
+défaut, ou une instance random.Random). generate_block_sizes accepte aussi une
+graine: chaque bloc tire alors dans son propre flux indexé par (i, j).
+"""
+
+import copy
+import math
+import random
+import traceback
+
+import numpy as np
+
+from .city_log import log
+from .city_rng import keyed_rng, rng_for
+from .grid_flood import UNCLAIMED, flood_regions
+from .poisson_disk import spaced_cells
+
+# Caractéristiques de base des types de zones
+ZONE_PROFILES = {
+    'COMMERCIAL': {
+        'size_multiplier': 1.5,     # 50% plus grand
+        'min_floors': 4,            # Bâtiments moyens à hauts
+        'max_floors_multiplier': 1.5,
+        'shape_preference': ['RECT', 'L', 'U']
+    },
+    'RESIDENTIAL': {
+        'size_multiplier': 1.0,     # Taille normale
+        'min_floors': 1,            # Bâtiments bas à moyens
+        'max_floors_multiplier': 1.0,
+        'shape_preference': ['RECT', 'L', 'T']
+    },
+    'INDUSTRIAL': {
+        'size_multiplier': 2.0,     # Double de taille
+        'min_floors': 1,            # Bâtiments bas
+        'max_floors_multiplier': 0.3,  # Peu d'étages
+        'shape_preference': ['RECT', 'L']
+    }
+}
+
+# Plages de variation des tailles de blocs selon le mode choisi
+VARIATION_RANGES = {
+    'UNIFORM': (1.0, 1.0),      # Pas de variation
+    'LOW': (0.8, 1.2),          # ±20%
+    'MEDIUM': (0.6, 1.4),       # ±40%
+    'HIGH': (0.4, 1.6),         # ±60%
+    'EXTREME': (0.25, 2.0),     # -75% à +100%
+    'DISTRICTS': (0.7, 1.3),    # ±30% mais par zones
+}
+
+# Codes des types de zones et de bâtiments (colonnes 'zone' et 'type' du plan)
+ZONE_TYPES = ('RESIDENTIAL', 'COMMERCIAL', 'INDUSTRIAL')
+BUILDING_TYPES = (
+    'rectangular', 'tower', 'stepped', 'l_shaped', 'u_shaped',
+    't_shaped', 'circular', 'elliptical', 'pyramid', 'complex',
+)
+
+# Correspondance mode de forme -> type de bâtiment (AUTO = choix pondéré)
+SHAPE_MODE_TYPES = {
+    'RECT': 'rectangular',
+    'L': 'l_shaped',
+    'U': 'u_shaped',
+    'T': 't_shaped',
+    'CIRC': 'circular',
+    'ELLIPSE': 'elliptical',
+}
+
+# Types de bâtiments: (poids, taille minimale, hauteur minimale)
+BUILDING_TYPE_RULES = {
+    'rectangular': (35, 2.0, 0),
+    'tower': (15, 3.0, 15),
+    'stepped': (12, 4.0, 12),
+    'l_shaped': (15, 5.0, 0),    # Augmenté de 8 à 15
+    'u_shaped': (10, 6.0, 0),    # Augmenté de 6 à 10 (utilisé comme F-shaped)
+    't_shaped': (12, 5.0, 0),    # Augmenté de 5 à 12
+    'circular': (4, 4.0, 0),
+    'elliptical': (3, 4.0, 0),
+    'complex': (2, 6.0, 18),
+    'pyramid': (2, 4.0, 12),
+    # cone supprimé comme demandé
+}
+
+# Répartition des types (sur 100 tirages) selon le niveau de variété, avec plus de L, T et U shapes
+VARIETY_TYPE_WEIGHTS = {
+    # Principalement rectangulaires mais avec quelques L et T
+    'LOW': (('rectangular', 50), ('tower', 20), ('l_shaped', 20), ('t_shaped', 10)),
+    # Équilibre avec forte présence de L, T, U
+    'MEDIUM': (('rectangular', 20), ('tower', 15), ('stepped', 10), ('l_shaped', 20), ('u_shaped', 15),
+               ('t_shaped', 15), ('circular', 3), ('elliptical', 2)),
+    # Maximum de variété avec dominance L, T, U
+    'HIGH': (('rectangular', 10), ('tower', 10), ('stepped', 10), ('l_shaped', 25), ('u_shaped', 20),
+             ('t_shaped', 20), ('circular', 3), ('elliptical', 2)),
+    # Tours et formes modernes avec L et T
+    'MODERN': (('tower', 30), ('stepped', 20), ('complex', 15), ('l_shaped', 15), ('t_shaped', 15),
+               ('rectangular', 5)),
+    # Formes créatives avec L, T, U dominants
+    'CREATIVE': (('l_shaped', 25), ('t_shaped', 25), ('u_shaped', 20), ('circular', 10), ('elliptical', 8),
+                 ('pyramid', 7), ('complex', 3), ('tower', 2)),
+}
+# Fallback avec forte présence de L et T
+DEFAULT_TYPE_WEIGHTS = (('rectangular', 25), ('l_shaped', 25), ('t_shaped', 20), ('tower', 15), ('u_shaped', 15))
+
+# Listes de tirage à plat (construites une fois, même ordre que les poids)
+_TYPE_CHOICES = {
+    level: tuple(name for name, count in weights for _ in range(count))
+    for level, weights in list(VARIETY_TYPE_WEIGHTS.items()) + [(None, DEFAULT_TYPE_WEIGHTS)]
+}
+
+# Hauteurs selon le type de zone: (multiplicateur min, multiplicateur max, bonus)
+ZONE_HEIGHT_FACTORS = {
+    'COMMERCIAL': (0.8, 1.5, 6),
+    'RESIDENTIAL': (0.6, 1.2, 3),
+    'INDUSTRIAL': (0.3, 0.8, 0),
+}
+
+# Hauteurs selon le type de bâtiment: (multiplicateur min, multiplicateur max)
+BUILDING_HEIGHT_FACTORS = {
+    'tower': (1.5, 2.5),
+    'stepped': (1.2, 1.8),
+    'complex': (1.3, 2.0),
+    'pyramid': (1.0, 1.6),
+    # cone supprimé définitivement de la base de code
+}
+
+def calculate_building_subdivisions(block_width, block_depth, buildings_per_block):
+    """Calcule les subdivisions d'un bloc pour placer plusieurs bâtiments"""
+    import math
+    
+    if buildings_per_block <= 1:
+        return [(0, 0, block_width, block_depth)]
+    
+    # Calculer une grille optimale pour le nombre de bâtiments
+    if buildings_per_block == 2:
+        # 2 bâtiments : côte à côte ou l'un au-dessus de l'autre selon les proportions
+        if block_width >= block_depth:
+            # Diviser horizontalement
+            sub_width = block_width / 2
+            return [
+                (0, 0, sub_width, block_depth),
+                (sub_width, 0, sub_width, block_depth)
+            ]
+        else:
+            # Diviser verticalement
+            sub_depth = block_depth / 2
+            return [
+                (0, 0, block_width, sub_depth),
+                (0, sub_depth, block_width, sub_depth)
+            ]
+    
+    elif buildings_per_block == 3:
+        # 3 bâtiments : disposition 3x1 ou 1x3
+        if block_width >= block_depth:
+            sub_width = block_width / 3
+            return [
+                (0, 0, sub_width, block_depth),
+                (sub_width, 0, sub_width, block_depth),
+                (sub_width * 2, 0, sub_width, block_depth)
+            ]
+        else:
+            sub_depth = block_depth / 3
+            return [
+                (0, 0, block_width, sub_depth),
+                (0, sub_depth, block_width, sub_depth),
+                (0, sub_depth * 2, block_width, sub_depth)
+            ]
+    
+    elif buildings_per_block == 4:
+        # 4 bâtiments : grille 2x2
+        sub_width = block_width / 2
+        sub_depth = block_depth / 2
+        return [
+            (0, 0, sub_width, sub_depth),
+            (sub_width, 0, sub_width, sub_depth),
+            (0, sub_depth, sub_width, sub_depth),
+            (sub_width, sub_depth, sub_width, sub_depth)
+        ]
+    
+    else:
+        # Pour 5-9 bâtiments : grille 3x3 ou 3x2
+        if buildings_per_block <= 6:
+            # Grille 3x2
+            sub_width = block_width / 3
+            sub_depth = block_depth / 2
+            subdivisions = []
+            for i in range(3):
+                for j in range(2):
+                    if len(subdivisions) < buildings_per_block:
+                        subdivisions.append((i * sub_width, j * sub_depth, sub_width, sub_depth))
+            return subdivisions
+        else:
+            # Grille 3x3
+            sub_width = block_width / 3
+            sub_depth = block_depth / 3
+            subdivisions = []
+            for i in range(3):
+                for j in range(3):
+                    if len(subdivisions) < buildings_per_block:
+                        subdivisions.append((i * sub_width, j * sub_depth, sub_width, sub_depth))
+            return subdivisions
+
+def choose_building_type(variety_level, zone_type, width, depth, height, building_index=0, rng=random):
+    """Choisit intelligemment le type de bâtiment selon la variété demandée
+
+    Version par lot; building_sampler.sample_building_types tire tous les lots d'un coup.
+    """
+    # Choisir un type aléatoire
+    weights = _TYPE_CHOICES.get(variety_level, _TYPE_CHOICES[None])
+    chosen_type = rng.choice(weights)
+    
+    # Vérifier si le type choisi est approprié pour les dimensions
+    _, min_size, min_height = BUILDING_TYPE_RULES.get(chosen_type, BUILDING_TYPE_RULES['rectangular'])
+    
+    # Si les dimensions ne conviennent pas, choisir un type plus simple
+    if min(width, depth) < min_size or height < min_height:
+        if min(width, depth) >= 3.0:
+            chosen_type = rng.choice(['rectangular', 'tower', 'stepped'])
+        else:
+            chosen_type = 'rectangular'
+    
+    # Ajustement selon le type de zone
+    if zone_type == 'COMMERCIAL' and chosen_type in ['rectangular', 'stepped']:
+        if rng.random() < 0.3:  # 30% de chance
+            chosen_type = 'tower'
+    elif zone_type == 'INDUSTRIAL' and chosen_type in ['tower', 'complex']:
+        if rng.random() < 0.5:  # 50% de chance
+            chosen_type = rng.choice(['rectangular', 'l_shaped'])
+    
+    log.debug("   🎯 Type choisi: %s (variété: %s, zone: %s)", chosen_type, variety_level, zone_type)
+    return chosen_type
+
+def calculate_height_with_variation(base_height, max_floors, height_variation, zone_type, building_type, rng=random):
+    """Calcule la hauteur d'un bâtiment avec variation intelligente
+
+    Version par lot; building_sampler.sample_heights calcule tous les lots d'un coup.
+    """
+    # Appliquer les facteurs de zone
+    min_mult, max_mult, bonus = ZONE_HEIGHT_FACTORS.get(zone_type, ZONE_HEIGHT_FACTORS['RESIDENTIAL'])
+    min_height = max(3, int(base_height * min_mult))
+    max_height = min(max_floors * 3, int(base_height * max_mult) + bonus)
+    
+    # Appliquer les facteurs de bâtiment
+    if building_type in BUILDING_HEIGHT_FACTORS:
+        min_mult, max_mult = BUILDING_HEIGHT_FACTORS[building_type]
+        min_height = max(min_height, int(base_height * min_mult))
+        max_height = max(max_height, int(base_height * max_mult))
+    
+    # Appliquer la variation
+    if height_variation > 0:
+        variation_range = int((max_height - min_height) * height_variation)
+        if variation_range > 0:
+            height_offset = rng.randint(-variation_range//2, variation_range//2)
+            final_height = base_height + height_offset
+        else:
+            final_height = base_height
+    else:
+        final_height = base_height
+    
+    # S'assurer que la hauteur reste dans les limites
+    final_height = max(min_height, min(max_height, final_height))
+    
+    log.debug("   📏 Hauteur calculée: base=%s, final=%s (zone=%s, type=%s)", base_height, final_height, zone_type, building_type)
+    return final_height
+
+def generate_uniform_district(grid_width, grid_length, district_type):
+    """Génère un district uniforme du type spécifié"""
+    # Mapper les types de district aux types de zone
+    district_mapping = {
+        'RESIDENTIAL': 'RESIDENTIAL',
+        'COMMERCIAL': 'COMMERCIAL', 
+        'INDUSTRIAL': 'INDUSTRIAL',
+        'DOWNTOWN': 'COMMERCIAL',     # Centre-ville = commercial dense
+        'SUBURBAN': 'RESIDENTIAL',    # Banlieue = résidentiel
+        'BUSINESS': 'COMMERCIAL'      # Affaires = commercial
+    }
+    
+    zone_type = district_mapping.get(district_type, 'RESIDENTIAL')
+    
+    # Créer une grille uniforme du type spécifié
+    zone_assignments = []
+    for i in range(grid_width):
+        row = []
+        for j in range(grid_length):
+            row.append(zone_type)
+        zone_assignments.append(row)
+    
+    return zone_assignments
+
+def generate_block_sizes(grid_width, grid_length, base_size=10, variety='MEDIUM', district_mode=False, 
+                        commercial_ratio=0.2, residential_ratio=0.6, industrial_ratio=0.2, district_type='MIXED', rng=random, seed=None):
+    """Génère une grille de tailles de blocs variées avec différents modes de variation
+
+    Avec seed, la taille de chaque bloc est une fonction pure de (seed, i, j).
+    """
+    try:
+        if grid_width <= 0 or grid_length <= 0:
+            log.debug("Dimensions de grille invalides: %sx%s", grid_width, grid_length)
+            return None
+            
+        if base_size <= 0:
+            log.debug("Taille de base invalide: %s", base_size)
+            return None
+        
+        log.debug("Génération blocs - Mode: %s, Districts: %s, Base: %s", variety, district_mode, base_size)
+        
+        min_var, max_var = VARIATION_RANGES.get(variety, (0.6, 1.4))
+        
+        # Copie des profils de zones (modifiés par les districts spécialisés)
+        zone_types = copy.deepcopy(ZONE_PROFILES)
+        
+        # Ajuster les caractéristiques selon le type de district spécialisé
+        if district_mode and district_type != 'MIXED':
+            zone_adjustments = {
+                'DOWNTOWN': {
+                    'size_multiplier': 0.8,     # Blocs plus compacts
+                    'min_floors': 8,            # Gratte-ciels
+                    'max_floors_multiplier': 3.0,  # Très hauts
+                    'shape_preference': ['RECT']
+                },
+                'SUBURBAN': {
+                    'size_multiplier': 1.3,     # Blocs plus grands
+                    'min_floors': 1,            # Maisons basses
+                    'max_floors_multiplier': 0.5,  # 1-2 étages max
+                    'shape_preference': ['RECT', 'L']
+                },
+                'BUSINESS': {
+                    'size_multiplier': 1.2,     # Taille moyenne-grande
+                    'min_floors': 6,            # Tours de bureaux
+                    'max_floors_multiplier': 2.5,  # Hauts
+                    'shape_preference': ['RECT', 'T']
+                }
+            }
+            
+            if district_type in zone_adjustments:
+                # Appliquer les ajustements à tous les types de zones
+                adjustments = zone_adjustments[district_type]
+                for zone_type in zone_types:
+                    zone_types[zone_type].update(adjustments)
+        
+        block_sizes = []
+        zone_assignments = []
+        
+        # Générer les assignations de zones si mode districts activé
+        if district_mode:
+            if district_type == 'MIXED':
+                # Mode mixte : utiliser les ratios comme avant
+                zone_assignments = generate_district_zones(grid_width, grid_length, 
+                                                         commercial_ratio, residential_ratio, industrial_ratio,
+                                                         rng_for(seed, rng, 'zones'))
+            else:
+                # Mode spécialisé : tout le district est du même type
+                zone_assignments = generate_uniform_district(grid_width, grid_length, district_type)
+        
+        for i in range(grid_width):
+            row = []
+            zone_row = []
+            for j in range(grid_length):
+                try:
+                    block_rng = rng_for(seed, rng, 'block_size', i, j)
+
+                    # Déterminer le type de zone
+                    if district_mode and i < len(zone_assignments) and j < len(zone_assignments[i]):
+                        zone_type = zone_assignments[i][j]
+                    else:
+                        zone_type = 'RESIDENTIAL'  # Type par défaut
+                    
+                    zone_row.append(zone_type)
+                    zone_info = zone_types[zone_type]
+                    
+                    # Calcul de la taille avec variation
+                    if variety == 'DISTRICTS':
+                        # Mode districts : variation par zones cohérentes
+                        size_variation = generate_district_variation(i, j, grid_width, grid_length, min_var, max_var, seed or 0)
+                    else:
+                        # Mode normal : variation aléatoire
+                        size_variation = block_rng.uniform(min_var, max_var)
+                    
+                    # Appliquer le multiplicateur de zone
+                    total_multiplier = size_variation * zone_info['size_multiplier']
+                    
+                    # Générer largeur et profondeur avec variations indépendantes
+                    width_variation = block_rng.uniform(0.8, 1.2)  # Variation fine supplémentaire
+                    depth_variation = block_rng.uniform(0.8, 1.2)
+                    
+                    width = base_size * total_multiplier * width_variation
+                    depth = base_size * total_multiplier * depth_variation
+                    
+                    # Validation et ajustement des tailles
+                    width = max(2.0, min(width, base_size * 3))  # Limites raisonnables
+                    depth = max(2.0, min(depth, base_size * 3))
+                    
+                    # Stocker les informations étendues du bloc
+                    block_info = {
+                        'size': (width, depth),
+                        'zone_type': zone_type,
+                        'zone_info': zone_info,
+                        'base_variation': size_variation
+                    }
+                    
+                    row.append(block_info)
+                    
+                except Exception as e:
+                    log.error("Erreur génération bloc à [%s][%s]: %s, utilisation valeurs par défaut", i, j, e)
+                    row.append({
+                        'size': (base_size, base_size),
+                        'zone_type': 'RESIDENTIAL',
+                        'zone_info': zone_types['RESIDENTIAL'],
+                        'base_variation': 1.0
+                    })
+            
+            block_sizes.append(row)
+        
+        # Afficher un résumé de la génération
+        total_blocks = grid_width * grid_length
+        if district_mode:
+            commercial_count = sum(1 for row in zone_assignments for zone in row if zone == 'COMMERCIAL')
+            residential_count = sum(1 for row in zone_assignments for zone in row if zone == 'RESIDENTIAL')
+            industrial_count = sum(1 for row in zone_assignments for zone in row if zone == 'INDUSTRIAL')
+            
+            log.debug("Districts générés - Commercial: %s/%s, Résidentiel: %s/%s, Industriel: %s/%s", commercial_count, total_blocks, residential_count, total_blocks, industrial_count, total_blocks)
+        
+        log.debug("Grille de blocs %sx%s générée avec variété '%s'", grid_width, grid_length, variety)
+        return block_sizes
+        
+    except Exception as e:
+        log.error("Erreur critique lors de la génération des tailles de blocs: %s", str(e))
+        return None
+
+def generate_district_zones(grid_width, grid_length, commercial_ratio, residential_ratio, industrial_ratio, rng=random):
+    """Génère des zones de districts cohérentes autour de centres, aux quotas exacts (grid_flood)"""
+    try:
+        log.debug("Génération districts - Ratios: C=%.2f, R=%.2f, I=%.2f", commercial_ratio, residential_ratio, industrial_ratio)
+        
+        # Normaliser les ratios pour qu'ils totalisent 1.0
+        total_ratio = commercial_ratio + residential_ratio + industrial_ratio
+        if total_ratio > 0:
+            commercial_ratio /= total_ratio
+            residential_ratio /= total_ratio
+            industrial_ratio /= total_ratio
+        else:
+            # Valeurs par défaut si ratios invalides
+            commercial_ratio, residential_ratio, industrial_ratio = 0.2, 0.6, 0.2
+        
+        log.debug("Ratios normalisés: C=%.2f, R=%.2f, I=%.2f", commercial_ratio, residential_ratio, industrial_ratio)
+        
+        total_blocks = grid_width * grid_length
+        
+        # Calculer le nombre de blocs pour chaque type
+        commercial_blocks = int(total_blocks * commercial_ratio)
+        industrial_blocks = int(total_blocks * industrial_ratio)
+        residential_blocks = total_blocks - commercial_blocks - industrial_blocks
+        
+        log.debug("Blocs prévus - Commercial: %s, Industriel: %s, Résidentiel: %s", commercial_blocks, industrial_blocks, residential_blocks)
+        
+        # Améliorer la génération des centres de zones
+        # Plus de centres pour une meilleure distribution
+        num_commercial_centers = max(1, commercial_blocks // 8) if commercial_blocks > 0 else 0
+        num_industrial_centers = max(1, industrial_blocks // 12) if industrial_blocks > 0 else 0
+        
+        commercial_centers = generate_zone_centers(grid_width, grid_length, num_commercial_centers, rng)
+        industrial_centers = generate_zone_centers(grid_width, grid_length, num_industrial_centers, rng)
+        
+        log.debug("Centres générés - Commercial: %s, Industriel: %s", len(commercial_centers), len(industrial_centers))
+        
+        # Inondation multi-sources: chaque type grandit autour de ses centres jusqu'à son quota
+        # (industriel en premier: il garde la priorité sur les cellules à égale distance)
+        labels, _ = flood_regions(grid_width, grid_length, [industrial_centers, commercial_centers],
+                                  [industrial_blocks, commercial_blocks], rng)
+        names = np.array(['INDUSTRIAL', 'COMMERCIAL', 'RESIDENTIAL'])
+        zones = names[np.where(labels == UNCLAIMED, 2, labels)].tolist()
+        zone_counts = {name: int(np.count_nonzero(labels == code)) for code, name in enumerate(names[:2])}
+        zone_counts['RESIDENTIAL'] = total_blocks - zone_counts['INDUSTRIAL'] - zone_counts['COMMERCIAL']
+        
+        # Afficher le résultat de la distribution
+        log.debug("Distribution finale - Commercial: %s, Industriel: %s, Résidentiel: %s", zone_counts['COMMERCIAL'], zone_counts['INDUSTRIAL'], zone_counts['RESIDENTIAL'])
+        
+        return zones
+        
+    except Exception as e:
+        log.error("Erreur génération zones de districts: %s", e)
+        log.error("Traceback: %s", traceback.format_exc())
+        # Retourner une assignation par défaut
+        return [['RESIDENTIAL' for _ in range(grid_length)] for _ in range(grid_width)]
+
+def generate_zone_centers(grid_width, grid_length, num_centers, rng=random):
+    """Génère des centres de zones espacés (échantillonnage de Poisson, poisson_disk)"""
+    centers = []
+    if num_centers <= 0:
+        return centers
+    
+    # S'assurer que les centres sont bien distribués
+    if num_centers == 1:
+        # Un seul centre au milieu
+        x = grid_width // 2
+        y = grid_length // 2
+        centers.append((x, y))
+    else:
+        # Espacement minimal (distance euclidienne, donc aussi en Manhattan), élargi selon la
+        # densité pour que l'échantillon couvre toute la grille avec un peu plus de centres que demandé
+        min_distance = max(2, min(grid_width, grid_length) // num_centers,
+                           math.sqrt(0.5 * grid_width * grid_length / num_centers))
+        cells = spaced_cells(grid_width, grid_length, num_centers, min_distance, rng, label="Centres de zones")
+        centers = [(i, j) for i, j in cells.tolist()]
+    
+    log.debug("Centres générés: %s", centers)
+    return centers
+
+def generate_district_variation(i, j, grid_width, grid_length, min_var, max_var, seed=0):
+    """Génère une variation basée sur la position pour créer des zones cohérentes"""
+    # Utiliser la position pour créer des zones de tailles similaires
+    zone_x = i // 3  # Diviser en zones de 3x3
+    zone_y = j // 3
+    
+    # Flux indexé par la zone: cohérent sans toucher au générateur global
+    return keyed_rng(seed, 'district_size', zone_x, zone_y).uniform(min_var, max_var)
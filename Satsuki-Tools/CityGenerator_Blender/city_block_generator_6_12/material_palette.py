@@ -0,0 +1,104 @@
+"""
+Palette de matériaux partagés de la ville.
+
+Chaque aspect distinct (rôle + couleur quantifiée) est construit une seule fois
+puis réutilisé pendant toute la génération: le nombre de matériaux, et donc le
+temps de compilation des shaders, ne dépend plus de la taille de la ville. Les
+petites variations de teinte propres à un objet passent par la couleur d'objet
+(Object.color, visible en mode Solid > Object) au lieu d'un matériau dédié.
+"""
+
+import bpy
+
+from .city_log import log
+
+PALETTE_PREFIX = "CityPal"
+
+# Résolution de la quantification: 1/20 = 0.05 par canal
+COLOR_STEPS = 20
+
+
+def quantize_color(color, steps=COLOR_STEPS):
+    """Couleur RGB arrondie à la grille de la palette (canaux bornés à [0, 1])"""
+    return tuple(round(min(1.0, max(0.0, float(channel))) * steps) / steps for channel in color[:3])
+
+
+class MaterialPalette:
+    """Cache {(rôle, couleur quantifiée): matériau} pour la durée d'une génération"""
+
+    def __init__(self, prefix=PALETTE_PREFIX, steps=COLOR_STEPS):
+        self.prefix = prefix
+        self.steps = steps
+        self._materials = {}
+
+    def __len__(self):
+        return len(self._materials)
+
+    def reset(self):
+        """Oublie les matériaux en cache (nouvelle génération ou fichier rechargé)"""
+        self._materials.clear()
+
+    def material_name(self, role, color):
+        code = ''.join(f"{round(channel * self.steps):02d}" for channel in color)
+        return f"{self.prefix}_{role}_{code}"
+
+    def material(self, role, color, roughness=0.5):
+        """Matériau partagé du rôle pour cette couleur (créé au premier appel)"""
+        key = (role, quantize_color(color, self.steps))
+        mat = self._materials.get(key)
+        if mat is not None:
+            try:
+                mat.name  # Le matériau a pu être supprimé depuis (nettoyage de la ville)
+                return mat
+            except ReferenceError:
+                pass
+
+        name = self.material_name(*key)
+        mat = bpy.data.materials.get(name)
+        if mat is None:
+            mat = self._build(name, key[1], roughness)
+        self._materials[key] = mat
+        return mat
+
+    def _build(self, name, color, roughness):
+        mat = bpy.data.materials.new(name)
+        mat.use_nodes = True
+        if mat.node_tree:
+            principled = mat.node_tree.nodes.get("Principled BSDF")
+            if principled:
+                principled.inputs['Base Color'].default_value = (*color, 1.0)
+                principled.inputs['Roughness'].default_value = roughness
+        mat.diffuse_color = (*color, 1.0)
+        log.debug("🎨 Matériau de palette '%s' créé", name)
+        return mat
+
+    def assign(self, obj, role, color, base_color=None):
+        """Applique le matériau du rôle à obj; la couleur exacte va dans obj.color
+
+        base_color fixe l'aspect partagé quand color n'est qu'une variation propre à l'objet.
+        """
+        mat = self.material(role, color if base_color is None else base_color)
+        if obj.data is not None and hasattr(obj.data, 'materials'):
+            obj.data.materials.clear()
+            obj.data.materials.append(mat)
+        obj.color = (*color[:3], 1.0)
+        return mat
+
+
+# Palette partagée par tous les générateurs de l'addon
+palette = MaterialPalette()
+
+
+def palette_material(role, color, base_color=None):
+    """Matériau partagé pour un élément de lot (MeshBatch): pas de couleur d'objet"""
+    return palette.material(role, color if base_color is None else base_color)
+
+
+def assign_palette_material(obj, role, color, base_color=None):
+    """Applique un matériau de palette à un objet; retourne False en cas d'échec"""
+    try:
+        palette.assign(obj, role, color, base_color)
+        return True
+    except Exception as e:
+        log.error("Erreur lors de l'application du matériau de palette '%s': %s", role, e)
+        return False
@@ -0,0 +1,480 @@
+"""
+Accumulateur de géométrie par lots pour le City Block Generator.
+
+Au lieu d'appeler bpy.ops.mesh.primitive_cube_add + transform_apply pour chaque
+bâtiment, route, trottoir ou carrefour, on collecte les sommets et les faces de
+toute une catégorie dans des tableaux NumPy, puis on crée le mesh en un seul
+passage foreach_set.
+"""
+
+import math
+
+import numpy as np
+
+from .city_log import log
+
+# Cube unitaire avec origine au centre bas: x, y dans [-0.5, 0.5], z dans [0, 1]
+UNIT_BOX_VERTS = np.array([
+    (-0.5, -0.5, 0.0), (0.5, -0.5, 0.0), (0.5, 0.5, 0.0), (-0.5, 0.5, 0.0),
+    (-0.5, -0.5, 1.0), (0.5, -0.5, 1.0), (0.5, 0.5, 1.0), (-0.5, 0.5, 1.0),
+], dtype=np.float64)
+
+# Faces du cube unitaire (quads, normales sortantes)
+UNIT_BOX_FACES = np.array([
+    (0, 3, 2, 1),  # bas
+    (4, 5, 6, 7),  # haut
+    (0, 1, 5, 4),  # avant (-Y)
+    (1, 2, 6, 5),  # droite (+X)
+    (2, 3, 7, 6),  # arrière (+Y)
+    (3, 0, 4, 7),  # gauche (-X)
+], dtype=np.int64)
+
+
+def rotate_xy(points, angle, origin=(0.0, 0.0)):
+    """Fait tourner des points (N, 2+) autour de l'axe Z passant par origin"""
+    if abs(angle) < 1e-9:
+        return points
+    cos_a = math.cos(angle)
+    sin_a = math.sin(angle)
+    rotated = points.copy()
+    dx = points[..., 0] - origin[0]
+    dy = points[..., 1] - origin[1]
+    rotated[..., 0] = origin[0] + dx * cos_a - dy * sin_a
+    rotated[..., 1] = origin[1] + dx * sin_a + dy * cos_a
+    return rotated
+
+
+def regular_polygon(sides, radius_x, radius_y=None, start_angle=0.0):
+    """Retourne les sommets (sides, 2) d'un polygone régulier centré sur l'origine"""
+    if radius_y is None:
+        radius_y = radius_x
+    angles = start_angle + np.arange(sides) * (2.0 * math.pi / sides)
+    return np.stack((np.cos(angles) * radius_x, np.sin(angles) * radius_y), axis=1)
+
+
+def set_origins_to_center_bottom(objects):
+    """Place l'origine de chaque objet mesh au centre bas de sa géométrie (en bloc)
+
+    Sans passage en mode édition: les sommets de chaque mesh distinct sont lus et
+    décalés en un foreach_get/foreach_set NumPy; chaque objet qui l'utilise est
+    déplacé du décalage transformé par sa rotation et son échelle, de sorte que
+    rien ne bouge à l'écran. Retourne le nombre d'objets traités.
+    """
+    from mathutils import Vector
+
+    users = {}
+    for obj in objects:
+        if obj is not None and obj.type == 'MESH' and obj.data is not None and len(obj.data.vertices):
+            users.setdefault(obj.data.as_pointer(), (obj.data, []))[1].append(obj)
+
+    count = 0
+    for mesh, mesh_users in users.values():
+        coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", coords)
+        coords = coords.reshape(-1, 3)
+        low, high = coords.min(axis=0), coords.max(axis=0)
+        offset = np.array(((low[0] + high[0]) / 2, (low[1] + high[1]) / 2, low[2]), dtype=np.float32)
+        if not offset.any():
+            count += len(mesh_users)
+            continue
+        coords -= offset
+        mesh.vertices.foreach_set("co", coords.ravel())
+        mesh.update()
+        shift = Vector(offset.tolist())
+        for obj in mesh_users:
+            obj.location += obj.matrix_basis.to_3x3() @ shift
+            count += 1
+    return count
+
+
+class MeshBatch:
+    """Collecte la géométrie d'une catégorie et la matérialise en un seul mesh"""
+
+    def __init__(self, name, material=None):
+        self.name = name
+        self.materials = []
+        self._default_slot = self._material_slot(material) if material else 0
+        self._vert_chunks = []
+        self._loop_chunks = []
+        self._total_chunks = []
+        self._slot_chunks = []
+        self._look_chunks = []
+        self._uv_chunks = []
+        self._look = None
+        # Faces cachées retirées à la matérialisation (lots de bâtiments)
+        self.cull_hidden = False
+        self.vertex_count = 0
+        self.face_count = 0
+        self.item_count = 0
+
+    def _material_slot(self, material):
+        """Retourne l'index de slot du matériau (ajouté au besoin)"""
+        if material is None:
+            return self._default_slot
+        for index, existing in enumerate(self.materials):
+            if existing is material:
+                return index
+        self.materials.append(material)
+        return len(self.materials) - 1
+
+    @property
+    def is_empty(self):
+        return self.face_count == 0
+
+    def set_look(self, color=None, roughness=0.5, zone=-1):
+        """Aspect (couleur, rugosité, index de zone) des faces ajoutées ensuite
+
+        Écrit en attributs de faces lus par le shader partagé (city_shader.py);
+        color=None revient à la couleur d'objet.
+        """
+        self._look = None if color is None else (tuple(color[:3]), float(roughness), int(zone))
+
+    def add_geometry(self, verts, loop_indices, loop_totals, material=None, uvs=None):
+        """Ajoute une géométrie déjà en coordonnées monde
+
+        verts: (N, 3), loop_indices: indices locaux à plat, loop_totals: nombre
+        de sommets de chaque face, uvs: coordonnées UV par loop (L, 2) optionnelles.
+        """
+        verts = np.asarray(verts, dtype=np.float64).reshape(-1, 3)
+        loop_indices = np.asarray(loop_indices, dtype=np.int64).ravel()
+        loop_totals = np.asarray(loop_totals, dtype=np.int64).ravel()
+        if len(verts) == 0 or len(loop_totals) == 0:
+            return self.item_count
+
+        self._vert_chunks.append(verts)
+        self._loop_chunks.append(loop_indices + self.vertex_count)
+        self._total_chunks.append(loop_totals)
+        self._slot_chunks.append(np.full(len(loop_totals), self._material_slot(material), dtype=np.int64))
+        self._look_chunks.append((len(loop_totals), self._look))
+        self._uv_chunks.append((len(loop_indices), None if uvs is None else np.asarray(uvs, dtype=np.float32).reshape(-1, 2)))
+
+        self.vertex_count += len(verts)
+        self.face_count += len(loop_totals)
+        self.item_count += 1
+        return self.item_count - 1
+
+    def add_boxes(self, sizes, locations, rotations=None, material=None):
+        """Ajoute N boîtes (origine centre bas) en une seule opération vectorisée"""
+        sizes = np.asarray(sizes, dtype=np.float64).reshape(-1, 3)
+        locations = np.asarray(locations, dtype=np.float64).reshape(-1, 3)
+        count = len(sizes)
+        if count == 0:
+            return
+
+        verts = UNIT_BOX_VERTS[None, :, :] * sizes[:, None, :]
+        if rotations is not None:
+            rotations = np.asarray(rotations, dtype=np.float64).reshape(-1)
+            cos_a = np.cos(rotations)[:, None]
+            sin_a = np.sin(rotations)[:, None]
+            x = verts[:, :, 0].copy()
+            y = verts[:, :, 1].copy()
+            verts[:, :, 0] = x * cos_a - y * sin_a
+            verts[:, :, 1] = x * sin_a + y * cos_a
+        verts += locations[:, None, :]
+
+        faces = UNIT_BOX_FACES[None, :, :] + (np.arange(count) * len(UNIT_BOX_VERTS))[:, None, None]
+        self.add_geometry(verts.reshape(-1, 3), faces.ravel(),
+                          np.full(count * len(UNIT_BOX_FACES), 4), material)
+        # add_geometry compte un seul élément pour tout le lot vectorisé
+        self.item_count += count - 1
+
+    def add_box(self, size_x, size_y, size_z, location=(0.0, 0.0, 0.0), rotation_z=0.0, material=None):
+        """Ajoute une boîte avec origine au centre bas (même convention que create_cube_with_center_bottom_origin)"""
+        if size_x <= 0 or size_y <= 0 or size_z <= 0:
+            return False
+        self.add_boxes([(size_x, size_y, size_z)], [location],
+                       [rotation_z] if abs(rotation_z) > 1e-9 else None, material)
+        return True
+
+    def add_templates(self, name, positions, sizes, rotations=None, ratios=None, material=None):
+        """Ajoute N instances d'un gabarit de bâtiment (building_templates) en une passe"""
+        from .building_templates import get_template
+
+        sizes = np.asarray(sizes, dtype=np.float64).reshape(-1, 3)
+        if len(sizes) == 0:
+            return
+        verts, loops, totals = get_template(name).stamp(positions, sizes, rotations, ratios)
+        self.add_geometry(verts, loops, totals, material)
+        self.item_count += len(sizes) - 1
+
+    def add_buildings(self, template_names, positions, sizes, rotations=None, ratios=None, material=None):
+        """Ajoute N bâtiments de gabarits variés (building_templates.stamp_buildings), une passe par gabarit"""
+        from .building_templates import stamp_buildings
+
+        for _, indices, verts, loops, totals in stamp_buildings(template_names, positions, sizes, rotations, ratios):
+            self.add_geometry(verts, loops, totals, material)
+            self.item_count += len(indices) - 1
+
+    def add_template(self, name, size_x, size_y, size_z, location=(0.0, 0.0, 0.0), rotation_z=0.0, ratio=1.0, material=None):
+        """Ajoute un bâtiment gabarit (origine centre bas, posé à base_z du gabarit au-dessus de location)"""
+        if size_x <= 0 or size_y <= 0 or size_z <= 0:
+            return False
+        self.add_templates(name, [location], [(size_x, size_y, size_z)],
+                           [rotation_z] if abs(rotation_z) > 1e-9 else None, [ratio], material)
+        return True
+
+    def add_prism(self, polygon_xy, height, location=(0.0, 0.0, 0.0), rotation_z=0.0, top_scale=1.0, material=None):
+        """Extrude un polygone 2D (K, 2), origine au centre bas
+
+        top_scale réduit le contour supérieur (0 = pyramide / cône avec apex).
+        """
+        polygon = np.asarray(polygon_xy, dtype=np.float64).reshape(-1, 2)
+        sides = len(polygon)
+        if sides < 3 or height <= 0:
+            return False
+        polygon = rotate_xy(polygon, rotation_z)
+
+        bottom = np.column_stack((polygon, np.zeros(sides)))
+        ring = np.arange(sides)
+        next_ring = (ring + 1) % sides
+
+        if top_scale <= 1e-6:
+            apex = np.array([[0.0, 0.0, height]])
+            verts = np.vstack((bottom, apex))
+            sides_loops = np.column_stack((ring, next_ring, np.full(sides, sides))).ravel()
+            totals = np.concatenate(([sides], np.full(sides, 3)))
+        else:
+            top = np.column_stack((polygon * top_scale, np.full(sides, float(height))))
+            verts = np.vstack((bottom, top))
+            sides_loops = np.column_stack((ring, next_ring, next_ring + sides, ring + sides)).ravel()
+            totals = np.concatenate(([sides, sides], np.full(sides, 4)))
+
+        loops = [ring[::-1]]  # cap inférieur, normale vers le bas
+        if top_scale > 1e-6:
+            loops.append(ring + sides)  # cap supérieur
+        loops.append(sides_loops)
+
+        verts += np.asarray(location, dtype=np.float64)
+        self.add_geometry(verts, np.concatenate(loops), totals, material)
+        return True
+
+    def add_ring(self, outer_xy, inner_xy, height=0.0, location=(0.0, 0.0, 0.0), material=None):
+        """Ajoute un anneau entre deux contours (K, 2) de même nombre de sommets, sens trigonométrique
+
+        height > 0 donne une dalle (dessus, dessous, flancs extérieur et intérieur),
+        sinon seul le dessus est créé: K quads par face.
+        """
+        outer = np.asarray(outer_xy, dtype=np.float64).reshape(-1, 2)
+        inner = np.asarray(inner_xy, dtype=np.float64).reshape(-1, 2)
+        sides = len(outer)
+        if sides < 3 or len(inner) != sides:
+            return False
+        ring = np.arange(sides)
+        next_ring = (ring + 1) % sides
+
+        top = float(max(height, 0.0))
+        verts = np.vstack((np.column_stack((outer, np.full(sides, top))),
+                           np.column_stack((inner, np.full(sides, top)))))
+        outer_top, inner_top = ring, ring + sides
+        quads = [np.column_stack((outer_top, next_ring, next_ring + sides, inner_top))]
+        if height > 0:
+            verts = np.vstack((verts, np.column_stack((outer, np.zeros(sides))),
+                               np.column_stack((inner, np.zeros(sides)))))
+            outer_bottom, inner_bottom = ring + 2 * sides, ring + 3 * sides
+            quads += [
+                np.column_stack((outer_bottom, inner_bottom, next_ring + 3 * sides, next_ring + 2 * sides)),  # dessous
+                np.column_stack((outer_bottom, next_ring + 2 * sides, next_ring, outer_top)),  # flanc extérieur
+                np.column_stack((next_ring + 3 * sides, inner_bottom, inner_top, next_ring + sides)),  # flanc intérieur
+            ]
+        quads = np.vstack(quads)
+
+        verts += np.asarray(location, dtype=np.float64)
+        self.add_geometry(verts, quads.ravel(), np.full(len(quads), 4), material)
+        return True
+
+    def add_ribbon(self, points, widths, material=None, curb_material=None, sidewalk_material=None, **options):
+        """Ajoute une route en ruban continu le long d'une polyligne (K, 2)
+
+        options est transmis à road_ribbon.ribbon_geometry (join, z, curb_width,
+        sidewalk_width...). Les bordures et trottoirs prennent leur propre matériau.
+        """
+        from .road_ribbon import ribbon_geometry
+
+        strips = ribbon_geometry(points, widths, **options)
+        materials = {'road': material, 'curb': curb_material or material, 'sidewalk': sidewalk_material or material}
+        for role, verts, loops, totals, uvs in strips:
+            self.add_geometry(verts, loops, totals, materials[role], uvs)
+        if len(strips) > 1:
+            # Un seul élément par route, bordures et trottoirs compris
+            self.item_count -= len(strips) - 1
+        return bool(strips)
+
+    def add_cylinder(self, radius_x, radius_y, height, location=(0.0, 0.0, 0.0), segments=32, top_scale=1.0, material=None):
+        """Ajoute un cylindre (ou cône si top_scale=0) elliptique, origine au centre bas"""
+        if radius_x <= 0 or radius_y <= 0:
+            return False
+        return self.add_prism(regular_polygon(segments, radius_x, radius_y), height, location,
+                              top_scale=top_scale, material=material)
+
+    def cull_hidden_faces(self, ground_z=None):
+        """Retire les faces cachées (face_culling): dessous au sol et murs collés entre voisins
+
+        Les sommets devenus inutilisés sont supprimés. Retourne le nombre de faces retirées.
+        """
+        from .face_culling import GROUND_Z, hidden_faces
+
+        if self.is_empty:
+            return 0
+        verts, loops, totals, _ = self.arrays()
+        hidden = hidden_faces(verts, loops, totals, GROUND_Z if ground_z is None else ground_z)
+        removed = int(hidden.sum())
+        if removed == 0:
+            return 0
+
+        keep_faces = ~hidden
+        keep_loops = np.repeat(keep_faces, totals)
+        face_start = loop_start = 0
+        for index, chunk_totals in enumerate(self._total_chunks):
+            face_end, loop_end = face_start + len(chunk_totals), loop_start + len(self._loop_chunks[index])
+            faces, chunk_loops = keep_faces[face_start:face_end], keep_loops[loop_start:loop_end]
+            self._loop_chunks[index] = self._loop_chunks[index][chunk_loops]
+            self._total_chunks[index] = chunk_totals[faces]
+            self._slot_chunks[index] = self._slot_chunks[index][faces]
+            self._look_chunks[index] = (int(faces.sum()), self._look_chunks[index][1])
+            uvs = self._uv_chunks[index][1]
+            self._uv_chunks[index] = (int(chunk_loops.sum()), None if uvs is None else uvs[chunk_loops])
+            face_start, loop_start = face_end, loop_end
+
+        # Compactage des sommets encore référencés
+        used = np.zeros(self.vertex_count, dtype=bool)
+        used[loops[keep_loops]] = True
+        remap = np.cumsum(used) - 1
+        vert_start = 0
+        for index, chunk in enumerate(self._vert_chunks):
+            self._vert_chunks[index] = chunk[used[vert_start:vert_start + len(chunk)]]
+            vert_start += len(chunk)
+            self._loop_chunks[index] = remap[self._loop_chunks[index]]
+        self.vertex_count = int(used.sum())
+        self.face_count -= removed
+        log.info("✂️ Lot '%s': %s faces cachées retirées", self.name, removed)
+        return removed
+
+    def arrays(self):
+        """Retourne (verts, loop_indices, loop_totals, material_indices) concaténés"""
+        if self.is_empty:
+            return (np.zeros((0, 3)), np.zeros(0, dtype=np.int64),
+                    np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+        return (np.concatenate(self._vert_chunks),
+                np.concatenate(self._loop_chunks),
+                np.concatenate(self._total_chunks),
+                np.concatenate(self._slot_chunks))
+
+    def face_looks(self):
+        """Retourne (RGBA (F, 4), rugosité (F,), zone (F,)) par face, ou None sans aspect"""
+        if all(look is None for _, look in self._look_chunks):
+            return None
+        counts = np.array([count for count, _ in self._look_chunks], dtype=np.int64)
+        rgba = np.zeros((len(counts), 4), dtype=np.float32)
+        roughness = np.full(len(counts), 0.5, dtype=np.float32)
+        zones = np.full(len(counts), -1, dtype=np.int32)
+        for index, (_, look) in enumerate(self._look_chunks):
+            if look is not None:
+                rgba[index] = (*look[0], 1.0)
+                roughness[index] = look[1]
+                zones[index] = look[2]
+        return np.repeat(rgba, counts, axis=0), np.repeat(roughness, counts), np.repeat(zones, counts)
+
+    def loop_uvs(self):
+        """Retourne les UV par loop (L, 2), zéro là où aucune n'a été fournie, ou None"""
+        if all(uvs is None for _, uvs in self._uv_chunks):
+            return None
+        return np.concatenate([np.zeros((count, 2), dtype=np.float32) if uvs is None else uvs
+                               for count, uvs in self._uv_chunks])
+
+    def to_mesh(self, mesh_name=None):
+        """Crée un datablock mesh Blender en un seul passage foreach_set"""
+        import bpy
+
+        verts, loops, totals, slots = self.arrays()
+        starts = np.zeros(len(totals), dtype=np.int64)
+        if len(totals) > 1:
+            starts[1:] = np.cumsum(totals)[:-1]
+
+        mesh = bpy.data.meshes.new(mesh_name or self.name)
+        mesh.vertices.add(len(verts))
+        mesh.vertices.foreach_set("co", verts.astype(np.float32).ravel())
+        mesh.loops.add(len(loops))
+        mesh.loops.foreach_set("vertex_index", loops.astype(np.int32))
+        mesh.polygons.add(len(totals))
+        mesh.polygons.foreach_set("loop_start", starts.astype(np.int32))
+        try:
+            # Blender < 4.0: loop_total doit être écrit explicitement
+            mesh.polygons.foreach_set("loop_total", totals.astype(np.int32))
+        except (AttributeError, TypeError, RuntimeError):
+            pass
+
+        for material in self.materials:
+            mesh.materials.append(material)
+        if len(self.materials) > 1:
+            mesh.polygons.foreach_set("material_index", slots.astype(np.int32))
+
+        uvs = self.loop_uvs()
+        if uvs is not None:
+            uv_layer = mesh.uv_layers.new(name="UVMap")
+            uv_layer.data.foreach_set("uv", uvs.ravel())
+
+        looks = self.face_looks()
+        if looks is not None:
+            from .city_shader import write_look_attributes
+            write_look_attributes(mesh, 'FACE', *looks)
+
+        mesh.update(calc_edges=True)
+        mesh.validate(clean_customdata=False)
+        return mesh
+
+    def build_object(self, collection=None):
+        """Crée l'objet Blender du lot et le lie à la collection (active par défaut)"""
+        import bpy
+
+        if self.is_empty:
+            return None
+        if self.cull_hidden:
+            self.cull_hidden_faces()
+        mesh = self.to_mesh()
+        obj = bpy.data.objects.new(self.name, mesh)
+        if collection is None:
+            collection = bpy.context.collection
+        collection.objects.link(obj)
+        log.info("✅ Lot '%s': %s éléments, %s sommets, %s faces",
+                 self.name, self.item_count, self.vertex_count, self.face_count)
+        return obj
+
+
+def create_city_batches(prefix, road_mat=None, side_mat=None, build_mat=None, backend='BATCHED', snap=0.0):
+    """Crée un lot par catégorie (routes, trottoirs, carrefours, jonctions, bâtiments)
+
+    backend='SHARED' retourne des émetteurs à meshes partagés de même interface,
+    backend='INSTANCED' remplace le lot des bâtiments par un nuage de points Geometry Nodes.
+    """
+    if backend == 'SHARED':
+        from .shared_meshes import SharedMeshEmitter, SharedMeshRegistry
+        registry = SharedMeshRegistry(snap)
+        return {
+            'roads': SharedMeshEmitter(f"{prefix}_Road", road_mat, registry),
+            'sidewalks': SharedMeshEmitter(f"{prefix}_Sidewalk", side_mat, registry),
+            'intersections': SharedMeshEmitter(f"{prefix}_Intersection", road_mat, registry),
+            'junctions': SharedMeshEmitter(f"{prefix}_Junction", road_mat, registry),
+            'buildings': SharedMeshEmitter(f"{prefix}_Building", build_mat, registry),
+        }
+    batches = {
+        'roads': MeshBatch(f"{prefix}_Roads", road_mat),
+        'sidewalks': MeshBatch(f"{prefix}_Sidewalks", side_mat),
+        'intersections': MeshBatch(f"{prefix}_Intersections", road_mat),
+        'junctions': MeshBatch(f"{prefix}_Junctions", road_mat),
+        'buildings': MeshBatch(f"{prefix}_Buildings", build_mat),
+    }
+    batches['buildings'].cull_hidden = True
+    if backend == 'INSTANCED':
+        from .gn_instancing import CityPointCloud
+        batches['buildings'] = CityPointCloud(f"{prefix}_BuildingPoints", build_mat)
+    return batches
+
+
+def build_city_batches(batches, collection=None):
+    """Matérialise tous les lots non vides et retourne les objets créés"""
+    objects = []
+    for batch in batches.values():
+        obj = batch.build_object(collection)
+        if obj:
+            objects.append(obj)
+    return objects
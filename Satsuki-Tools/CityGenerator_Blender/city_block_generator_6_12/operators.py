@@ -3,6 +3,8 @@ import traceback
 import sys
 import importlib
 
+from .city_log import log
+
 # Fonction pour accéder aux propriétés de manière uniforme
 def get_citygen_properties(context):
     """Retourne un objet avec les propriétés city generator"""
@@ -46,6 +48,10 @@ def get_citygen_properties(context):
         def road_curve_intensity(self):
             return getattr(self.scene, 'citygen_road_curve_intensity', 0.5)
             
+        @property
+        def organic_extra_roads(self):
+            return getattr(self.scene, 'citygen_organic_extra_roads', 0.2)
+            
         @property
         def plaza_frequency(self):
             return getattr(self.scene, 'citygen_plaza_frequency', 0.1)
@@ -101,6 +107,22 @@ def get_citygen_properties(context):
         @property
         def growth_pattern(self):
             return getattr(self.scene, 'citygen_growth_pattern', 'ORGANIC')
+
+        @property
+        def mesh_backend(self):
+            return getattr(self.scene, 'citygen_mesh_backend', 'OBJECTS')
+
+        @property
+        def shared_snap(self):
+            return getattr(self.scene, 'citygen_shared_snap', 0.0)
+
+        @property
+        def seed(self):
+            return getattr(self.scene, 'citygen_seed', 0)
+
+        @property
+        def verbosity(self):
+            return getattr(self.scene, 'citygen_verbosity', 'INFO')
     
     return PropertyAccessor(context.scene)
 
@@ -165,6 +187,109 @@ class CITYGEN_OT_Generate(bpy.types.Operator):
             self.report({'ERROR'}, error_msg)
             return {'CANCELLED'}
 
+class CITYGEN_OT_GenerateModal(bpy.types.Operator):
+    bl_idname = "citygen.generate_city_modal"
+    bl_label = "Générer Progressivement"
+    bl_description = "Génère la ville par tranches sans bloquer Blender (Échap pour annuler). Grandes villes acceptées"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    # Budget de temps d'émission par tick (secondes)
+    time_budget: bpy.props.FloatProperty(name="Budget par tick", default=0.016, min=0.001, max=0.5)
+
+    # Limite de blocs de la génération progressive (la génération synchrone reste à 100)
+    max_blocks = 2500
+
+    def invoke(self, context, event):
+        try:
+            from .generator import prepare_city_generation
+            from .city_collections import activate_collection, ensure_city_collections
+
+            self._previous_collection = context.view_layer.active_layer_collection
+            activate_collection(context, ensure_city_collections(context.scene)['root'])
+            prepared = prepare_city_generation(context, max_blocks=self.max_blocks)
+            if isinstance(prepared, bool):
+                # Mise à jour incrémentale terminée ou paramètres invalides
+                self._restore_collection(context)
+                return {'FINISHED'} if prepared else {'CANCELLED'}
+
+            self._plan, self._emitter, self._mesh_backend = prepared
+            self._steps = self._emitter.steps(self._plan)
+            self._total = self._emitter.step_count(self._plan)
+            self._done = 0
+
+            wm = context.window_manager
+            wm.progress_begin(0, max(1, self._total))
+            self._timer = wm.event_timer_add(0.001, window=context.window)
+            wm.modal_handler_add(self)
+            log.info("⏳ Génération progressive: %s éléments, %.0f ms par tick", self._total, self.time_budget * 1000)
+            return {'RUNNING_MODAL'}
+
+        except Exception as e:
+            error_msg = f"Erreur lors de la préparation: {str(e)}"
+            log.error("❌ %s", error_msg)
+            log.error("Traceback: %s", traceback.format_exc())
+            self.report({'ERROR'}, error_msg)
+            return {'CANCELLED'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self._rollback(context)
+            self.report({'WARNING'}, "Génération annulée, objets partiels supprimés")
+            return {'CANCELLED'}
+
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        import time
+        try:
+            done, finished = self._emitter.emit_until(self._plan, self._steps,
+                                                      time.perf_counter() + self.time_budget)
+        except Exception as e:
+            log.error("❌ Erreur pendant la génération progressive: %s", e)
+            self._rollback(context)
+            self.report({'ERROR'}, f"Génération interrompue: {e}")
+            return {'CANCELLED'}
+
+        self._done += done
+        context.window_manager.progress_update(self._done)
+        if context.area:
+            context.area.header_text_set(f"Génération: {self._done}/{self._total} (Échap pour annuler)")
+        if not finished:
+            return {'RUNNING_MODAL'}
+
+        from .city_update import save_plan
+        counts = self._emitter.finish()
+        save_plan(context.scene, self._plan, self._mesh_backend)
+        self._end(context)
+        self.report({'INFO'}, f"Quartier généré: {counts['buildings']} bâtiments, {counts['roads']} routes")
+        return {'FINISHED'}
+
+    def cancel(self, context):
+        # Appelé par Blender si l'opérateur est interrompu (chargement de fichier...)
+        self._end(context)
+
+    def _rollback(self, context):
+        """Supprime les objets déjà créés: la ville a été vidée au lancement"""
+        from .city_collections import clear_city
+        self._end(context)
+        clear_city(context.scene, remove_collections=False)
+
+    def _end(self, context):
+        wm = context.window_manager
+        if getattr(self, '_timer', None) is not None:
+            wm.event_timer_remove(self._timer)
+            self._timer = None
+        wm.progress_end()
+        if context.area:
+            context.area.header_text_set(None)
+        self._restore_collection(context)
+
+    def _restore_collection(self, context):
+        try:
+            context.view_layer.active_layer_collection = self._previous_collection
+        except (AttributeError, ReferenceError, RuntimeError, TypeError):
+            pass
+
 class CITYGEN_OT_Clear(bpy.types.Operator):
     bl_idname = "citygen.clear_city"
     bl_label = "Nettoyer Scène"
@@ -173,34 +298,9 @@ class CITYGEN_OT_Clear(bpy.types.Operator):
     
     def execute(self, context):
         try:
-            # Liste des préfixes d'objets à supprimer
-            prefixes_to_remove = [
-                "Building_", "Road_", "Sidewalk_", "Block_", "Plaza_", "Landmark_",
-                "StreetLight_", "Bench_", "Tree_", "Car_", "Fountain_",
-                "OrganicRoad_", "OrganicBlock_", "Block_Zone_"
-            ]
-            
-            # Compter les objets supprimés
-            removed_count = 0
-            
-            # Collecter les objets à supprimer
-            objects_to_remove = []
-            for obj in bpy.data.objects:
-                if any(obj.name.startswith(prefix) for prefix in prefixes_to_remove):
-                    objects_to_remove.append(obj)
-            
-            # Supprimer les objets
-            for obj in objects_to_remove:
-                try:
-                    bpy.data.objects.remove(obj, do_unlink=True)
-                    removed_count += 1
-                except Exception as e:
-                    print(f"Erreur lors de la suppression de {obj.name}: {e}")
-            
-            # Nettoyer les données orphelines
-            bpy.ops.outliner.orphans_purge(
-                do_local_ids=True, do_linked_ids=True, do_recursive=True
-            )
+            # Seuls les objets de la collection de la ville sont supprimés
+            from .city_collections import clear_city
+            removed_count = clear_city(context.scene)
             
             message = f"{removed_count} objets de ville supprimés"
             print(f"✅ {message}")
@@ -222,10 +322,10 @@ class CITYGEN_OT_RegenerateBuildings(bpy.types.Operator):
     def execute(self, context):
         try:
             # Import différé
-            from .generator import generate_city
+            from .city_update import regenerate_buildings
             
-            print("🏢 RÉGÉNÉRATION: Appel generate_city avec regen_only=True")
-            success = generate_city(context, regen_only=True)
+            print("🏢 RÉGÉNÉRATION: nouvelle graine de bâtiments, blocs et routes conservés")
+            success = regenerate_buildings(context)
             
             if success:
                 self.report({'INFO'}, "Bâtiments régénérés avec succès!")
@@ -249,32 +349,12 @@ class CITYGEN_OT_RegenerateRoadsSidewalks(bpy.types.Operator):
     
     def execute(self, context):
         try:
-            # Supprimer les routes et trottoirs existants
-            prefixes_roads = ["Road_", "Sidewalk_", "OrganicRoad_"]
-            removed_count = 0
-            
-            # Collecter les objets à supprimer
-            objects_to_remove = []
-            for obj in bpy.data.objects:
-                if any(obj.name.startswith(prefix) for prefix in prefixes_roads):
-                    objects_to_remove.append(obj)
-            
-            # Supprimer les objets
-            for obj in objects_to_remove:
-                try:
-                    bpy.data.objects.remove(obj, do_unlink=True)
-                    removed_count += 1
-                except Exception as e:
-                    print(f"Erreur lors de la suppression de {obj.name}: {e}")
-            
-            print(f"🛣️ {removed_count} routes/trottoirs supprimés")
-            
-            # Régénérer complètement (pas de paramètre roads_only disponible)
-            from .generator import generate_city
-            success = generate_city(context, regen_only=False)
+            # Mise à jour incrémentale: routes recréées, blocs et bâtiments déplacés
+            from .city_update import update_city
+            success = update_city(context)
             
             if success:
-                self.report({'INFO'}, f"Routes et trottoirs régénérés! ({removed_count} supprimés)")
+                self.report({'INFO'}, "Routes et trottoirs mis à jour!")
                 return {'FINISHED'}
             else:
                 self.report({'ERROR'}, "Échec de la régénération des routes")
@@ -287,6 +367,69 @@ class CITYGEN_OT_RegenerateRoadsSidewalks(bpy.types.Operator):
             self.report({'ERROR'}, error_msg)
             return {'CANCELLED'}
 
+class CITYGEN_OT_RealizeInstances(bpy.types.Operator):
+    bl_idname = "citygen.realize_instances"
+    bl_label = "Réaliser Instances"
+    bl_description = "Convertit les bâtiments instanciés (points sélectionnés en mode édition, sinon tous) en objets réels"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj is not None and obj.type == 'MESH' and obj.get("citygen_point_cloud", False)
+
+    def execute(self, context):
+        try:
+            from .gn_instancing import realize_point_cloud
+
+            obj = context.active_object
+            # La sélection des points n'est synchronisée qu'en mode objet
+            if obj.mode == 'EDIT':
+                bpy.ops.object.mode_set(mode='OBJECT')
+
+            created = realize_point_cloud(obj, only_selected=True)
+            if created:
+                self.report({'INFO'}, f"{len(created)} bâtiments réalisés")
+                return {'FINISHED'}
+            else:
+                self.report({'WARNING'}, "Aucun bâtiment à réaliser")
+                return {'CANCELLED'}
+
+        except Exception as e:
+            error_msg = f"Erreur lors de la réalisation des instances: {str(e)}"
+            print(f"❌ {error_msg}")
+            print(f"Traceback: {traceback.format_exc()}")
+            self.report({'ERROR'}, error_msg)
+            return {'CANCELLED'}
+
+class CITYGEN_OT_RealizeLiveRoads(bpy.types.Operator):
+    bl_idname = "citygen.realize_live_roads"
+    bl_label = "Réaliser Routes Courbes"
+    bl_description = "Convertit les routes courbes vivantes (Geometry Nodes) en mesh"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        from .bezier_roads import LIVE_ROADS_PROP
+
+        obj = context.active_object
+        return obj is not None and obj.type == 'CURVE' and obj.get(LIVE_ROADS_PROP, False)
+
+    def execute(self, context):
+        try:
+            from .bezier_roads import realize_live_roads
+
+            realized = realize_live_roads(context.active_object)
+            self.report({'INFO'}, f"Routes réalisées: {len(realized.data.vertices)} sommets")
+            return {'FINISHED'}
+
+        except Exception as e:
+            error_msg = f"Erreur lors de la réalisation des routes: {str(e)}"
+            log.error("❌ %s", error_msg)
+            log.error("Traceback: %s", traceback.format_exc())
+            self.report({'ERROR'}, error_msg)
+            return {'CANCELLED'}
+
 class CITYGEN_OT_Diagnostic(bpy.types.Operator):
     bl_idname = "citygen.diagnostic"
     bl_label = "Diagnostic Système"
@@ -403,6 +546,11 @@ def get_city_properties():
             description="Génère d'abord les routes, puis remplit les espaces avec des blocs (recommandé)",
             default=True
         ),
+        'citygen_live_curve_roads': bpy.props.BoolProperty(
+            name="Routes Courbes Vivantes",
+            description="Routes d'abord: routes Bézier gardées en courbes maillées par Geometry Nodes, sans conversion en mesh",
+            default=False
+        ),
         'citygen_building_variety': bpy.props.EnumProperty(
             name="Variété Bâtiments",
             description="Niveau de variété dans les bâtiments",
@@ -421,6 +569,13 @@ def get_city_properties():
             min=0.0,
             max=2.0
         ),
+        'citygen_organic_extra_roads': bpy.props.FloatProperty(
+            name="Routes Supplémentaires",
+            description="Connexions ajoutées à l'arbre couvrant entre blocs organiques (0=arbre seul, 1=deux fois plus de routes)",
+            default=0.2,
+            min=0.0,
+            max=1.0
+        ),
         'citygen_plaza_frequency': bpy.props.FloatProperty(
             name="Fréquence Places",
             description="Probabilité d'avoir des places publiques",
@@ -510,15 +665,54 @@ def get_city_properties():
                 ('MIXED', "Mixte", "Combinaison des deux")
             ],
             default='ORGANIC'
+        ),
+        'citygen_mesh_backend': bpy.props.EnumProperty(
+            name="Backend Géométrie",
+            description="Mode de création de la géométrie de la ville",
+            items=[
+                ('OBJECTS', "Objets Séparés", "Un objet Blender par bâtiment, route et trottoir"),
+                ('BATCHED', "Maillages Groupés", "Un seul mesh par catégorie, beaucoup plus rapide sur les grandes villes"),
+                ('SHARED', "Meshes Partagés", "Un objet par élément, les formes identiques partagent le même mesh"),
+                ('INSTANCED', "Instances GN", "Bâtiments en nuage de points instancié par Geometry Nodes (villes de 10k+ bâtiments)")
+            ],
+            default='OBJECTS'
+        ),
+        'citygen_shared_snap': bpy.props.FloatProperty(
+            name="Snap Dimensions",
+            description="Aligne empreintes et hauteurs sur cette grille pour maximiser le partage des meshes (0=désactivé)",
+            default=0.0,
+            min=0.0,
+            max=5.0
+        ),
+        'citygen_seed': bpy.props.IntProperty(
+            name="Graine",
+            description="Graine de la ville: même graine = même ville (0=nouvelle graine à chaque génération)",
+            default=0,
+            min=0
+        ),
+        'citygen_verbosity': bpy.props.EnumProperty(
+            name="Verbosité",
+            description="Niveau de détail des messages console (DEBUG ralentit les grandes villes)",
+            items=[
+                ('SILENT', "Silencieux", "Aucun message"),
+                ('ERROR', "Erreurs", "Erreurs uniquement"),
+                ('WARNING', "Avertissements", "Erreurs et avertissements"),
+                ('INFO', "Info", "Résumés et progression"),
+                ('DEBUG', "Debug", "Détail de chaque objet créé")
+            ],
+            default='INFO'
         )
     }
 
 # Liste des classes à enregistrer
 classes = [
     CITYGEN_OT_Generate,
+    CITYGEN_OT_GenerateModal,
     CITYGEN_OT_Clear,
     CITYGEN_OT_RegenerateBuildings,
     CITYGEN_OT_RegenerateRoadsSidewalks,
+    CITYGEN_OT_RealizeInstances,
+    CITYGEN_OT_RealizeLiveRoads,
     CITYGEN_OT_Diagnostic,
 ]
 
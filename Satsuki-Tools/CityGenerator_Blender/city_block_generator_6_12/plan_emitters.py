@@ -0,0 +1,286 @@
+"""
+Émetteurs de CityPlan vers Blender.
+
+Un PlanEmitter parcourt les tables d'un plan et crée la géométrie avec le
+backend choisi: objets séparés (OBJECTS), maillages groupés (BATCHED), meshes
+partagés (SHARED) ou instances Geometry Nodes (INSTANCED). Chaque objet créé
+est marqué (citygen_kind, citygen_key) pour la régénération incrémentale.
+En BATCHED, les bâtiments sont émis par paquets depuis les colonnes du plan
+(building_templates.stamp_buildings, une passe NumPy par gabarit).
+"""
+
+import math
+import time
+
+import numpy as np
+
+from .building_sampler import FOOTPRINT_TEMPLATES
+from .city_log import log
+from .city_plan import PLAN_CATEGORIES, BUILDING_TYPES, ROAD_DIAGONAL, ROAD_HORIZONTAL, ZONE_TYPES
+
+# Bâtiments par étape en émission groupée (BATCHED)
+BUILDING_CHUNK = 512
+
+
+def _step_label(index):
+    """Index d'une étape pour le journal (premier-dernier pour un paquet)"""
+    if np.ndim(index) == 0:
+        return index
+    return f"{index[0]}-{index[-1]}" if len(index) else "-"
+
+
+class PlanEmitter:
+    """Transforme un CityPlan en géométrie Blender"""
+
+    def __init__(self, road_mat, side_mat, build_mat, district_materials=None, mesh_backend='OBJECTS', shared_snap=0.0, prefix="CityGrid",
+                 collections=None):
+        self.road_mat = road_mat
+        self.side_mat = side_mat
+        self.build_mat = build_mat
+        self.district_materials = district_materials or {}
+        self.mesh_backend = mesh_backend
+        self.batches = None
+        if mesh_backend in ('BATCHED', 'SHARED', 'INSTANCED'):
+            from .mesh_batch import create_city_batches
+            self.batches = create_city_batches(prefix, road_mat, side_mat, build_mat, mesh_backend, shared_snap)
+        # Collections de la ville (city_collections.ensure_city_collections), None = collection active
+        self.collections = collections
+        self._active_category = None
+        if collections and self.batches:
+            from .city_collections import category_collection
+            for category, batch in self.batches.items():
+                if hasattr(batch, 'collection'):
+                    batch.collection = category_collection(collections, category)
+        self.counts = {'roads': 0, 'blocks': 0, 'buildings': 0, 'intersections': 0, 'junctions': 0}
+
+    def _batch(self, category):
+        return self.batches[category] if self.batches else None
+
+    @property
+    def per_object(self):
+        """Vrai si chaque élément est un objet séparé (mise à jour élément par élément possible)"""
+        return self.mesh_backend in ('OBJECTS', 'SHARED')
+
+    @staticmethod
+    def _tag(objects, category, key):
+        """Marque les objets créés avec leur catégorie et leur clé dans le plan"""
+        if objects is None or isinstance(objects, bool):
+            return
+        if not isinstance(objects, (list, tuple)):
+            objects = (objects,)
+        for obj in objects:
+            obj['citygen_kind'] = category
+            obj['citygen_key'] = key
+
+    def _activate(self, category):
+        """Active la collection de la catégorie (objets créés via bpy.ops)"""
+        if self.collections is None or category == self._active_category:
+            return
+        import bpy
+
+        from .city_collections import activate_collection, category_collection
+        activate_collection(bpy.context, category_collection(self.collections, category))
+        self._active_category = category
+
+    def _collection(self, category):
+        if self.collections is None:
+            return None
+        from .city_collections import category_collection
+        return category_collection(self.collections, category)
+
+    @staticmethod
+    def _block_key(plan, block_index):
+        return f"{plan.blocks['i'][block_index]}_{plan.blocks['j'][block_index]}"
+
+    def emit_road(self, plan, index):
+        from .generator import generate_road
+
+        road = plan.roads.row(index)
+        self._activate('roads')
+        if road['kind'] == ROAD_DIAGONAL:
+            created = generate_road(road['x'], road['y'], road['width'], road['length'], self.road_mat,
+                                    is_horizontal=True, rotation=road['rotation'], batch=self._batch('roads'))
+        else:
+            created = generate_road(road['x'], road['y'], road['width'], road['length'], self.road_mat,
+                                    is_horizontal=road['kind'] == ROAD_HORIZONTAL, batch=self._batch('roads'))
+        if created:
+            self.counts['roads'] += 1
+            self._tag(created, 'roads', str(index))
+        return created
+
+    def emit_block(self, plan, index):
+        from .generator import generate_sidewalk
+
+        block = plan.blocks.row(index)
+        self._activate('sidewalks')
+        created = generate_sidewalk(block['x'], block['y'], block['width'], block['depth'], self.side_mat,
+                                    batch=self._batch('sidewalks'))
+        if created:
+            self.counts['blocks'] += 1
+            self._tag(created, 'sidewalks', self._block_key(plan, index))
+        return created
+
+    def emit_building(self, plan, index):
+        from .city_shader import zone_look
+        from .generator import append_building_to_batch, generate_building_with_type
+
+        building = plan.buildings.row(index)
+        self._activate('buildings')
+        building_type = BUILDING_TYPES[building['type']]
+        zone_type = ZONE_TYPES[building['zone']]
+        mat = self.district_materials.get(zone_type, self.build_mat)
+        # Gabarit et variante tirés au plan (building_sampler.sample_buildings)
+        template = (FOOTPRINT_TEMPLATES[building['template']],
+                    (building['footprint_width'], building['footprint_depth'], building['height']), building['ratio'])
+
+        batch = self._batch('buildings')
+        if batch is not None:
+            if hasattr(batch, 'begin_block'):
+                batch.begin_block(building['block'])
+            first_object = len(getattr(batch, 'objects', ()))
+            look = zone_look(zone_type) if zone_type in self.district_materials else None
+            created = append_building_to_batch(batch, building_type, building['x'], building['y'], building['width'],
+                                                building['depth'], building['height'], mat, zone_type, look, template)
+            if created and hasattr(batch, 'objects'):
+                # Meshes partagés: un bâtiment peut compter plusieurs objets
+                created = batch.objects[first_object:]
+        else:
+            created = generate_building_with_type(building['x'], building['y'], building['width'], building['depth'],
+                                                  building['height'], mat, zone_type, self.district_materials, building_type,
+                                                  template)
+        if created:
+            self.counts['buildings'] += 1
+            self._tag(created, 'buildings', self._block_key(plan, building['block']))
+        return created
+
+    def emit_buildings(self, plan, indices):
+        """Émet un paquet de bâtiments dans le lot groupé, une passe vectorisée par zone et par gabarit"""
+        from .city_shader import zone_look
+
+        indices = np.asarray(indices, dtype=np.int64)
+        table = plan.buildings
+        batch = self._batch('buildings')
+        zones = table['zone'][indices]
+        templates = np.array(FOOTPRINT_TEMPLATES)[table['template'][indices]]
+        positions = np.column_stack((table['x'][indices], table['y'][indices]))
+        sizes = np.column_stack((table['footprint_width'][indices], table['footprint_depth'][indices],
+                                 table['height'][indices]))
+        ratios = table['ratio'][indices]
+        for zone in np.unique(zones).tolist():
+            zone_type = ZONE_TYPES[zone]
+            if zone_type in self.district_materials:
+                batch.set_look(*zone_look(zone_type))
+            else:
+                batch.set_look()
+            mask = zones == zone
+            batch.add_buildings(templates[mask], positions[mask], sizes[mask], ratios=ratios[mask],
+                                material=self.district_materials.get(zone_type, self.build_mat))
+        self.counts['buildings'] += len(indices)
+        return True
+
+    def emit_intersection(self, plan, index):
+        from .generator import generate_intersection
+
+        intersection = plan.intersections.row(index)
+        self._activate('intersections')
+        created = generate_intersection(intersection['x'], intersection['y'], intersection['size'], self.road_mat,
+                                        batch=self._batch('intersections'))
+        if created:
+            self.counts['intersections'] += 1
+            self._tag(created, 'intersections', str(index))
+        return created
+
+    def emit_junction(self, plan, index):
+        from .generator import generate_junction_patch
+
+        junction = plan.junctions.row(index)
+        self._activate('junctions')
+        # Croisement au format de road_crossings.find_road_crossings
+        crossing = {
+            'point': (junction['x'], junction['y']),
+            'widths': (junction['width_a'], junction['width_b']),
+            'directions': tuple(np.array((math.cos(junction[name]), math.sin(junction[name])))
+                                for name in ('angle_a', 'angle_b')),
+        }
+        created = generate_junction_patch(crossing, self.road_mat, batch=self._batch('junctions'))
+        if created:
+            self.counts['junctions'] += 1
+            self._tag(created, 'junctions', str(index))
+        return created
+
+    def steps(self, plan, selection=None):
+        """Itère sur les émissions élémentaires du plan, dans l'ordre
+
+        selection ({catégorie: index}) restreint l'émission à certaines lignes.
+        """
+        emitters = {
+            'roads': self.emit_road,
+            'sidewalks': self.emit_block,
+            'buildings': self.emit_building,
+            'intersections': self.emit_intersection,
+            'junctions': self.emit_junction,
+        }
+        stamped = hasattr(self._batch('buildings'), 'add_buildings')
+        for category, table_name in PLAN_CATEGORIES:
+            if selection is None:
+                indices = range(len(getattr(plan, table_name)))
+            else:
+                indices = selection.get(category, ())
+            if category == 'buildings' and stamped:
+                # Lot groupé: un paquet de bâtiments par étape
+                indices = list(indices)
+                for start in range(0, len(indices), BUILDING_CHUNK):
+                    yield self.emit_buildings, indices[start:start + BUILDING_CHUNK]
+                continue
+            for index in indices:
+                yield emitters[category], index
+
+    def emit_until(self, plan, steps, deadline):
+        """Émet les étapes de steps jusqu'à l'échéance deadline (horloge time.perf_counter)
+
+        Retourne (nombre d'éléments émis, True si steps est épuisé); un paquet compte pour
+        ses éléments. La collection active est réappliquée à chaque appel car l'utilisateur
+        a pu la changer entre deux ticks.
+        """
+        self._active_category = None
+        done = 0
+        for emit, index in steps:
+            try:
+                emit(plan, index)
+            except Exception as e:
+                log.error("❌ Erreur émission %s #%s: %s", emit.__name__, _step_label(index), e)
+            done += np.size(index)
+            if time.perf_counter() >= deadline:
+                return done, False
+        return done, True
+
+    def step_count(self, plan):
+        return sum(len(getattr(plan, table_name)) for _, table_name in PLAN_CATEGORIES)
+
+    def finish(self):
+        """Matérialise les lots éventuels et retourne les compteurs"""
+        if self.batches:
+            for category, batch in self.batches.items():
+                obj = batch.build_object(self._collection(category))
+                if obj is not None:
+                    self._tag(obj, category, '*')
+        return dict(self.counts)
+
+    def emit(self, plan, selection=None):
+        """Émet tout le plan (ou la sélection) d'un coup"""
+        if selection is None:
+            total = self.step_count(plan)
+        else:
+            total = sum(len(indices) for indices in selection.values())
+        done = 0
+        for emit, index in self.steps(plan, selection):
+            try:
+                emit(plan, index)
+            except Exception as e:
+                log.error("❌ Erreur émission %s #%s: %s", emit.__name__, _step_label(index), e)
+            done += np.size(index)
+            log.progress("Émission du plan", done, total)
+        counts = self.finish()
+        log.info("✅ Plan émis: %s routes, %s blocs, %s bâtiments, %s carrefours, %s jonctions",
+                 counts['roads'], counts['blocks'], counts['buildings'], counts['intersections'], counts['junctions'])
+        return counts
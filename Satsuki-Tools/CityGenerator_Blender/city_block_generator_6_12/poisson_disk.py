@@ -0,0 +1,173 @@
+"""
+Échantillonnage de Poisson (disques) accéléré par grille (sans dépendance à bpy).
+
+Les centres de zones étaient tirés par essais aléatoires rejetés, chaque
+candidat étant comparé à tous les centres existants: le nombre de centres
+obtenu dépendait de la chance. Ici l'algorithme de Bridson part d'un point et
+essaie, autour d'un point actif tiré au hasard, quelques candidats dans
+l'anneau [r, 2r]; un point sans candidat valide quitte la liste active. Une
+grille de fond rend chaque test local:
+- sur une grille de cellules (blocs), un masque des cellules interdites: chaque
+  point accepté y tamponne son disque de rayon r, un candidat est testé en O(1);
+- dans le plan, une grille de pas r/√2 (au plus un point par case): un candidat
+  n'est comparé qu'aux points des 5x5 cases voisines.
+Le coût est en O(points) et l'espacement minimal est garanti. spaced_cells
+choisit un nombre exact de cellules parmi l'échantillon, en relâchant
+l'espacement si la grille est trop petite (et le signale dans le journal).
+Utilisable pour tout placement espacé: centres de zones, monuments, places,
+mobilier urbain.
+"""
+
+import math
+import random
+
+import numpy as np
+
+from .city_log import log
+
+# Candidats essayés autour d'un point actif avant de le retirer (valeur de Bridson)
+DEFAULT_ATTEMPTS = 30
+
+# Jeux de candidats tirés d'un coup (un jeu par point actif visité)
+_CHUNK = 512
+
+
+def _annulus_offsets(generator, radius, attempts):
+    """Itérateur de décalages (attempts, 2) tirés dans l'anneau [radius, 2 * radius]"""
+    while True:
+        angles = generator.uniform(0.0, 2 * math.pi, (_CHUNK, attempts))
+        distances = radius * (1.0 + generator.random((_CHUNK, attempts)))
+        yield from np.stack((np.cos(angles) * distances, np.sin(angles) * distances), axis=-1)
+
+
+def disk_offsets(radius):
+    """Décalages entiers (K, 2) des cellules à distance < radius de l'origine"""
+    reach = max(0, math.ceil(radius) - 1)
+    di, dj = np.mgrid[-reach:reach + 1, -reach:reach + 1]
+    inside = di * di + dj * dj < radius * radius
+    return np.column_stack((di[inside], dj[inside]))
+
+
+def poisson_disk_cells(width, length, radius, rng=random, attempts=DEFAULT_ATTEMPTS, blocked=None, initial=()):
+    """Cellules (N, 2) d'une grille width x length deux à deux à distance >= radius
+
+    blocked: masque (width, length) des cellules interdites (non modifié);
+    initial: cellules déjà placées, gardées en tête du résultat sans être testées.
+    """
+    blocked = np.zeros((width, length), dtype=bool) if blocked is None else np.array(blocked, dtype=bool)
+    offsets = disk_offsets(radius)
+    annulus = _annulus_offsets(np.random.default_rng(rng.getrandbits(64)), radius, attempts)
+    points = []
+    active = []
+
+    def accept(cell):
+        points.append(cell)
+        active.append(cell)
+        stamp = offsets + cell
+        valid = (stamp[:, 0] >= 0) & (stamp[:, 0] < width) & (stamp[:, 1] >= 0) & (stamp[:, 1] < length)
+        blocked[stamp[valid, 0], stamp[valid, 1]] = True
+
+    for cell in np.asarray(initial, dtype=np.int64).reshape(-1, 2):
+        accept(cell)
+    if not points:
+        free = np.argwhere(~blocked)
+        if len(free) == 0:
+            return np.empty((0, 2), dtype=np.int64)
+        accept(free[rng.randrange(len(free))])
+
+    while active:
+        index = rng.randrange(len(active))
+        candidates = np.rint(active[index] + next(annulus)).astype(np.int64)
+        inside = ((candidates[:, 0] >= 0) & (candidates[:, 0] < width) &
+                  (candidates[:, 1] >= 0) & (candidates[:, 1] < length))
+        candidates = candidates[inside]
+        valid = np.flatnonzero(~blocked[candidates[:, 0], candidates[:, 1]])
+        if len(valid):
+            accept(candidates[valid[0]])
+        else:
+            active[index] = active[-1]
+            active.pop()
+    return np.array(points, dtype=np.int64).reshape(-1, 2)
+
+
+def poisson_disk_points(size_x, size_y, radius, rng=random, attempts=DEFAULT_ATTEMPTS, initial=()):
+    """Points (N, 2) du rectangle [0, size_x] x [0, size_y] deux à deux à distance >= radius"""
+    initial = np.asarray(initial, dtype=np.float64).reshape(-1, 2)
+    cell = radius / math.sqrt(2)
+    columns, rows = max(1, math.ceil(size_x / cell)), max(1, math.ceil(size_y / cell))
+    # Grille de fond: index du point de chaque case (-1: vide), bordée de 2 cases vides
+    grid = np.full((columns + 4, rows + 4), -1, dtype=np.int64)
+    annulus = _annulus_offsets(np.random.default_rng(rng.getrandbits(64)), radius, attempts)
+    # Au plus un point par case: la grille borne le nombre de points
+    points = np.empty((grid.size + len(initial), 2))
+    count = 0
+    active = []
+
+    def accept(point):
+        nonlocal count
+        grid[int(point[0] / cell) + 2, int(point[1] / cell) + 2] = count
+        points[count] = point
+        count += 1
+        active.append(point)
+
+    for point in initial:
+        accept(point)
+    if not count:
+        accept(np.array((rng.uniform(0, size_x), rng.uniform(0, size_y))))
+
+    window = np.arange(-2, 3)
+    while active:
+        index = rng.randrange(len(active))
+        candidates = active[index] + next(annulus)
+        candidates = candidates[(candidates[:, 0] >= 0) & (candidates[:, 0] < size_x) &
+                                (candidates[:, 1] >= 0) & (candidates[:, 1] < size_y)]
+        valid = ()
+        if len(candidates):
+            # Points des 5x5 cases autour de chaque candidat (k, 25)
+            gx = (candidates[:, 0] / cell).astype(np.int64) + 2
+            gy = (candidates[:, 1] / cell).astype(np.int64) + 2
+            near = grid[gx[:, None, None] + window[None, :, None], gy[:, None, None] + window[None, None, :]]
+            near = near.reshape(len(candidates), -1)
+            gap = np.linalg.norm(points[np.maximum(near, 0)] - candidates[:, None, :], axis=-1)
+            valid = np.flatnonzero(np.all((near < 0) | (gap >= radius), axis=1))
+        if len(valid):
+            accept(candidates[valid[0]])
+        else:
+            active[index] = active[-1]
+            active.pop()
+    return points[:count].copy()
+
+
+def spaced_cells(width, length, count, min_distance, rng=random, attempts=DEFAULT_ATTEMPTS, label="points"):
+    """Exactement count cellules (count, 2) espacées d'au moins min_distance si possible
+
+    L'échantillon de Poisson couvre toute la grille, puis count cellules y sont tirées.
+    S'il en manque, l'espacement est divisé par deux (les cellules déjà placées sont
+    gardées) jusqu'à 1; le manque éventuel (count > cellules) est signalé dans le journal.
+    """
+    radius = max(1.0, float(min_distance))
+    kept = np.empty((0, 2), dtype=np.int64)
+    while True:
+        cells = poisson_disk_cells(width, length, radius, rng, attempts, initial=kept)
+        if radius <= 1.0 and len(cells) < count:
+            # Espacement 1: toute cellule libre convient
+            taken = np.zeros((width, length), dtype=bool)
+            taken[cells[:, 0], cells[:, 1]] = True
+            free = np.argwhere(~taken)
+            extra = [free[index] for index in rng.sample(range(len(free)), min(len(free), count - len(cells)))]
+            cells = np.vstack([cells] + extra) if extra else cells
+        if len(cells) >= count or radius <= 1.0:
+            break
+        log.debug("   ↔️ %s: %s/%s avec espacement %.1f, espacement réduit", label, len(cells), count, radius)
+        kept = cells
+        radius = max(1.0, radius / 2)
+
+    if len(cells) < count:
+        log.warning("⚠️ %s: seulement %s/%s cellules disponibles (grille %sx%s)", label, len(cells), count, width, length)
+        return cells
+    # Les cellules des passes précédentes (plus espacées) d'abord, puis un tirage parmi les nouvelles
+    chosen = list(range(min(len(kept), count)))
+    chosen += rng.sample(range(len(kept), len(cells)), count - len(chosen))
+    if radius < min_distance:
+        log.warning("⚠️ %s: espacement réduit de %.1f à %.1f pour placer %s cellules", label, min_distance, radius, count)
+    return cells[np.sort(chosen)]
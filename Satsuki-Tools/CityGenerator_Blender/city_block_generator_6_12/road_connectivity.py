@@ -0,0 +1,94 @@
+"""
+Graphe de connexion clairsemé entre blocs organiques.
+
+Au lieu de relier chaque couple de blocs proches (O(n²) tests, routes qui se
+chevauchent), les centres des blocs sont triangulés (Delaunay, via
+mathutils.geometry.delaunay_2d_cdt dans Blender), puis réduits à leur arbre
+couvrant minimal: chaque bloc reste accessible avec le minimum de routes. Une
+fraction réglable des autres arêtes de Delaunay, les plus courtes d'abord,
+rajoute des boucles pour que le réseau ne soit pas un simple arbre.
+"""
+
+import numpy as np
+
+# Voisins retenus par point quand mathutils n'est pas disponible (hors Blender)
+FALLBACK_NEIGHBOURS = 6
+
+
+def delaunay_edges(points):
+    """Arêtes (i, j), i < j, de la triangulation de Delaunay des points (N, 2)"""
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if len(points) < 2:
+        return set()
+    if len(points) < 3:
+        return {(0, 1)}
+    try:
+        from mathutils import Vector
+        from mathutils.geometry import delaunay_2d_cdt
+    except ImportError:
+        return _nearest_neighbour_edges(points, FALLBACK_NEIGHBOURS)
+
+    # output_type 0: triangles de l'enveloppe convexe; orig_verts relie chaque
+    # sommet de sortie aux points d'entrée (les doublons sont fusionnés)
+    result = delaunay_2d_cdt([Vector(point) for point in points], [], [], 0, 1e-6)
+    faces, orig_verts = result[2], result[3]
+    source = [originals[0] if originals else -1 for originals in orig_verts]
+    edges = set()
+    for face in faces:
+        for a, b in zip(face, face[1:] + face[:1]):
+            i, j = source[a], source[b]
+            if i >= 0 and j >= 0 and i != j:
+                edges.add((i, j) if i < j else (j, i))
+    return edges
+
+
+def _nearest_neighbour_edges(points, count):
+    """Graphe des k plus proches voisins: sur-ensemble de l'arbre couvrant minimal en pratique"""
+    edges = set()
+    count = min(count, len(points) - 1)
+    for start in range(0, len(points), 512):
+        chunk = points[start:start + 512]
+        distances = ((chunk[:, None, :] - points[None, :, :]) ** 2).sum(axis=2)
+        distances[np.arange(len(chunk)), np.arange(start, start + len(chunk))] = np.inf
+        nearest = np.argpartition(distances, count - 1, axis=1)[:, :count]
+        for offset, neighbours in enumerate(nearest):
+            i = start + offset
+            edges.update((i, int(j)) if i < j else (int(j), i) for j in neighbours)
+    return edges
+
+
+def minimum_spanning_tree(points, edges):
+    """Kruskal: arêtes de l'arbre (ou forêt) couvrant minimal, puis les autres, par longueur"""
+    parent = list(range(len(points)))
+
+    def find(node):
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    tree, others = [], []
+    for i, j in sorted(edges, key=lambda edge: float(np.hypot(*(points[edge[0]] - points[edge[1]])))):
+        root_i, root_j = find(i), find(j)
+        if root_i == root_j:
+            others.append((i, j))
+        else:
+            parent[root_i] = root_j
+            tree.append((i, j))
+    return tree, others
+
+
+def sparse_connections(points, extra_ratio=0.2, max_length=None):
+    """Connexions entre blocs: arbre couvrant minimal de Delaunay + arêtes supplémentaires
+
+    extra_ratio ajoute ce ratio (par rapport à l'arbre) des arêtes de Delaunay
+    restantes, les plus courtes d'abord. max_length écarte les arêtes trop longues
+    (blocs isolés laissés à l'écart plutôt que reliés par une route interminable).
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    tree, others = minimum_spanning_tree(points, delaunay_edges(points))
+    extra = others[:int(round(len(tree) * max(0.0, extra_ratio)))]
+    connections = tree + extra
+    if max_length is not None:
+        connections = [(i, j) for i, j in connections if np.hypot(*(points[i] - points[j])) <= max_length]
+    return connections
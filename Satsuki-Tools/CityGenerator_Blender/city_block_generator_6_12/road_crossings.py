@@ -0,0 +1,78 @@
+"""
+Croisements de routes quelconques (sans dépendance à bpy).
+
+Les carrefours de la grille sont placés analytiquement; les routes diagonales et
+courbes, elles, croisent tout le reste sans géométrie de jonction et leurs
+surfaces se chevauchent (z-fighting). Les lignes médianes de toutes les routes
+passent par la table de hachage spatiale de road_graph: chaque croisement donne
+un point où un patch de jonction (le parallélogramme commun aux deux chaussées)
+est posé légèrement au-dessus des routes.
+"""
+
+import math
+
+import numpy as np
+
+from .road_graph import SpatialHash, polyline_segments, segment_crossings
+
+# Sinus minimal de l'angle entre deux routes: borne la taille des patches rasants
+MIN_CROSSING_SINE = 0.25
+
+
+def find_road_crossings(polylines, widths, kinds=None, cell_size=None, merge_distance=0.5):
+    """Croisements entre routes décrites par leurs lignes médianes (K, 2)
+
+    kinds (un libellé par route) permet d'ignorer les croisements entre routes
+    du même libellé 'grid', déjà couverts par les carrefours analytiques.
+    Les croisements plus proches que merge_distance sont fusionnés (plusieurs
+    routes concourantes): le plus large est conservé.
+
+    Retourne une liste de dicts {point, roads, widths, directions}.
+    """
+    segments = polyline_segments(polylines, widths)
+    crossings = []
+    for a, b, t, _ in segment_crossings(segments, cell_size):
+        road_a, road_b = segments[a][2], segments[b][2]
+        if kinds is not None and kinds[road_a] == kinds[road_b] == 'grid':
+            continue
+        p, q = segments[a][0], segments[a][1]
+        directions = []
+        for index in (a, b):
+            edge = segments[index][1] - segments[index][0]
+            directions.append(edge / math.hypot(*edge))
+        crossings.append({
+            'point': p + (q - p) * t,
+            'roads': (road_a, road_b),
+            'widths': (segments[a][3], segments[b][3]),
+            'directions': tuple(directions),
+        })
+    return _merge_crossings(crossings, merge_distance)
+
+
+def _merge_crossings(crossings, distance):
+    """Fusionne les croisements trop proches (garde le patch le plus large)"""
+    if distance <= 0:
+        return crossings
+    index = SpatialHash(distance * 2)
+    merged = []
+    for crossing in sorted(crossings, key=lambda c: -max(c['widths'])):
+        x, y = crossing['point']
+        if any(math.hypot(*(merged[k]['point'] - crossing['point'])) < distance
+               for k in index.query_point(x, y, distance)):
+            continue
+        index.insert_point(len(merged), x, y)
+        merged.append(crossing)
+    return merged
+
+
+def junction_patch(crossing, margin=0.0):
+    """Contour (4, 2), relatif au point de croisement, de la zone commune aux deux chaussées"""
+    (da, db), (wa, wb) = crossing['directions'], crossing['widths']
+    sine = max(abs(da[0] * db[1] - da[1] * db[0]), MIN_CROSSING_SINE)
+    # Le long de la route a, la chaussée b occupe wb / sin; et réciproquement
+    along_a = da * ((wb / 2 + margin) / sine)
+    along_b = db * ((wa / 2 + margin) / sine)
+    corners = np.array([-along_a - along_b, along_a - along_b, along_a + along_b, -along_a + along_b])
+    # Sens trigonométrique pour des faces orientées vers le haut
+    area = 0.5 * float(np.dot(corners[:, 0], np.roll(corners[:, 1], -1)) - np.dot(corners[:, 1], np.roll(corners[:, 0], -1)))
+    return corners if area > 0 else corners[::-1]
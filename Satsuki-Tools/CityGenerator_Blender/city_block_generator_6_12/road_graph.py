@@ -0,0 +1,340 @@
+"""
+Graphe routier planaire (sans dépendance à bpy).
+
+Les routes sont décrites par leurs lignes médianes (polylignes). Le graphe
+découpe chaque segment à ses croisements avec les autres routes: les nœuds sont
+les intersections et extrémités, les arêtes les tronçons de ligne médiane. Les
+faces fermées du graphe sont les vrais îlots entre les routes; elles sont
+rétrécies de la demi-largeur de route plus le trottoir pour donner les
+polygones de blocs. Une table de hachage spatiale limite les tests de
+croisement aux segments voisins: le coût reste quasi linéaire en nombre de routes.
+"""
+
+import math
+from collections import defaultdict
+
+import numpy as np
+
+
+class SpatialHash:
+    """Grille uniforme {cellule: identifiants} pour les requêtes de voisinage"""
+
+    def __init__(self, cell_size):
+        self.cell_size = float(cell_size)
+        self.cells = defaultdict(list)
+
+    def _range(self, low, high):
+        return range(int(math.floor(low / self.cell_size)), int(math.floor(high / self.cell_size)) + 1)
+
+    def insert_box(self, item, x_min, y_min, x_max, y_max):
+        for cx in self._range(x_min, x_max):
+            for cy in self._range(y_min, y_max):
+                self.cells[(cx, cy)].append(item)
+
+    def query_box(self, x_min, y_min, x_max, y_max):
+        found = set()
+        for cx in self._range(x_min, x_max):
+            for cy in self._range(y_min, y_max):
+                found.update(self.cells.get((cx, cy), ()))
+        return found
+
+    def insert_point(self, item, x, y):
+        self.insert_box(item, x, y, x, y)
+
+    def query_point(self, x, y, radius):
+        return self.query_box(x - radius, y - radius, x + radius, y + radius)
+
+
+def segment_intersection(p1, p2, p3, p4, eps=1e-9):
+    """Paramètres (t, u) du croisement des segments p1p2 et p3p4, ou None"""
+    d1x, d1y = p2[0] - p1[0], p2[1] - p1[1]
+    d2x, d2y = p4[0] - p3[0], p4[1] - p3[1]
+    denom = d1x * d2y - d1y * d2x
+    if abs(denom) < eps:
+        return None  # Segments parallèles (ou colinéaires): pas de nœud
+    ox, oy = p3[0] - p1[0], p3[1] - p1[1]
+    t = (ox * d2y - oy * d2x) / denom
+    u = (ox * d1y - oy * d1x) / denom
+    if -eps <= t <= 1 + eps and -eps <= u <= 1 + eps:
+        return min(1.0, max(0.0, t)), min(1.0, max(0.0, u))
+    return None
+
+
+def _next(values):
+    """Valeurs décalées d'un cran (sommet suivant, avec bouclage); plus rapide que np.roll"""
+    return np.concatenate((values[1:], values[:1]))
+
+
+def signed_area(polygon):
+    """Aire signée (positive si sens trigonométrique) d'un polygone (K, 2)"""
+    x = polygon[:, 0]
+    y = polygon[:, 1]
+    return 0.5 * float(np.dot(x, _next(y)) - np.dot(y, _next(x)))
+
+
+def polygon_centroid(polygon):
+    """Centre de gravité d'un polygone (K, 2) non dégénéré"""
+    x = polygon[:, 0]
+    y = polygon[:, 1]
+    cross = x * _next(y) - _next(x) * y
+    area = cross.sum() / 2
+    if abs(area) < 1e-12:
+        return polygon.mean(axis=0)
+    cx = ((x + _next(x)) * cross).sum() / (6 * area)
+    cy = ((y + _next(y)) * cross).sum() / (6 * area)
+    return np.array((cx, cy))
+
+
+def points_in_polygon(points, polygon):
+    """Test pair-impair vectorisé: masque des points (N, 2) à l'intérieur du polygone"""
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    x = points[:, 0][:, None]
+    y = points[:, 1][:, None]
+    x1 = polygon[:, 0][None, :]
+    y1 = polygon[:, 1][None, :]
+    x2 = _next(polygon[:, 0])[None, :]
+    y2 = _next(polygon[:, 1])[None, :]
+    crosses = (y1 > y) != (y2 > y)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_cross = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+    return (crosses & (x < x_cross)).sum(axis=1) % 2 == 1
+
+
+def inset_polygon(polygon, distance, max_iterations=8):
+    """Rétrécit un polygone sens trigonométrique de distance (jointures en onglet)
+
+    Les arêtes qui s'inversent (concavités plus étroites que la distance) sont
+    retirées puis le calcul recommence. Retourne None si le polygone disparaît.
+    """
+    polygon = np.asarray(polygon, dtype=np.float64)
+    for _ in range(max_iterations):
+        if len(polygon) < 3:
+            return None
+        edges = _next(polygon) - polygon
+        lengths = np.hypot(edges[:, 0], edges[:, 1])
+        keep = lengths > 1e-9
+        if not keep.all():
+            polygon = polygon[keep]
+            continue
+        normals = np.column_stack((-edges[:, 1], edges[:, 0])) / lengths[:, None]  # Normales intérieures
+        previous = np.concatenate((normals[-1:], normals[:-1]))
+        denom = np.maximum(1.0 + (normals * previous).sum(axis=1), 0.2)  # Onglet borné (angles aigus)
+        inset = polygon + (normals + previous) * (distance / denom)[:, None]
+
+        new_edges = _next(inset) - inset
+        flipped = (new_edges * edges).sum(axis=1) <= 0
+        if not flipped.any():
+            return inset if signed_area(inset) > 1e-6 else None
+        # Supprimer le sommet de départ des arêtes inversées
+        polygon = polygon[~flipped]
+    return None
+
+
+def largest_centered_rect(polygon, center, steps=32):
+    """Demi-dimensions du plus grand rectangle aligné aux axes, centré sur center, dans le polygone
+
+    Toutes les échelles candidates sont testées d'un seul coup (un appel vectorisé
+    par bloc au lieu d'une recherche dichotomique).
+    """
+    half = (polygon.max(axis=0) - polygon.min(axis=0)) / 2
+    scales = np.arange(1, steps + 1, dtype=np.float64) / steps
+    signs = np.array([(-1, -1), (1, -1), (1, 1), (-1, 1)], dtype=np.float64)
+    corners = center + signs[None, :, :] * half * scales[:, None, None]
+    inside = points_in_polygon(corners.reshape(-1, 2), polygon).reshape(steps, 4).all(axis=1)
+    # Aucun sommet du polygone ne doit entrer dans le rectangle (concavités)
+    offset = np.abs(polygon - center)
+    reach = np.maximum(offset[:, 0] / max(half[0], 1e-9), offset[:, 1] / max(half[1], 1e-9))
+    inside &= scales <= reach.min()
+    # Première échelle en échec: les suivantes sont écartées
+    valid = np.cumprod(inside).astype(bool)
+    return half * (scales[valid][-1] if valid.any() else 0.0)
+
+
+def polyline_segments(polylines, widths, extend=0.0):
+    """Segments (p, q, route, largeur) non dégénérés des polylignes (K, 2)
+
+    extend prolonge les extrémités de chaque route de cette distance.
+    """
+    segments = []
+    for road, (points, width) in enumerate(zip(polylines, widths)):
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        if len(points) < 2:
+            continue
+        if extend > 0:
+            points = points.copy()
+            for end, inner in ((0, 1), (-1, -2)):
+                direction = points[end] - points[inner]
+                norm = math.hypot(*direction)
+                if norm > 1e-9:
+                    points[end] = points[end] + direction / norm * extend
+        for p, q in zip(points[:-1], points[1:]):
+            if math.hypot(*(q - p)) > 1e-9:
+                segments.append((p, q, road, width))
+    return segments
+
+
+def segment_crossings(segments, cell_size=None):
+    """Croisements (i, j, t, u) entre segments de routes différentes
+
+    Les segments sont rangés dans une table de hachage spatiale: seuls les voisins
+    d'une même cellule sont testés, soit O(n + k) au lieu de tous les couples.
+    """
+    if cell_size is None:
+        lengths = [math.hypot(*(q - p)) for p, q, _, _ in segments]
+        cell_size = float(np.median(lengths)) if lengths else 10.0
+    segment_index = SpatialHash(max(cell_size, 1e-3))
+    for index, (p, q, _, _) in enumerate(segments):
+        segment_index.insert_box(index, min(p[0], q[0]), min(p[1], q[1]), max(p[0], q[0]), max(p[1], q[1]))
+
+    crossings = []
+    for index, (p, q, road, _) in enumerate(segments):
+        candidates = segment_index.query_box(min(p[0], q[0]), min(p[1], q[1]), max(p[0], q[0]), max(p[1], q[1]))
+        for other in candidates:
+            if other <= index or segments[other][2] == road:
+                continue
+            hit = segment_intersection(p, q, segments[other][0], segments[other][1])
+            if hit is not None:
+                crossings.append((index, other, hit[0], hit[1]))
+    return crossings
+
+
+class RoadGraph:
+    """Graphe planaire: nœuds aux croisements, arêtes = tronçons de lignes médianes"""
+
+    def __init__(self, tolerance=0.05, cell_size=10.0):
+        self.tolerance = tolerance
+        self.nodes = []
+        self.edges = {}  # (a, b) avec a < b -> largeur de route
+        self.adjacency = []
+        self._node_index = SpatialHash(max(cell_size, tolerance * 4))
+
+    def node_at(self, x, y):
+        """Index du nœud à (x, y), fusionné avec un nœud existant à moins de tolerance"""
+        for node in self._node_index.query_point(x, y, self.tolerance):
+            nx, ny = self.nodes[node]
+            if (nx - x) ** 2 + (ny - y) ** 2 <= self.tolerance ** 2:
+                return node
+        self.nodes.append((x, y))
+        self.adjacency.append(set())
+        node = len(self.nodes) - 1
+        self._node_index.insert_point(node, x, y)
+        return node
+
+    def add_edge(self, a, b, width):
+        if a == b:
+            return
+        key = (a, b) if a < b else (b, a)
+        self.edges[key] = max(width, self.edges.get(key, 0.0))
+        self.adjacency[a].add(b)
+        self.adjacency[b].add(a)
+
+    def remove_node_edges(self, node):
+        for other in self.adjacency[node]:
+            self.adjacency[other].discard(node)
+            self.edges.pop((node, other) if node < other else (other, node), None)
+        self.adjacency[node] = set()
+
+    @classmethod
+    def from_polylines(cls, polylines, widths, tolerance=0.05, cell_size=None, extend=0.0):
+        """Construit le graphe de routes décrites par des polylignes (K, 2)
+
+        extend prolonge les extrémités de chaque route: une route qui s'arrête juste
+        avant sa voisine la croise quand même (le surplus est élagué ensuite).
+        """
+        segments = polyline_segments(polylines, widths, extend)
+        if cell_size is None:
+            lengths = [math.hypot(*(q - p)) for p, q, _, _ in segments]
+            cell_size = max(float(np.median(lengths)) if lengths else 10.0, tolerance * 4)
+        graph = cls(tolerance, cell_size)
+
+        splits = [[0.0, 1.0] for _ in segments]
+        for index, other, t, u in segment_crossings(segments, cell_size):
+            splits[index].append(t)
+            splits[other].append(u)
+
+        for (p, q, _, width), params in zip(segments, splits):
+            previous = None
+            for t in sorted(set(params)):
+                node = graph.node_at(p[0] + (q[0] - p[0]) * t, p[1] + (q[1] - p[1]) * t)
+                if previous is not None:
+                    graph.add_edge(previous, node, width)
+                previous = node
+        return graph
+
+    def prune_dead_ends(self):
+        """Retire itérativement les impasses (nœuds de degré 1): elles ne bordent aucun îlot"""
+        stack = [node for node, neighbours in enumerate(self.adjacency) if len(neighbours) == 1]
+        removed = 0
+        while stack:
+            node = stack.pop()
+            if len(self.adjacency[node]) != 1:
+                continue
+            other = next(iter(self.adjacency[node]))
+            self.remove_node_edges(node)
+            removed += 1
+            if len(self.adjacency[other]) == 1:
+                stack.append(other)
+        return removed
+
+    def faces(self, min_area=1.0):
+        """Faces bornées du graphe: listes de nœuds en sens trigonométrique
+
+        Chaque demi-arête (u, v) est suivie par l'arête de v qui tourne le plus à
+        gauche: la face parcourue est toujours à gauche. La face extérieure (aire négative)
+        est écartée.
+        """
+        ordered = []
+        for node, neighbours in enumerate(self.adjacency):
+            x, y = self.nodes[node]
+            ordered.append(sorted(neighbours, key=lambda other: math.atan2(self.nodes[other][1] - y,
+                                                                           self.nodes[other][0] - x)))
+        position = [{other: k for k, other in enumerate(around)} for around in ordered]
+
+        visited = set()
+        faces = []
+        for a, b in self.edges:
+            for start in ((a, b), (b, a)):
+                if start in visited:
+                    continue
+                face = []
+                u, v = start
+                while (u, v) not in visited:
+                    visited.add((u, v))
+                    face.append(u)
+                    around = ordered[v]
+                    u, v = v, around[(position[v][u] - 1) % len(around)]
+                if len(face) >= 3:
+                    polygon = np.array([self.nodes[node] for node in face])
+                    if signed_area(polygon) >= min_area:
+                        faces.append(face)
+        return faces
+
+    def face_width(self, face):
+        """Largeur de la plus large route bordant la face"""
+        return max(self.edges[(a, b) if a < b else (b, a)] for a, b in zip(face, face[1:] + face[:1]))
+
+    def block_polygons(self, sidewalk_width=0.0, min_area=1.0):
+        """Polygones de blocs: faces rétrécies de la demi-largeur de route plus le trottoir
+
+        Retourne une liste de dicts {polygon, centroid, area, half_size}; half_size
+        donne les demi-dimensions du plus grand rectangle aligné centré dans le bloc.
+        """
+        blocks = []
+        for face in self.faces(min_area):
+            polygon = np.array([self.nodes[node] for node in face])
+            inset = inset_polygon(polygon, self.face_width(face) / 2 + sidewalk_width)
+            if inset is None:
+                continue
+            area = signed_area(inset)
+            if area < min_area:
+                continue
+            centroid = polygon_centroid(inset)
+            if not points_in_polygon(centroid, inset)[0]:
+                continue
+            blocks.append({
+                'polygon': inset,
+                'centroid': centroid,
+                'area': area,
+                'half_size': largest_centered_rect(inset, centroid),
+            })
+        return blocks
@@ -0,0 +1,165 @@
+"""
+Maillage en ruban des routes (sans dépendance à bpy).
+
+Une route est décrite par sa ligne médiane (polyligne) et un profil de largeur.
+Le ruban est une seule bande de quads continue: chaque sommet de la ligne
+médiane donne une rangée de sommets décalés le long de la bissectrice (jointure
+en onglet, bornée par miter_limit), ou la ligne médiane est d'abord arrondie aux
+virages (jointure ronde). Bordures et trottoirs sont des bandes décalées du même
+calcul, surélevées avec un flanc côté chaussée. Les UV suivent la longueur de la
+route (v en mètres divisés par uv_scale, u à travers la bande).
+"""
+
+import math
+
+import numpy as np
+
+# Rapport maximal entre le décalage en onglet et la demi-largeur (virages serrés)
+MITER_LIMIT = 3.0
+
+# Rayon des virages arrondis en demi-emprises: au-dessus de 1, le bord intérieur
+# garde un rayon non nul et ses quads une aire non nulle
+ROUND_JOIN_FACTOR = 1.5
+
+
+def fillet_polyline(points, radius, segments=4):
+    """Arrondit les virages d'une polyligne (K, 2) par des arcs de rayon radius
+
+    Retourne (points, paramètres): le paramètre de chaque point est sa position
+    fractionnaire dans la polyligne d'origine (pour interpoler le profil de largeur).
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    result = [points[0]]
+    params = [0.0]
+    for k in range(1, len(points) - 1):
+        before, after = points[k] - points[k - 1], points[k + 1] - points[k]
+        len_before, len_after = math.hypot(*before), math.hypot(*after)
+        if len_before < 1e-9 or len_after < 1e-9:
+            continue
+        d0, d1 = before / len_before, after / len_after
+        turn = math.atan2(d0[0] * d1[1] - d0[1] * d1[0], float(np.dot(d0, d1)))
+        if abs(turn) < 1e-3 or radius <= 0:
+            result.append(points[k])
+            params.append(float(k))
+            continue
+        cut = min(radius * math.tan(abs(turn) / 2), len_before / 2, len_after / 2)
+        arc_radius = cut / math.tan(abs(turn) / 2)
+        start = points[k] - d0 * cut
+        side = 1.0 if turn > 0 else -1.0  # Virage à gauche: centre à gauche
+        center = start + np.array((-d0[1], d0[0])) * arc_radius * side
+        arm = start - center
+        steps = np.arange(segments + 1) / segments
+        angles = turn * steps
+        cos_a, sin_a = np.cos(angles), np.sin(angles)
+        arc = center + np.column_stack((arm[0] * cos_a - arm[1] * sin_a, arm[0] * sin_a + arm[1] * cos_a))
+        result.extend(arc)
+        params.extend(k - cut / len_before + steps * (cut / len_before + cut / len_after))
+    result.append(points[-1])
+    params.append(float(len(points) - 1))
+    return np.array(result), np.array(params)
+
+
+def miter_frames(points, miter_limit=MITER_LIMIT):
+    """Directions de décalage (K, 2) et facteurs d'onglet (K,) de chaque sommet
+
+    Un décalage latéral d à gauche de la ligne médiane se place en
+    points + directions * (facteurs * d).
+    """
+    edges = points[1:] - points[:-1]
+    lengths = np.maximum(np.hypot(edges[:, 0], edges[:, 1]), 1e-12)
+    normals = np.column_stack((-edges[:, 1], edges[:, 0])) / lengths[:, None]  # Normales à gauche
+    before = np.vstack((normals[:1], normals))
+    after = np.vstack((normals, normals[-1:]))
+    bisector = before + after
+    norm = np.hypot(bisector[:, 0], bisector[:, 1])
+    # Demi-tour: la bissectrice s'annule, on garde la normale entrante
+    directions = np.where((norm > 1e-9)[:, None], bisector / np.maximum(norm, 1e-12)[:, None], before)
+    cosine = (directions * before).sum(axis=1)
+    factors = np.minimum(1.0 / np.maximum(cosine, 1e-6), miter_limit)
+    return directions, factors
+
+
+def strip_geometry(frame, inner, outer, height, distance, uv_scale=1.0, wall_from=None):
+    """Bande de quads entre les décalages latéraux inner et outer (K,) à hauteur height
+
+    frame vient de miter_frames (centre, directions, facteurs); distance (K,) est
+    l'abscisse curviligne de chaque rangée. wall_from ajoute un flanc vertical du
+    côté inner, de cette hauteur à height.
+    Retourne (verts (N, 3), loops, totals, uvs par loop (L, 2)).
+    """
+    directions, factors, centre = frame['directions'], frame['factors'], frame['centre']
+    count = len(centre)
+    columns = [(inner, height, 0.0), (outer, height, 1.0)]
+    if wall_from is not None:
+        columns.insert(0, (inner, wall_from, -0.1))
+
+    verts = np.empty((count, len(columns), 3))
+    uv_u = np.empty(len(columns))
+    for column, (offset, z, u) in enumerate(columns):
+        verts[:, column, :2] = centre + directions * (factors * offset)[:, None]
+        verts[:, column, 2] = z
+        uv_u[column] = u
+
+    # Quads (i, c) -> (i+1, c) -> (i+1, c+1) -> (i, c+1): normales vers le haut
+    # pour des décalages croissants vers la gauche; le flanc regarde la chaussée
+    rows = np.arange(count - 1)[:, None]
+    cols = np.arange(len(columns) - 1)[None, :]
+    width = len(columns)
+    a = rows * width + cols
+    quads = np.stack((a, a + width, a + width + 1, a + 1), axis=-1)
+    if float(np.mean(np.asarray(outer) - np.asarray(inner))) < 0:
+        quads = quads[..., ::-1]  # Bande à droite: inverser pour garder les normales vers le haut
+    quads = quads.reshape(-1, 4)
+
+    v = distance / uv_scale
+    uv_grid = np.stack(np.broadcast_arrays(uv_u[None, :], v[:, None]), axis=-1).reshape(-1, 2)
+    return verts.reshape(-1, 3), quads.ravel(), np.full(len(quads), 4), uv_grid[quads.ravel()]
+
+
+def ribbon_geometry(points, widths, join='MITER', z=0.0, curb_width=0.0, curb_height=0.15,
+                    sidewalk_width=0.0, sidewalk_height=0.15, round_segments=4,
+                    miter_limit=MITER_LIMIT, uv_scale=None):
+    """Géométrie d'une route le long d'une polyligne (K, 2)
+
+    widths: largeur constante ou profil (K,) le long de la polyligne d'origine.
+    join: 'MITER' (onglet) ou 'ROUND' (virages arrondis à ROUND_JOIN_FACTOR demi-emprises,
+    borné par la longueur des segments).
+    Retourne une liste [(rôle, verts, loops, totals, uvs)] avec les rôles 'road',
+    puis 'curb' et 'sidewalk' (une bande de chaque côté) s'ils sont demandés.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    keep = np.concatenate(([True], np.hypot(*(points[1:] - points[:-1]).T) > 1e-9))
+    widths = np.broadcast_to(np.asarray(widths, dtype=np.float64), (len(points),))[keep]
+    points = points[keep]
+    if len(points) < 2:
+        return []
+
+    half_span = float(widths.max()) / 2 + curb_width + sidewalk_width
+    if join == 'ROUND':
+        centre, params = fillet_polyline(points, half_span * ROUND_JOIN_FACTOR, round_segments)
+        widths = np.interp(params, np.arange(len(points)), widths)
+        # Deux arcs voisins peuvent se rejoindre au milieu d'un segment
+        distinct = np.concatenate(([True], np.hypot(*(centre[1:] - centre[:-1]).T) > 1e-9))
+        centre, widths = centre[distinct], widths[distinct]
+    else:
+        centre = points
+    directions, factors = miter_frames(centre, miter_limit)
+    frame = {'centre': centre, 'directions': directions, 'factors': factors}
+
+    # Abscisse curviligne pour les UV le long de la route
+    distance = np.concatenate(([0.0], np.cumsum(np.hypot(*(centre[1:] - centre[:-1]).T))))
+    uv_scale = uv_scale or max(float(widths.mean()), 1e-6)
+
+    half = widths / 2
+    strips = [('road',) + strip_geometry(frame, -half, half, z, distance, uv_scale)]
+    for side in (1.0, -1.0):
+        edge = half
+        if curb_width > 0:
+            strips.append(('curb',) + strip_geometry(frame, side * edge, side * (edge + curb_width), z + curb_height,
+                                                     distance, uv_scale, wall_from=z))
+            edge = edge + curb_width
+        if sidewalk_width > 0:
+            wall = None if curb_width > 0 else z
+            strips.append(('sidewalk',) + strip_geometry(frame, side * edge, side * (edge + sidewalk_width),
+                                                         z + sidewalk_height, distance, uv_scale, wall_from=wall))
+    return strips
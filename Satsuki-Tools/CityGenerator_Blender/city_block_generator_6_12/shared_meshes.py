@@ -0,0 +1,185 @@
+"""
+Réutilisation de meshes partagés pour le City Block Generator.
+
+Les formes identiques (ou identiques après quantification) partagent un seul
+datablock mesh: un cube unitaire sert tous les bâtiments rectangulaires, routes,
+trottoirs et carrefours, la taille étant portée par l'échelle de l'objet. Les
+meshes sont indexés par une clé de hachage calculée sur leur contenu.
+"""
+
+import hashlib
+
+import numpy as np
+
+from .city_log import log
+from .mesh_batch import MeshBatch
+
+# Précision de quantification des dimensions pour les clés (1 mm)
+KEY_QUANTUM = 0.001
+
+# Pas de quantification des ratios de variante des gabarits de bâtiments partagés
+TEMPLATE_RATIO_STEP = 0.05
+
+
+def snap_value(value, snap):
+    """Aligne une valeur sur la grille de snap (snap <= 0 = désactivé)"""
+    if snap <= 0:
+        return value
+    return max(snap, round(value / snap) * snap)
+
+
+def geometry_key(kind, values):
+    """Retourne une clé stable pour une géométrie à partir de ses paramètres quantifiés"""
+    quantized = tuple(int(round(float(v) / KEY_QUANTUM)) for v in np.asarray(values, dtype=np.float64).ravel())
+    digest = hashlib.sha1(repr((kind, quantized)).encode('utf-8')).hexdigest()[:12]
+    return f"{kind}_{digest}"
+
+
+class SharedMeshRegistry:
+    """Cache des meshes partagés indexés par clé de contenu"""
+
+    def __init__(self, snap=0.0, prefix="CityShared"):
+        self.snap = max(0.0, float(snap))
+        self.prefix = prefix
+        self.meshes = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_mesh(self, key, fill):
+        """Retourne le mesh de clé key, en le construisant via fill(batch) si absent"""
+        import bpy
+
+        mesh = self.meshes.get(key)
+        if mesh is None:
+            mesh = bpy.data.meshes.get(f"{self.prefix}_{key}")
+        if mesh is not None:
+            self.meshes[key] = mesh
+            self.hits += 1
+            return mesh
+
+        batch = MeshBatch(f"{self.prefix}_{key}")
+        fill(batch)
+        mesh = batch.to_mesh()
+        # Un slot vide: le matériau est lié au niveau objet
+        mesh.materials.append(None)
+        self.meshes[key] = mesh
+        self.misses += 1
+        return mesh
+
+    def unit_box(self):
+        return self.get_mesh("box_unit", lambda batch: batch.add_box(1.0, 1.0, 1.0))
+
+    def unit_cylinder(self, segments, top_scale):
+        key = geometry_key("cylinder", (segments, top_scale))
+        return self.get_mesh(key, lambda batch: batch.add_cylinder(0.5, 0.5, 1.0, segments=segments, top_scale=top_scale))
+
+
+class SharedMeshEmitter:
+    """Même interface que MeshBatch mais crée un objet par élément avec un mesh partagé"""
+
+    def __init__(self, name, material, registry, collection=None):
+        self.name = name
+        self.material = material
+        self.registry = registry
+        self.collection = collection
+        self.objects = []
+        self._look = None
+
+    @property
+    def item_count(self):
+        return len(self.objects)
+
+    @property
+    def is_empty(self):
+        return not self.objects
+
+    def set_look(self, color=None, roughness=0.5, zone=-1):
+        """Aspect des objets créés ensuite: couleur d'objet et rugosité lues par le shader partagé"""
+        self._look = None if color is None else (tuple(color[:3]), float(roughness), int(zone))
+
+    def _instance(self, mesh, location, scale=(1.0, 1.0, 1.0), rotation_z=0.0, material=None):
+        import bpy
+
+        obj = bpy.data.objects.new(f"{self.name}_{len(self.objects):05d}", mesh)
+        obj.location = location
+        obj.scale = scale
+        obj.rotation_euler[2] = rotation_z
+        collection = self.collection or bpy.context.collection
+        collection.objects.link(obj)
+
+        material = material or self.material
+        if material and obj.material_slots:
+            obj.material_slots[0].link = 'OBJECT'
+            obj.material_slots[0].material = material
+        if self._look is not None:
+            from .city_shader import ROUGHNESS_ATTR
+            obj.color = (*self._look[0], 1.0)
+            obj[ROUGHNESS_ATTR] = self._look[1]
+        self.objects.append(obj)
+        return obj
+
+    def add_box(self, size_x, size_y, size_z, location=(0.0, 0.0, 0.0), rotation_z=0.0, material=None):
+        """Boîte centre bas: cube unitaire partagé mis à l'échelle"""
+        if size_x <= 0 or size_y <= 0 or size_z <= 0:
+            return None
+        snap = self.registry.snap
+        scale = (snap_value(size_x, snap), snap_value(size_y, snap), snap_value(size_z, snap))
+        return self._instance(self.registry.unit_box(), location, scale, rotation_z, material)
+
+    def add_cylinder(self, radius_x, radius_y, height, location=(0.0, 0.0, 0.0), segments=32, top_scale=1.0, material=None):
+        """Cylindre ou cône: cylindre unitaire partagé par (segments, top_scale)"""
+        if radius_x <= 0 or radius_y <= 0 or height <= 0:
+            return None
+        snap = self.registry.snap
+        scale = (snap_value(radius_x * 2, snap), snap_value(radius_y * 2, snap), snap_value(height, snap))
+        return self._instance(self.registry.unit_cylinder(segments, top_scale), location, scale, 0.0, material)
+
+    def add_prism(self, polygon_xy, height, location=(0.0, 0.0, 0.0), rotation_z=0.0, top_scale=1.0, material=None):
+        """Polygone extrudé: mesh indexé par le contenu du contour quantifié"""
+        polygon = np.asarray(polygon_xy, dtype=np.float64).reshape(-1, 2)
+        if len(polygon) < 3 or height <= 0:
+            return None
+        snap = self.registry.snap
+        if snap > 0:
+            polygon = np.round(polygon / snap) * snap
+            height = snap_value(height, snap)
+        key = geometry_key("prism", np.concatenate((polygon.ravel(), [height, top_scale])))
+        mesh = self.registry.get_mesh(key, lambda batch: batch.add_prism(polygon, height, top_scale=top_scale))
+        return self._instance(mesh, location, (1.0, 1.0, 1.0), rotation_z, material)
+
+    def add_template(self, name, size_x, size_y, size_z, location=(0.0, 0.0, 0.0), rotation_z=0.0, ratio=1.0, material=None):
+        """Bâtiment gabarit: mesh unitaire partagé par (gabarit, ratio quantifié) mis à l'échelle"""
+        from .building_templates import get_template
+
+        if size_x <= 0 or size_y <= 0 or size_z <= 0:
+            return None
+        template = get_template(name)
+        if template.stretch.any():
+            ratio = round(ratio / TEMPLATE_RATIO_STEP) * TEMPLATE_RATIO_STEP
+        else:
+            ratio = 1.0
+        key = geometry_key(f"template_{name}", (ratio,))
+        mesh = self.registry.get_mesh(key, lambda batch: batch.add_templates(name, [(0.0, 0.0, -template.base_z)],
+                                                                             [(1.0, 1.0, 1.0)], ratios=[ratio]))
+        snap = self.registry.snap
+        scale = (snap_value(size_x, snap), snap_value(size_y, snap), snap_value(size_z, snap))
+        location = (location[0], location[1], location[2] + template.base_z)
+        return self._instance(mesh, location, scale, rotation_z, material)
+
+    def add_ribbon(self, points, widths, material=None, curb_material=None, sidewalk_material=None, **options):
+        """Route en ruban: mesh indexé par la polyligne et le profil (rarement partagé)"""
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        if len(points) < 2:
+            return None
+        values = np.concatenate((points.ravel(), np.atleast_1d(np.asarray(widths, dtype=np.float64)),
+                                 [float(value) for value in options.values() if isinstance(value, (int, float))]))
+        key = geometry_key(f"ribbon_{options.get('join', 'MITER')}", values)
+        mesh = self.registry.get_mesh(key, lambda batch: batch.add_ribbon(points, widths, **options))
+        return self._instance(mesh, (0.0, 0.0, 0.0), material=material)
+
+    def build_object(self, collection=None):
+        """Les objets sont créés au fil de l'eau: rien à matérialiser"""
+        if self.objects:
+            log.info("♻️ '%s': %s objets, %s meshes partagés (%s réutilisations)",
+                     self.name, len(self.objects), len(self.registry.meshes), self.registry.hits)
+        return None
@@ -20,7 +20,9 @@ class CITYGEN_PT_Panel(Panel):
             'citygen_height_variation', 'citygen_organic_mode', 'citygen_road_first_method',
             'citygen_density_variation', 'citygen_age_variation', 'citygen_mixed_use', 
             'citygen_landmark_frequency', 'citygen_plaza_frequency', 'citygen_street_life', 
-            'citygen_weathering', 'citygen_irregular_lots', 'citygen_growth_pattern'
+            'citygen_weathering', 'citygen_irregular_lots', 'citygen_growth_pattern',
+            'citygen_mesh_backend', 'citygen_shared_snap', 'citygen_verbosity', 'citygen_seed',
+            'citygen_organic_extra_roads'
         ]
         missing_props = [prop for prop in required_props if not hasattr(scene, prop)]
         
@@ -48,6 +50,11 @@ class CITYGEN_PT_Panel(Panel):
         grid.prop(scene, "citygen_buildings_per_block", text="Bât./Bloc")
         grid.prop(scene, "citygen_seamless_roads", text="Routes collées")
         
+        seed_row = layout.row(align=True)
+        seed_row.prop(scene, "citygen_seed", text="Graine")
+        if scene.citygen_seed == 0 and 'citygen_last_seed' in scene:
+            seed_row.label(text=f"Dernière: {scene['citygen_last_seed']}")
+        
         layout.separator()
         
         # Section variété des bâtiments
@@ -78,6 +85,9 @@ class CITYGEN_PT_Panel(Panel):
             if getattr(scene, 'citygen_road_first_method', True):
                 method_col.label(text="✅ Routes créées en premier", icon='INFO')
                 method_col.label(text="   Blocs générés dans les espaces")
+                method_col.prop(scene, "citygen_live_curve_roads", text="Courbes Vivantes (GN)")
+                if getattr(scene, 'citygen_live_curve_roads', False):
+                    method_col.operator("citygen.realize_live_roads", text="Réaliser Routes", icon='MESH_DATA')
             else:
                 method_col.label(text="⚠️ Ancienne méthode (peut bugger)", icon='ERROR')
             
@@ -86,6 +96,7 @@ class CITYGEN_PT_Panel(Panel):
             # Contrôles pour les courbes et variations
             organic_col.label(text="Paramètres Organiques:")
             organic_col.prop(scene, "citygen_road_curve_intensity", text="Courbes Routes")
+            organic_col.prop(scene, "citygen_organic_extra_roads", text="Routes Suppl.")
             organic_col.prop(scene, "citygen_block_size_variation", text="Variation Blocs")
             organic_col.prop(scene, "citygen_growth_pattern", text="Croissance")
         
@@ -120,6 +131,18 @@ class CITYGEN_PT_Panel(Panel):
         freq_grid.prop(scene, "citygen_landmark_frequency", text="Monuments")
         freq_grid.prop(scene, "citygen_plaza_frequency", text="Places")
         
+        layout.separator()
+
+        # Section performance
+        layout.label(text="Performance:", icon='MEMORY')
+        perf_box = layout.box()
+        perf_box.prop(scene, "citygen_mesh_backend", text="Géométrie")
+        if scene.citygen_mesh_backend == 'SHARED':
+            perf_box.prop(scene, "citygen_shared_snap", text="Snap")
+        elif scene.citygen_mesh_backend == 'INSTANCED':
+            perf_box.operator("citygen.realize_instances", text="Réaliser Sélection", icon='OBJECT_DATA')
+        perf_box.prop(scene, "citygen_verbosity", text="Console")
+        
         layout.separator()
         
         # Section génération
@@ -127,6 +150,7 @@ class CITYGEN_PT_Panel(Panel):
         col = layout.column(align=True)
         col.scale_y = 1.2
         col.operator("citygen.generate_city", text="Générer Quartier", icon='MESH_CUBE')
+        col.operator("citygen.generate_city_modal", text="Générer Progressivement", icon='TIME')
         col.operator("citygen.regenerate_roads_sidewalks", text="Régénérer Routes", icon='MOD_BUILD')
         
         layout.separator()